@@ -0,0 +1 @@
+"""Performance benchmarks for i2code; run with ``python -m benchmarks.<suite>``."""
@@ -0,0 +1,164 @@
+"""Timing, peak-memory and baseline-comparison helpers shared by the suites.
+
+A suite is a list of ``Case`` objects.  Each case has a ``setup`` that
+builds fresh input (not timed) and a ``run`` that consumes it (timed), so
+mutating operations never see state left by a previous iteration.
+
+Results are ``{case_name: {"seconds": best, "peak_kib": peak}}``.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BASELINES_DIR = Path(__file__).parent / "baselines"
+DEFAULT_TOLERANCE = 0.5
+NOISE_FLOOR_SECONDS = 0.0005
+MIN_TIME_PER_CASE = 0.2
+MAX_WALL_PER_CASE = 1.5
+MIN_REPEAT = 3
+MAX_REPEAT = 1000
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[], Any]
+    run: Callable[[Any], Any]
+
+
+def measure(case: Case) -> Dict[str, float]:
+    """Best-of-N wall time, then one traced run for peak allocation.
+
+    Repeats until the timed runs add up to MIN_TIME_PER_CASE, bounded by
+    MAX_WALL_PER_CASE including setup so expensive setups stay affordable.
+    """
+    timings: List[float] = []
+    deadline = time.perf_counter() + MAX_WALL_PER_CASE
+    while len(timings) < MIN_REPEAT or (
+        len(timings) < MAX_REPEAT
+        and sum(timings) < MIN_TIME_PER_CASE
+        and time.perf_counter() < deadline
+    ):
+        subject = case.setup()
+        start = time.perf_counter()
+        case.run(subject)
+        timings.append(time.perf_counter() - start)
+
+    subject = case.setup()
+    tracemalloc.start()
+    try:
+        case.run(subject)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(timings), "peak_kib": round(peak / 1024, 1), "repeat": len(timings)}
+
+
+def run_cases(cases: List[Case], out=sys.stdout) -> Dict[str, Dict[str, float]]:
+    results = {}
+    width = max(len(case.name) for case in cases)
+    for case in cases:
+        result = measure(case)
+        results[case.name] = result
+        print(
+            f"{case.name:<{width}}  {format_seconds(result['seconds']):>10}"
+            f"  {result['peak_kib']:>10.1f} KiB  (x{result['repeat']})",
+            file=out, flush=True,
+        )
+    return results
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.2f}s"
+
+
+def load_baseline(path: Path) -> Optional[Dict[str, Any]]:
+    if not path.is_file():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(path: Path, results: Dict[str, Dict[str, float]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {
+            name: {"seconds": round(r["seconds"], 7), "peak_kib": r["peak_kib"]}
+            for name, r in sorted(results.items())
+        },
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """Return one message per case that got slower or hungrier than baseline.
+
+    Time regressions below NOISE_FLOOR_SECONDS in absolute terms are
+    ignored; cases missing from the baseline are skipped.
+    """
+    regressions = []
+    expected = baseline.get("results", {})
+    for name, result in results.items():
+        base = expected.get(name)
+        if base is None:
+            continue
+        seconds, base_seconds = result["seconds"], base["seconds"]
+        if (seconds > base_seconds * (1 + tolerance)
+                and seconds - base_seconds > NOISE_FLOOR_SECONDS):
+            regressions.append(
+                f"{name}: time {format_seconds(seconds)} vs baseline {format_seconds(base_seconds)}"
+            )
+        if result["peak_kib"] > base["peak_kib"] * (1 + tolerance) + 1:
+            regressions.append(
+                f"{name}: peak memory {result['peak_kib']:.1f} KiB vs baseline {base['peak_kib']:.1f} KiB"
+            )
+    return regressions
+
+
+def add_baseline_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true",
+                        help="Fail if any case regressed against the baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed fractional slowdown/growth in --compare mode (default: 0.5)")
+    parser.add_argument("--baseline", type=Path,
+                        help="Baseline JSON file (default: benchmarks/baselines/<suite>.json)")
+
+
+def finish(args, results, baseline_path: Path) -> int:
+    """Apply --save-baseline/--compare; return the process exit code."""
+    if args.save_baseline:
+        save_baseline(baseline_path, results)
+        print(f"Baseline written to {baseline_path}")
+        return 0
+    if not args.compare:
+        return 0
+    baseline = load_baseline(baseline_path)
+    if baseline is None:
+        print(f"No baseline at {baseline_path}; run with --save-baseline first", file=sys.stderr)
+        return 2
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against {baseline_path}:", file=sys.stderr)
+        for message in regressions:
+            print(f"  {message}", file=sys.stderr)
+        return 1
+    print(f"\nNo regressions against {baseline_path}")
+    return 0
@@ -0,0 +1,365 @@
+"""End-to-end benchmark of the implement task loop over N-task plans.
+
+Drives WorktreeMode and TrunkMode, wired by the real ModeFactory, through a
+synthetic plan.  Claude, CI and gh are simulated with configurable
+latencies; everything else is measured as orchestration overhead: plan
+re-parsing, git calls, state saves and polling.
+
+Each backend can be switched from its test fake to the real implementation:
+
+    claude  real ClaudeRunner spawning a mock-claude script (needs real git)
+    git     real GitRepository on a temp repo pushing to a local bare origin
+    state   real WorkflowState persisted to JSON (worktree mode only)
+
+gh is always the fake from tests/implement: the real client needs GitHub.
+
+    python -m benchmarks.implement_loop --tasks 20
+    python -m benchmarks.implement_loop --tasks 20 --real git,state
+    python -m benchmarks.implement_loop --tasks 20 --matrix
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional
+from unittest import mock
+
+from git import Repo
+
+from benchmarks.harness import format_seconds
+from benchmarks.plan_domain import synthetic_plan
+from i2code.implement import commit_recovery
+from i2code.implement.claude_runner import CapturedOutput, ClaudeResult, ClaudeRunner
+from i2code.implement.git_repository import GitRepository
+from i2code.implement.github_actions_build_fixer import GithubActionsBuildFixerFactory
+from i2code.implement.idea_project import IdeaProject
+from i2code.implement.implement_opts import ImplementOpts
+from i2code.implement.mode_factory import ModeFactory
+from i2code.implement.workflow_state import WorkflowState
+from i2code.plan import plan_file_io
+from i2code.plan.plan_file_io import atomic_write
+from i2code.plan_domain.parser import parse
+from i2code.trace.processes import process_stats
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests" / "implement"))
+
+from fake_claude_runner import FakeClaudeRunner  # noqa: E402
+from fake_git_repository import FakeGitRepository  # noqa: E402
+from fake_github_client import FakeGitHubClient  # noqa: E402
+from fake_workflow_state import FakeWorkflowState  # noqa: E402
+
+BACKENDS = ("claude", "git", "state")
+MODES = ("worktree", "trunk")
+IDEA_NAME = "bench"
+BRANCH = f"idea/{IDEA_NAME}"
+ORIGIN_URL = "https://github.com/bench/repo.git"
+
+
+@dataclass(frozen=True)
+class LoopConfig:
+    mode: str
+    tasks: int
+    real: FrozenSet[str] = frozenset()
+    claude_latency: float = 0.0
+    ci_latency: float = 0.0
+    gh_latency: float = 0.0
+
+    @property
+    def label(self) -> str:
+        backends = "+".join(sorted(self.real)) or "fakes"
+        return f"{self.mode}[{backends}]"
+
+
+class Probe:
+    """Counts calls to, and time spent in, the callables it wraps."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def wrap(self, fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            self.count += 1
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.seconds += time.perf_counter() - start
+        return wrapper
+
+
+@dataclass
+class LoopResult:
+    config: LoopConfig
+    wall: float
+    probes: Dict[str, Probe] = field(default_factory=dict)
+    git_spawns: int = 0
+
+    @property
+    def simulated(self) -> float:
+        """Time inside Claude and gh, including their simulated latency."""
+        return self.probes["claude"].seconds + self.probes["gh"].seconds
+
+    @property
+    def overhead_per_task(self) -> float:
+        return max(self.wall - self.simulated, 0.0) / self.config.tasks
+
+    def per_task(self, name: str) -> float:
+        return self.probes[name].count / self.config.tasks
+
+
+class _LatentGitHubClient:
+    """Proxy that delays every gh call; CI waits use the CI latency."""
+
+    def __init__(self, inner, gh_latency, ci_latency, probe):
+        self._inner = inner
+        self._gh_latency = gh_latency
+        self._ci_latency = ci_latency
+        self._probe = probe
+
+    def __getattr__(self, name):
+        attr = getattr(self._inner, name)
+        if not callable(attr):
+            return attr
+        latency = self._ci_latency if name == "wait_for_workflow_completion" else self._gh_latency
+
+        def delayed(*args, **kwargs):
+            if latency:
+                time.sleep(latency)
+            return attr(*args, **kwargs)
+        return self._probe.wrap(delayed)
+
+
+def complete_next_task(plan_path: str) -> None:
+    """Mark the first open task of the plan complete, as Claude would."""
+    with open(plan_path, encoding="utf-8") as f:
+        plan = parse(f.read())
+    next_task = plan.get_next_task()
+    plan.mark_task_complete(next_task.number.thread, next_task.number.task)
+    atomic_write(plan_path, plan.to_text())
+
+
+def _git(repo_dir, *args):
+    subprocess.run(["git", *args], cwd=repo_dir, check=True, capture_output=True)
+
+
+def _init_real_repo(root: Path, repo_dir: Path) -> GitRepository:
+    origin = root / "origin.git"
+    _git(root, "init", "-q", "--bare", str(origin))
+    _git(repo_dir, "init", "-q", "-b", BRANCH)
+    _git(repo_dir, "config", "user.name", "Bench")
+    _git(repo_dir, "config", "user.email", "bench@example.com")
+    _git(repo_dir, "remote", "add", "origin", ORIGIN_URL)
+    _git(repo_dir, "config", f"url.{origin}.insteadOf", ORIGIN_URL)
+    _git(repo_dir, "add", "-A")
+    _git(repo_dir, "commit", "-q", "-m", "Initial plan")
+    return GitRepository(Repo(str(repo_dir)), gh_client=None)
+
+
+def _mock_claude_script(root: Path, plan_path: str, latency: float) -> str:
+    """Write a mock-claude script that completes the next task and commits."""
+    project_root = Path(__file__).resolve().parent.parent
+    script = root / "mock-claude.sh"
+    script.write_text(textwrap.dedent(f"""\
+        #!/usr/bin/env bash
+        set -e
+        sleep {latency}
+        PYTHONPATH={shlex.quote(f"{project_root}:{project_root / 'src'}")}${{PYTHONPATH:+:$PYTHONPATH}} \\
+            {shlex.quote(sys.executable)} \\
+            -c 'import sys; from benchmarks.implement_loop import complete_next_task; complete_next_task(sys.argv[1])' \\
+            {shlex.quote(plan_path)}
+        git commit -q -am "$1"
+        echo '{{"type": "result", "result": "<SUCCESS>"}}'
+        """))
+    script.chmod(0o755)
+    return str(script)
+
+
+class _FakeClaudeWork:
+    """FakeClaudeRunner side effect: wait, complete the next task, commit."""
+
+    def __init__(self, runner, git_repo, plan_path, latency, real_git):
+        self._runner = runner
+        self._git_repo = git_repo
+        self._plan_path = plan_path
+        self._latency = latency
+        self._real_git = real_git
+        self._commits = 0
+
+    def __call__(self):
+        if self._latency:
+            time.sleep(self._latency)
+        complete_next_task(self._plan_path)
+        self._commits += 1
+        if self._real_git:
+            _git(self._git_repo.working_tree_dir, "commit", "-q", "-am", f"Task {self._commits}")
+        else:
+            self._git_repo.set_head_sha(f"sha{self._commits:06d}")
+        self._runner.set_side_effect(self)
+        self._runner.set_result(ClaudeResult(returncode=0, output=CapturedOutput("<SUCCESS>")))
+
+
+def run_loop(config: LoopConfig) -> LoopResult:
+    """Run one mode over a fresh synthetic plan and return its measurements."""
+    if "claude" in config.real and "git" not in config.real:
+        raise ValueError("a real claude backend needs a real git backend")
+    probes = {name: Probe() for name in ("claude", "gh", "plan_parse", "state_save", "git")}
+
+    with tempfile.TemporaryDirectory(prefix="i2code-bench-") as tmp:
+        root = Path(tmp)
+        repo_dir = root / "repo"
+        idea_dir = repo_dir / "docs" / "ideas" / IDEA_NAME
+        idea_dir.mkdir(parents=True)
+        plan_path = str(idea_dir / f"{IDEA_NAME}-plan.md")
+        Path(plan_path).write_text(synthetic_plan(config.tasks, completed=0), encoding="utf-8")
+        workflows = repo_dir / ".github" / "workflows"
+        workflows.mkdir(parents=True)
+        (workflows / "ci.yml").write_text("name: CI\n", encoding="utf-8")
+
+        gh = _LatentGitHubClient(FakeGitHubClient(), config.gh_latency, config.ci_latency, probes["gh"])
+        if "git" in config.real:
+            git_repo = _init_real_repo(root, repo_dir)
+            git_repo._gh_client = gh
+        else:
+            git_repo = FakeGitRepository(working_tree_dir=str(repo_dir), gh_client=gh)
+        git_repo.branch = BRANCH
+
+        opts = ImplementOpts(idea_directory=str(idea_dir))
+        if "claude" in config.real:
+            opts.mock_claude = _mock_claude_script(root, plan_path, config.claude_latency)
+            claude_runner = ClaudeRunner(interactive=False)
+        else:
+            claude_runner = FakeClaudeRunner()
+            claude_runner.set_side_effect(_FakeClaudeWork(
+                claude_runner, git_repo, plan_path, config.claude_latency, "git" in config.real,
+            ))
+        claude_runner.execute = probes["claude"].wrap(claude_runner.execute)
+
+        if "state" in config.real:
+            state = WorkflowState.load(str(root / "state.json"))
+        else:
+            state = FakeWorkflowState()
+        state.save = probes["state_save"].wrap(state.save)
+
+        factory = ModeFactory(
+            opts=opts,
+            claude_runner=claude_runner,
+            build_fixer_factory=GithubActionsBuildFixerFactory(opts=opts, claude_runner=claude_runner),
+        )
+        project = IdeaProject(str(idea_dir))
+        if config.mode == "worktree":
+            loop = factory.make_worktree_mode(git_repo=git_repo, state=state, work_project=project)
+        else:
+            loop = factory.make_trunk_mode(git_repo=git_repo, project=project)
+
+        return _measure(config, loop, git_repo, repo_dir, probes)
+
+
+def _measure(config, loop, git_repo, repo_dir, probes) -> LoopResult:
+    output = io.StringIO()
+    previous_cwd = os.getcwd()
+    process_stats.reset()
+    with contextlib.ExitStack() as stack:
+        for module in (plan_file_io, commit_recovery):
+            stack.enter_context(mock.patch.object(module, "parse", probes["plan_parse"].wrap(module.parse)))
+        stack.enter_context(contextlib.redirect_stdout(output))
+        stack.enter_context(contextlib.redirect_stderr(output))
+        os.chdir(repo_dir)
+        start = time.perf_counter()
+        try:
+            loop.execute()
+        except SystemExit as e:
+            raise RuntimeError(f"{config.label} exited with {e.code}:\n{output.getvalue()}") from e
+        finally:
+            wall = time.perf_counter() - start
+            os.chdir(previous_cwd)
+
+    result = LoopResult(config=config, wall=wall, probes=probes)
+    if "git" in config.real:
+        git_records = [r for r in process_stats.records if r.program == "git"]
+        probes["git"].count = len(git_records)
+        probes["git"].seconds = sum(r.duration for r in git_records)
+    else:
+        probes["git"].count = len(git_repo.calls)
+    return result
+
+
+def matrix_configs(base: LoopConfig) -> List[LoopConfig]:
+    """All fakes, each backend real on its own, then everything real."""
+    variants = [frozenset(), frozenset({"git"}), frozenset({"git", "claude"}), frozenset(BACKENDS)]
+    if base.mode == "worktree":
+        variants.insert(1, frozenset({"state"}))
+    configs = []
+    for real in variants:
+        if base.mode == "trunk":
+            real = real - {"state"}
+        config = LoopConfig(base.mode, base.tasks, real, base.claude_latency, base.ci_latency, base.gh_latency)
+        if config not in configs:
+            configs.append(config)
+    return configs
+
+
+def format_results(results: List[LoopResult]) -> str:
+    reference: Dict[str, float] = {}
+    header = (f"{'Config':<30} {'Wall':>9} {'Overhead/task':>14} {'vs fakes':>9}"
+              f" {'Parses/task':>12} {'Git/task':>9} {'Saves/task':>11} {'gh/task':>8}")
+    lines = [header, "-" * len(header)]
+    for result in results:
+        overhead = result.overhead_per_task
+        base = reference.setdefault(result.config.mode, overhead)
+        lines.append(
+            f"{result.config.label:<30} {format_seconds(result.wall):>9}"
+            f" {format_seconds(overhead):>14} {format_seconds(overhead - base):>9}"
+            f" {result.per_task('plan_parse'):>12.1f} {result.per_task('git'):>9.1f}"
+            f" {result.per_task('state_save'):>11.1f} {result.per_task('gh'):>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def _parse_real(value: str) -> FrozenSet[str]:
+    real = frozenset(name.strip() for name in value.split(",") if name.strip())
+    unknown = real - set(BACKENDS)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown backend(s): {', '.join(sorted(unknown))}")
+    return real
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", default=",".join(MODES),
+                        help="Comma-separated modes to run: worktree, trunk (default: both)")
+    parser.add_argument("--tasks", type=int, default=10, help="Tasks in the synthetic plan (default: 10)")
+    parser.add_argument("--real", type=_parse_real, default=frozenset(),
+                        help=f"Comma-separated backends to use for real: {', '.join(BACKENDS)}")
+    parser.add_argument("--matrix", action="store_true",
+                        help="Run all fakes, each backend real in turn, then all real")
+    parser.add_argument("--claude-latency", type=float, default=0.0, help="Seconds per simulated Claude run")
+    parser.add_argument("--ci-latency", type=float, default=0.0, help="Seconds per simulated CI wait")
+    parser.add_argument("--gh-latency", type=float, default=0.0, help="Seconds per simulated gh call")
+    args = parser.parse_args(argv)
+
+    results = []
+    for mode in [m.strip() for m in args.mode.split(",") if m.strip()]:
+        if mode not in MODES:
+            parser.error(f"unknown mode: {mode}")
+        real = args.real - {"state"} if mode == "trunk" else args.real
+        base = LoopConfig(mode, args.tasks, real, args.claude_latency, args.ci_latency, args.gh_latency)
+        for config in (matrix_configs(base) if args.matrix else [base]):
+            results.append(run_loop(config))
+    print(format_results(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""Benchmarks for plan_domain parsing and mutation on synthetic plans.
+
+    python -m benchmarks.plan_domain                   # run, print results
+    python -m benchmarks.plan_domain --compare         # fail on regression
+    python -m benchmarks.plan_domain --save-baseline   # record new baseline
+
+Plans have TASKS_PER_THREAD tasks per thread with every task but the last
+completed, so get_next_task and task_progress scan the whole plan.
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from benchmarks.harness import BASELINES_DIR, Case, add_baseline_arguments, finish, run_cases
+from i2code.plan_domain.parser import parse
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+TASKS_PER_THREAD = 10
+STEPS_PER_TASK = 3
+BASELINE_PATH = BASELINES_DIR / "plan_domain.json"
+
+
+def synthetic_plan(task_count: int, completed: Optional[int] = None) -> str:
+    """Return plan markdown with task_count tasks, the first completed done.
+
+    completed defaults to all but the last task.
+    """
+    if completed is None:
+        completed = task_count - 1
+    lines = [
+        "# Implementation Plan: Benchmark Plan",
+        "",
+        "## Idea Type",
+        "**A. Feature** - Synthetic benchmark plan",
+        "",
+        "---",
+        "",
+        "## Overview",
+        "A generated plan used to measure plan_domain performance.",
+        "",
+        "---",
+        "",
+    ]
+    thread_count = -(-task_count // TASKS_PER_THREAD)
+    written = 0
+    for thread_num in range(1, thread_count + 1):
+        lines += [f"## Steel Thread {thread_num}: Thread {thread_num}", "Introduction.", ""]
+        for task_num in range(1, TASKS_PER_THREAD + 1):
+            if written == task_count:
+                break
+            written += 1
+            mark = "x" if written <= completed else " "
+            lines += [
+                f"- [{mark}] **Task {thread_num}.{task_num}: Task number {written}**",
+                "  - TaskType: OUTCOME",
+                f"  - Entrypoint: `uv run pytest tests/test_{written}.py`",
+                "  - Observable: The behaviour works",
+                f"  - Evidence: `pytest tests/test_{written}.py passes`",
+                "  - Steps:",
+            ]
+            lines += [f"    - [{mark}] Step {step}" for step in range(1, STEPS_PER_TASK + 1)]
+        lines.append("")
+    lines += ["---", "", "## Change History", "- Generated"]
+    return "\n".join(lines)
+
+
+def _last_thread(plan):
+    return len(plan.threads)
+
+
+def _last_task(plan):
+    return len(plan.threads[-1].tasks)
+
+
+def cases_for_size(task_count: int) -> List[Case]:
+    text = synthetic_plan(task_count)
+
+    def parsed():
+        return parse(text)
+
+    def mark_last_complete(plan):
+        plan.mark_task_complete(_last_thread(plan), _last_task(plan))
+
+    def reverse_last_thread(plan):
+        plan.reorder_tasks(_last_thread(plan), list(range(_last_task(plan), 0, -1)))
+
+    def move_last_to_front(plan):
+        plan.move_task_before(_last_thread(plan), _last_task(plan), 1)
+
+    operations = [
+        Case("parse", lambda: text, parse),
+        Case("to_text", parsed, lambda plan: plan.to_text()),
+        Case("get_next_task", parsed, lambda plan: plan.get_next_task()),
+        Case("task_progress", parsed, lambda plan: plan.task_progress()),
+        Case("mark_task_complete", parsed, mark_last_complete),
+        Case("reorder_tasks", parsed, reverse_last_thread),
+        Case("move_task_before", parsed, move_last_to_front),
+    ]
+    return [Case(f"{case.name}[{task_count}]", case.setup, case.run) for case in operations]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="Comma-separated plan sizes in tasks (default: 10,100,1000,10000)")
+    add_baseline_arguments(parser)
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    cases = [case for size in sizes for case in cases_for_size(size)]
+    results = run_cases(cases)
+    return finish(args, results, args.baseline or BASELINE_PATH)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,8 @@ from i2code.improve.cli import improve
 from i2code.plan.cli import plan
 from i2code.setup_cmd.cli import setup_group
 from i2code.spec_cmd.cli import spec
+from i2code.trace.cli import trace
+from i2code.trace.processes import process_stats
 from i2code.tracking.cli import tracking
 
 
@@ -27,12 +29,22 @@ def _init_sdkman():
         os.environ["PATH"] = os.pathsep.join(bins) + os.pathsep + os.environ.get("PATH", "")
 
 
+def _print_process_stats():
+    click.echo("\nSubprocess stats:", err=True)
+    click.echo(process_stats.format(), err=True)
+
+
 @click.group()
 @click.option("--with-sdkman", is_flag=True, help="Add SDKMAN-installed tools to PATH")
-def main(with_sdkman):
+@click.option("--stats", is_flag=True,
+              help="Print counts and timings of spawned git/gh/claude processes on exit")
+@click.pass_context
+def main(ctx, with_sdkman, stats):
     """i2code - Idea to Code development workflow tools."""
     if with_sdkman:
         _init_sdkman()
+    if stats:
+        ctx.call_on_close(_print_process_stats)
 
 
 main.add_command(plan)
@@ -44,5 +56,6 @@ main.add_command(improve)
 main.add_command(scaffold_cmd)
 main.add_command(setup_group)
 main.add_command(tracking)
+main.add_command(trace)
 main.add_command(go_cmd)
 main.add_command(completion)
@@ -0,0 +1,60 @@
+"""Console-script entry point for i2code.
+
+Shell completion re-runs ``i2code`` on every TAB press.  Importing the full
+CLI pulls in every subcommand module (GitPython, Jinja2, the implement
+machinery), which dominates completion latency.  Completing an idea name
+for ``i2code idea state`` only needs the completion cache, so that case is
+answered here before the full CLI is imported.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import click
+from click.shell_completion import get_completion_class
+
+from i2code.idea.completion_cache import idea_name_completions
+
+PROG_NAME = "i2code"
+COMPLETE_VAR = "_I2CODE_COMPLETE"
+
+_FAST_COMPLETION_COMMANDS = (["idea", "state"],)
+
+
+def fast_complete(instruction: str | None) -> str | None:
+    """Answer a completion request without loading the full CLI.
+
+    Returns the formatted completion output, or None if the request is not
+    one the fast path handles and must go through the full CLI.
+    """
+    if not instruction:
+        return None
+    shell, _, action = instruction.partition("_")
+    if action != "complete":
+        return None
+    comp_cls = get_completion_class(shell)
+    if comp_cls is None:
+        return None
+    comp = comp_cls(cli=None, ctx_args={}, prog_name=PROG_NAME, complete_var=COMPLETE_VAR)  # type: ignore[arg-type]
+    try:
+        args, incomplete = comp.get_completion_args()
+    except (KeyError, ValueError):
+        return None
+    if args not in _FAST_COMPLETION_COMMANDS or incomplete.startswith("-"):
+        return None
+    items = idea_name_completions(incomplete, Path.cwd())
+    return "\n".join(comp.format_completion(item) for item in items)
+
+
+def main():
+    """Run i2code, short-circuiting idea-name completion requests."""
+    output = fast_complete(os.environ.get(COMPLETE_VAR))
+    if output is not None:
+        if output:
+            click.echo(output)
+        sys.exit(0)
+    # Deferred so completion requests answered above never load the full CLI.
+    from i2code.cli import main as cli_main  # noqa: PLC0415
+
+    cli_main()
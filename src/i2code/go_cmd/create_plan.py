@@ -1,10 +1,12 @@
 """Create implementation plan via Claude with validation and auto-repair."""
 
 import sys
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, replace
 from typing import Callable
 
 from i2code.claude.permissions import build_read_only_tools_flag
+from i2code.go_cmd.plan_validator import IncrementalPlanValidator
 from i2code.implement.claude_runner import ClaudeCodeCommand, ClaudeResult
 from i2code.implement.idea_project import IdeaProject
 
@@ -17,17 +19,102 @@ class PlanServices:
     plugin_skills_fn: Callable
     validator_fn: Callable
 
-def _generate_plan(project, claude_runner, rendered_prompt, *, repo_root=None):
-    """Invoke Claude in batch mode to generate the plan."""
+def _plan_command(project, rendered_prompt, *, repo_root=None):
+    """Build the batch-mode Claude command that generates a plan."""
     cwd = repo_root if repo_root is not None else project.directory
     allowed_tools = build_read_only_tools_flag(repo_root) if repo_root is not None else None
-    command = ClaudeCodeCommand(
+    return ClaudeCodeCommand(
         prompt=rendered_prompt,
         cwd=cwd,
         interactive=False,
         allowed_tools=allowed_tools,
     )
-    return claude_runner.execute(command)
+
+
+def _generate_plan(project, claude_runner, rendered_prompt, *, repo_root=None):
+    """Invoke Claude in batch mode to generate the plan."""
+    command = _plan_command(project, rendered_prompt, repo_root=repo_root)
+    return _execute_streaming(claude_runner, command)
+
+
+def _execute_streaming(claude_runner, command):
+    """Run command with text deltas streamed to a PlanStreamMonitor."""
+    streaming = replace(command, extra_args=[*command.extra_args, "--include-partial-messages"])
+    return claude_runner.execute(streaming, on_message=PlanStreamMonitor().on_message)
+
+
+class PlanStreamMonitor:
+    """Validate plan text while Claude streams it and report problems early.
+
+    Feeds assistant text deltas (or whole assistant messages, when partial
+    messages are not streamed) into an IncrementalPlanValidator, restarting
+    with each new assistant message so only the final message -- the plan --
+    is judged.  Diagnostics are printed to stderr as soon as they are found.
+    """
+
+    def __init__(self):
+        self._validator = IncrementalPlanValidator()
+        self._saw_delta = False
+
+    @property
+    def diagnostics(self):
+        return self._validator.diagnostics
+
+    def on_message(self, msg) -> bool:
+        msg_type = msg.get("type")
+        if msg_type == "stream_event":
+            self._on_stream_event(msg.get("event") or {})
+        elif msg_type == "assistant" and not self._saw_delta:
+            self._restart()
+            self._report(self._validator.feed(_assistant_text(msg)))
+        elif msg_type == "result":
+            self._report(self._validator.finish())
+        return False
+
+    def _on_stream_event(self, event):
+        if event.get("type") == "message_start":
+            self._restart()
+        elif event.get("type") == "content_block_delta":
+            delta = event.get("delta") or {}
+            if delta.get("type") == "text_delta":
+                self._saw_delta = True
+                self._report(self._validator.feed(delta.get("text", "")))
+
+    def _restart(self):
+        self._validator = IncrementalPlanValidator()
+
+    @staticmethod
+    def _report(diagnostics):
+        for diagnostic in diagnostics:
+            print(
+                f"PLAN_STREAM_DIAGNOSTIC: line {diagnostic.line} "
+                f"[{diagnostic.rule}] {diagnostic.message}",
+                file=sys.stderr,
+            )
+
+
+def _assistant_text(msg):
+    """Concatenate the text blocks of a stream-json assistant message."""
+    content = (msg.get("message") or {}).get("content") or []
+    return "".join(
+        block.get("text", "") for block in content
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
+
+
+def prepare_plan_command(project: IdeaProject, services: PlanServices, *, repo_root: str | None = None) -> ClaudeCodeCommand:
+    """Enumerate plugin skills and render the plan-generation command.
+
+    Does not validate the idea or spec files, so it is safe to run
+    speculatively in the background before the user picks the step.
+    """
+    skills = services.plugin_skills_fn()
+    rendered_prompt = services.template_renderer("create-implementation-plan.md", {
+        "IDEA_FILE": project.idea_file,
+        "SPEC_FILE": project.spec_file,
+        "PLAN_SKILLS": skills,
+    })
+    return _plan_command(project, rendered_prompt, repo_root=repo_root)
 
 
 def _build_repair_prompt(template_renderer, plan_text, errors):
@@ -38,9 +125,61 @@ def _build_repair_prompt(template_renderer, plan_text, errors):
         "PLAN_TEXT": plan_text,
     })
 
+CANDIDATE_POLL_INTERVAL = 0.5
+
 
+def _generate_best_of_n(claude_runner, command, validator_fn, candidates):
+    """Run candidate generations concurrently and keep the first valid plan.
 
-def create_plan(project: IdeaProject, claude_runner, services: PlanServices, *, repo_root: str | None = None) -> ClaudeResult:
+    Each candidate is a separate Claude process started via
+    claude_runner.start.  Candidates are validated as they finish; the
+    first valid one wins and the rest are terminated.  If none is valid,
+    returns the candidate with the fewest validation errors.
+
+    Returns:
+        (result, is_valid, errors) for the chosen candidate
+    """
+    print(f"Generating {candidates} plan candidates in parallel", file=sys.stderr)
+    pending = {index: claude_runner.start(command) for index in range(1, candidates + 1)}
+    failures = []
+    try:
+        while pending:
+            for index, process in list(pending.items()):
+                result = process.poll()
+                if result is None:
+                    continue
+                del pending[index]
+                is_valid, errors = validator_fn(result.result_text)
+                if is_valid:
+                    print(f"Plan candidate {index} is valid", file=sys.stderr)
+                    return result, True, []
+                _print_candidate_failure(index, errors)
+                failures.append((result, errors))
+            if pending:
+                time.sleep(CANDIDATE_POLL_INTERVAL)
+    finally:
+        for process in pending.values():
+            process.terminate()
+    result, errors = min(failures, key=lambda failure: len(failure[1]))
+    return result, False, errors
+
+
+def _print_candidate_failure(index, errors):
+    """Report which validation checks a plan candidate failed."""
+    print(f"Plan candidate {index} failed {len(errors)} check(s):", file=sys.stderr)
+    for error in errors:
+        print(f"  PLAN_VALIDATION_ERROR: {error}", file=sys.stderr)
+
+
+def create_plan(
+    project: IdeaProject,
+    claude_runner,
+    services: PlanServices,
+    *,
+    repo_root: str | None = None,
+    prepared: ClaudeCodeCommand | None = None,
+    candidates: int = 1,
+) -> ClaudeResult:
     """Generate an implementation plan, validate it, and auto-repair if needed.
 
     Validates idea and spec exist, enumerates plugin skills, renders the
@@ -53,6 +192,11 @@ def create_plan(project: IdeaProject, claude_runner, services: PlanServices, *,
         claude_runner: ClaudeRunner instance for invoking Claude
         services: PlanServices bundling template_renderer, plugin_skills_fn,
             and validator_fn callables
+        prepared: Generation command from prepare_plan_command, if it was
+            already built in the background
+        candidates: Number of plan generations to run concurrently. The
+            first valid candidate is used; if none is valid, the one with
+            the fewest errors goes through the repair pass.
 
     Raises:
         SystemExit: If idea/spec missing or plan invalid after repair
@@ -60,20 +204,23 @@ def create_plan(project: IdeaProject, claude_runner, services: PlanServices, *,
     project.validate_idea()
     project.validate_spec()
 
-    skills = services.plugin_skills_fn()
-    rendered_prompt = services.template_renderer("create-implementation-plan.md", {
-        "IDEA_FILE": project.idea_file,
-        "SPEC_FILE": project.spec_file,
-        "PLAN_SKILLS": skills,
-    })
+    if prepared is None:
+        prepared = prepare_plan_command(project, services, repo_root=repo_root)
 
     print("Generate plan", file=sys.stderr)
-    result = _generate_plan(project, claude_runner, rendered_prompt, repo_root=repo_root)
-    plan_text = result.result_text
+    if candidates > 1:
+        result, is_valid, errors = _generate_best_of_n(
+            claude_runner, prepared, services.validator_fn, candidates,
+        )
+        plan_text = result.result_text
+    else:
+        result = _execute_streaming(claude_runner, prepared)
+        plan_text = result.result_text
+        is_valid, errors = services.validator_fn(plan_text)
+        if not is_valid:
+            _print_validation_errors(errors)
 
-    is_valid, errors = services.validator_fn(plan_text)
     if not is_valid:
-        _print_validation_errors(errors)
         print("Attempting one automatic repair pass...", file=sys.stderr)
         repair_prompt = _build_repair_prompt(services.template_renderer, plan_text, errors)
         result = _generate_plan(project, claude_runner, repair_prompt, repo_root=repo_root)
@@ -92,7 +92,11 @@ def build_implement_label(config_path):
 
     Shows the i2code implement command with flags when config exists.
     """
-    config = read_implement_config(config_path)
+    return build_implement_label_for_config(read_implement_config(config_path))
+
+
+def build_implement_label_for_config(config):
+    """Build the implement menu label from an already-read config (or None)."""
     if config is not None:
         flags = build_implement_flags(config)
     else:
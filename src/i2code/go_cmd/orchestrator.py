@@ -1,8 +1,5 @@
 """Workflow orchestrator: detects state, presents menus, dispatches steps."""
 
-import glob
-import os
-import subprocess
 import sys
 from dataclasses import dataclass, field
 from enum import Enum
@@ -10,10 +7,10 @@ from typing import Callable, Protocol, TextIO
 
 from pathlib import Path
 
-from i2code.go_cmd.create_plan import PlanServices, create_plan
+from i2code.go_cmd.create_plan import PlanServices, create_plan, prepare_plan_command
 from i2code.go_cmd.implement_config import (
     build_implement_flags,
-    build_implement_label,
+    build_implement_label_for_config,
     prompt_implement_config,
     read_implement_config,
     write_implement_config,
@@ -24,16 +21,18 @@ from i2code.go_cmd.plan_completion import (
 )
 from i2code.go_cmd.plan_validator import validate_plan
 from i2code.go_cmd.plugin_skills import list_plugin_skills
+from i2code.go_cmd.project_snapshot import ProjectSnapshot
 from i2code.go_cmd.revise_plan import revise_plan
+from i2code.go_cmd.step_prefetch import PreparableStep, StepPrefetcher
 from i2code.idea_cmd.brainstorm import brainstorm_idea
 from i2code.idea_cmd.state_cmd import execute_transition
-from i2code.idea.metadata import read_metadata
 from i2code.implement.claude_runner import ClaudeResult, ClaudeRunner
 from i2code.implement.idea_project import IdeaProject
 from i2code.plan_domain.parser import parse
-from i2code.spec_cmd.create_spec import create_spec
+from i2code.spec_cmd.create_spec import create_spec, prepare_spec_command
 from i2code.spec_cmd.revise_spec import revise_spec
 from i2code.template_renderer import render_template
+from i2code.trace.processes import run_command
 
 
 class StepFn(Protocol):
@@ -135,12 +134,12 @@ _MENU_DEFAULTS = {
 
 
 def _default_git_runner(cmd, **kwargs):
-    return subprocess.run(cmd, **kwargs)
+    return run_command(cmd, **kwargs)
 
 
 def _default_implement_runner(flags, directory):
     cmd = ["i2code", "implement"] + flags + [directory]
-    return subprocess.run(cmd)
+    return run_command(cmd)
 
 
 def _default_brainstorm_idea(project):
@@ -148,9 +147,17 @@ def _default_brainstorm_idea(project):
     return brainstorm_idea(project, ClaudeRunner(), repo_root=repo_root)
 
 
-def _default_create_spec(project):
+def _prepare_create_spec(project):
     repo_root = str(_git_root_from_path(project.directory))
-    return create_spec(project, ClaudeRunner(), repo_root=repo_root)
+    return prepare_spec_command(project, repo_root=repo_root)
+
+
+def _run_create_spec(project, prepared):
+    repo_root = str(_git_root_from_path(project.directory))
+    return create_spec(project, ClaudeRunner(), repo_root=repo_root, prepared=prepared)
+
+
+_default_create_spec = PreparableStep(prepare=_prepare_create_spec, run=_run_create_spec)
 
 
 def _default_revise_spec(project):
@@ -158,15 +165,28 @@ def _default_revise_spec(project):
     return revise_spec(project, ClaudeRunner(), repo_root=repo_root)
 
 
-def _default_create_plan(project):
-    repo_root = str(_git_root_from_path(project.directory))
-    runner = ClaudeRunner()
-    services = PlanServices(
+def _default_plan_services():
+    return PlanServices(
         template_renderer=render_template,
         plugin_skills_fn=list_plugin_skills,
         validator_fn=validate_plan,
     )
-    return create_plan(project, runner, services, repo_root=repo_root)
+
+
+def _prepare_create_plan(project):
+    repo_root = str(_git_root_from_path(project.directory))
+    return prepare_plan_command(project, _default_plan_services(), repo_root=repo_root)
+
+
+def _run_create_plan(project, prepared):
+    repo_root = str(_git_root_from_path(project.directory))
+    return create_plan(
+        project, ClaudeRunner(), _default_plan_services(),
+        repo_root=repo_root, prepared=prepared,
+    )
+
+
+_default_create_plan = PreparableStep(prepare=_prepare_create_plan, run=_run_create_plan)
 
 
 def _default_revise_plan(project):
@@ -207,17 +227,19 @@ class Orchestrator:
                 menu_config=kwargs.get("menu_config") or MenuConfig(),
                 **dep_overrides,
             )
+        self._prefetcher = StepPrefetcher()
 
-    def detect_state(self) -> WorkflowState:
-        project = self._project
-        idea_pattern = os.path.join(
-            project.directory, f"{project.name}-idea.*"
-        )
-        if not glob.glob(idea_pattern):
+    def take_snapshot(self) -> ProjectSnapshot:
+        return ProjectSnapshot.capture(self._project, self._deps.git_runner)
+
+    def detect_state(self, snapshot: ProjectSnapshot | None = None) -> WorkflowState:
+        if snapshot is None:
+            snapshot = self.take_snapshot()
+        if not snapshot.has_idea_file:
             return WorkflowState.NO_IDEA
-        if not os.path.isfile(project.spec_file):
+        if not snapshot.has_spec_file:
             return WorkflowState.HAS_IDEA_NO_SPEC
-        if not os.path.isfile(project.plan_file):
+        if not snapshot.has_plan_file:
             return WorkflowState.HAS_SPEC
         return WorkflowState.HAS_PLAN
 
@@ -232,6 +254,8 @@ class Orchestrator:
             print("", file=self._deps.output)
             print("Workflow interrupted.", file=self._deps.output)
             sys.exit(130)
+        finally:
+            self._prefetcher.shutdown()
 
     def _main_loop(self):
         dispatchers = {
@@ -241,38 +265,43 @@ class Orchestrator:
             WorkflowState.HAS_PLAN: self._dispatch_has_plan,
         }
         while True:
-            state = self.detect_state()
-            if not dispatchers[state](state):
+            snapshot = self.take_snapshot()
+            state = self.detect_state(snapshot)
+            if not dispatchers[state](state, snapshot):
                 return
 
-    def _dispatch_no_idea(self, _state):
+    def _dispatch_no_idea(self, _state, _snapshot):
         desc, script = _STEP_DISPATCH[WorkflowState.NO_IDEA][1]
         self._run_step_with_retry(desc, script)
         return True
 
-    def _dispatch_with_menu(self, state):
+    def _dispatch_with_menu(self, state, _snapshot):
         options = self.menu_options_for(state)
         prompt = _MENU_PROMPTS[state].format(name=self._project.name)
+        default = _MENU_DEFAULTS.get(state, 1)
+        dispatch = _STEP_DISPATCH.get(state, {})
+        if default in dispatch:
+            self._prefetch_step(dispatch[default][1])
         choice = get_user_choice(
-            prompt, _MENU_DEFAULTS.get(state, 1),
+            prompt, default,
             options, config=self._deps.menu_config,
         )
         if options[choice - 1] == "Exit":
+            self._prefetcher.discard()
             return False
-        dispatch = _STEP_DISPATCH.get(state, {})
         if choice in dispatch:
             desc, script = dispatch[choice]
             self._run_step_with_retry(desc, script)
         return True
 
-    def _dispatch_has_plan(self, _state):
-        options, lifecycle_state = self._build_has_plan_options()
+    def _dispatch_has_plan(self, _state, snapshot):
+        options = self._build_has_plan_options(snapshot)
         prompt = _MENU_PROMPTS[WorkflowState.HAS_PLAN].format(
             name=self._project.name,
         )
         choice = get_user_choice(
             prompt,
-            self._lifecycle_default(options, lifecycle_state), options,
+            self._lifecycle_default(options, snapshot), options,
             config=self._deps.menu_config,
         )
         return self._handle_has_plan_choice(options[choice - 1])
@@ -300,45 +329,35 @@ class Orchestrator:
         message = self._deps.transition_fn(name, old_path, new_state, git_root)
         print(message, file=self._deps.output)
 
-    def _read_lifecycle_state(self):
-        metadata_path = Path(self._project.metadata_file)
-        if not metadata_path.is_file():
-            return None
-        try:
-            metadata = read_metadata(metadata_path)
-        except (OSError, ValueError):
-            return None
-        return metadata.get("state")
-
     def _lifecycle_move_label(self, state):
         if state is None:
             return None
         return _LIFECYCLE_MOVE_OPTIONS.get(state)
 
-    def _build_has_plan_options(self):
-        config_path = self._project.implement_config_file
-        lifecycle_state = self._read_lifecycle_state()
+    def _build_has_plan_options(self, snapshot):
         options = [REVISE_PLAN]
-        options.append(self._configure_implement_label())
-        move_label = self._lifecycle_move_label(lifecycle_state)
+        options.append(self._configure_implement_label(snapshot))
+        move_label = self._lifecycle_move_label(snapshot.lifecycle_state)
         if move_label:
             options.append(move_label)
-        if self._has_uncommitted_changes():
+        if snapshot.has_uncommitted_changes:
             options.append(COMMIT_CHANGES)
-        options.append(build_implement_label(config_path))
+        options.append(build_implement_label_for_config(snapshot.implement_config))
         options.append("Exit")
-        return options, lifecycle_state
+        return options
 
-    def _configure_implement_label(self):
-        if os.path.isfile(self._project.implement_config_file):
+    @staticmethod
+    def _configure_implement_label(snapshot):
+        if snapshot.has_implement_config:
             return REVISE_IMPLEMENT
         return CONFIGURE_IMPLEMENT
 
-    def _lifecycle_default(self, options, state):
+    def _lifecycle_default(self, options, snapshot):
+        state = snapshot.lifecycle_state
         if state == "draft" and MOVE_TO_READY in options:
             return options.index(MOVE_TO_READY) + 1
         if state == "ready":
-            configure_label = self._configure_implement_label()
+            configure_label = self._configure_implement_label(snapshot)
             return options.index(configure_label) + 1
         if state == "wip":
             if COMMIT_CHANGES in options:
@@ -354,13 +373,6 @@ class Orchestrator:
                 return i + 1
         return 2
 
-    def _has_uncommitted_changes(self):
-        result = self._deps.git_runner(
-            ["git", "status", "--porcelain", "--", self._project.directory],
-            capture_output=True, text=True,
-        )
-        return bool(result.stdout.strip())
-
     def _commit_changes(self):
         self._deps.git_runner(
             ["git", "add", self._project.directory],
@@ -457,15 +469,25 @@ class Orchestrator:
         print("", file=self._deps.output)
         return self._run_python_step(step_key)
 
-    def _run_python_step(self, step_key: str) -> ClaudeResult:
-        step_fns = {
+    def _step_fns(self) -> dict[str, StepFn]:
+        return {
             "brainstorm_idea": self._deps.brainstorm_idea_fn,
             "create_spec": self._deps.create_spec_fn,
             "revise_spec": self._deps.revise_spec_fn,
             "create_plan": self._deps.create_plan_fn,
             "revise_plan": self._deps.revise_plan_fn,
         }
-        return step_fns[step_key](self._project)
+
+    def _prefetch_step(self, step_key: str) -> None:
+        """Prepare the step in the background while the menu is displayed."""
+        self._prefetcher.prefetch(step_key, self._step_fns()[step_key], self._project)
+
+    def _run_python_step(self, step_key: str) -> ClaudeResult:
+        step_fn = self._step_fns()[step_key]
+        prepared = self._prefetcher.take(step_key)
+        if prepared is not None and isinstance(step_fn, PreparableStep):
+            return step_fn(self._project, prepared)
+        return step_fn(self._project)
 
     def _handle_error(self):
         choice = get_user_choice(
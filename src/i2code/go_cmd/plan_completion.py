@@ -14,6 +14,7 @@ from typing import Any, Callable, TextIO
 
 from i2code.implement.git_repository import GitRepository
 from i2code.implement.idea_project import IdeaProject
+from i2code.trace.processes import run_command
 
 
 sibling_path = GitRepository._sibling_path
@@ -60,7 +61,7 @@ def derive_origin_owner_repo(git_root: str) -> str:
     (read-only inspection) and accepts both `https://github.com/<owner>/<repo>(.git)`
     and `git@github.com:<owner>/<repo>(.git)` URL forms.
     """
-    result = subprocess.run(
+    result = run_command(
         ["git", "-C", git_root, "remote", "get-url", "origin"],
         capture_output=True, text=True, check=True,
     )
@@ -119,7 +120,7 @@ def _emit_gh_failure(output: TextIO | None, reason: str) -> None:
 
 
 def _default_gh_runner(argv: list[str]) -> subprocess.CompletedProcess:
-    return subprocess.run(argv, capture_output=True, text=True, check=False)
+    return run_command(argv, capture_output=True, text=True, check=False)
 
 
 def resolve_plan_text(
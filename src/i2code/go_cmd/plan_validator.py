@@ -2,35 +2,79 @@
 
 Each task block (``- [ ] **Task X.Y: ...`` or ``- [x] **Task X.Y: ...``)
 must contain TaskType, Entrypoint, Observable, and Evidence fields.
+
+``validate_plan`` checks a complete plan.  ``IncrementalPlanValidator``
+applies the same rules to plan text as it streams in, emitting a
+``PlanDiagnostic`` as soon as each task block is complete.
 """
 
-from i2code.plan_domain.parser import parse
+from dataclasses import dataclass
+
+from i2code.plan_domain.parser import TASK_LINE_RE, THREAD_HEADING_RE, parse
+from i2code.plan_domain.task import Task
 
 _REQUIRED_FIELDS = [
-    ("task_type", "TaskType"),
-    ("entrypoint", "Entrypoint"),
-    ("observable", "Observable"),
-    ("evidence", "Evidence"),
+    ("task_type", "TaskType", "missing-task-type"),
+    ("entrypoint", "Entrypoint", "missing-entrypoint"),
+    ("observable", "Observable", "missing-observable"),
+    ("evidence", "Evidence", "missing-evidence"),
 ]
 
+RULE_NO_STEPS = "no-steps"
+RULE_EMPTY_THREAD = "empty-thread"
+RULE_NO_THREADS = "no-threads"
 
-def _task_errors(thread_num, task_num, task):
-    """Return error messages for missing fields or steps in *task*."""
+
+@dataclass(frozen=True)
+class PlanDiagnostic:
+    """A single validation failure located in the plan text.
+
+    ``line`` is the 1-based line of the offending task or thread heading
+    (0 when the whole plan is at fault).  ``thread`` and ``task`` are
+    1-based positions, as used in the error message.
+    """
+
+    rule: str
+    message: str
+    line: int = 0
+    thread: int | None = None
+    task: int | None = None
+
+
+def _task_diagnostics(thread_num, task_num, task, line=0):
+    """Return diagnostics for missing fields or steps in *task*."""
     task_id = f"Task {thread_num}.{task_num}"
-    errors = [
-        f"Missing {label} in {task_id}"
-        for attr, label in _REQUIRED_FIELDS
+    diagnostics = [
+        PlanDiagnostic(rule, f"Missing {label} in {task_id}", line, thread_num, task_num)
+        for attr, label, rule in _REQUIRED_FIELDS
         if not getattr(task, attr)
     ]
     if not task.steps:
-        errors.append(f"{task_id} must contain at least one step")
-    return errors
+        diagnostics.append(PlanDiagnostic(
+            RULE_NO_STEPS, f"{task_id} must contain at least one step", line, thread_num, task_num,
+        ))
+    return diagnostics
+
+
+def _empty_thread_diagnostic(thread_num, line=0):
+    return PlanDiagnostic(
+        RULE_EMPTY_THREAD, f"Thread {thread_num} must contain at least one task", line, thread_num,
+    )
+
+
+def _no_threads_diagnostic():
+    return PlanDiagnostic(RULE_NO_THREADS, "Plan must contain at least one thread")
+
+
+def _task_errors(thread_num, task_num, task):
+    """Return error messages for missing fields or steps in *task*."""
+    return [d.message for d in _task_diagnostics(thread_num, task_num, task)]
 
 
 def _thread_errors(thread_num, thread):
     """Return error messages for an empty thread or its tasks."""
     if not thread.tasks:
-        return [f"Thread {thread_num} must contain at least one task"]
+        return [_empty_thread_diagnostic(thread_num).message]
     errors = []
     for task_num, task in enumerate(thread.tasks, 1):
         errors.extend(_task_errors(thread_num, task_num, task))
@@ -45,8 +89,89 @@ def validate_plan(plan_text: str) -> tuple[bool, list[str]]:
     """
     plan = parse(plan_text)
     if not plan.threads:
-        return (False, ["Plan must contain at least one thread"])
+        return (False, [_no_threads_diagnostic().message])
     errors = []
     for thread_num, thread in enumerate(plan.threads, 1):
         errors.extend(_thread_errors(thread_num, thread))
     return (len(errors) == 0, errors)
+
+
+class IncrementalPlanValidator:
+    """Validate plan text fed in arbitrary chunks.
+
+    A task block is checked once the next task, thread heading, or
+    non-thread ``## `` section starts; ``finish`` checks whatever is still
+    open.  Each diagnostic is reported once, as soon as it is known.
+    """
+
+    def __init__(self):
+        self._partial = ""
+        self._line_count = 0
+        self._thread_num = 0
+        self._thread_line = 0
+        self._task_num = 0
+        self._task_lines: list[str] | None = None
+        self._task_line = 0
+        self._in_thread = False
+        self.diagnostics: list[PlanDiagnostic] = []
+
+    def feed(self, text: str) -> list[PlanDiagnostic]:
+        """Consume a chunk of plan text; return diagnostics newly found."""
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        found = []
+        for line in lines:
+            found.extend(self._consume_line(line))
+        self.diagnostics.extend(found)
+        return found
+
+    def finish(self) -> list[PlanDiagnostic]:
+        """Flush the final line and open blocks; return diagnostics newly found."""
+        found = self._consume_line(self._partial) if self._partial else []
+        self._partial = ""
+        found.extend(self._close_thread())
+        if self._thread_num == 0:
+            found.append(_no_threads_diagnostic())
+        self.diagnostics.extend(found)
+        return found
+
+    def _consume_line(self, line: str) -> list[PlanDiagnostic]:
+        self._line_count += 1
+        if THREAD_HEADING_RE.match(line):
+            found = self._close_thread()
+            self._thread_num += 1
+            self._thread_line = self._line_count
+            self._task_num = 0
+            self._in_thread = True
+            return found
+        if not self._in_thread:
+            return []
+        if line.startswith("## "):
+            found = self._close_thread()
+            self._in_thread = False
+            return found
+        if TASK_LINE_RE.match(line):
+            found = self._close_task()
+            self._task_num += 1
+            self._task_lines = [line]
+            self._task_line = self._line_count
+            return found
+        if self._task_lines is not None:
+            self._task_lines.append(line)
+        return []
+
+    def _close_task(self) -> list[PlanDiagnostic]:
+        if self._task_lines is None:
+            return []
+        task = Task(_lines=self._task_lines)
+        self._task_lines = None
+        return _task_diagnostics(self._thread_num, self._task_num, task, self._task_line)
+
+    def _close_thread(self) -> list[PlanDiagnostic]:
+        if not self._in_thread:
+            return []
+        found = self._close_task()
+        if self._task_num == 0:
+            found.append(_empty_thread_diagnostic(self._thread_num, self._thread_line))
+        self._in_thread = False
+        return found
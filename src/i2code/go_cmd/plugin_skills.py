@@ -1,11 +1,18 @@
 """Enumerate installed idea-to-code plugin skills."""
 
+import json
 import os
 import sys
 from pathlib import Path
 
+PLUGIN_NAME = "idea-to-code"
 
-def list_plugin_skills(cache_dir=None):
+# Claude Code lays out its plugin cache as <marketplace>/<plugin>/<version>/skills.
+MAX_SCAN_DEPTH = 4
+_SKIPPED_DIRS = {"node_modules", ".git"}
+
+
+def list_plugin_skills(cache_dir=None, index_file=None):
     """List installed idea-to-code plugin skills as comma-separated names.
 
     Searches cache_dir (or $PLUGIN_CACHE_DIR, default ~/.claude/plugins/cache)
@@ -20,7 +27,7 @@ def list_plugin_skills(cache_dir=None):
         )
 
     cache_path = Path(cache_dir)
-    skills_dir = _find_skills_dir(cache_path)
+    skills_dir = _find_skills_dir(cache_path, index_file)
 
     if skills_dir is None:
         print(f"Warning: idea-to-code plugin not found in {cache_dir}", file=sys.stderr)
@@ -33,13 +40,143 @@ def list_plugin_skills(cache_dir=None):
     return ", ".join(f"idea-to-code:{name}" for name in skill_names)
 
 
-def _find_skills_dir(cache_path):
-    """Find the skills directory under an idea-to-code plugin in cache_path."""
+def default_index_file() -> Path:
+    """Return the file caching the latest scan result."""
+    return Path.home() / ".hitl" / "plugin-skills-cache.json"
+
+
+def _find_skills_dir(cache_path, index_file=None):
+    """Find the skills directory under an idea-to-code plugin in cache_path.
+
+    Tries the installed-plugins manifest first, then a cached scan result,
+    and finally a bounded-depth scan whose result is cached.
+    """
     if not cache_path.is_dir():
         return None
 
-    for path in cache_path.rglob("skills"):
-        if path.is_dir() and "idea-to-code" in str(path):
-            return path
+    skills_dir = _skills_dir_from_manifest(cache_path.parent / "installed_plugins.json")
+    if skills_dir is not None:
+        return skills_dir
+
+    index_path = Path(index_file) if index_file is not None else default_index_file()
+    cache_mtime = _mtime_ns(cache_path)
+    skills_dir = _read_cached_scan(index_path, cache_path, cache_mtime)
+    if skills_dir is not None:
+        return skills_dir
+
+    skills_dir = _scan_for_skills_dir(cache_path)
+    if skills_dir is not None:
+        _write_cached_scan(index_path, cache_path, cache_mtime, skills_dir)
+    return skills_dir
+
 
+def _install_paths(entry):
+    """Yield installPath values from a manifest entry (dict or list of dicts)."""
+    records = entry if isinstance(entry, list) else [entry]
+    for record in records:
+        if isinstance(record, dict) and record.get("installPath"):
+            yield Path(record["installPath"])
+
+
+def _skills_dir_from_manifest(manifest_path):
+    """Return the skills dir of the installed plugin recorded in the manifest."""
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    plugins = manifest.get("plugins") if isinstance(manifest, dict) else None
+    if not isinstance(plugins, dict):
+        return None
+    for key, entry in plugins.items():
+        if key.split("@", 1)[0] != PLUGIN_NAME:
+            continue
+        for install_path in _install_paths(entry):
+            skills_dir = install_path / "skills"
+            if skills_dir.is_dir():
+                return skills_dir
     return None
+
+
+def _scan_for_skills_dir(cache_path):
+    """Scan at most MAX_SCAN_DEPTH levels for an idea-to-code skills directory.
+
+    When several plugin versions are cached, the most recently modified
+    skills directory wins.
+    """
+    candidates = []
+    level = [cache_path]
+    for _ in range(MAX_SCAN_DEPTH):
+        next_level = []
+        for directory in level:
+            next_level.extend(_subdirectories(directory))
+        for path in next_level:
+            if path.name == "skills" and PLUGIN_NAME in str(path.relative_to(cache_path)):
+                candidates.append(path)
+        level = [path for path in next_level if path.name != "skills"]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda path: path.stat().st_mtime_ns)
+
+
+def _subdirectories(directory):
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                Path(entry.path) for entry in entries
+                if entry.is_dir() and entry.name not in _SKIPPED_DIRS
+                and not entry.name.startswith(".")
+            ]
+    except OSError:
+        return []
+
+
+def _mtime_ns(path):
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _plugin_dir(skills_dir):
+    """The idea-to-code plugin directory holding skills_dir's version.
+
+    Installing a new version adds a directory here, several levels below
+    the cache root, so its mtime changes when the root's does not.
+    """
+    for parent in skills_dir.parents:
+        if PLUGIN_NAME in parent.name:
+            return parent
+    return skills_dir.parent
+
+
+def _read_cached_scan(index_path, cache_path, cache_mtime):
+    try:
+        with open(index_path) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("cache_dir") != str(cache_path.resolve()) or entry.get("mtime_ns") != cache_mtime:
+        return None
+    skills_dir = Path(entry.get("skills_dir", ""))
+    if not skills_dir.is_dir() or entry.get("plugin_mtime_ns") != _mtime_ns(_plugin_dir(skills_dir)):
+        return None
+    return skills_dir
+
+
+def _write_cached_scan(index_path, cache_path, cache_mtime, skills_dir):
+    """Record the scan result, replacing any earlier one."""
+    entry = {
+        "cache_dir": str(cache_path.resolve()),
+        "mtime_ns": cache_mtime,
+        "plugin_mtime_ns": _mtime_ns(_plugin_dir(skills_dir)),
+        "skills_dir": str(skills_dir),
+    }
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(index_path, "w") as f:
+            json.dump(entry, f, indent=2)
+    except OSError:
+        pass
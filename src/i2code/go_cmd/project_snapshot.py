@@ -0,0 +1,79 @@
+"""ProjectSnapshot: one-pass view of an idea directory for the orchestrator menu loop."""
+
+import os
+from functools import cached_property
+from typing import Callable
+
+from i2code.go_cmd.implement_config import read_implement_config
+from i2code.idea.metadata import read_metadata
+
+
+def _list_files(directory) -> frozenset[str]:
+    """Return the names of regular files in directory (empty if missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+
+
+class ProjectSnapshot:
+    """Idea directory state captured once per orchestrator loop iteration.
+
+    File presence comes from a single scandir of the idea directory.
+    Metadata and implement config are read only when their files exist,
+    and git status runs at most once, on first access.
+    """
+
+    def __init__(self, project, files: frozenset[str], git_runner: Callable):
+        self._project = project
+        self._files = files
+        self._git_runner = git_runner
+
+    @classmethod
+    def capture(cls, project, git_runner: Callable) -> "ProjectSnapshot":
+        return cls(project, _list_files(project.directory), git_runner)
+
+    def _has(self, path: str) -> bool:
+        return os.path.basename(path) in self._files
+
+    @property
+    def has_idea_file(self) -> bool:
+        prefix = f"{self._project.name}-idea."
+        return any(name.startswith(prefix) for name in self._files)
+
+    @property
+    def has_spec_file(self) -> bool:
+        return self._has(self._project.spec_file)
+
+    @property
+    def has_plan_file(self) -> bool:
+        return self._has(self._project.plan_file)
+
+    @property
+    def has_implement_config(self) -> bool:
+        return self._has(self._project.implement_config_file)
+
+    @cached_property
+    def implement_config(self) -> dict | None:
+        if not self.has_implement_config:
+            return None
+        return read_implement_config(self._project.implement_config_file)
+
+    @cached_property
+    def lifecycle_state(self) -> str | None:
+        if not self._has(self._project.metadata_file):
+            return None
+        try:
+            metadata = read_metadata(self._project.metadata_file)
+        except (OSError, ValueError):
+            return None
+        return metadata.get("state")
+
+    @cached_property
+    def has_uncommitted_changes(self) -> bool:
+        result = self._git_runner(
+            ["git", "status", "--porcelain", "--", self._project.directory],
+            capture_output=True, text=True,
+        )
+        return bool(result.stdout.strip())
@@ -0,0 +1,68 @@
+"""Speculative preparation of the default next step while a menu is displayed."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+
+from i2code.implement.claude_runner import ClaudeCodeCommand, ClaudeResult
+from i2code.implement.idea_project import IdeaProject
+
+
+@dataclass(frozen=True)
+class PreparableStep:
+    """Step function split into a side-effect-free prepare phase and a run phase.
+
+    prepare builds the Claude command (rendered prompt, permission flags,
+    skill list) without validating files or spawning anything, so it can
+    run in the background.  run accepts that command, or None to prepare
+    inline.
+    """
+
+    prepare: Callable[[IdeaProject], ClaudeCodeCommand]
+    run: Callable[[IdeaProject, ClaudeCodeCommand | None], ClaudeResult]
+
+    def __call__(self, project: IdeaProject, prepared: ClaudeCodeCommand | None = None) -> ClaudeResult:
+        return self.run(project, prepared)
+
+
+class StepPrefetcher:
+    """Runs at most one PreparableStep.prepare in a background thread."""
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="i2code-prefetch")
+        self._pending: tuple[str, Future] | None = None
+
+    def prefetch(self, step_key: str, step_fn, project: IdeaProject) -> None:
+        """Start preparing step_key if its step function supports it."""
+        self.discard()
+        if isinstance(step_fn, PreparableStep):
+            self._pending = (step_key, self._executor.submit(step_fn.prepare, project))
+
+    def take(self, step_key: str) -> ClaudeCodeCommand | None:
+        """Return the prepared command for step_key, or None.
+
+        Waits for an in-flight preparation of the same step.  A preparation
+        for a different step, or one that failed, is discarded and None is
+        returned so the step prepares inline.
+        """
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return None
+        key, future = pending
+        if key != step_key:
+            future.cancel()
+            return None
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def discard(self) -> None:
+        """Drop any pending preparation."""
+        if self._pending is not None:
+            self._pending[1].cancel()
+            self._pending = None
+
+    def shutdown(self) -> None:
+        self.discard()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,135 @@
+"""Completion cache: idea names and states for fast shell completion.
+
+Shell completion runs on every TAB press, so re-scanning docs/ideas and
+YAML-parsing every metadata file each time is wasteful.  The cache stores
+the idea list alongside a fingerprint of the modification times of the
+docs/ideas directories and metadata files; it is rebuilt only when the
+fingerprint changes.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from click.shell_completion import CompletionItem
+
+from i2code.idea.resolver import LIFECYCLE_STATES, IdeaInfo, list_ideas
+
+CACHE_VERSION = 2
+
+
+def default_cache_dir() -> Path:
+    """Return the directory holding per-repository completion caches."""
+    return Path.home() / ".hitl" / "completion-cache"
+
+
+def cache_file_for(git_root: Path, cache_dir: Path | None = None) -> Path:
+    """Return the cache file path for a repository root."""
+    digest = hashlib.sha256(str(git_root.resolve()).encode()).hexdigest()[:16]
+    return (cache_dir or default_cache_dir()) / f"{digest}.json"
+
+
+def _stat_mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _location_dirs(git_root: Path) -> list[Path]:
+    ideas_root = git_root / "docs" / "ideas"
+    return [ideas_root, ideas_root / "active"] + [
+        ideas_root / state for state in LIFECYCLE_STATES
+    ]
+
+
+def _metadata_mtimes(location_dir: Path) -> list[tuple[str, int]]:
+    """Return (path, mtime) for each idea metadata file in a location directory."""
+    results = []
+    with os.scandir(location_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            metadata_path = Path(entry.path) / f"{entry.name}-metadata.yaml"
+            mtime = _stat_mtime(metadata_path)
+            if mtime is not None:
+                results.append((str(metadata_path), mtime))
+    return results
+
+
+def compute_fingerprint(git_root: Path) -> list:
+    """Return modification times that determine whether the cache is stale.
+
+    Covers the docs/ideas location directories (ideas added, removed, or
+    moved) and each idea's metadata file (state transitions).
+    """
+    fingerprint: list = []
+    for location_dir in _location_dirs(git_root):
+        mtime = _stat_mtime(location_dir)
+        fingerprint.append([str(location_dir), mtime])
+        if mtime is not None and location_dir.name == "active":
+            fingerprint.extend([list(item) for item in sorted(_metadata_mtimes(location_dir))])
+    return fingerprint
+
+
+def _read_cache(cache_file: Path) -> dict | None:
+    try:
+        with open(cache_file) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(cache_file: Path, data: dict) -> None:
+    """Write the cache atomically; failures are ignored."""
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+
+
+def cached_ideas(git_root: Path, cache_dir: Path | None = None) -> list[IdeaInfo]:
+    """Return active ideas, as list_ideas does, served from the cache when fresh."""
+    cache_file = cache_file_for(git_root, cache_dir)
+    fingerprint = compute_fingerprint(git_root)
+    cached = _read_cache(cache_file)
+    if (
+        cached is not None
+        and cached.get("version") == CACHE_VERSION
+        and cached.get("fingerprint") == fingerprint
+    ):
+        return [IdeaInfo(**idea) for idea in cached["ideas"]]
+
+    ideas = list_ideas(git_root)
+    if (git_root / "docs" / "ideas").is_dir():
+        _write_cache(cache_file, {
+            "version": CACHE_VERSION,
+            "fingerprint": fingerprint,
+            "ideas": [
+                {"name": idea.name, "state": idea.state, "directory": idea.directory}
+                for idea in ideas
+            ],
+        })
+    return ideas
+
+
+def idea_name_completions(incomplete: str, git_root: Path) -> list[CompletionItem]:
+    """Return completion items for idea names starting with incomplete.
+
+    Each item carries the idea's lifecycle state as help text.  Errors are
+    swallowed: completion must never fail noisily.
+    """
+    try:
+        ideas = cached_ideas(git_root)
+    except Exception:
+        return []
+    return [
+        CompletionItem(idea.name, help=idea.state)
+        for idea in ideas
+        if idea.name.startswith(incomplete)
+    ]
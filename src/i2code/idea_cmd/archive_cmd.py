@@ -1,17 +1,17 @@
 """Click command for archiving an idea."""
 
-import subprocess
 import sys
 from pathlib import Path
 
 import click
 
 from i2code.idea.resolver import list_ideas, resolve_idea
+from i2code.trace.processes import run_command
 
 
 def _git_commit(message: str, git_root: Path) -> None:
     """Create a git commit with the given message."""
-    result = subprocess.run(
+    result = run_command(
         ["git", "commit", "-m", message],
         cwd=str(git_root), capture_output=True, text=True,
     )
@@ -24,7 +24,7 @@ def _archive_one(name: str, git_root: Path) -> None:
     active_dir = git_root / "docs" / "ideas" / "active" / name
     archived_dir = git_root / "docs" / "ideas" / "archived" / name
     archived_dir.parent.mkdir(parents=True, exist_ok=True)
-    result = subprocess.run(
+    result = run_command(
         ["git", "mv", str(active_dir), str(archived_dir)],
         cwd=str(git_root), capture_output=True, text=True,
     )
@@ -109,7 +109,7 @@ def idea_unarchive(name, no_commit):
         sys.exit(1)
 
     active_dir.parent.mkdir(parents=True, exist_ok=True)
-    result = subprocess.run(
+    result = run_command(
         ["git", "mv", str(archived_dir), str(active_dir)],
         cwd=str(git_root), capture_output=True, text=True,
     )
@@ -3,7 +3,6 @@
 import glob
 import os
 import shutil
-import subprocess
 from pathlib import Path
 
 from i2code.claude.permissions import build_allowed_tools_flag
@@ -12,6 +11,7 @@ from i2code.implement.claude_runner import ClaudeCodeCommand, ClaudeResult
 from i2code.implement.idea_project import IdeaProject
 from i2code.session_manager import read_or_create_session
 from i2code.template_renderer import render_template
+from i2code.trace.processes import run_command
 
 IDEA_TEMPLATE_TEXT = "PLEASE DESCRIBE YOUR IDEA"
 
@@ -53,7 +53,7 @@ def brainstorm_idea(
         project: The idea project containing file paths
         claude_runner: ClaudeRunner instance for invoking Claude
         run_editor: Callback to launch editor, receives command list.
-                    If None, uses subprocess.run.
+                    If None, uses run_command.
 
     Returns:
         ClaudeResult from the Claude invocation
@@ -78,7 +78,7 @@ def brainstorm_idea(
         if run_editor is not None:
             run_editor(full_cmd)
         else:
-            subprocess.run(full_cmd, check=False)
+            run_command(full_cmd, check=False)
 
     prompt = render_template("brainstorm-idea.md", {
         "IDEA_FILE": project.idea_file,
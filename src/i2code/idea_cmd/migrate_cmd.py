@@ -9,6 +9,7 @@ from pathlib import Path
 import click
 
 from i2code.idea.metadata import write_metadata
+from i2code.trace.processes import run_command
 
 LEGACY_STATES = ("draft", "ready", "wip", "completed", "abandoned")
 IDEAS_DIR = os.path.join("docs", "ideas")
@@ -16,7 +17,7 @@ COMMIT_MESSAGE = "Migrate ideas from directory-based state to metadata files"
 
 
 def _find_git_root() -> Path:
-    result = subprocess.run(
+    result = run_command(
         ["git", "rev-parse", "--show-toplevel"],
         check=True, capture_output=True, text=True,
     )
@@ -41,13 +42,13 @@ def _discover_legacy_ideas(git_root: Path) -> list[tuple[str, str, Path]]:
 
 
 def _move_idea_directory(old_path: Path, new_path: Path, git_root: Path) -> None:
-    result = subprocess.run(
+    result = run_command(
         ["git", "mv", str(old_path), str(new_path)],
         cwd=str(git_root), capture_output=True,
     )
     if result.returncode != 0:
         shutil.move(str(old_path), str(new_path))
-        subprocess.run(
+        run_command(
             ["git", "add", str(new_path)],
             cwd=str(git_root), check=True, capture_output=True,
         )
@@ -59,7 +60,7 @@ def _migrate_idea(idea: tuple[str, str, Path], active_dir: Path, git_root: Path)
     _move_idea_directory(old_path, new_path, git_root)
     metadata_path = new_path / f"{name}-metadata.yaml"
     write_metadata(metadata_path, {"state": state})
-    subprocess.run(
+    run_command(
         ["git", "add", str(metadata_path)],
         cwd=str(git_root), check=True, capture_output=True,
     )
@@ -73,7 +74,7 @@ def _remove_legacy_state_dirs(git_root: Path) -> None:
 
 
 def _git_commit(git_root: Path) -> None:
-    result = subprocess.run(
+    result = run_command(
         ["git", "commit", "-m", COMMIT_MESSAGE],
         cwd=str(git_root), capture_output=True, text=True,
     )
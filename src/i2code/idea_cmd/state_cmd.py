@@ -1,28 +1,21 @@
 """Click command for displaying and transitioning idea lifecycle state."""
 
-import subprocess
 import sys
 from pathlib import Path
 
 import click
 
+from i2code.idea.completion_cache import idea_name_completions
 from i2code.idea.metadata import read_metadata, write_metadata
 from i2code.idea_cmd.transition_rules import validate_transition
 from i2code.idea.resolver import LIFECYCLE_STATES, list_ideas, resolve_idea
 from i2code.plan_domain.parser import parse as parse_plan
+from i2code.trace.processes import run_command
 
 
 def _complete_name_or_path(ctx, _param, incomplete):
-    """Offer both idea names and filesystem paths for shell completion."""
-    completions = []
-    try:
-        git_root = Path.cwd()
-        for idea in list_ideas(git_root):
-            if idea.name.startswith(incomplete):
-                completions.append(idea.name)
-    except Exception:
-        pass
-    return completions
+    """Offer idea names for shell completion, served from the completion cache."""
+    return idea_name_completions(incomplete, Path.cwd())
 
 
 def _resolve_state(name_or_path):
@@ -34,7 +27,7 @@ def _resolve_state(name_or_path):
 
 def _git_commit(message, git_root):
     """Create a git commit. Raises RuntimeError on failure."""
-    result = subprocess.run(
+    result = run_command(
         ["git", "commit", "-m", message],
         cwd=str(git_root), capture_output=True, text=True,
     )
@@ -58,7 +51,7 @@ def execute_transition(name, old_path, new_state, git_root):
         metadata = {}
     metadata["state"] = new_state
     write_metadata(metadata_path, metadata)
-    result = subprocess.run(
+    result = run_command(
         ["git", "add", str(metadata_path)],
         cwd=str(git_root), capture_output=True, text=True,
     )
@@ -1,6 +1,6 @@
 """Branch lifecycle: rebase and cleanup."""
 
-import subprocess
+from i2code.trace.processes import run_command
 
 
 # Main Branch Advancement Functions
@@ -12,11 +12,11 @@ def has_main_advanced(original_head: str, current_head: str) -> bool:
 
 def get_remote_main_head(branch: str, remote: str = "origin") -> str:
     """Get the current HEAD SHA of the remote main branch."""
-    subprocess.run(
+    run_command(
         ["git", "fetch", remote, branch],
         capture_output=True, text=True,
     )
-    result = subprocess.run(
+    result = run_command(
         ["git", "ls-remote", remote, f"refs/heads/{branch}"],
         capture_output=True, text=True,
     )
@@ -29,7 +29,7 @@ def get_remote_main_head(branch: str, remote: str = "origin") -> str:
 
 def remove_worktree(worktree_path: str) -> bool:
     """Remove a git worktree."""
-    result = subprocess.run(
+    result = run_command(
         ["git", "worktree", "remove", worktree_path],
         capture_output=True, text=True,
     )
@@ -38,7 +38,7 @@ def remove_worktree(worktree_path: str) -> bool:
 
 def delete_local_branch(branch_name: str) -> bool:
     """Delete a local git branch."""
-    result = subprocess.run(
+    result = run_command(
         ["git", "branch", "-D", branch_name],
         capture_output=True, text=True,
     )
@@ -0,0 +1,62 @@
+"""CiFailureFingerprints: remembers CI fix attempts per normalized failure signature."""
+
+import hashlib
+import re
+from typing import Dict, List
+
+from i2code.implement.ci_log_excerpt import signature_priority
+
+OUTCOME_NO_COMMIT = "no-commit"
+OUTCOME_STILL_FAILING = "still-failing"
+OUTCOME_FIXED = "fixed"
+
+_VOLATILE_PATTERNS = [
+    (re.compile(r"\b0x[0-9a-fA-F]+\b|\b[0-9a-f]{7,40}\b"), "<hash>"),
+    (re.compile(r"\d+(?:\.\d+)?"), "<n>"),
+    (re.compile(r"/(?:tmp|var/folders|home/runner/work/_temp)/\S*"), "<tmp>"),
+]
+
+
+def _normalize(line: str) -> str:
+    for pattern, replacement in _VOLATILE_PATTERNS:
+        line = pattern.sub(replacement, line)
+    return line.strip()
+
+
+def failure_fingerprint(job_name: str, log_excerpt: str) -> str:
+    """Return a stable signature for a job's failure.
+
+    Hashes the error-signature lines of the excerpt with hashes, numbers
+    and temp paths masked, so the same failure on a later commit or run
+    yields the same fingerprint.  Falls back to the whole excerpt when it
+    contains no recognizable error line.
+    """
+    lines = log_excerpt.splitlines()
+    error_lines = [line for line in lines if signature_priority(line) is not None]
+    normalized = "\n".join(_normalize(line) for line in (error_lines or lines))
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+    return f"{job_name}:{digest}"
+
+
+class CiFailureFingerprints:
+    """Fix attempts keyed by failure fingerprint, backed by a plain dict.
+
+    The dict is owned by the caller (normally WorkflowState) so it is
+    persisted with the rest of the workflow state.
+    """
+
+    def __init__(self, data: Dict[str, List[Dict[str, str]]]):
+        self._data = data
+
+    def failed_attempts(self, fingerprint: str) -> int:
+        """Number of recorded attempts for fingerprint that did not fix it."""
+        return sum(
+            1 for attempt in self._data.get(fingerprint, [])
+            if attempt.get("outcome") != OUTCOME_FIXED
+        )
+
+    def attempts(self, fingerprint: str) -> List[Dict[str, str]]:
+        return list(self._data.get(fingerprint, []))
+
+    def record(self, fingerprint: str, outcome: str, sha: str) -> None:
+        self._data.setdefault(fingerprint, []).append({"outcome": outcome, "sha": sha})
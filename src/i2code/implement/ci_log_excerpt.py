@@ -0,0 +1,243 @@
+"""Extract a compact, relevance-ordered excerpt from GitHub Actions failure logs.
+
+``gh run view --log-failed`` prints one line per log line, prefixed with the
+job name, step name, and a timestamp, separated by tabs.  Logs can run to
+tens of megabytes, so ``CiLogExcerptor`` consumes them line by line and keeps
+only bounded state: a short window of context around each error signature
+and the tail of every job step.
+"""
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
+
+MAX_EXCERPT_CHARS = 5000
+MAX_LINE_CHARS = 400
+CONTEXT_BEFORE = 5
+CONTEXT_AFTER = 15
+MAX_WINDOW_LINES = 60
+MAX_WINDOWS_PER_SECTION = 10
+TAIL_LINES = 30
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+_TIMESTAMP_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z ?")
+
+# Error signatures, most useful first.  The index is the window priority.
+_SIGNATURES = [
+    re.compile(
+        r"(?:^|\s|:)error(?:\[E\d+\])?:|error TS\d+|SyntaxError|^\[ERROR\]"
+        r"|^e: |\.(?:java|kt|c|cc|cpp|h|go|ts|rs):\d+(?::\d+)?:? error",
+    ),
+    re.compile(
+        r"^=+ FAILURES =+|^FAIL\b|^--- FAIL:|\bFAILED\b|AssertionError"
+        r"|Tests? failed|\d+ failed",
+    ),
+    re.compile(
+        r"^Traceback \(most recent call last\)|^\s+at [\w.$<>]+\(|^\w+(?:\.\w+)*(?:Exception|Error):"
+        r"|^panic:",
+    ),
+    re.compile(r"##\[error\]|\berror\b", re.IGNORECASE),
+]
+
+Section = Tuple[str, str]
+
+
+def clean_log_line(raw: str) -> Tuple[Section, str]:
+    """Split a ``--log-failed`` line into its (job, step) section and message.
+
+    Strips ANSI escape codes and the leading timestamp, and caps the
+    message at MAX_LINE_CHARS.
+    """
+    line = _ANSI_RE.sub("", raw.rstrip("\r\n"))
+    parts = line.split("\t", 2)
+    if len(parts) == 3:
+        section, message = (parts[0], parts[1]), parts[2]
+    else:
+        section, message = ("", ""), line
+    message = _TIMESTAMP_RE.sub("", message)
+    if len(message) > MAX_LINE_CHARS:
+        message = message[:MAX_LINE_CHARS] + " ... (truncated)"
+    return section, message
+
+
+def signature_priority(message: str) -> Optional[int]:
+    """Return the priority of the first error signature matching message."""
+    for priority, pattern in enumerate(_SIGNATURES):
+        if pattern.search(message):
+            return priority
+    return None
+
+
+@dataclass
+class _Window:
+    priority: int
+    first_line: int
+    lines: List[str] = field(default_factory=list)
+
+    def chars(self) -> int:
+        return sum(len(line) + 1 for line in self.lines)
+
+
+@dataclass
+class _SectionState:
+    order: int
+    before: deque = field(default_factory=lambda: deque(maxlen=CONTEXT_BEFORE))
+    tail: deque = field(default_factory=lambda: deque(maxlen=TAIL_LINES))
+    windows: List[_Window] = field(default_factory=list)
+    open_window: Optional[_Window] = None
+    after_remaining: int = 0
+    line_count: int = 0
+    covered_until: int = 0
+
+
+class CiLogExcerptor:
+    """Streaming builder for a bounded excerpt of CI failure logs.
+
+    Feed raw log lines with ``add_line``; ``excerpt`` renders the result.
+    Logs that fit in max_chars are returned whole (cleaned); larger logs
+    are reduced to the highest-priority error windows per job step, or
+    to the step tails when no error signature was found.
+    """
+
+    def __init__(self, max_chars: int = MAX_EXCERPT_CHARS):
+        self._max_chars = max_chars
+        self._sections: dict[Section, _SectionState] = {}
+        self._full: Optional[List[Tuple[Section, str]]] = []
+        self._full_chars = 0
+
+    def add_line(self, raw: str) -> None:
+        section, message = clean_log_line(raw)
+        self._remember_full(section, message)
+        state = self._sections.get(section)
+        if state is None:
+            state = self._sections[section] = _SectionState(order=len(self._sections))
+        state.line_count += 1
+        state.tail.append(message)
+        self._track_windows(state, message)
+        state.before.append(message)
+
+    def excerpt(self) -> str:
+        if self._full is not None:
+            return _render(
+                [(section, None, [message]) for section, message in self._full],
+            )
+        windows = self._select_windows()
+        if windows:
+            return _render(windows)
+        return self._render_tails()
+
+    def _remember_full(self, section: Section, message: str) -> None:
+        if self._full is None:
+            return
+        self._full_chars += len(message) + 1
+        if self._full_chars > self._max_chars:
+            self._full = None
+        else:
+            self._full.append((section, message))
+
+    def _track_windows(self, state: _SectionState, message: str) -> None:
+        priority = signature_priority(message)
+        window = state.open_window
+        if window is not None and len(window.lines) >= MAX_WINDOW_LINES:
+            window = state.open_window = None
+        if window is not None:
+            window.lines.append(message)
+            state.covered_until = state.line_count
+            if priority is not None:
+                window.priority = min(window.priority, priority)
+                state.after_remaining = CONTEXT_AFTER
+            else:
+                state.after_remaining -= 1
+                if state.after_remaining <= 0:
+                    state.open_window = None
+            return
+        if priority is None:
+            return
+        index = state.line_count - 1
+        context = list(state.before)[max(0, len(state.before) - (index - state.covered_until)):]
+        window = _Window(
+            priority=priority,
+            first_line=index - len(context),
+            lines=[*context, message],
+        )
+        if not self._admit(state, window):
+            return
+        state.covered_until = state.line_count
+        state.open_window = window
+        state.after_remaining = CONTEXT_AFTER
+
+    @staticmethod
+    def _admit(state: _SectionState, window: _Window) -> bool:
+        """Keep at most MAX_WINDOWS_PER_SECTION, evicting the least useful."""
+        if len(state.windows) < MAX_WINDOWS_PER_SECTION:
+            state.windows.append(window)
+            return True
+        worst = max(state.windows, key=lambda w: (w.priority, w.first_line))
+        if worst.priority <= window.priority:
+            return False
+        state.windows.remove(worst)
+        state.windows.append(window)
+        return True
+
+    def _select_windows(self):
+        candidates = [
+            (window.priority, state.order, window.first_line, section, window)
+            for section, state in self._sections.items()
+            for window in state.windows
+        ]
+        candidates.sort(key=lambda c: c[:3])
+        chosen = []
+        budget = self._max_chars
+        for _, _, _, section, window in candidates:
+            cost = window.chars()
+            if cost > budget:
+                continue
+            budget -= cost
+            chosen.append((self._sections[section].order, window.first_line, section, window))
+        chosen.sort(key=lambda c: c[:2])
+        return [(section, window.first_line, window.lines) for _, _, section, window in chosen]
+
+    def _render_tails(self) -> str:
+        blocks = []
+        budget = self._max_chars
+        for section, state in reversed(list(self._sections.items())):
+            lines = list(state.tail)
+            while lines and sum(len(line) + 1 for line in lines) > budget:
+                lines.pop(0)
+            if not lines:
+                break
+            budget -= sum(len(line) + 1 for line in lines)
+            blocks.append((section, state.line_count - len(lines), lines))
+        return _render(list(reversed(blocks)))
+
+
+def _render(blocks) -> str:
+    """Render (section, first_line, lines) blocks under section headers.
+
+    first_line is None for a verbatim log; otherwise a gap before a block
+    is marked as truncated.
+    """
+    out: List[str] = []
+    current: Optional[Section] = None
+    next_line = 0
+    for section, first_line, lines in blocks:
+        if section != current:
+            current = section
+            next_line = 0
+            if section != ("", ""):
+                out.append(f"== {section[0]} / {section[1]} ==")
+        if first_line is not None and first_line > next_line:
+            out.append(f"... (truncated: {first_line - next_line} lines omitted)")
+        out.extend(lines)
+        if first_line is not None:
+            next_line = first_line + len(lines)
+    return "\n".join(out)
+
+
+def excerpt_ci_log(lines: Iterable[str], max_chars: int = MAX_EXCERPT_CHARS) -> str:
+    """Return a bounded, relevance-ordered excerpt of the given log lines."""
+    excerptor = CiLogExcerptor(max_chars=max_chars)
+    for line in lines:
+        excerptor.add_line(line)
+    return excerptor.excerpt()
@@ -3,17 +3,25 @@
 Exposes the public ``ClaudeRunner.execute(command)`` API plus result diagnostics
 (``check_claude_success`` and ``print_task_failure_diagnostics``). The actual
 subprocess work is handled by the private module-level
-``_run_claude_interactive`` and ``_run_claude_with_output_capture`` helpers.
+``_run_claude_interactive`` and ``_run_claude_with_output_capture`` helpers;
+``_run_claude_async`` is the asyncio backend used to run several batch-mode
+commands on one event loop.
 """
 
+import asyncio
 import json
+import os
+import signal
 import subprocess
 import sys
+import tempfile
 import threading
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from i2code.implement.managed_subprocess import ManagedSubprocess
+from i2code.implement.managed_subprocess import AsyncManagedSubprocess, ManagedSubprocess
+from i2code.trace.processes import ProcessRecord, process_stats, run_command, track_process
 
 
 @dataclass
@@ -72,7 +80,7 @@ def _run_claude_interactive(cmd: List[str], cwd: str) -> ClaudeResult:
     In interactive mode, Claude needs direct access to the terminal
     for its TUI, so we don't capture stdout/stderr.
     """
-    result = subprocess.run(cmd, cwd=cwd)
+    result = run_command(cmd, cwd=cwd, program="claude")
 
     return ClaudeResult(returncode=result.returncode)
 
@@ -98,18 +106,49 @@ def _read_pipe_chunks(pipe, chunks: List[str]):
         yield text
 
 
-def _read_pipe_with_progress(pipe, chunks: List[str]):
+MessageListener = Callable[[Dict[str, Any]], bool]
+
+
+class _JsonLineDispatcher:
+    """Hands each complete stream-json line to a listener as it arrives.
+
+    The listener returns True to ask for the run to be aborted; on_abort is
+    then called once and no further messages are dispatched.
+    """
+
+    def __init__(self, listener: MessageListener, on_abort: Callable[[], None]):
+        self._listener = listener
+        self._on_abort = on_abort
+        self._buffer = ""
+        self.aborted = False
+
+    def feed(self, text: str) -> None:
+        self._buffer += text
+        while '\n' in self._buffer and not self.aborted:
+            line, self._buffer = self._buffer.split('\n', 1)
+            for msg in _iter_json_messages(line):
+                if self._listener(msg):
+                    self.aborted = True
+                    self._on_abort()
+                    break
+
+
+def _read_pipe_with_progress(pipe, chunks: List[str], dispatcher: Optional[_JsonLineDispatcher] = None):
     """Read stdout pipe, printing a dot for each JSON message."""
     buffer = ""
     for text in _read_pipe_chunks(pipe, chunks):
         buffer = _print_dot_per_line(buffer + text)
+        if dispatcher is not None:
+            dispatcher.feed(text)
 
 
-def _read_pipe_verbose(pipe, chunks: List[str]):
+def _read_pipe_verbose(pipe, chunks: List[str], dispatcher: Optional[_JsonLineDispatcher] = None):
     """Read stdout pipe, printing full output."""
     for text in _read_pipe_chunks(pipe, chunks):
         sys.stdout.write(text)
         sys.stdout.flush()
+        if dispatcher is not None:
+            dispatcher.feed(text)
 
 
 def _read_pipe_to_stderr(pipe, chunks: List[str]):
@@ -157,6 +196,8 @@ def _parse_stream_json_output(full_stdout: str) -> Tuple[DiagnosticInfo, str]:
     result_text: Optional[str] = None
 
     for msg in _iter_json_messages(full_stdout):
+        if msg.get('type') == 'stream_event':
+            continue  # partial-message deltas would crowd out last_messages
         all_messages.append(msg)
         if msg.get('type') != 'result':
             continue
@@ -171,12 +212,28 @@ def _parse_stream_json_output(full_stdout: str) -> Tuple[DiagnosticInfo, str]:
     return diagnostics, result_text if result_text is not None else full_stdout
 
 
-def _run_claude_with_output_capture(cmd: List[str], cwd: str, debug: bool = False) -> ClaudeResult:
+def _run_claude_with_output_capture(
+    cmd: List[str], cwd: str, debug: bool = False,
+    on_message: Optional[MessageListener] = None,
+) -> ClaudeResult:
     """Run Claude command, capturing output while displaying progress.
 
     For stream-json output, prints a dot for each JSON message received.
     At the end, parses the result to check for errors and permission denials.
+
+    If on_message is given it is called with each JSON message as it
+    arrives; returning True terminates the Claude process group.
     """
+    with track_process(cmd, program="claude") as record:
+        result = _capture_claude_output(cmd, cwd, debug, on_message)
+        record.returncode = result.returncode
+        record.output_bytes = len(result.output.stdout) + len(result.output.stderr)
+    return result
+
+
+def _capture_claude_output(
+    cmd: List[str], cwd: str, debug: bool, on_message: Optional[MessageListener],
+) -> ClaudeResult:
     process = subprocess.Popen(
         cmd,
         cwd=cwd,
@@ -189,10 +246,16 @@ def _run_claude_with_output_capture(cmd: List[str], cwd: str, debug: bool = Fals
     stdout_chunks: List[str] = []
     stderr_chunks: List[str] = []
 
+    dispatcher = None
+    if on_message is not None:
+        dispatcher = _JsonLineDispatcher(
+            on_message, lambda: _terminate_process_group(process),
+        )
+
     stdout_reader = _read_pipe_verbose if debug else _read_pipe_with_progress
     stdout_thread = threading.Thread(
         target=stdout_reader,
-        args=(process.stdout, stdout_chunks),
+        args=(process.stdout, stdout_chunks, dispatcher),
     )
     stderr_thread = threading.Thread(
         target=_read_pipe_to_stderr,
@@ -232,6 +295,197 @@ def _run_claude_with_output_capture(cmd: List[str], cwd: str, debug: bool = Fals
     )
 
 
+async def _read_stream_chunks(stream, chunks: List[str]) -> AsyncIterator[str]:
+    """Async counterpart of _read_pipe_chunks for an asyncio StreamReader."""
+    while True:
+        chunk = await stream.read(4096)
+        if not chunk:
+            break
+        text = chunk.decode('utf-8', errors='replace')
+        chunks.append(text)
+        yield text
+
+
+async def _drain_stdout(
+    stream, chunks: List[str], debug: bool, dispatcher: Optional[_JsonLineDispatcher],
+) -> None:
+    """Read stdout as _read_pipe_verbose or _read_pipe_with_progress would."""
+    buffer = ""
+    async for text in _read_stream_chunks(stream, chunks):
+        if debug:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        else:
+            buffer = _print_dot_per_line(buffer + text)
+        if dispatcher is not None:
+            dispatcher.feed(text)
+
+
+async def _drain_stderr(stream, chunks: List[str]) -> None:
+    async for text in _read_stream_chunks(stream, chunks):
+        sys.stderr.write(text)
+        sys.stderr.flush()
+
+
+async def _run_claude_async(
+    cmd: List[str], cwd: str, supervisor: AsyncManagedSubprocess, debug: bool = False,
+    on_message: Optional[MessageListener] = None,
+) -> ClaudeResult:
+    """Run Claude like _run_claude_with_output_capture, on the running event loop.
+
+    Output is drained by coroutines rather than reader threads, and the
+    process is handed to supervisor for signal handling, so any number of
+    runs can share one loop and one supervisor.  The run is recorded in
+    process_stats but not as a span: concurrent runs on one thread would
+    interleave the span stack.
+    """
+    if supervisor.interrupted:
+        return ClaudeResult(returncode=130)
+    record = ProcessRecord(argv=[str(arg) for arg in cmd], program="claude")
+    started = time.monotonic()
+    stdout_chunks: List[str] = []
+    stderr_chunks: List[str] = []
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True,
+    )
+    supervisor.add(process)
+    try:
+        dispatcher = None
+        if on_message is not None:
+            dispatcher = _JsonLineDispatcher(
+                on_message, lambda: _terminate_process_group(process),
+            )
+        readers = [
+            asyncio.ensure_future(_drain_stdout(process.stdout, stdout_chunks, debug, dispatcher)),
+            asyncio.ensure_future(_drain_stderr(process.stderr, stderr_chunks)),
+        ]
+        returncode = await process.wait()
+        if supervisor.interrupted:
+            # Grandchildren may still hold the pipes open; don't wait on them.
+            _, pending = await asyncio.wait(readers, timeout=supervisor.terminate_timeout)
+            for reader in pending:
+                reader.cancel()
+            return ClaudeResult(
+                returncode=130,
+                output=CapturedOutput(''.join(stdout_chunks), ''.join(stderr_chunks)),
+            )
+        await asyncio.gather(*readers)
+    finally:
+        record.duration = time.monotonic() - started
+        record.returncode = process.returncode
+        record.output_bytes = sum(len(chunk) for chunk in stdout_chunks + stderr_chunks)
+        process_stats.add(record)
+
+    sys.stdout.write('\n')
+    sys.stdout.flush()
+
+    full_stdout = ''.join(stdout_chunks)
+    diagnostics, result_text = _parse_stream_json_output(full_stdout)
+
+    return ClaudeResult(
+        returncode=returncode,
+        output=CapturedOutput(full_stdout, ''.join(stderr_chunks)),
+        diagnostics=diagnostics,
+        result_text=result_text,
+    )
+
+
+def _terminate_process_group(process) -> None:
+    """Send SIGTERM to the process group started for *process*."""
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+class ClaudeProcess:
+    """Handle for a batch-mode Claude process that runs without blocking.
+
+    Output goes to temporary files rather than pipes, so no reader threads
+    are needed and several processes can be supervised from one thread by
+    polling.  The process is started in its own session so terminate() can
+    signal its whole process group.
+    """
+
+    def __init__(self, cmd: List[str], cwd: str, terminate_timeout: float = 5.0):
+        self._stdout = tempfile.TemporaryFile()
+        self._stderr = tempfile.TemporaryFile()
+        self._terminate_timeout = terminate_timeout
+        self._result: Optional[ClaudeResult] = None
+        self._record = ProcessRecord(argv=list(cmd), program="claude")
+        self._started = time.monotonic()
+        self.process = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=self._stdout,
+            stderr=self._stderr,
+            start_new_session=True,
+        )
+
+    def poll(self) -> Optional[ClaudeResult]:
+        """Return the result once the process has exited, else None."""
+        if self._result is None and self.process.poll() is not None:
+            self._result = self._collect()
+            self._record_finished(len(self._result.output.stdout) + len(self._result.output.stderr))
+        return self._result
+
+    def terminate(self) -> None:
+        """Stop the process group if still running and release output files."""
+        if self.process.poll() is None:
+            self._signal_group(signal.SIGTERM)
+            try:
+                self.process.wait(timeout=self._terminate_timeout)
+            except subprocess.TimeoutExpired:
+                self._signal_group(signal.SIGKILL)
+                self.process.wait()
+        self._record_finished(0)
+        self._stdout.close()
+        self._stderr.close()
+
+    def _record_finished(self, output_bytes: int) -> None:
+        """Add this process to process_stats once, when it is first seen to end.
+
+        Not a span: the process outlives the caller's stack frame.
+        """
+        if self._record is None:
+            return
+        self._record.duration = time.monotonic() - self._started
+        self._record.returncode = self.process.returncode
+        self._record.output_bytes = output_bytes
+        process_stats.add(self._record)
+        self._record = None
+
+    def _signal_group(self, signum: int) -> None:
+        try:
+            os.killpg(self.process.pid, signum)
+        except ProcessLookupError:
+            pass
+
+    def _collect(self) -> ClaudeResult:
+        stdout = _read_temp_file(self._stdout)
+        stderr = _read_temp_file(self._stderr)
+        diagnostics, result_text = _parse_stream_json_output(stdout)
+        return ClaudeResult(
+            returncode=self.process.returncode,
+            output=CapturedOutput(stdout, stderr),
+            diagnostics=diagnostics,
+            result_text=result_text,
+        )
+
+
+def _read_temp_file(f) -> str:
+    f.seek(0)
+    text = f.read().decode('utf-8', errors='replace')
+    f.close()
+    return text
+
+
 def check_claude_success(exit_code: int, head_before: str, head_after: str) -> bool:
     """Check if Claude invocation was successful.
 
@@ -294,12 +548,19 @@ class ClaudeRunner:
         self._interactive = interactive
         self._debug = debug
 
-    def execute(self, command: ClaudeCodeCommand) -> ClaudeResult:
+    def execute(
+        self, command: ClaudeCodeCommand, on_message: Optional[MessageListener] = None,
+    ) -> ClaudeResult:
+        """Run command to completion.
+
+        on_message only applies to batch mode: it receives each stream-json
+        message as it arrives and may return True to abort the run.
+        """
         if command.mock_command is not None:
             if self._interactive:
                 return _run_claude_interactive(command.mock_command, cwd=command.cwd)
             return _run_claude_with_output_capture(
-                command.mock_command, cwd=command.cwd, debug=self._debug,
+                command.mock_command, cwd=command.cwd, debug=self._debug, on_message=on_message,
             )
 
         effective_interactive = (
@@ -309,7 +570,57 @@ class ClaudeRunner:
 
         if effective_interactive:
             return _run_claude_interactive(argv, cwd=command.cwd)
-        return _run_claude_with_output_capture(argv, cwd=command.cwd, debug=self._debug)
+        return _run_claude_with_output_capture(
+            argv, cwd=command.cwd, debug=self._debug, on_message=on_message,
+        )
+
+    def start(self, command: ClaudeCodeCommand) -> ClaudeProcess:
+        """Start a batch-mode Claude process without waiting for it."""
+        if command.mock_command is not None:
+            return ClaudeProcess(command.mock_command, cwd=command.cwd)
+        return ClaudeProcess(self._build_argv(command, False), cwd=command.cwd)
+
+    async def execute_async(
+        self, command: ClaudeCodeCommand, supervisor: AsyncManagedSubprocess,
+        on_message: Optional[MessageListener] = None,
+    ) -> ClaudeResult:
+        """Run command in batch mode on the running event loop.
+
+        supervisor handles signals for this and every other run sharing
+        the loop; on_message behaves as in execute().
+        """
+        argv = command.mock_command
+        if argv is None:
+            argv = self._build_argv(command, False)
+        return await _run_claude_async(
+            argv, command.cwd, supervisor, debug=self._debug, on_message=on_message,
+        )
+
+    def execute_all(
+        self, commands: Sequence[ClaudeCodeCommand], max_concurrent: Optional[int] = None,
+    ) -> List[ClaudeResult]:
+        """Run commands concurrently in batch mode, returning results in order.
+
+        At most max_concurrent processes run at once (all of them when
+        None).  They are supervised from one event loop on the calling
+        thread, without a reader thread per process, so this must be
+        called from the main thread.  After Ctrl+C every process still
+        running is terminated, none is started, and each of their
+        results has returncode 130.
+        """
+        return asyncio.run(self._execute_all(commands, max_concurrent or len(commands) or 1))
+
+    async def _execute_all(
+        self, commands: Sequence[ClaudeCodeCommand], max_concurrent: int,
+    ) -> List[ClaudeResult]:
+        slots = asyncio.Semaphore(max_concurrent)
+
+        async def run(command: ClaudeCodeCommand, supervisor: AsyncManagedSubprocess) -> ClaudeResult:
+            async with slots:
+                return await self.execute_async(command, supervisor)
+
+        async with AsyncManagedSubprocess(label="claude") as supervisor:
+            return list(await asyncio.gather(*(run(command, supervisor) for command in commands)))
 
     def _build_argv(
         self, command: ClaudeCodeCommand, effective_interactive: bool,
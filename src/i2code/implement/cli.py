@@ -50,6 +50,14 @@ from i2code.implement.scaffold_opts import ScaffoldOpts
               help="Skip project scaffolding step")
 @click.option("--debug-claude", is_flag=True,
               help="Show full Claude output instead of progress dots")
+@click.option("--local-ci", is_flag=True,
+              help="Run workflow run: steps locally and fix failures before each push")
+@click.option("--local-ci-jobs", metavar="JOBS",
+              help="Comma-separated workflow job ids or names to run with --local-ci (default: all)")
+@click.option("--trace", is_flag=True,
+              help="Record timing spans to .hitl/traces/ (see 'i2code trace summarize')")
+@click.option("--session-per-thread", is_flag=True,
+              help="Resume one Claude session across consecutive tasks of a steel thread")
 @click.pass_context
 def implement_cmd(ctx, **kwargs):
     """Implement a development plan using Git worktrees and GitHub Draft PRs."""
@@ -1,18 +1,29 @@
 """CommandBuilder: builds ``ClaudeCodeCommand`` instances for all invocation types."""
 
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
-from i2code.implement.claude_runner import ClaudeCodeCommand
+from i2code.implement.ci_log_excerpt import MAX_EXCERPT_CHARS, excerpt_ci_log
+from i2code.implement.claude_runner import ClaudeCodeCommand, SessionId
+from i2code.implement.prompt_budget import TEMPLATE_BUDGETS, render_within_budget
 from i2code.templates.template_renderer import render_template
+from i2code.trace.spans import span
+
+TRIAGE_TEMPLATE = "triage_feedback.j2"
 
 
 @dataclass
 class TaskCommandOpts:
-    """Optional execution modifiers for build_task_command."""
+    """Optional execution modifiers for build_task_command.
+
+    session_id runs the task in that Claude session; when it resumes an
+    existing one the prompt no longer attaches the idea and spec.
+    """
     interactive: bool = True
     extra_prompt: Optional[str] = None
     extra_cli_args: Optional[List[str]] = None
+    session_id: Optional[SessionId] = None
 
 
 @dataclass
@@ -25,10 +36,18 @@ class FixRequest:
 
 @dataclass
 class CiFixRequest:
-    """The failing workflow run that build_ci_fix_command should ask Claude to fix."""
-    run_id: int
+    """The failing workflow run that build_ci_fix_command should ask Claude to fix.
+
+    job_logs maps each failed job name to its log excerpt; when present it
+    is used instead of the run-wide failure_logs.  previous_attempts counts
+    earlier fixes that did not clear this same failure.  run_id is None for
+    failures found by the local pre-flight run.
+    """
+    run_id: Optional[int]
     workflow_name: str
     failure_logs: str
+    job_logs: Dict[str, str] = field(default_factory=dict)
+    previous_attempts: int = 0
 
 
 class CommandBuilder:
@@ -57,13 +76,13 @@ class CommandBuilder:
         cwd: str = "",
     ) -> ClaudeCodeCommand:
         opts = opts or TaskCommandOpts()
-        prompt = render_template(
+        prompt = _render_prompt(
             "task_execution.j2",
-            package="i2code.implement",
             idea_directory=idea_directory,
             task_description=task_description,
             extra_prompt=opts.extra_prompt,
             interactive=opts.interactive,
+            resumed=opts.session_id is not None and not opts.session_id.is_new,
         )
 
         allowed_tools, add_dirs, extra_args = self._split_extra_cli_args(
@@ -75,6 +94,7 @@ class CommandBuilder:
             prompt=prompt,
             interactive=opts.interactive,
             allowed_tools=allowed_tools,
+            session_id=opts.session_id,
             add_dirs=add_dirs,
             extra_args=extra_args,
         )
@@ -108,9 +128,8 @@ class CommandBuilder:
         cwd: str = "",
         interactive: bool = True,
     ) -> ClaudeCodeCommand:
-        prompt = render_template(
+        prompt = _render_prompt(
             "scaffolding.j2",
-            package="i2code.implement",
             idea_directory=idea_directory,
         )
 
@@ -132,11 +151,7 @@ class CommandBuilder:
         interactive: bool,
         **template_args: object,
     ) -> ClaudeCodeCommand:
-        prompt = render_template(
-            template_name,
-            package="i2code.implement",
-            **template_args,
-        )
+        prompt = _render_prompt(template_name, **template_args)
         return ClaudeCodeCommand(
             cwd=cwd,
             prompt=prompt,
@@ -150,7 +165,7 @@ class CommandBuilder:
         interactive: bool = True,
     ) -> ClaudeCodeCommand:
         return self._render_prompt_command(
-            "triage_feedback.j2",
+            TRIAGE_TEMPLATE,
             cwd,
             interactive,
             feedback_content=feedback_content,
@@ -177,18 +192,15 @@ class CommandBuilder:
         cwd: str = "",
         interactive: bool = True,
     ) -> ClaudeCodeCommand:
-        max_log_length = 5000
-        failure_logs = request.failure_logs
-        if len(failure_logs) > max_log_length:
-            failure_logs = f"... (truncated)\n{failure_logs[-max_log_length:]}"
-
         return self._render_prompt_command(
             "ci_fix.j2",
             cwd,
             interactive,
             run_id=request.run_id,
             workflow_name=request.workflow_name,
-            failure_logs=failure_logs,
+            failure_logs=_bounded_log(request.failure_logs),
+            job_logs={name: _bounded_log(logs) for name, logs in request.job_logs.items()},
+            previous_attempts=request.previous_attempts,
         )
 
     def build_feedback_command(
@@ -198,9 +210,8 @@ class CommandBuilder:
         feedback_content: str,
         cwd: str = "",
     ) -> ClaudeCodeCommand:
-        prompt = render_template(
+        prompt = _render_prompt(
             "address_feedback.j2",
-            package="i2code.implement",
             pr_url=pr_url,
             feedback_type=feedback_type,
             feedback_content=feedback_content,
@@ -212,3 +223,27 @@ class CommandBuilder:
             interactive=False,
             extra_args=["--print", "wt-handle-feedback.md"],
         )
+
+
+def _render_prompt(template_name: str, **template_args: object) -> str:
+    """Render a template within its prompt budget, tracing the prompt's size."""
+    with span("render_prompt", template=template_name) as attrs:
+        budgeted = render_within_budget(
+            lambda **args: render_template(template_name, package="i2code.implement", **args),
+            TEMPLATE_BUDGETS.get(template_name),
+            template_args,
+        )
+        attrs.update(budgeted.trace_attrs())
+    if budgeted.over_budget:
+        print(
+            f"Warning: {template_name} prompt is ~{budgeted.size.tokens} tokens,"
+            f" over its {budgeted.budget_tokens} token budget",
+            file=sys.stderr,
+        )
+    return budgeted.prompt
+
+
+def _bounded_log(logs: str) -> str:
+    if len(logs) > MAX_EXCERPT_CHARS:
+        return excerpt_ci_log(logs.splitlines())
+    return logs
@@ -0,0 +1,63 @@
+"""FeedbackIndex: one round of new PR feedback, indexed by ID."""
+
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+REVIEW_COMMENT = "review_comment"
+REVIEW = "review"
+CONVERSATION = "conversation"
+
+_KINDS = (REVIEW_COMMENT, REVIEW, CONVERSATION)
+
+
+class FeedbackIndex:
+    """New review comments, reviews and conversation comments for one round.
+
+    Built once per fetch, so looking up an item or its kind by ID is
+    constant time however many comments the round holds.  Unpacks like the
+    (review_comments, reviews, conversation_comments) tuple it replaces.
+    """
+
+    def __init__(
+        self,
+        review_comments: List[Dict[str, Any]],
+        reviews: List[Dict[str, Any]],
+        conversation_comments: List[Dict[str, Any]],
+    ):
+        self.review_comments = review_comments
+        self.reviews = reviews
+        self.conversation_comments = conversation_comments
+        # id -> [(kind, position, item)]; lists because IDs of different
+        # kinds come from different GitHub tables and may coincide.
+        self._by_id: Dict[Any, List[Tuple[str, int, Dict[str, Any]]]] = {}
+        position = 0
+        for kind, items in zip(_KINDS, self._lists()):
+            for item in items:
+                self._by_id.setdefault(item.get("id"), []).append((kind, position, item))
+                position += 1
+
+    def _lists(self):
+        return (self.review_comments, self.reviews, self.conversation_comments)
+
+    def __iter__(self) -> Iterator[List[Dict[str, Any]]]:
+        return iter(self._lists())
+
+    def __bool__(self) -> bool:
+        return bool(self._by_id)
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._lists())
+
+    def is_review_comment(self, comment_id) -> bool:
+        """True if comment_id is a line-anchored review comment (replies go in its thread)."""
+        return any(kind == REVIEW_COMMENT for kind, _, _ in self._by_id.get(comment_id, ()))
+
+    def select(self, comment_ids: Iterable) -> "FeedbackIndex":
+        """The items with the given IDs, in the order they were fetched."""
+        entries = sorted(
+            (entry for comment_id in set(comment_ids) for entry in self._by_id.get(comment_id, ())),
+            key=lambda entry: entry[1],
+        )
+        by_kind: Dict[str, List[Dict[str, Any]]] = {kind: [] for kind in _KINDS}
+        for kind, _, item in entries:
+            by_kind[kind].append(item)
+        return FeedbackIndex(*(by_kind[kind] for kind in _KINDS))
@@ -0,0 +1,33 @@
+"""Split triaged fix groups into those safe to fix concurrently and the rest."""
+
+from typing import Any, Dict, List, Tuple
+
+MAX_CONCURRENT_FIXES = 4
+
+
+def partition_fix_groups(
+    fix_groups: List[Dict[str, Any]], review_comments: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Return (concurrent, serial) fix groups, each in triage order.
+
+    A group can run concurrently when all of its feedback is review
+    comments anchored to files, and none of those files belong to an
+    earlier concurrent group.  Groups that include reviews or general
+    comments touch unknown files and run serially.  With fewer than two
+    concurrent candidates everything runs serially.
+    """
+    paths_by_id = {c["id"]: c.get("path") for c in review_comments}
+    concurrent: List[Dict[str, Any]] = []
+    serial: List[Dict[str, Any]] = []
+    claimed = set()
+    for group in fix_groups:
+        comment_ids = group.get("comment_ids", [])
+        paths = {paths_by_id.get(comment_id) for comment_id in comment_ids}
+        if not comment_ids or None in paths or paths & claimed:
+            serial.append(group)
+        else:
+            concurrent.append(group)
+            claimed |= paths
+    if len(concurrent) < 2:
+        return [], list(fix_groups)
+    return concurrent, serial
@@ -5,13 +5,13 @@ FakeGitRepository in tests without unittest.mock.patch.
 """
 
 import os
-import subprocess
 import sys
 
 from git import Repo
 
 from i2code.implement.git_setup import sanitize_branch_name
 from i2code.implement.pr_helpers import generate_pr_body, generate_pr_title
+from i2code.trace.processes import run_command
 
 
 class GitRepository:
@@ -135,7 +135,11 @@ class GitRepository:
 
     def checkout(self, branch_name):
         """Check out the named branch."""
-        self._repo.git.checkout(branch_name)
+        run_command(
+            ["git", "checkout", branch_name],
+            capture_output=True, text=True, check=True,
+            cwd=self._repo.working_tree_dir,
+        )
 
     @staticmethod
     def _sibling_path(repo_root, suffix, idea_name):
@@ -158,13 +162,59 @@ class GitRepository:
         )
 
         if not os.path.isdir(worktree_path):
-            self._repo.git.worktree("add", worktree_path, branch_name)
+            run_command(
+                ["git", "worktree", "add", worktree_path, branch_name],
+                capture_output=True, text=True, check=True,
+                cwd=self._repo.working_tree_dir,
+            )
 
         return GitRepository(
             Repo(worktree_path), gh_client=self._gh_client,
             main_repo_dir=self._repo.working_tree_dir,
         )
 
+    def add_scratch_worktree(self, path):
+        """Check out HEAD, detached, in a new worktree at path.
+
+        Returns:
+            A GitRepository wrapping the scratch worktree.
+        """
+        run_command(
+            ["git", "worktree", "add", "--detach", path, "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=self._repo.working_tree_dir,
+        )
+        return GitRepository(Repo(path), gh_client=self._gh_client, main_repo_dir=self._main_repo_dir)
+
+    def remove_worktree(self, path):
+        """Remove a worktree created by add_scratch_worktree, discarding changes."""
+        run_command(
+            ["git", "worktree", "remove", "--force", path],
+            capture_output=True, text=True,
+            cwd=self._repo.working_tree_dir,
+        )
+
+    def cherry_pick(self, from_sha, to_sha):
+        """Apply the commits from_sha..to_sha on top of HEAD.
+
+        Returns:
+            True if they applied cleanly; on conflict the cherry-pick is
+            aborted, leaving HEAD unchanged, and False is returned.
+        """
+        result = run_command(
+            ["git", "cherry-pick", f"{from_sha}..{to_sha}"],
+            capture_output=True, text=True,
+            cwd=self._repo.working_tree_dir,
+        )
+        if result.returncode == 0:
+            return True
+        run_command(
+            ["git", "cherry-pick", "--abort"],
+            capture_output=True, text=True,
+            cwd=self._repo.working_tree_dir,
+        )
+        return False
+
     def find_clone(self, idea_name):
         """Return a GitRepository for an existing clone, or None."""
         clone_path = self._sibling_path(self._main_repo_dir, "cl", idea_name)
@@ -183,12 +233,12 @@ class GitRepository:
         """
         clone_path = self._sibling_path(self._main_repo_dir, "cl", idea_name)
         if not os.path.isdir(clone_path):
-            subprocess.run(
+            run_command(
                 ["git", "clone", "--depth", "1",
                  self._repo.working_tree_dir, clone_path],
                 check=True,
             )
-            subprocess.run(
+            run_command(
                 ["git", "remote", "set-url", "origin", self.origin_url],
                 cwd=clone_path, check=True,
             )
@@ -215,7 +265,7 @@ class GitRepository:
         Returns True if there are local commits ahead of upstream, or if
         no upstream is configured (branch never pushed).
         """
-        result = subprocess.run(
+        result = run_command(
             ["git", "rev-list", "--count", "@{upstream}..HEAD"],
             capture_output=True,
             text=True,
@@ -232,7 +282,7 @@ class GitRepository:
             True if the branch exists on origin, False otherwise.
         """
         assert self._branch is not None
-        result = subprocess.run(
+        result = run_command(
             ["git", "ls-remote", "--heads", "origin", self._branch],
             capture_output=True,
             text=True,
@@ -246,7 +296,7 @@ class GitRepository:
             True if push succeeded, False otherwise.
         """
         assert self._branch is not None
-        result = subprocess.run(
+        result = run_command(
             ["git", "push", "-u", "origin", self._branch],
             capture_output=True,
             text=True,
@@ -262,7 +312,7 @@ class GitRepository:
         Returns:
             The diff output as a string, or empty string if no diff.
         """
-        result = subprocess.run(
+        result = run_command(
             ["git", "diff", "HEAD", "--", file_path],
             capture_output=True,
             text=True,
@@ -277,7 +327,7 @@ class GitRepository:
             The file content as a string.
         """
         rel_path = os.path.relpath(file_path, self._repo.working_tree_dir)
-        result = subprocess.run(
+        result = run_command(
             ["git", "show", f"HEAD:{rel_path}"],
             capture_output=True,
             text=True,
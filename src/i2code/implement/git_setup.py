@@ -7,6 +7,8 @@ import sys
 from git import Repo
 from git.exc import InvalidGitRepositoryError
 
+from i2code.trace.processes import run_command
+
 
 def validate_idea_files_committed(project) -> None:
     """Validate that all idea files are committed to Git."""
@@ -29,19 +31,28 @@ def _open_repo(directory):
 
 def _find_uncommitted(repo, idea_files):
     """Return idea files that have uncommitted changes or are untracked."""
-    changed_files = _changed_files(repo)
-    untracked = set(repo.untracked_files)
-    return [f for f in idea_files if f in changed_files or f in untracked]
-
-
-def _changed_files(repo):
-    """Return the set of files with staged or unstaged changes."""
-    changed = {item.a_path for item in repo.index.diff(None)}
-    try:
-        changed.update(item.a_path for item in repo.index.diff("HEAD"))
-    except Exception:
-        pass
-    return changed
+    if not idea_files:
+        return []
+    result = run_command(
+        ["git", "status", "--porcelain", "-z", "--untracked-files=all", "--", *idea_files],
+        capture_output=True, text=True, check=True,
+        cwd=repo.working_tree_dir,
+    )
+    listed = _porcelain_paths(result.stdout)
+    return [f for f in idea_files if f in listed]
+
+
+def _porcelain_paths(output):
+    """Return the paths in ``git status --porcelain -z`` output."""
+    paths = set()
+    entries = iter(output.split("\0"))
+    for entry in entries:
+        if not entry:
+            continue
+        paths.add(entry[3:])
+        if entry[0] in "RC":
+            next(entries, None)  # a rename or copy is followed by its source path
+    return paths
 
 
 def _report_uncommitted_and_exit(uncommitted):
@@ -1,12 +1,26 @@
 """GithubActionsBuildFixer: detects and fixes CI failures on current HEAD."""
 
 import sys
-from typing import Any, Dict, Optional
-
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from i2code.implement.ci_failure_fingerprints import (
+    OUTCOME_FIXED,
+    OUTCOME_NO_COMMIT,
+    OUTCOME_STILL_FAILING,
+    CiFailureFingerprints,
+    failure_fingerprint,
+)
 from i2code.implement.claude_runner import ClaudeCodeCommand
 from i2code.implement.command_builder import CiFixRequest, CommandBuilder
 
 
+MAX_CONCURRENT_LOG_DOWNLOADS = 4
+
+# A failure signature that survived this many fix attempts is not retried.
+MAX_ATTEMPTS_PER_FINGERPRINT = 2
+
+
 class GithubActionsBuildFixerFactory:
     """Creates GithubActionsBuildFixer instances with a specific git_repo."""
 
@@ -14,11 +28,12 @@ class GithubActionsBuildFixerFactory:
         self._opts = opts
         self._claude_runner = claude_runner
 
-    def create(self, git_repo):
+    def create(self, git_repo, state=None):
         return GithubActionsBuildFixer(
             opts=self._opts,
             git_repo=git_repo,
             claude_runner=self._claude_runner,
+            state=state,
         )
 
 
@@ -29,12 +44,19 @@ class GithubActionsBuildFixer:
         opts: ImplementOpts with execution parameters.
         git_repo: GitRepository (or FakeGitRepository) for branch/push/CI operations.
         claude_runner: ClaudeRunner (or FakeClaudeRunner) for invoking Claude.
+        state: WorkflowState (or FakeWorkflowState) persisting fix attempts per
+            failure fingerprint. Without it, attempts are only remembered for
+            the lifetime of this fixer.
     """
 
-    def __init__(self, opts, git_repo, claude_runner):
+    def __init__(self, opts, git_repo, claude_runner, state=None):
         self._opts = opts
         self._git_repo = git_repo
         self._claude_runner = claude_runner
+        self._state = state
+        self._fingerprints = (
+            state.ci_failure_fingerprints if state is not None else CiFailureFingerprints({})
+        )
 
     def _get_failing_workflow_run(
         self, branch: str, sha: str,
@@ -95,16 +117,45 @@ class GithubActionsBuildFixer:
             print(f"  Workflow '{workflow_name}' failed (run {run_id})")
 
             print("  Fetching failure logs...")
-            failure_logs = self._git_repo.gh_client.get_workflow_failure_logs(run_id)
+            job_logs = self._fetch_job_logs(run_id)
+            failure_logs = (
+                "" if job_logs
+                else self._git_repo.gh_client.get_workflow_failure_logs(run_id)
+            )
+
+            fingerprints = self._failure_fingerprints(workflow_name, failure_logs, job_logs)
+            previous_attempts = max(
+                self._fingerprints.failed_attempts(fingerprint) for fingerprint in fingerprints
+            )
+            if previous_attempts >= MAX_ATTEMPTS_PER_FINGERPRINT:
+                print(
+                    f"  Identical failure already survived {previous_attempts} fix attempts; "
+                    "giving up",
+                    file=sys.stderr,
+                )
+                return False
+            if previous_attempts:
+                print(f"  Failure seen before ({previous_attempts} failed attempt(s)); escalating")
 
             head_before = self._git_repo.head_sha
-            self._invoke_claude_for_fix(run_id, workflow_name, failure_logs)
+            self._invoke_claude_for_fix(CiFixRequest(
+                run_id=run_id,
+                workflow_name=workflow_name,
+                failure_logs=failure_logs,
+                job_logs=job_logs,
+                previous_attempts=previous_attempts,
+            ))
 
             if not self._git_repo.head_advanced_since(head_before):
                 print("  Claude did not make any commits")
+                self._record_attempt(fingerprints, OUTCOME_NO_COMMIT, head_before)
                 continue
 
             passed = self._push_and_wait_for_ci(current_sha)
+            self._record_attempt(
+                fingerprints, OUTCOME_FIXED if passed else OUTCOME_STILL_FAILING,
+                self._git_repo.head_sha,
+            )
             if passed:
                 return True
             current_sha = self._git_repo.head_sha
@@ -112,6 +163,42 @@ class GithubActionsBuildFixer:
         print(f"Max retries ({max_retries}) exceeded")
         return False
 
+    def fix_local_ci_failures(self, local_ci) -> bool:
+        """Run local_ci and let Claude fix its failures before pushing.
+
+        Returns True once the local run passes, False if it still fails
+        after ci_fix_retries attempts (the caller pushes anyway and lets
+        remote CI decide).
+        """
+        max_retries = self._opts.ci_fix_retries
+        print("Running local CI pre-flight...")
+        result = local_ci.run()
+        for attempt in range(1, max_retries + 1):
+            if result.passed:
+                print("  Local CI passed")
+                return True
+            job_logs = result.failed_job_logs
+            print(f"  Local CI failed: {', '.join(job_logs)}")
+            print(f"\nLocal CI fix attempt {attempt}/{max_retries}")
+
+            head_before = self._git_repo.head_sha
+            self._invoke_claude_for_fix(CiFixRequest(
+                run_id=None,
+                workflow_name="local pre-flight",
+                failure_logs="",
+                job_logs=job_logs,
+            ))
+            if not self._git_repo.head_advanced_since(head_before):
+                print("  Claude did not make any commits")
+                continue
+            result = local_ci.run()
+
+        if result.passed:
+            print("  Local CI passed")
+            return True
+        print("  Local CI still failing; pushing for remote CI")
+        return False
+
     def _push_and_wait_for_ci(self, current_sha):
         print("  Pushing fix...")
         if not self._git_repo.push():
@@ -132,7 +219,38 @@ class GithubActionsBuildFixer:
             print(f"  CI still failing: {new_failing_run.get('name', 'unknown')}")
         return False
 
-    def _invoke_claude_for_fix(self, run_id, workflow_name, failure_logs):
+    @staticmethod
+    def _failure_fingerprints(workflow_name, failure_logs, job_logs):
+        if job_logs:
+            return [failure_fingerprint(name, logs) for name, logs in job_logs.items()]
+        return [failure_fingerprint(workflow_name, failure_logs)]
+
+    def _record_attempt(self, fingerprints, outcome, sha):
+        for fingerprint in fingerprints:
+            self._fingerprints.record(fingerprint, outcome, sha)
+        if self._state is not None:
+            self._state.save()
+
+    def _fetch_job_logs(self, run_id) -> Dict[str, str]:
+        """Download each failed job's log excerpt concurrently.
+
+        Returns a dict of job label to log excerpt, in job order, or an
+        empty dict when the run's jobs could not be listed.  Logs are
+        fetched per job id; jobs sharing a name are labelled
+        ``name #2``, ``name #3`` and so on so none is dropped.
+        """
+        gh_client = self._git_repo.gh_client
+        jobs = gh_client.get_failed_jobs(run_id)
+        if not jobs:
+            return {}
+        workers = min(MAX_CONCURRENT_LOG_DOWNLOADS, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ci-logs") as pool:
+            logs = list(pool.map(
+                lambda job: gh_client.get_job_failure_logs(job["databaseId"]), jobs,
+            ))
+        return dict(zip(_job_labels(jobs), logs))
+
+    def _invoke_claude_for_fix(self, request: CiFixRequest):
         """Build and run the Claude command for a CI fix."""
         interactive = not self._opts.non_interactive
         cwd = self._git_repo.working_tree_dir
@@ -140,18 +258,28 @@ class GithubActionsBuildFixer:
         if self._opts.mock_claude:
             claude_cmd = ClaudeCodeCommand(
                 cwd=cwd,
-                mock_command=[self._opts.mock_claude, f"fix-ci-{run_id}"],
+                mock_command=[self._opts.mock_claude, f"fix-ci-{request.run_id or 'local'}"],
             )
         else:
             claude_cmd = CommandBuilder().build_ci_fix_command(
-                CiFixRequest(
-                    run_id=run_id,
-                    workflow_name=workflow_name,
-                    failure_logs=failure_logs,
-                ),
+                request,
                 cwd=cwd,
                 interactive=interactive,
             )
 
         print("  Invoking Claude to fix CI failure...")
         self._claude_runner.execute(claude_cmd)
+
+
+def _job_labels(jobs) -> List[str]:
+    """Name each job, numbering repeats of a name (matrix legs) in job order.
+
+    Numbers rather than job ids keep the labels, and so the failure
+    fingerprints, stable across runs of the same workflow.
+    """
+    seen: Dict[str, int] = {}
+    labels = []
+    for job in jobs:
+        count = seen[job["name"]] = seen.get(job["name"], 0) + 1
+        labels.append(job["name"] if count == 1 else f"{job['name']} #{count}")
+    return labels
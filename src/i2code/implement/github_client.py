@@ -2,14 +2,25 @@
 
 import json
 import subprocess
+import tempfile
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from i2code.implement.ci_log_excerpt import CiLogExcerptor
+from i2code.implement.pr_replies import Reply, post_replies
+from i2code.trace.processes import run_command, track_process
+
+FEEDBACK_PAGE_SIZE = 100
+# Job conclusions whose logs explain why a run failed.
+FAILED_JOB_CONCLUSIONS = ("failure", "timed_out", "cancelled")
 
 
 class GitHubClient:
     """Wraps GitHub CLI (gh) calls for PR operations.
 
-    All subprocess calls go through _run_gh() for consistency.
+    All subprocess calls go through _run_gh() for consistency, or
+    _stream_gh() when the output is too large to hold in memory.
 
     Args:
         cwd: Working directory for gh commands. When set, all gh CLI calls
@@ -22,13 +33,37 @@ class GitHubClient:
     def _run_gh(self, args, **kwargs):
         if self._cwd is not None and "cwd" not in kwargs:
             kwargs["cwd"] = self._cwd
-        return subprocess.run(
+        return run_command(
             args,
             capture_output=True,
             text=True,
             **kwargs,
         )
 
+    def _stream_gh(self, args, consume_line: Callable[[str], None]) -> Tuple[int, str]:
+        """Run a gh command, passing each stdout line to consume_line.
+
+        Returns (returncode, stderr).
+        """
+        with track_process(args) as record, tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                args,
+                cwd=self._cwd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                errors="replace",
+            )
+            assert process.stdout is not None
+            with process.stdout:
+                for line in process.stdout:
+                    record.output_bytes += len(line)
+                    consume_line(line)
+            returncode = record.returncode = process.wait()
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode("utf-8", errors="replace")
+        return returncode, stderr
+
     def find_pr(self, branch_name: str) -> Optional[int]:
         result = self._run_gh(
             ["gh", "pr", "list", "--json", "number,headRefName,isDraft", "--state", "open"]
@@ -90,33 +125,70 @@ class GitHubClient:
         )
         return result.returncode == 0
 
-    def fetch_pr_comments(self, pr_number: int) -> List[Dict[str, Any]]:
-        result = self._run_gh(
-            ["gh", "api", f"repos/{{owner}}/{{repo}}/pulls/{pr_number}/comments",
-             "--jq", "."]
-        )
-        if result.returncode != 0:
-            return []
-        return json.loads(result.stdout)
+    def fetch_pr_comments(self, pr_number: int, since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetch review comments, or only those updated at or after since.
 
-    def fetch_pr_reviews(self, pr_number: int) -> List[Dict[str, Any]]:
-        result = self._run_gh(
-            ["gh", "api", f"repos/{{owner}}/{{repo}}/pulls/{pr_number}/reviews",
-             "--jq", "."]
+        With since, comments are paged newest-updated first and paging
+        stops at the first page that reaches back past since.
+        """
+        path = f"repos/{{owner}}/{{repo}}/pulls/{pr_number}/comments"
+        if since is None:
+            return self._fetch_list(path)
+        comments = self._fetch_pages(
+            path,
+            stop_after=lambda page: page[-1].get("updated_at", "") < since,
+            sort="updated", direction="desc",
         )
-        if result.returncode != 0:
-            return []
-        return json.loads(result.stdout)
+        return [c for c in reversed(comments) if c.get("updated_at", since) >= since]
 
-    def fetch_pr_conversation_comments(self, pr_number: int) -> List[Dict[str, Any]]:
-        result = self._run_gh(
-            ["gh", "api", f"repos/{{owner}}/{{repo}}/issues/{pr_number}/comments",
-             "--jq", "."]
-        )
+    def fetch_pr_reviews(self, pr_number: int, known_count: int = 0) -> List[Dict[str, Any]]:
+        """Fetch reviews, skipping pages that only hold the first known_count.
+
+        Reviews are listed oldest first and cannot be deleted once
+        submitted, so paging resumes at the page holding the last known one.
+        """
+        path = f"repos/{{owner}}/{{repo}}/pulls/{pr_number}/reviews"
+        if not known_count:
+            return self._fetch_list(path)
+        return self._fetch_pages(path, first_page=(known_count - 1) // FEEDBACK_PAGE_SIZE + 1)
+
+    def fetch_pr_conversation_comments(
+        self, pr_number: int, since: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch PR conversation comments, or only those updated at or after since."""
+        path = f"repos/{{owner}}/{{repo}}/issues/{pr_number}/comments"
+        if since is None:
+            return self._fetch_list(path)
+        return self._fetch_pages(path, since=since)
+
+    def _fetch_list(self, path: str) -> List[Dict[str, Any]]:
+        result = self._run_gh(["gh", "api", path, "--jq", "."])
         if result.returncode != 0:
             return []
         return json.loads(result.stdout)
 
+    def _fetch_pages(
+        self, path: str, first_page: int = 1,
+        stop_after: Optional[Callable[[List[Dict[str, Any]]], bool]] = None, **params,
+    ) -> List[Dict[str, Any]]:
+        """Fetch a list endpoint page by page until a short page or stop_after.
+
+        Returns [] if any page fails, so a partial fetch is never mistaken
+        for everything newer than a cursor.
+        """
+        items: List[Dict[str, Any]] = []
+        page_number = first_page
+        while True:
+            query = urlencode({**params, "per_page": FEEDBACK_PAGE_SIZE, "page": page_number})
+            result = self._run_gh(["gh", "api", f"{path}?{query}"])
+            if result.returncode != 0:
+                return []
+            page = json.loads(result.stdout)
+            items.extend(page)
+            if len(page) < FEEDBACK_PAGE_SIZE or (stop_after is not None and stop_after(page)):
+                return items
+            page_number += 1
+
     def reply_to_review_comment(self, pr_number: int, comment_id: int, body: str) -> bool:
         result = self._run_gh(
             ["gh", "api",
@@ -131,6 +203,10 @@ class GitHubClient:
         )
         return result.returncode == 0
 
+    def post_replies(self, pr_number: int, replies: List[Reply]) -> List[bool]:
+        """Post many replies at once; see pr_replies.post_replies."""
+        return post_replies(self, pr_number, replies)
+
     def fetch_failed_checks(self, pr_number: int) -> List[Dict[str, Any]]:
         result = self._run_gh(
             ["gh", "pr", "checks", str(pr_number), "--json", "name,state",
@@ -157,12 +233,40 @@ class GitHubClient:
         return json.loads(result.stdout)
 
     def get_workflow_failure_logs(self, run_id: int) -> str:
+        """Return a bounded excerpt of the failed jobs' logs for run_id."""
+        excerptor = CiLogExcerptor()
+        returncode, stderr = self._stream_gh(
+            ["gh", "run", "view", str(run_id), "--log-failed"],
+            excerptor.add_line,
+        )
+        if returncode != 0:
+            return f"Error fetching logs: {stderr}"
+        return excerptor.excerpt()
+
+    def get_failed_jobs(self, run_id: int) -> List[Dict[str, Any]]:
+        """Return the failed jobs of run_id as dicts with databaseId and name."""
         result = self._run_gh(
-            ["gh", "run", "view", str(run_id), "--log-failed"]
+            ["gh", "run", "view", str(run_id), "--json", "jobs"]
         )
-        if result.returncode != 0:
-            return f"Error fetching logs: {result.stderr}"
-        return result.stdout
+        if result.returncode != 0 or not result.stdout.strip():
+            return []
+        jobs = json.loads(result.stdout).get("jobs", [])
+        return [
+            {"databaseId": job.get("databaseId"), "name": job.get("name", "unknown")}
+            for job in jobs
+            if job.get("conclusion") in FAILED_JOB_CONCLUSIONS
+        ]
+
+    def get_job_failure_logs(self, job_id: int) -> str:
+        """Return a bounded excerpt of the failed steps' logs for one job."""
+        excerptor = CiLogExcerptor()
+        returncode, stderr = self._stream_gh(
+            ["gh", "run", "view", "--job", str(job_id), "--log-failed"],
+            excerptor.add_line,
+        )
+        if returncode != 0:
+            return f"Error fetching logs: {stderr}"
+        return excerptor.excerpt()
 
     def wait_for_workflow_completion(
         self, branch: str, sha: str, timeout_seconds: int = 600
@@ -78,6 +78,10 @@ class IdeaProject:
     def state_file(self) -> str:
         return os.path.join(self._directory, f"{self._name}-wt-state.json")
 
+    @property
+    def triage_cache_dir(self) -> str:
+        return os.path.join(self._directory, f"{self._name}-triage-cache")
+
     def validate(self) -> "IdeaProject":
         """Validate that the idea directory exists.
 
@@ -4,10 +4,10 @@ import sys
 
 from dotenv import load_dotenv
 
-from i2code.implement.timing import Timer, timed
 from i2code.implement.workflow_state import WorkflowState
 from i2code.implement.git_setup import validate_idea_files_committed
 from i2code.implement.worktree_setup import ProjectSetup
+from i2code.trace.spans import new_trace_path, span, start_tracing, stop_tracing
 
 
 class ImplementCommand:
@@ -21,7 +21,20 @@ class ImplementCommand:
 
     def execute(self):
         """Implement a development plan using Git worktrees and GitHub Draft PRs."""
-        with timed("validate"):
+        if not self.opts.trace:
+            self._execute()
+            return
+        trace_path = new_trace_path(self.git_repo.main_repo_dir, self.project.name)
+        start_tracing(trace_path)
+        try:
+            with span("implement", kind="command", idea=self.project.name):
+                self._execute()
+        finally:
+            stop_tracing()
+            print(f"Trace written to {trace_path}")
+
+    def _execute(self):
+        with span("validate"):
             self._validate_and_apply_defaults()
         if not self.opts.isolate:
             load_dotenv(".env.local")
@@ -30,7 +43,7 @@ class ImplementCommand:
             self._print_dry_run()
             return
 
-        with timed("check_committed"):
+        with span("check_committed"):
             self._check_idea_files_committed()
 
         # if not self.opts.address_review_comments and self._all_tasks_already_complete():
@@ -68,12 +81,10 @@ class ImplementCommand:
 #        if not self.opts.address_review_comments and self._all_tasks_already_complete_in_worktree():
 #            return
 
-        t_total = Timer.start()
-
-        with timed("load_state"):
+        with span("load_state"):
             state = WorkflowState.load(self.project.state_file)
 
-        with timed("ensure_idea_branch"):
+        with span("ensure_idea_branch", kind="git"):
             idea_branch = self.git_repo.ensure_idea_branch(self.project.name)
         print(f"Idea branch: {idea_branch}")
 
@@ -82,7 +93,7 @@ class ImplementCommand:
             ProjectSetup().setup_worktree(self.git_repo)
             work_project = self.project
         else:
-            with timed("ensure_worktree"):
+            with span("ensure_worktree", kind="git"):
                 self.git_repo = self.git_repo.ensure_worktree(self.project.name, idea_branch)
             print(f"Worktree: {self.git_repo.working_tree_dir}")
             ProjectSetup().setup_worktree(self.git_repo)
@@ -96,7 +107,7 @@ class ImplementCommand:
             print("Setup complete. Exiting (--setup-only mode).")
             return
 
-        with timed("find_pr"):
+        with span("find_pr", kind="gh"):
             existing_pr = self.git_repo.gh_client.find_pr(idea_branch)
         if existing_pr:
             self.git_repo.pr_number = existing_pr
@@ -109,14 +120,13 @@ class ImplementCommand:
             )
             sys.exit(1)
 
-        with timed("worktree_mode.execute"):
+        with span("worktree_mode.execute"):
             worktree_mode = self.mode_factory.make_worktree_mode(
                 git_repo=self.git_repo,
                 state=state,
                 work_project=work_project,
             )
             worktree_mode.execute()
-        t_total.print("_worktree_mode total")
 
     def _validate_and_apply_defaults(self):
         self.project.validate()
@@ -28,6 +28,10 @@ class ImplementOpts:
     address_review_comments: bool = False
     skip_scaffolding: bool = False
     debug_claude: bool = False
+    local_ci: bool = False
+    local_ci_jobs: str | None = None
+    trace: bool = False
+    session_per_thread: bool = False
 
     _INNER_FORWARDED = {
         "cleanup",
@@ -40,6 +44,10 @@ class ImplementOpts:
         "extra_prompt",
         "ci_fix_retries",
         "ci_timeout",
+        "local_ci",
+        "local_ci_jobs",
+        "trace",
+        "session_per_thread",
     }
 
     _INNER_IGNORED = {
@@ -61,6 +69,7 @@ class ImplementOpts:
         ("isolated", "--isolated"),
         ("skip_ci_wait", "--skip-ci-wait"),
         ("address_review_comments", "--address-review-comments"),
+        ("local_ci", "--local-ci"),
     ]
 
     def validate_trunk_options(self):
@@ -78,6 +87,12 @@ class ImplementOpts:
                 f"--trunk cannot be combined with: {', '.join(incompatible)}"
             )
 
+    def local_ci_job_names(self):
+        """Return the --local-ci-jobs selection as a list, or None for all jobs."""
+        if not self.local_ci_jobs:
+            return None
+        return [name.strip() for name in self.local_ci_jobs.split(",") if name.strip()]
+
     def inner_cli_flags(self):
         """Return CLI flags to pass to the inner i2code implement command."""
         result = []
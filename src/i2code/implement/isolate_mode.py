@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from i2code.implement.managed_subprocess import ManagedSubprocess
+from i2code.trace.processes import track_process
 
 
 def _find_i2code_src_dir():
@@ -152,9 +153,11 @@ class SubprocessRunner:
     """Runs subprocess with ManagedSubprocess for clean interrupt handling."""
 
     def run(self, cmd, cwd=None):
-        process = subprocess.Popen(cmd, start_new_session=True, cwd=cwd)
-        with ManagedSubprocess(process, label="isolarium") as managed:
-            process.wait()
+        with track_process(cmd) as record:
+            process = subprocess.Popen(cmd, start_new_session=True, cwd=cwd)
+            with ManagedSubprocess(process, label="isolarium") as managed:
+                process.wait()
+            record.returncode = process.returncode
         if managed.interrupted:
             return 130
         return process.returncode
@@ -0,0 +1,218 @@
+"""Run the ``run:`` steps of GitHub Actions workflows locally before pushing.
+
+This is a pre-flight check, not an Actions emulator: ``uses:`` steps are
+skipped (the worktree is assumed to have the toolchain already), as are
+``run:`` steps that depend on ``${{ }}`` expressions.  Jobs run in
+parallel, in waves ordered by ``needs``.
+"""
+
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import yaml
+
+from i2code.implement.ci_log_excerpt import excerpt_ci_log
+from i2code.trace.processes import run_command
+
+DEFAULT_STEP_TIMEOUT = 900
+MAX_PARALLEL_JOBS = 4
+
+
+@dataclass
+class LocalCiStep:
+    name: str
+    run: str
+    working_directory: Optional[str] = None
+    env: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class LocalCiJob:
+    job_id: str
+    name: str
+    steps: List[LocalCiStep]
+    needs: List[str] = field(default_factory=list)
+    env: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class LocalCiJobResult:
+    name: str
+    passed: bool
+    log: str
+
+
+@dataclass
+class LocalCiResult:
+    jobs: List[LocalCiJobResult]
+
+    @property
+    def passed(self) -> bool:
+        return all(job.passed for job in self.jobs)
+
+    @property
+    def failed_job_logs(self) -> Dict[str, str]:
+        """Log excerpt of each failed job, keyed by job name."""
+        return {job.name: job.log for job in self.jobs if not job.passed}
+
+
+def _literal_env(env) -> Dict[str, str]:
+    """Keep env entries whose values need no expression evaluation."""
+    if not isinstance(env, dict):
+        return {}
+    return {
+        str(key): str(value) for key, value in env.items()
+        if value is not None and "${{" not in str(value)
+    }
+
+
+def _as_list(value) -> List[str]:
+    if value is None:
+        return []
+    return [value] if isinstance(value, str) else [str(item) for item in value]
+
+
+def _parse_job(job_id, job, workflow_env) -> LocalCiJob:
+    steps = []
+    for index, step in enumerate(job.get("steps") or [], start=1):
+        if not isinstance(step, dict) or "run" not in step:
+            continue
+        run = str(step["run"])
+        if "${{" in run:
+            continue
+        steps.append(LocalCiStep(
+            name=str(step.get("name") or f"step {index}"),
+            run=run,
+            working_directory=step.get("working-directory"),
+            env=_literal_env(step.get("env")),
+        ))
+    name = str(job.get("name") or job_id)
+    return LocalCiJob(
+        job_id=job_id,
+        name=job_id if "${{" in name else name,
+        steps=steps,
+        needs=_as_list(job.get("needs")),
+        env={**workflow_env, **_literal_env(job.get("env"))},
+    )
+
+
+def load_local_ci_jobs(repo_path: str, job_names: Optional[List[str]] = None) -> List[LocalCiJob]:
+    """Parse .github/workflows/*.yml and return the locally runnable jobs.
+
+    Jobs are matched against job_names by job id or display name; with no
+    names given, every job that has at least one runnable step is returned.
+    """
+    workflows_dir = Path(repo_path) / ".github" / "workflows"
+    if not workflows_dir.is_dir():
+        return []
+    jobs = []
+    for path in sorted(workflows_dir.iterdir()):
+        if path.suffix not in (".yml", ".yaml"):
+            continue
+        try:
+            workflow = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        except (OSError, yaml.YAMLError):
+            continue
+        if not isinstance(workflow, dict):
+            continue
+        workflow_env = _literal_env(workflow.get("env"))
+        for job_id, job in (workflow.get("jobs") or {}).items():
+            if not isinstance(job, dict):
+                continue
+            parsed = _parse_job(str(job_id), job, workflow_env)
+            if job_names and parsed.job_id not in job_names and parsed.name not in job_names:
+                continue
+            if parsed.steps:
+                jobs.append(parsed)
+    return jobs
+
+
+def dependency_waves(jobs: List[LocalCiJob]) -> List[List[LocalCiJob]]:
+    """Group jobs into waves; each job comes after the selected jobs it needs.
+
+    needs entries naming unselected jobs are ignored; jobs caught in a
+    dependency cycle form a final wave.
+    """
+    selected = {job.job_id for job in jobs}
+    waves, placed = [], set()
+    pending = list(jobs)
+    while pending:
+        ready = [
+            job for job in pending
+            if {need for need in job.needs if need in selected} <= placed
+        ] or pending
+        waves.append(ready)
+        placed.update(job.job_id for job in ready)
+        pending = [job for job in pending if job.job_id not in placed]
+    return waves
+
+
+class LocalCiRunner:
+    """Runs workflow jobs in a working tree and collects their failure logs.
+
+    Args:
+        repo_path: Working tree containing .github/workflows.
+        job_names: Optional job ids or names to run; default all.
+        run_fn: run_command-compatible callable, injectable for tests.
+    """
+
+    def __init__(self, repo_path, job_names=None, run_fn=run_command,
+                 step_timeout=DEFAULT_STEP_TIMEOUT, max_parallel=MAX_PARALLEL_JOBS):
+        self._repo_path = repo_path
+        self._job_names = job_names
+        self._run_fn = run_fn
+        self._step_timeout = step_timeout
+        self._max_parallel = max_parallel
+
+    def run(self) -> LocalCiResult:
+        """Run the selected jobs; a job whose dependency failed is not run."""
+        jobs = load_local_ci_jobs(self._repo_path, self._job_names)
+        selected = {job.job_id for job in jobs}
+        results: Dict[str, LocalCiJobResult] = {}
+        with ThreadPoolExecutor(max_workers=self._max_parallel, thread_name_prefix="local-ci") as pool:
+            for wave in dependency_waves(jobs):
+                runnable = [
+                    job for job in wave
+                    if all(
+                        need in results and results[need].passed
+                        for need in job.needs if need in selected
+                    )
+                ]
+                for job, result in zip(runnable, pool.map(self._run_job, runnable)):
+                    results[job.job_id] = result
+        return LocalCiResult(jobs=list(results.values()))
+
+    def _run_job(self, job: LocalCiJob) -> LocalCiJobResult:
+        log_lines = []
+        for step in job.steps:
+            passed, output = self._run_step(job, step)
+            log_lines.extend(f"{job.name}\t{step.name}\t{line}" for line in output.splitlines())
+            if not passed:
+                return LocalCiJobResult(job.name, False, excerpt_ci_log(log_lines))
+        return LocalCiJobResult(job.name, True, "")
+
+    def _run_step(self, job: LocalCiJob, step: LocalCiStep):
+        cwd = self._repo_path
+        if step.working_directory:
+            cwd = os.path.join(self._repo_path, step.working_directory)
+        env = {**os.environ, "CI": "true", **job.env, **step.env}
+        try:
+            result = self._run_fn(
+                ["bash", "-e", "-c", step.run],
+                cwd=cwd,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                timeout=self._step_timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return False, f"Step timed out after {self._step_timeout}s"
+        output = (result.stdout or "") + (result.stderr or "")
+        if result.returncode != 0:
+            output += f"\n##[error]Process completed with exit code {result.returncode}."
+        return result.returncode == 0, output
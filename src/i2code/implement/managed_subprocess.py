@@ -1,9 +1,14 @@
+import asyncio
 import os
 import signal
 import subprocess
 import sys
 import threading
-from typing import List, Optional
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Union
+
+# What signal.getsignal() returns and signal.signal() accepts.
+SignalHandler = Union[Callable[[int, Optional[FrameType]], Any], int, None]
 
 
 class ManagedSubprocess:
@@ -73,3 +78,107 @@ class ManagedSubprocess:
         print("Done.", file=sys.stderr)
         self.interrupted = True
         return True
+
+
+class AsyncManagedSubprocess:
+    """Async counterpart of ManagedSubprocess supervising many children at once.
+
+    Used with ``async with`` on the running event loop; every process
+    passed to add() must have been started with start_new_session=True.
+    Handling matches ManagedSubprocess, applied to all children: Ctrl+Z
+    stops each child's process group before stopping this process,
+    resuming forwards SIGCONT, and Ctrl+C terminates every child
+    (force-killing after terminate_timeout) and sets interrupted instead
+    of raising KeyboardInterrupt.  Children still running when the block
+    exits with an exception are terminated the same way.
+    """
+
+    def __init__(self, label: str, terminate_timeout: float = 5.0):
+        self.label = label
+        self.terminate_timeout = terminate_timeout
+        self.interrupted = False
+        self._processes: List[asyncio.subprocess.Process] = []
+        self._original_handlers: Dict[int, SignalHandler] = {}
+        self._shutdown: Optional[asyncio.Task] = None
+
+    def add(self, process: asyncio.subprocess.Process) -> None:
+        self._processes.append(process)
+
+    def _running(self) -> List[asyncio.subprocess.Process]:
+        return [p for p in self._processes if p.returncode is None]
+
+    def _signal_groups(self, signum: int) -> None:
+        for process in self._running():
+            try:
+                os.killpg(process.pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def _handle_sigtstp(self) -> None:
+        self._signal_groups(signal.SIGTSTP)
+        asyncio.get_running_loop().remove_signal_handler(signal.SIGTSTP)
+        os.kill(os.getpid(), signal.SIGTSTP)
+
+    def _handle_sigcont(self) -> None:
+        self._signal_groups(signal.SIGCONT)
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTSTP, self._handle_sigtstp)
+
+    def _handle_sigint(self) -> None:
+        if self.interrupted:
+            return
+        self.interrupted = True
+        print(
+            f"\nInterrupted. Terminating {self.label} processes...",
+            file=sys.stderr,
+        )
+        self._shutdown = asyncio.get_running_loop().create_task(self._terminate_all())
+
+    async def __aenter__(self) -> "AsyncManagedSubprocess":
+        loop = asyncio.get_running_loop()
+        handlers = {
+            signal.SIGTSTP: self._handle_sigtstp,
+            signal.SIGCONT: self._handle_sigcont,
+            signal.SIGINT: self._handle_sigint,
+        }
+        for signum, handler in handlers.items():
+            self._original_handlers[signum] = signal.getsignal(signum)
+            loop.add_signal_handler(signum, handler)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            if self._shutdown is None and exc_type is not None and self._running():
+                self._shutdown = asyncio.ensure_future(self._terminate_all())
+            if self._shutdown is not None:
+                await self._shutdown
+            if self.interrupted:
+                print("Done.", file=sys.stderr)
+        finally:
+            loop = asyncio.get_running_loop()
+            for signum, original in self._original_handlers.items():
+                loop.remove_signal_handler(signum)
+                signal.signal(signum, original)
+
+    async def _terminate_all(self) -> None:
+        processes = self._running()
+        for process in processes:
+            _send(process.terminate)
+        waiting = asyncio.gather(*(p.wait() for p in processes))
+        try:
+            await asyncio.wait_for(asyncio.shield(waiting), self.terminate_timeout)
+        except asyncio.TimeoutError:
+            print(
+                f"Force-killing {self.label} processes...",
+                file=sys.stderr,
+            )
+            for process in self._running():
+                _send(process.kill)
+            await waiting
+
+
+def _send(signal_process) -> None:
+    """Call process.terminate or process.kill, ignoring a process that already exited."""
+    try:
+        signal_process()
+    except ProcessLookupError:
+        pass
@@ -3,11 +3,16 @@
 from i2code.implement.command_builder import CommandBuilder
 from i2code.implement.commit_recovery import TaskCommitRecovery
 from i2code.implement.github_actions_monitor import GithubActionsMonitor
+from i2code.implement.idea_project import IdeaProject
 from i2code.implement.isolate_mode import IsolateMode, SubprocessRunner, WorktreeSetupDeps
+from i2code.implement.local_ci import LocalCiRunner
 from i2code.implement.pr_helpers import push_branch_to_remote
 from i2code.implement.project_scaffolding import ProjectScaffolder, ScaffoldingCreator, ScaffoldingSteps
 from i2code.implement.pull_request_review_processor import PullRequestReviewProcessor
+from i2code.implement.thread_sessions import ThreadSessions
+from i2code.implement.triage_cache import TriageCache
 from i2code.implement.trunk_mode import TrunkMode
+from i2code.implement.workflow_state import WorkflowState
 from i2code.implement.workspace import Workspace
 from i2code.implement.worktree_mode import LoopSteps, WorktreeMode
 from i2code.implement.worktree_setup import ProjectSetup
@@ -28,11 +33,15 @@ class ModeFactory:
             project=project,
             claude_runner=self._claude_runner,
         )
+        sessions = None
+        if self._opts.session_per_thread:
+            sessions = ThreadSessions(WorkflowState.load(project.state_file))
         return TrunkMode(
             opts=self._opts,
             workspace=workspace,
             claude_runner=self._claude_runner,
             commit_recovery=commit_recovery,
+            sessions=sessions,
         )
 
     def make_isolate_mode(self, git_repo, project, opts):
@@ -71,18 +80,25 @@ class ModeFactory:
             skip_ci_wait=self._opts.skip_ci_wait,
             ci_timeout=self._opts.ci_timeout,
         )
-        build_fixer = self._build_fixer_factory.create(git_repo)
+        build_fixer = self._build_fixer_factory.create(git_repo, state=state)
         review_processor = PullRequestReviewProcessor(
             opts=self._opts,
             git_repo=git_repo,
             state=state,
             claude_runner=self._claude_runner,
+            # Kept beside the workflow state in the main repo's idea directory.
+            triage_cache=TriageCache(IdeaProject(self._opts.idea_directory).triage_cache_dir),
         )
         commit_recovery = TaskCommitRecovery(
             git_repo=git_repo,
             project=work_project,
             claude_runner=self._claude_runner,
         )
+        local_ci = None
+        if self._opts.local_ci:
+            local_ci = LocalCiRunner(
+                git_repo.working_tree_dir, job_names=self._opts.local_ci_job_names(),
+            )
         loop_steps = LoopSteps(
             claude_runner=self._claude_runner,
             state=state,
@@ -90,6 +106,8 @@ class ModeFactory:
             build_fixer=build_fixer,
             review_processor=review_processor,
             commit_recovery=commit_recovery,
+            local_ci=local_ci,
+            sessions=ThreadSessions(state) if self._opts.session_per_thread else None,
         )
         return WorktreeMode(
             opts=self._opts,
@@ -2,11 +2,11 @@
 
 import glob
 import os
-import subprocess
 import sys
 from typing import List, Optional
 
 from i2code.implement.github_client import GitHubClient
+from i2code.trace.processes import run_command
 
 
 def _default_gh_client():
@@ -65,7 +65,7 @@ def create_draft_pr(branch_name: str, title: str, body: str, base_branch: str) -
 
 def push_branch_to_remote(branch_name: str) -> bool:
     """Push a branch to the remote origin."""
-    result = subprocess.run(
+    result = run_command(
         ["git", "push", "-u", "origin", branch_name],
         capture_output=True, text=True,
     )
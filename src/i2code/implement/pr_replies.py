@@ -0,0 +1,59 @@
+"""Post i2code's replies to PR feedback in bulk."""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, List
+
+I2CODE_MARKER = "<!-- i2code -->"
+MAX_PARALLEL_REPLIES = 8
+
+
+@dataclass(frozen=True)
+class Reply:
+    """A reply to one feedback item.
+
+    in_thread replies answer a line-anchored review comment in its thread;
+    the rest become part of a general PR comment quoting comment_id.
+    """
+
+    comment_id: Any
+    text: str
+    in_thread: bool
+
+
+def consolidated_body(replies: List[Reply]) -> str:
+    """One general PR comment answering each reply's comment in turn."""
+    sections = [f"Re: comment {reply.comment_id}\n\n{reply.text}" for reply in replies]
+    return f"{I2CODE_MARKER}\n" + "\n\n".join(sections)
+
+
+def post_replies(gh_client, pr_number: int, replies: List[Reply]) -> List[bool]:
+    """Post replies concurrently; return whether each one was posted.
+
+    Thread replies need one request each and are sent in parallel.  All
+    general replies are folded into a single PR comment, so they succeed
+    or fail together.
+    """
+    results = [False] * len(replies)
+    jobs = []
+    general = []
+    for position, reply in enumerate(replies):
+        if reply.in_thread:
+            body = f"{I2CODE_MARKER}\n{reply.text}"
+            jobs.append(([position], lambda r=reply, b=body: gh_client.reply_to_review_comment(
+                pr_number, r.comment_id, b,
+            )))
+        else:
+            general.append(position)
+    if general:
+        body = consolidated_body([replies[position] for position in general])
+        jobs.append((general, lambda: gh_client.reply_to_pr_comment(pr_number, body)))
+    if not jobs:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_REPLIES, len(jobs))) as pool:
+        outcomes = list(pool.map(lambda job: job[1](), jobs))
+    for (positions, _), success in zip(jobs, outcomes):
+        for position in positions:
+            results[position] = bool(success)
+    return results
@@ -0,0 +1,217 @@
+"""Prompt size accounting and per-template budgets.
+
+Each template argument is measured in bytes and approximate tokens; an
+argument mapping names to texts, such as per-job CI logs, is measured per
+entry.  When a rendered prompt exceeds its template's token budget, the
+template's shrinkable arguments are reduced in priority order, re-rendering
+after each, until the prompt fits or nothing is left to shrink.  Arguments
+that must reach Claude whole are never shrinkable; a prompt that is still
+over budget is reported as such.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, TypeGuard
+
+CHARS_PER_TOKEN = 4
+MIN_SECTION_CHARS = 400
+# Room left for the omission markers a shrink adds.
+_MARKER_ALLOWANCE = 80
+
+
+@dataclass(frozen=True)
+class Size:
+    """Size of a piece of prompt text."""
+    bytes: int
+    tokens: int
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"bytes": self.bytes, "tokens": self.tokens}
+
+
+def approx_tokens(text: str) -> int:
+    """Rough token count: about CHARS_PER_TOKEN characters per token."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def measure(text: str) -> Size:
+    return Size(bytes=len(text.encode("utf-8")), tokens=approx_tokens(text))
+
+
+def shrink_middle(text: str, max_chars: int) -> str:
+    """Keep the head and tail of text on line boundaries, noting what was cut."""
+    if len(text) <= max_chars:
+        return text
+    head = text[:max_chars * 2 // 3]
+    tail = text[len(text) - (max_chars - len(head)):]
+    if "\n" in head:
+        head = head[:head.rindex("\n") + 1]
+    if "\n" in tail:
+        tail = tail[tail.index("\n") + 1:]
+    omitted = text[len(head):len(text) - len(tail)]
+    lines = omitted.count("\n") or 1
+    return f"{head}[... {lines} lines omitted to fit the prompt budget ...]\n{tail}"
+
+
+def shrink_markdown_items(text: str, max_chars: int) -> str:
+    """Cap the body under every markdown heading evenly, keeping all headings.
+
+    Used for formatted PR feedback, whose headings carry the comment IDs
+    that Claude must echo back: every item stays visible, and only the
+    longest bodies are cut.
+    """
+    if len(text) <= max_chars:
+        return text
+    blocks = _split_at_headings(text)
+    # Every heading is kept, and any body may gain an omission marker.
+    fixed = sum(len(heading) + _MARKER_ALLOWANCE for heading, _ in blocks)
+    cap = _even_cap([len(body) for _, body in blocks], max_chars - fixed)
+    parts = []
+    for heading, body in blocks:
+        parts.append(heading)
+        if len(body) > cap:
+            body = f"{body[:cap]}\n[... {len(body) - cap} chars omitted to fit the prompt budget ...]\n"
+        parts.append(body)
+    return "".join(parts)
+
+
+def _split_at_headings(text: str) -> List[Tuple[str, str]]:
+    """Split text into (heading line, body) pairs; leading text has an empty heading."""
+    blocks: List[Tuple[str, str]] = [("", "")]
+    for line in text.splitlines(keepends=True):
+        if line.startswith("#"):
+            blocks.append((line, ""))
+        else:
+            heading, body = blocks[-1]
+            blocks[-1] = (heading, body + line)
+    return blocks
+
+
+def _even_cap(lengths: List[int], budget: int) -> int:
+    """Largest per-item cap such that the capped lengths fit in budget."""
+    remaining = max(budget, 0)
+    for i, length in enumerate(sorted(lengths)):
+        share = remaining // (len(lengths) - i)
+        if length > share:
+            return share
+        remaining -= length
+    return max(lengths, default=0)
+
+
+Shrinker = Callable[[str, int], str]
+
+
+@dataclass(frozen=True)
+class TemplateBudget:
+    """Token budget for one template.
+
+    shrinkable lists (argument name, shrinker) pairs, shrunk in order until
+    the prompt fits.  A mapping argument is shrunk by applying the shrinker
+    to each of its texts, with the room split evenly between them.
+    """
+    max_tokens: int
+    shrinkable: Tuple[Tuple[str, Shrinker], ...] = ()
+
+
+TEMPLATE_BUDGETS: Dict[str, TemplateBudget] = {
+    "triage_feedback.j2": TemplateBudget(30_000, (("feedback_content", shrink_markdown_items),)),
+    "fix_feedback.j2": TemplateBudget(20_000, (
+        ("feedback_content", shrink_markdown_items),
+        ("fix_description", shrink_middle),
+    )),
+    "address_feedback.j2": TemplateBudget(20_000, (("feedback_content", shrink_markdown_items),)),
+    "commit_recovery.j2": TemplateBudget(15_000, (("diff_summary", shrink_middle),)),
+    "ci_fix.j2": TemplateBudget(15_000, (
+        ("job_logs", shrink_middle),
+        ("failure_logs", shrink_middle),
+    )),
+    # The task description is the work itself, so it is never cut.
+    "task_execution.j2": TemplateBudget(10_000, (("extra_prompt", shrink_middle),)),
+}
+
+
+@dataclass
+class BudgetedPrompt:
+    """A rendered prompt with the sizes of its arguments as requested."""
+    prompt: str
+    size: Size
+    sections: Dict[str, Size] = field(default_factory=dict)
+    truncated: List[str] = field(default_factory=list)
+    budget_tokens: Optional[int] = None
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget_tokens is not None and self.size.tokens > self.budget_tokens
+
+    def trace_attrs(self) -> Dict[str, object]:
+        return {
+            "bytes": self.size.bytes,
+            "tokens": self.size.tokens,
+            "budget_tokens": self.budget_tokens,
+            "sections": {name: size.as_dict() for name, size in self.sections.items()},
+            "truncated": self.truncated,
+            "over_budget": self.over_budget,
+        }
+
+
+def render_within_budget(
+    render: Callable[..., str],
+    budget: Optional[TemplateBudget],
+    template_args: Mapping[str, object],
+) -> BudgetedPrompt:
+    """Render with render(**args), shrinking args until budget is met.
+
+    Without a budget the prompt is rendered as is and only measured.
+    """
+    args = dict(template_args)
+    sections = _measure_sections(args)
+    prompt = render(**args)
+    if budget is None:
+        return BudgetedPrompt(prompt=prompt, size=measure(prompt), sections=sections)
+    truncated: List[str] = []
+    for name, shrink in budget.shrinkable:
+        overflow = len(prompt) - budget.max_tokens * CHARS_PER_TOKEN
+        if overflow <= 0:
+            break
+        shrunk = _shrunk(args.get(name), shrink, overflow)
+        if shrunk is None:
+            continue
+        args[name] = shrunk
+        truncated.append(name)
+        prompt = render(**args)
+    return BudgetedPrompt(
+        prompt=prompt,
+        size=measure(prompt),
+        sections=sections,
+        truncated=truncated,
+        budget_tokens=budget.max_tokens,
+    )
+
+
+def _measure_sections(args: Mapping[str, object]) -> Dict[str, Size]:
+    sections: Dict[str, Size] = {}
+    for name, value in args.items():
+        if isinstance(value, str):
+            sections[name] = measure(value)
+        elif _is_text_mapping(value):
+            for key, text in value.items():
+                sections[f"{name}[{key}]"] = measure(text)
+    return sections
+
+
+def _shrunk(value: object, shrink: Shrinker, overflow: int) -> Optional[object]:
+    """value shrunk by about overflow chars, or None if it cannot shrink."""
+    if isinstance(value, str):
+        target = max(len(value) - overflow - _MARKER_ALLOWANCE, MIN_SECTION_CHARS)
+        return shrink(value, target) if target < len(value) else None
+    if _is_text_mapping(value):
+        lengths = [len(text) for text in value.values()]
+        room = sum(lengths) - overflow - _MARKER_ALLOWANCE * len(lengths)
+        cap = max(_even_cap(lengths, room), MIN_SECTION_CHARS)
+        if cap >= max(lengths, default=0):
+            return None
+        return {key: shrink(text, cap) for key, text in value.items()}
+    return None
+
+
+def _is_text_mapping(value: object) -> TypeGuard[Mapping[str, str]]:
+    return isinstance(value, Mapping) and all(isinstance(text, str) for text in value.values())
@@ -1,15 +1,17 @@
 """PullRequestReviewProcessor: processes PR review feedback."""
 
 import json
-import os
 import re
 import sys
-from datetime import datetime, timezone
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+import tempfile
+from typing import AbstractSet, Any, Dict, List, Optional
 
 from i2code.implement.claude_runner import ClaudeCodeCommand
 from i2code.implement.command_builder import CommandBuilder, FixRequest
+from i2code.implement.feedback_index import FeedbackIndex
+from i2code.implement.fix_groups import MAX_CONCURRENT_FIXES, partition_fix_groups
+from i2code.implement.pr_replies import I2CODE_MARKER, Reply
+from i2code.implement.triage_log import TriageLog, default_log_dir
 
 
 class PullRequestReviewProcessor:
@@ -20,13 +22,17 @@ class PullRequestReviewProcessor:
         git_repo: GitRepository (or FakeGitRepository) for branch/push/PR/CI operations.
         state: WorkflowState (or FakeWorkflowState) for tracking processed feedback.
         claude_runner: ClaudeRunner (or FakeClaudeRunner) for invoking Claude.
+        triage_cache: Optional TriageCache; when set, triage of feedback seen
+            before (e.g. on a retry after a crash) skips Claude.
     """
 
-    def __init__(self, opts, git_repo, state, claude_runner):
+    def __init__(self, opts, git_repo, state, claude_runner, triage_cache=None):
         self._opts = opts
         self._git_repo = git_repo
         self._state = state
         self._claude_runner = claude_runner
+        self._triage_cache = triage_cache
+        self._triage_log = None
 
     def process_feedback(self):
         """Process PR feedback if any exists.
@@ -54,30 +60,34 @@ class PullRequestReviewProcessor:
         """
         pr_number = self._git_repo.pr_number
 
-        new_review_comments, new_reviews, new_conversation = (
-            self._fetch_unprocessed_feedback(pr_number)
-        )
-
-        has_feedback = any([new_review_comments, new_reviews, new_conversation])
-        if not has_feedback:
+        feedback = self._fetch_unprocessed_feedback(pr_number)
+        if not feedback:
             return (False, False)
 
-        return self._triage_and_apply_feedback(
-            new_review_comments, new_reviews, new_conversation, pr_number,
-        )
+        return self._triage_and_apply_feedback(feedback, pr_number)
 
-    I2CODE_MARKER = "<!-- i2code -->"
+    I2CODE_MARKER = I2CODE_MARKER
 
     def _fetch_unprocessed_feedback(self, pr_number):
-        """Fetch PR feedback and filter to only unprocessed items."""
+        """Fetch PR feedback and index the unprocessed items.
+
+        Only feedback newer than the state's high-water marks is fetched.
+        Review comments are refetched in full when there is a new review:
+        comments drafted in a pending review can predate the mark.
+        """
         gh_client = self._git_repo.gh_client
+        marks = self._state.high_water_marks
 
-        review_comments = gh_client.fetch_pr_comments(pr_number)
-        reviews = gh_client.fetch_pr_reviews(pr_number)
-        conversation_comments = gh_client.fetch_pr_conversation_comments(pr_number)
+        reviews = gh_client.fetch_pr_reviews(pr_number, known_count=len(self._state.processed_review_ids))
+        new_reviews = self._get_new_feedback(reviews, self._state.processed_review_ids)
+        review_comments = gh_client.fetch_pr_comments(
+            pr_number, since=None if new_reviews else marks.get("comment"),
+        )
+        conversation_comments = gh_client.fetch_pr_conversation_comments(
+            pr_number, since=marks.get("conversation"),
+        )
 
         new_review_comments = self._get_new_feedback(review_comments, self._state.processed_comment_ids)
-        new_reviews = self._get_new_feedback(reviews, self._state.processed_review_ids)
         new_conversation = self._get_new_feedback(conversation_comments, self._state.processed_conversation_ids)
 
         new_review_comments, self_comment_ids = self._filter_self_comments(new_review_comments)
@@ -91,7 +101,13 @@ class PullRequestReviewProcessor:
         )
         self._state.mark_comments_processed(resolved_ids)
 
-        return (new_review_comments, new_reviews, new_conversation)
+        # Everything fetched is now handled, so later polls can skip it.
+        if not new_review_comments:
+            self._state.mark_comments_processed([], latest_timestamp(review_comments))
+        if not new_conversation:
+            self._state.mark_conversations_processed([], latest_timestamp(conversation_comments))
+
+        return FeedbackIndex(new_review_comments, new_reviews, new_conversation)
 
     @classmethod
     def _filter_self_comments(cls, comments):
@@ -115,7 +131,7 @@ class PullRequestReviewProcessor:
         """
         owner, repo = self._parse_owner_repo()
         gh_client = self._git_repo.gh_client
-        resolved_ids = gh_client.get_resolved_review_comment_ids(owner, repo, pr_number)
+        resolved_ids = set(gh_client.get_resolved_review_comment_ids(owner, repo, pr_number))
         return self._exclude_resolved_comments(comments, resolved_ids)
 
     @staticmethod
@@ -136,30 +152,27 @@ class PullRequestReviewProcessor:
     def _parse_owner_repo(self):
         return parse_owner_repo(self._git_repo.origin_url)
 
-    def _triage_and_apply_feedback(self, new_review_comments, new_reviews, new_conversation, pr_number):
+    def _triage_and_apply_feedback(self, feedback, pr_number):
         """Triage feedback via Claude and apply the results.
 
         Returns:
             Tuple of (had_feedback=True, made_changes).
         """
-        print(f"Found new feedback: {len(new_reviews)} review(s), "
-              f"{len(new_review_comments)} review comment(s), "
-              f"{len(new_conversation)} general comment(s)")
+        print(f"Found new feedback: {len(feedback.reviews)} review(s), "
+              f"{len(feedback.review_comments)} review comment(s), "
+              f"{len(feedback.conversation_comments)} general comment(s)")
 
-        feedback_content = self._format_all_feedback(
-            new_review_comments, new_reviews, new_conversation,
-        )
+        feedback_content = self._format_all_feedback(*feedback)
 
         triage = self._triage_feedback(feedback_content, pr_number)
 
         if not triage:
-            self._mark_all_processed(new_review_comments, new_reviews, new_conversation)
+            self._mark_all_processed(feedback)
             return (True, False)
 
-        new_feedback = (new_review_comments, new_reviews, new_conversation)
-        made_changes = self._apply_feedback(triage, new_feedback, pr_number)
+        made_changes = self._apply_feedback(triage, feedback, pr_number)
 
-        self._mark_all_processed(new_review_comments, new_reviews, new_conversation)
+        self._mark_all_processed(feedback)
         return (True, made_changes)
 
     def _triage_feedback(self, feedback_content, pr_number):
@@ -168,20 +181,32 @@ class PullRequestReviewProcessor:
         Returns:
             Parsed triage dict, or None if parsing failed.
         """
+        cache = None if self._opts.mock_claude else self._triage_cache
+        if cache is not None:
+            cached = cache.get(feedback_content)
+            if cached is not None:
+                print("Reusing cached triage for this feedback")
+                return cached
+
         triage_cmd, triage_result = self._run_triage(feedback_content, pr_number)
 
-        prompt = self._extract_prompt_from_command(triage_cmd)
-        self._log_to_file(
-            f"=== Triage request ===\n"
-            f"--- prompt ---\n{prompt}\n"
-            f"--- claude response ---\n{triage_result.output.stdout}\n"
+        triage_log = self._get_triage_log()
+        triage_log.log(
+            "triage",
+            prompt=self._extract_prompt_from_command(triage_cmd),
+            pr=pr_number,
+            returncode=triage_result.returncode,
+            response=triage_result.output.stdout,
         )
+        triage_log.flush()
 
         triage = self._parse_triage_result(triage_result.result_text)
         if not triage:
             print("Warning: Could not parse triage result, marking all as processed")
             return None
 
+        if cache is not None:
+            cache.put(feedback_content, triage)
         return triage
 
     @staticmethod
@@ -195,26 +220,22 @@ class PullRequestReviewProcessor:
         except (ValueError, IndexError):
             return " ".join(cmd)
 
-    def _apply_feedback(self, triage, new_feedback, pr_number):
+    def _apply_feedback(self, triage, feedback, pr_number):
         """Apply a parsed triage result: clarifications then fixes.
 
         Returns:
             True if code changes were made, False otherwise.
             Raises early (returns True) on push failure.
         """
-        new_review_comments, _, new_conversation = new_feedback
-
         will_fix = triage.get("will_fix", [])
         needs_clarification = triage.get("needs_clarification", [])
 
         print(f"Triage result: {len(will_fix)} fix group(s), "
               f"{len(needs_clarification)} needing clarification")
 
-        self._reply_with_clarifications(
-            needs_clarification, pr_number, new_review_comments, new_conversation,
-        )
+        self._reply_with_clarifications(needs_clarification, pr_number, feedback)
 
-        made_any_changes = self._apply_fix_groups(will_fix, new_feedback)
+        made_any_changes = self._apply_fix_groups(will_fix, feedback)
         if made_any_changes is None:
             return True
 
@@ -241,105 +262,145 @@ class PullRequestReviewProcessor:
         result = self._claude_runner.execute(cmd)
         return cmd, result
 
-    def _reply_with_clarifications(self, needs_clarification, pr_number, new_review_comments, new_conversation):
+    def _reply_with_clarifications(self, needs_clarification, pr_number, feedback):
         """Reply to comments needing clarification."""
-        gh_client = self._git_repo.gh_client
-
+        replies = []
         for item in needs_clarification:
             comment_id = item.get("comment_id")
             question = item.get("question", "Could you please clarify?")
-
-            comment_type = self._determine_comment_type(
-                comment_id, new_review_comments, new_conversation,
-            )
-
-            marker = "<!-- i2code -->\n"
             print(f"Asking for clarification on comment {comment_id}...")
-            if comment_type == "review":
-                success = gh_client.reply_to_review_comment(pr_number, comment_id, f"{marker}{question}")
-            else:
-                success = gh_client.reply_to_pr_comment(pr_number, f"{marker}Re: comment {comment_id}\n\n{question}")
+            replies.append(Reply(comment_id, question, feedback.is_review_comment(comment_id)))
 
+        results = self._git_repo.gh_client.post_replies(pr_number, replies) if replies else []
+        for reply, success in zip(replies, results):
             if success:
-                print(f"  Replied to comment {comment_id}")
+                print(f"  Replied to comment {reply.comment_id}")
             else:
-                print(f"  Warning: Failed to reply to comment {comment_id}")
+                print(f"  Warning: Failed to reply to comment {reply.comment_id}")
+
+    def _apply_fix_groups(self, will_fix, feedback):
+        """Apply fix groups by invoking Claude, then push and reply once.
 
-    def _apply_fix_groups(self, will_fix, new_feedback):
-        """Apply fix groups by invoking Claude, pushing, and replying.
+        In non-interactive mode, groups on disjoint files are fixed
+        concurrently in scratch worktrees and cherry-picked onto the branch
+        in triage order; the rest are fixed on the branch one at a time.
+        A group whose commits do not cherry-pick cleanly is redone on the
+        branch.  One push and one CI wait then cover every fix.
 
         Returns:
             True/False for whether changes were made, or None if push failed.
         """
-        made_any_changes = False
+        fix_groups = [group for group in will_fix if group.get("comment_ids")]
+        if self._opts.non_interactive:
+            concurrent, serial = partition_fix_groups(fix_groups, feedback.review_comments)
+        else:
+            concurrent, serial = [], fix_groups
+
+        fixes = []
+        if concurrent:
+            picked, conflicting = self._fix_concurrently(concurrent, feedback)
+            fixes.extend(picked)
+            serial = conflicting + serial
+        for fix_group in serial:
+            commit_sha = self._fix_on_repo(self._git_repo, fix_group, feedback)
+            if commit_sha:
+                fixes.append((commit_sha, fix_group["comment_ids"]))
+
+        if not fixes:
+            return False
+        if not self._push_and_reply(fixes, feedback):
+            return None
+        self._wait_for_ci_if_needed(self._git_repo.head_sha)
+        return True
 
-        for fix_group in will_fix:
-            result = self._process_fix_group(fix_group, new_feedback)
-            if result is None:
-                return None
-            if result:
-                made_any_changes = True
+    def _fix_concurrently(self, fix_groups, feedback):
+        """Fix groups in parallel scratch worktrees and cherry-pick the results.
 
-        return made_any_changes
+        The Claude processes are supervised together from this thread, as
+        signal handling only works on the main thread.
 
-    def _process_fix_group(self, fix_group, new_feedback):
-        """Process a single fix group: invoke Claude, push, reply.
+        Returns:
+            Tuple of ([(commit_sha, comment_ids)] applied to the branch,
+            [fix groups whose commits conflicted]).
+        """
+        print(f"\nFixing {len(fix_groups)} independent group(s) concurrently...")
+        base_sha = self._git_repo.head_sha
+        scratch_repos = []
+        try:
+            for _ in fix_groups:
+                scratch_repos.append(
+                    self._git_repo.add_scratch_worktree(tempfile.mkdtemp(prefix="i2code-fix-")),
+                )
+            fix_cmds = [
+                self._fix_command(scratch_repo, fix_group, feedback)
+                for scratch_repo, fix_group in zip(scratch_repos, fix_groups)
+            ]
+            print(f"  Invoking Claude for {len(fix_cmds)} fixes...")
+            self._claude_runner.execute_all(fix_cmds, max_concurrent=MAX_CONCURRENT_FIXES)
+            commit_shas = [self._new_commit(scratch_repo, base_sha) for scratch_repo in scratch_repos]
+            return self._cherry_pick_fixes(base_sha, scratch_repos, fix_groups, commit_shas)
+        finally:
+            for scratch_repo in scratch_repos:
+                self._git_repo.remove_worktree(scratch_repo.working_tree_dir)
+
+    def _cherry_pick_fixes(self, base_sha, scratch_repos, fix_groups, commit_shas):
+        picked = []
+        conflicting = []
+        for scratch_repo, fix_group, commit_sha in zip(scratch_repos, fix_groups, commit_shas):
+            if not commit_sha:
+                continue
+            if self._git_repo.cherry_pick(base_sha, scratch_repo.head_sha):
+                picked.append((self._git_repo.head_sha[:8], fix_group["comment_ids"]))
+            else:
+                print(f"  Fix for {fix_group['comment_ids']} conflicts with earlier fixes; redoing it")
+                conflicting.append(fix_group)
+        return picked, conflicting
+
+    def _fix_on_repo(self, git_repo, fix_group, feedback):
+        """Have Claude fix a single group in git_repo.
 
         Returns:
-            True if changes were made, False if not, None if push failed.
+            Short SHA of the resulting HEAD, or None if nothing was committed.
         """
-        new_review_comments, new_reviews, new_conversation = new_feedback
-        comment_ids = fix_group.get("comment_ids", [])
-        description = fix_group.get("description", "Address feedback")
+        head_before = git_repo.head_sha
+        fix_cmd = self._fix_command(git_repo, fix_group, feedback)
+        print("  Invoking Claude to fix...")
+        self._claude_runner.execute(fix_cmd)
+        return self._new_commit(git_repo, head_before)
 
-        if not comment_ids:
-            return False
+    def _fix_command(self, git_repo, fix_group, feedback):
+        """Announce a fix group and build the Claude command that fixes it in git_repo."""
+        comment_ids = fix_group["comment_ids"]
+        description = fix_group.get("description", "Address feedback")
 
         print(f"\nFixing: {description}")
         print(f"  Comments: {comment_ids}")
 
-        all_feedback = new_review_comments + new_reviews + new_conversation
-        group_feedback = self._get_feedback_by_ids(all_feedback, comment_ids)
-        group_content = self._format_all_feedback(
-            [f for f in group_feedback if f in new_review_comments],
-            [f for f in group_feedback if f in new_reviews],
-            [f for f in group_feedback if f in new_conversation],
-        )
-
-        commit_sha = self._invoke_fix(group_content, description, comment_ids)
-        if not commit_sha:
-            return False
-
-        if not self._push_and_reply(commit_sha, comment_ids, new_review_comments, new_conversation):
-            return None
-
-        self._wait_for_ci_if_needed(commit_sha)
-        return True
-
-    def _invoke_fix(self, group_content, description, comment_ids):
-        """Invoke Claude to fix a group. Returns short commit SHA or None."""
         pr_number = self._git_repo.pr_number
-        pr_url = self._git_repo.gh_client.get_pr_url(pr_number)
-        interactive = not self._opts.non_interactive
-        head_before = self._git_repo.head_sha
-        cwd = self._git_repo.working_tree_dir
-
+        cwd = git_repo.working_tree_dir
         if self._opts.mock_claude:
-            fix_cmd = ClaudeCodeCommand(
+            return ClaudeCodeCommand(
                 cwd=cwd,
                 mock_command=[self._opts.mock_claude, f"fix-{pr_number}-{comment_ids[0]}"],
             )
-        else:
-            fix_cmd = CommandBuilder().build_fix_command(
-                FixRequest(pr_url=pr_url, feedback_content=group_content, fix_description=description),
-                cwd=cwd,
-                interactive=interactive,
-            )
-
-        print("  Invoking Claude to fix...")
-        self._claude_runner.execute(fix_cmd)
+        selected = feedback.select(comment_ids)
+        group_content = self._format_all_feedback(
+            selected.review_comments, selected.reviews, selected.conversation_comments,
+        )
+        return CommandBuilder().build_fix_command(
+            FixRequest(
+                pr_url=self._git_repo.gh_client.get_pr_url(pr_number),
+                feedback_content=group_content,
+                fix_description=description,
+            ),
+            cwd=cwd,
+            interactive=not self._opts.non_interactive,
+        )
 
-        head_after = self._git_repo.head_sha
+    @staticmethod
+    def _new_commit(git_repo, head_before):
+        """Return the short SHA of git_repo's HEAD if it moved past head_before, else None."""
+        head_after = git_repo.head_sha
         if head_before == head_after:
             print("  Warning: Claude did not make any commits for this fix")
             return None
@@ -348,31 +409,30 @@ class PullRequestReviewProcessor:
         print(f"  Committed: {commit_sha}")
         return commit_sha
 
-    def _push_and_reply(self, commit_sha, comment_ids, new_review_comments, new_conversation):
-        """Push changes and reply to comments. Returns False if push fails."""
-        pr_number = self._git_repo.pr_number
-        gh_client = self._git_repo.gh_client
+    def _push_and_reply(self, fixes, feedback):
+        """Push all fixes, then reply to all their comments in one batch.
+
+        Args:
+            fixes: (commit_sha, comment_ids) per fix, in commit order.
 
+        Returns False if push fails.
+        """
         print("  Pushing...")
         if not self._git_repo.push():
             print("  Error: Could not push fix", file=sys.stderr)
             return False
 
-        for comment_id in comment_ids:
-            comment_type = self._determine_comment_type(
-                comment_id, new_review_comments, new_conversation,
-            )
-            marker = "<!-- i2code -->\n"
-            reply_body = f"Fixed in {commit_sha}"
-            if comment_type == "review":
-                success = gh_client.reply_to_review_comment(pr_number, comment_id, f"{marker}{reply_body}")
-            else:
-                success = gh_client.reply_to_pr_comment(pr_number, f"{marker}Re: comment {comment_id}\n\n{reply_body}")
-
+        replies = [
+            Reply(comment_id, f"Fixed in {commit_sha}", feedback.is_review_comment(comment_id))
+            for commit_sha, comment_ids in fixes
+            for comment_id in comment_ids
+        ]
+        results = self._git_repo.gh_client.post_replies(self._git_repo.pr_number, replies)
+        for reply, success in zip(replies, results):
             if success:
-                print(f"  Replied to comment {comment_id}: {reply_body}")
+                print(f"  Replied to comment {reply.comment_id}: {reply.text}")
             else:
-                print(f"  Warning: Failed to reply to comment {comment_id}")
+                print(f"  Warning: Failed to reply to comment {reply.comment_id}")
 
         return True
 
@@ -394,17 +454,26 @@ class PullRequestReviewProcessor:
         elif ci_success:
             print("  CI passed!")
 
-    def _mark_all_processed(self, new_review_comments, new_reviews, new_conversation):
+    def _mark_all_processed(self, feedback):
         """Mark all feedback items as processed in workflow state."""
-        self._state.mark_comments_processed([c["id"] for c in new_review_comments])
-        self._state.mark_reviews_processed([r["id"] for r in new_reviews])
-        self._state.mark_conversations_processed([c["id"] for c in new_conversation])
+        review_comments, reviews, conversation = feedback
+        self._state.mark_comments_processed(
+            [c["id"] for c in review_comments], latest_timestamp(review_comments),
+        )
+        self._state.mark_reviews_processed([r["id"] for r in reviews], latest_timestamp(reviews))
+        self._state.mark_conversations_processed(
+            [c["id"] for c in conversation], latest_timestamp(conversation),
+        )
 
     @staticmethod
     def _get_new_feedback(
-        all_feedback: List[Dict[str, Any]], processed_ids: List[int],
+        all_feedback: List[Dict[str, Any]], processed_ids: AbstractSet[Any],
     ) -> List[Dict[str, Any]]:
-        """Filter feedback to only include items not yet processed."""
+        """Filter feedback to only include items not yet processed.
+
+        processed_ids should be a set (as WorkflowState provides) so each
+        lookup is constant time on PRs with thousands of comments.
+        """
         return [f for f in all_feedback if f.get("id") not in processed_ids]
 
     @staticmethod
@@ -470,30 +539,10 @@ class PullRequestReviewProcessor:
             print(f"  Output: {text.strip()}", file=sys.stderr)
         return None
 
-    @staticmethod
-    def _get_feedback_by_ids(
-        all_feedback: List[Dict[str, Any]], comment_ids: List[int],
-    ) -> List[Dict[str, Any]]:
-        """Get feedback items matching the given IDs."""
-        return [f for f in all_feedback if f.get("id") in comment_ids]
-
-    @staticmethod
-    def _determine_comment_type(
-        comment_id: int, review_comments: List[Dict], conversation_comments: List[Dict],
-    ) -> str:
-        """Determine whether a comment ID is a review comment or conversation comment."""
-        for c in review_comments:
-            if c.get("id") == comment_id:
-                return "review"
-        return "conversation"
-
-    def _log_to_file(self, message):
-        worktree_name = os.path.basename(self._git_repo.working_tree_dir)
-        log_dir = Path.home() / ".hitl" / worktree_name / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
-        with open(log_dir / "log.log", "a") as f:
-            timestamp = datetime.now(timezone.utc).isoformat()
-            f.write(f"[{timestamp}] {message}\n")
+    def _get_triage_log(self):
+        if self._triage_log is None:
+            self._triage_log = TriageLog(default_log_dir(self._git_repo.working_tree_dir))
+        return self._triage_log
 
 
 def _is_ssh_url(url: str) -> bool:
@@ -511,3 +560,12 @@ def parse_owner_repo(url: str) -> tuple[str, str]:
         path = "/".join(url.split("/")[-2:])
     owner, repo = path.split("/")
     return owner, repo
+
+
+def latest_timestamp(items: List[Dict[str, Any]]) -> Optional[str]:
+    """Latest updated_at/submitted_at/created_at among GitHub feedback items."""
+    timestamps = [
+        item.get("updated_at") or item.get("submitted_at") or item.get("created_at")
+        for item in items
+    ]
+    return max((t for t in timestamps if t), default=None)
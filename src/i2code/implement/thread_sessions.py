@@ -0,0 +1,70 @@
+"""ThreadSessions: one resumable Claude session per steel thread."""
+
+import uuid
+from typing import Dict, Optional
+
+from i2code.implement.claude_runner import ClaudeResult, SessionId
+
+MAX_SESSION_TURNS = 8
+MAX_SESSION_OUTPUT_BYTES = 4 * 1024 * 1024
+
+
+class ThreadSessions:
+    """Hands out the Claude session for the next task of a steel thread.
+
+    The first task of a thread starts a new session and later tasks in the
+    same thread resume it, so Claude does not re-read the idea, spec and
+    plan each time.  A session rolls over to a fresh one after max_turns
+    runs or max_output_bytes of captured output, and after a run that
+    fails outright (it may never have been created).
+
+    Sessions are recorded in the workflow state's ``thread_sessions``
+    mapping only once a run in them succeeds, so a restarted loop resumes
+    the session its thread was using.
+    """
+
+    def __init__(
+        self,
+        state,
+        max_turns: int = MAX_SESSION_TURNS,
+        max_output_bytes: int = MAX_SESSION_OUTPUT_BYTES,
+    ):
+        self._state = state
+        self._max_turns = max_turns
+        self._max_output_bytes = max_output_bytes
+        self._unstarted: Dict[str, str] = {}
+
+    def session_for(self, thread: int) -> SessionId:
+        """Return the session the next task of thread should run in."""
+        record = self._usable_record(str(thread))
+        if record is not None:
+            return SessionId(record["session_id"], is_new=False)
+        session_id = self._unstarted.setdefault(str(thread), str(uuid.uuid4()))
+        return SessionId(session_id, is_new=True)
+
+    def record_run(self, thread: int, session_id: SessionId, result: ClaudeResult) -> None:
+        """Account for a finished run in session_id and persist the mapping."""
+        key = str(thread)
+        sessions = self._state.thread_sessions
+        self._unstarted.pop(key, None)
+        if result.returncode != 0:
+            if sessions.pop(key, None) is not None:
+                self._state.save()
+            return
+
+        record = sessions.get(key)
+        if record is None or record["session_id"] != session_id.session_id:
+            # Only the current thread's session can be resumed again.
+            sessions.clear()
+            record = sessions[key] = {"session_id": session_id.session_id, "turns": 0, "output_bytes": 0}
+        record["turns"] += 1
+        record["output_bytes"] += len(result.output.stdout.encode("utf-8"))
+        self._state.save()
+
+    def _usable_record(self, key: str) -> Optional[dict]:
+        record = self._state.thread_sessions.get(key)
+        if record is None:
+            return None
+        if record["turns"] >= self._max_turns or record["output_bytes"] >= self._max_output_bytes:
+            return None
+        return record
@@ -0,0 +1,56 @@
+"""Content-addressed cache of triage results.
+
+A run that crashes after triage but before marking feedback processed
+refetches the same feedback on retry.  Triage results are cached under a
+hash of the formatted feedback and the triage template version, so the
+retry reuses the earlier result instead of invoking Claude again.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from i2code.implement.command_builder import TRIAGE_TEMPLATE
+from i2code.plan.plan_file_io import atomic_write
+from i2code.templates.template_renderer import template_version
+
+MAX_ENTRIES = 50
+
+
+class TriageCache:
+    """Stores parsed triage JSON as ``<key>.json`` files in cache_dir.
+
+    Only the MAX_ENTRIES most recently written results are kept.
+    """
+
+    def __init__(self, cache_dir: str, max_entries: int = MAX_ENTRIES):
+        self.cache_dir = Path(cache_dir)
+        self._max_entries = max_entries
+        self._template_version = template_version(TRIAGE_TEMPLATE, package="i2code.implement")
+
+    def key(self, feedback_content: str) -> str:
+        digest = hashlib.sha256(f"{self._template_version}\0{feedback_content}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, feedback_content: str) -> Optional[Dict[str, Any]]:
+        """Return the cached triage for this feedback, or None."""
+        try:
+            with open(self._path(feedback_content), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, feedback_content: str, triage: Dict[str, Any]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write(str(self._path(feedback_content)), json.dumps(triage, indent=2))
+        self._prune()
+
+    def _path(self, feedback_content: str) -> Path:
+        return self.cache_dir / f"{self.key(feedback_content)}.json"
+
+    def _prune(self) -> None:
+        entries = sorted(self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime_ns)
+        for stale in entries[:-self._max_entries]:
+            os.remove(stale)
@@ -0,0 +1,182 @@
+"""Structured, size-capped log of triage requests and Claude's responses.
+
+Each entry is one JSON line in ``triage.jsonl``::
+
+    {"ts": "2026-01-01T00:00:00+00:00", "event": "triage", "pr": 6,
+     "prompt": "3f2a...", "response": "..."}
+
+Prompts are large and often repeated, so they are stored once under
+``prompts/<sha256>.txt`` and entries refer to them by hash.  The active
+file is rotated to ``triage-<timestamp>.jsonl`` (gzipped by default) once
+it exceeds MAX_BYTES or MAX_AGE_SECONDS; only BACKUP_COUNT rotated
+segments are kept, and prompts no entry in them can refer to are pruned.
+"""
+
+import atexit
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, TextIO
+
+LOG_FILE = "triage.jsonl"
+PROMPTS_DIR = "prompts"
+
+MAX_BYTES = 10 * 1024 * 1024
+MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+BACKUP_COUNT = 5
+BUFFER_SIZE = 64 * 1024
+
+# Logs flushed at interpreter exit, held weakly so they can still be freed.
+_open_logs: "weakref.WeakSet[TriageLog]" = weakref.WeakSet()
+
+
+def default_log_dir(worktree_dir: str) -> Path:
+    """Return ~/.hitl/<worktree>/logs for a working tree."""
+    return Path.home() / ".hitl" / os.path.basename(worktree_dir) / "logs"
+
+
+def prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+class TriageLog:
+    """Appends triage entries to a rotating JSONL file through a buffer.
+
+    Entries are held in the write buffer until ``flush``; the file is also
+    flushed before rotation and at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        max_bytes: int = MAX_BYTES,
+        max_age_seconds: float = MAX_AGE_SECONDS,
+        backup_count: int = BACKUP_COUNT,
+        compress: bool = True,
+        buffer_size: int = BUFFER_SIZE,
+    ):
+        self.log_dir = Path(log_dir)
+        self.path = self.log_dir / LOG_FILE
+        self.prompts_dir = self.log_dir / PROMPTS_DIR
+        self._max_bytes = max_bytes
+        self._max_age_seconds = max_age_seconds
+        self._backup_count = backup_count
+        self._compress = compress
+        self._buffer_size = buffer_size
+        self._lock = threading.Lock()
+        self._file: Optional[TextIO] = None
+        self._size = 0
+        self._opened_at = 0.0
+        _open_logs.add(self)
+
+    def log(self, event: str, prompt: Optional[str] = None, **fields) -> None:
+        """Append an entry; prompt is stored by reference under prompts/."""
+        entry = {"ts": datetime.now(timezone.utc).isoformat(), "event": event}
+        if prompt is not None:
+            entry["prompt"] = prompt_hash(prompt)
+        entry.update(fields)
+        line = json.dumps(entry, default=str) + "\n"
+        size = len(line.encode("utf-8"))
+        with self._lock:
+            file = self._open()
+            if self._size and self._should_rotate(size):
+                self._rotate(file)
+                file = self._open()
+            # Stored after any rotation so pruning never removes this prompt.
+            if prompt is not None:
+                self._store_prompt(prompt, entry["prompt"])
+            file.write(line)
+            self._size += size
+
+    def read_prompt(self, digest: str) -> str:
+        return (self.prompts_dir / f"{digest}.txt").read_text(encoding="utf-8")
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _store_prompt(self, prompt: str, digest: str) -> None:
+        prompt_file = self.prompts_dir / f"{digest}.txt"
+        if prompt_file.exists():
+            # Touch it so pruning by age keeps prompts that are still in use.
+            os.utime(prompt_file)
+        else:
+            self.prompts_dir.mkdir(parents=True, exist_ok=True)
+            tmp = prompt_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(prompt, encoding="utf-8")
+            os.replace(tmp, prompt_file)
+
+    def _open(self) -> TextIO:
+        """Return the current log file, opening it if needed."""
+        if self._file is not None:
+            return self._file
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        file = self._file = open(self.path, "a", encoding="utf-8", buffering=self._buffer_size)
+        self._size = file.tell()
+        self._opened_at = self._first_entry_time() if self._size else time.time()
+        return file
+
+    def _first_entry_time(self) -> float:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return datetime.fromisoformat(json.loads(f.readline())["ts"]).timestamp()
+        except (OSError, ValueError, KeyError, TypeError):
+            return time.time()
+
+    def _should_rotate(self, incoming: int) -> bool:
+        return (self._size + incoming > self._max_bytes
+                or time.time() - self._opened_at >= self._max_age_seconds)
+
+    def _rotate(self, file: TextIO) -> None:
+        file.close()
+        self._file = None
+        stamp = datetime.fromtimestamp(self._opened_at, timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        segment = self.log_dir / f"triage-{stamp}.jsonl"
+        os.replace(self.path, segment)
+        if self._compress:
+            with open(segment, "rb") as src, gzip.open(f"{segment}.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            segment.unlink()
+        self._prune()
+
+    def _segments(self):
+        return sorted(self.log_dir.glob("triage-*.jsonl*"))
+
+    def _prune(self) -> None:
+        segments = self._segments()
+        for old in segments[:-self._backup_count] if self._backup_count else segments:
+            old.unlink()
+        if not self.prompts_dir.is_dir():
+            return
+        # A prompt last used before the oldest kept segment was started
+        # can only be referenced from segments that were just deleted.
+        kept = self._segments()
+        cutoff = _segment_start(kept[0]) if kept else time.time()
+        for prompt_file in self.prompts_dir.glob("*.txt"):
+            if prompt_file.stat().st_mtime < cutoff:
+                prompt_file.unlink()
+
+
+def _segment_start(segment: Path) -> float:
+    stamp = segment.name.split("-", 1)[1].split(".", 1)[0]
+    return datetime.strptime(stamp, "%Y%m%dT%H%M%S%f").replace(tzinfo=timezone.utc).timestamp()
+
+
+@atexit.register
+def _close_open_logs() -> None:
+    for log in list(_open_logs):
+        log.close()
@@ -12,13 +12,18 @@ from i2code.implement.command_builder import CommandBuilder, TaskCommandOpts
 
 
 class TrunkMode:
-    """Execution mode that runs tasks on the current branch (no worktree/PR/CI)."""
+    """Execution mode that runs tasks on the current branch (no worktree/PR/CI).
 
-    def __init__(self, opts, workspace, claude_runner, commit_recovery):
+    sessions is an optional ThreadSessions that lets consecutive tasks of
+    one steel thread share a Claude session.
+    """
+
+    def __init__(self, opts, workspace, claude_runner, commit_recovery, sessions=None):
         self._opts = opts
         self._workspace = workspace
         self._claude_runner = claude_runner
         self._commit_recovery = commit_recovery
+        self._sessions = sessions
 
     def execute(self):
         """Run the task loop until all tasks are complete."""
@@ -36,13 +41,15 @@ class TrunkMode:
         max_attempts = 3
         task_description = task.print()
 
-        claude_cmd = self._build_command(task_description)
         head_before = self._workspace.git_repo.head_sha
 
         for attempt in range(1, max_attempts + 1):
             print(f"Executing task (attempt {attempt}/{max_attempts}): {task_description}")
 
+            # Rebuilt per attempt: a failed run may roll the thread's session over.
+            claude_cmd = self._build_command(task, task_description)
             claude_result = self._run_claude(claude_cmd)
+            self._record_session(task, claude_cmd, claude_result)
             head_after = self._workspace.git_repo.head_sha
 
             if not check_claude_success(claude_result.returncode, head_before, head_after):
@@ -62,7 +69,7 @@ class TrunkMode:
         print(f"Error: Task failed after {max_attempts} attempts.", file=sys.stderr)
         sys.exit(1)
 
-    def _build_command(self, task_description):
+    def _build_command(self, task, task_description):
         cwd = self._workspace.git_repo.working_tree_dir
         if self._opts.mock_claude:
             return ClaudeCodeCommand(
@@ -81,9 +88,19 @@ class TrunkMode:
                 interactive=not self._opts.non_interactive,
                 extra_prompt=self._opts.extra_prompt,
                 extra_cli_args=extra_cli_args,
+                session_id=self._session_for(task),
             ),
             cwd=cwd,
         )
 
+    def _session_for(self, task):
+        if self._sessions is None:
+            return None
+        return self._sessions.session_for(task.number.thread)
+
+    def _record_session(self, task, claude_cmd, claude_result):
+        if self._sessions is not None and claude_cmd.session_id is not None:
+            self._sessions.record_run(task.number.thread, claude_cmd.session_id, claude_result)
+
     def _run_claude(self, claude_cmd):
         return self._claude_runner.execute(claude_cmd)
@@ -2,57 +2,171 @@
 
 import json
 import os
-from typing import List
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional
+
+from i2code.implement.ci_failure_fingerprints import CiFailureFingerprints
+from i2code.plan.plan_file_io import atomic_write
+
+COMMENTS = "comment"
+REVIEWS = "review"
+CONVERSATIONS = "conversation"
+
+_ID_KEYS = {
+    COMMENTS: "processed_comment_ids",
+    REVIEWS: "processed_review_ids",
+    CONVERSATIONS: "processed_conversation_ids",
+}
+_HIGH_WATER_MARKS_KEY = "high_water_marks"
+
+COMPACT_AFTER_ENTRIES = 200
+
+
+def processed_log_file(state_file: str) -> str:
+    """Path of the append-only log of processed IDs next to state_file."""
+    return f"{os.path.splitext(state_file)[0]}-processed.jsonl"
 
 
 class WorkflowState:
-    """Owns load/save of workflow state and processed-ID tracking."""
+    """Owns load/save of workflow state and processed-ID tracking.
+
+    Processed IDs are held as insertion-ordered sets per feedback kind.
+    ``save`` appends IDs marked since the last save to a JSONL log instead
+    of rewriting the state file; the log is folded back into the state
+    file once it reaches COMPACT_AFTER_ENTRIES entries, or whenever other
+    state (e.g. CI failure fingerprints) has changed.
+
+    Each kind also has a high-water mark: the latest GitHub timestamp of
+    any processed item of that kind, for skipping older items when fetching.
+    """
 
-    def __init__(self, state_file: str, data: dict):
+    def __init__(self, state_file: str, data: dict, log_entries: int = 0, needs_compaction: bool = False):
         self._state_file = state_file
+        self._processed: Dict[str, Dict[Any, None]] = {
+            kind: dict.fromkeys(data.pop(key, [])) for kind, key in _ID_KEYS.items()
+        }
+        self._high_water_marks: Dict[str, str] = dict(data.pop(_HIGH_WATER_MARKS_KEY, {}))
         self._data = data
+        self._saved_data = json.dumps(data, sort_keys=True)
+        self._pending: List[dict] = []
+        self._log_entries = log_entries
+        self._needs_compaction = needs_compaction
 
     @classmethod
     def load(cls, state_file: str) -> "WorkflowState":
         """Load state from file, creating with defaults if it doesn't exist."""
-        if os.path.isfile(state_file):
-            with open(state_file, "r") as f:
-                data = json.load(f)
-            data.pop("slice_number", None)
-            data.setdefault("processed_conversation_ids", [])
-        else:
-            data = {
-                "processed_comment_ids": [],
-                "processed_review_ids": [],
-                "processed_conversation_ids": [],
-            }
-            with open(state_file, "w") as f:
-                json.dump(data, f, indent=2)
-
-        return cls(state_file, data)
+        if not os.path.isfile(state_file):
+            state = cls(state_file, {})
+            state._compact()
+            return state
+
+        with open(state_file, "r") as f:
+            data = json.load(f)
+        migrated = data.pop("slice_number", None) is not None
+        state = cls(
+            state_file, data,
+            needs_compaction=migrated or any(key not in data for key in _ID_KEYS.values()),
+        )
+        state._replay_log()
+        return state
+
+    def _replay_log(self) -> None:
+        log_file = processed_log_file(self._state_file)
+        if not os.path.isfile(log_file):
+            return
+        with open(log_file, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn write from an interrupted save
+                self._apply(entry)
+                self._log_entries += 1
+
+    def _apply(self, entry: dict) -> None:
+        kind = entry.get("kind")
+        if kind not in self._processed:
+            return
+        self._processed[kind].update(dict.fromkeys(entry.get("ids", [])))
+        self._advance_high_water_mark(kind, entry.get("high_water_mark"))
+
+    def _advance_high_water_mark(self, kind: str, timestamp: Optional[str]) -> None:
+        # GitHub timestamps are ISO 8601 UTC, so they order as strings.
+        if timestamp and timestamp > self._high_water_marks.get(kind, ""):
+            self._high_water_marks[kind] = timestamp
 
     def save(self) -> None:
         """Persist current state to disk."""
-        with open(self._state_file, "w") as f:
-            json.dump(self._data, f, indent=2)
+        data_changed = json.dumps(self._data, sort_keys=True) != self._saved_data
+        if (data_changed or self._needs_compaction
+                or self._log_entries + len(self._pending) >= COMPACT_AFTER_ENTRIES):
+            self._compact()
+            return
+        if not self._pending:
+            return
+        with open(processed_log_file(self._state_file), "a") as f:
+            f.write("".join(json.dumps(entry) + "\n" for entry in self._pending))
+        self._log_entries += len(self._pending)
+        self._pending = []
+
+    def _compact(self) -> None:
+        """Rewrite the state file with everything and drop the log."""
+        snapshot = dict(self._data)
+        for kind, key in _ID_KEYS.items():
+            snapshot[key] = list(self._processed[kind])
+        if self._high_water_marks:
+            snapshot[_HIGH_WATER_MARKS_KEY] = dict(self._high_water_marks)
+        atomic_write(self._state_file, json.dumps(snapshot, indent=2))
+        log_file = processed_log_file(self._state_file)
+        if os.path.exists(log_file):
+            os.remove(log_file)
+        self._saved_data = json.dumps(self._data, sort_keys=True)
+        self._pending = []
+        self._log_entries = 0
+        self._needs_compaction = False
+
+    @property
+    def processed_comment_ids(self) -> AbstractSet:
+        return self._processed[COMMENTS].keys()
 
     @property
-    def processed_comment_ids(self) -> List:
-        return self._data["processed_comment_ids"]
+    def processed_review_ids(self) -> AbstractSet:
+        return self._processed[REVIEWS].keys()
 
     @property
-    def processed_review_ids(self) -> List:
-        return self._data["processed_review_ids"]
+    def processed_conversation_ids(self) -> AbstractSet:
+        return self._processed[CONVERSATIONS].keys()
 
     @property
-    def processed_conversation_ids(self) -> List:
-        return self._data["processed_conversation_ids"]
+    def high_water_marks(self) -> Dict[str, str]:
+        """Latest processed timestamp per kind: comment, review, conversation."""
+        return dict(self._high_water_marks)
+
+    @property
+    def ci_failure_fingerprints(self) -> CiFailureFingerprints:
+        return CiFailureFingerprints(self._data.setdefault("ci_failure_fingerprints", {}))
+
+    @property
+    def thread_sessions(self) -> Dict[str, dict]:
+        """Claude session per steel thread number, used by ThreadSessions."""
+        return self._data.setdefault("thread_sessions", {})
+
+    def mark_comments_processed(self, ids: Iterable, high_water_mark: Optional[str] = None) -> None:
+        self._mark_processed(COMMENTS, ids, high_water_mark)
 
-    def mark_comments_processed(self, ids: List) -> None:
-        self._data["processed_comment_ids"].extend(ids)
+    def mark_reviews_processed(self, ids: Iterable, high_water_mark: Optional[str] = None) -> None:
+        self._mark_processed(REVIEWS, ids, high_water_mark)
 
-    def mark_reviews_processed(self, ids: List) -> None:
-        self._data["processed_review_ids"].extend(ids)
+    def mark_conversations_processed(self, ids: Iterable, high_water_mark: Optional[str] = None) -> None:
+        self._mark_processed(CONVERSATIONS, ids, high_water_mark)
 
-    def mark_conversations_processed(self, ids: List) -> None:
-        self._data["processed_conversation_ids"].extend(ids)
+    def _mark_processed(self, kind: str, ids: Iterable, high_water_mark: Optional[str]) -> None:
+        processed = self._processed[kind]
+        new_ids = [i for i in dict.fromkeys(ids) if i not in processed]
+        advances = bool(high_water_mark) and high_water_mark > self._high_water_marks.get(kind, "")
+        if not new_ids and not advances:
+            return
+        entry: Dict[str, Any] = {"kind": kind, "ids": new_ids}
+        if advances:
+            entry["high_water_mark"] = high_water_mark
+        self._apply(entry)
+        self._pending.append(entry)
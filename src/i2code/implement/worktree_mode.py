@@ -3,6 +3,7 @@
 import sys
 import time
 from dataclasses import dataclass
+from typing import Optional
 
 from i2code.claude.permissions import calculate_claude_permissions
 from i2code.implement.git_setup import (
@@ -15,7 +16,8 @@ from i2code.implement.claude_runner import (
 )
 from i2code.implement.command_builder import CommandBuilder, TaskCommandOpts
 from i2code.implement.pr_helpers import is_pr_complete
-from i2code.implement.timing import Timer, timed
+from i2code.implement.thread_sessions import ThreadSessions
+from i2code.trace.spans import span
 
 REVIEW_POLL_INTERVAL_SECONDS = 30
 
@@ -41,6 +43,8 @@ class LoopSteps:
     commit_recovery: object
     clock: object = None
     sleep: object = None
+    local_ci: object = None
+    sessions: Optional[ThreadSessions] = None
 
 
 class WorktreeMode:
@@ -50,7 +54,9 @@ class WorktreeMode:
         opts: ImplementOpts with execution parameters.
         git_repo: GitRepository (or FakeGitRepository) for branch/push/PR/CI operations.
         work_project: IdeaProject for the working directory (may differ from project in worktree mode).
-        loop_steps: LoopSteps grouping claude_runner, state, ci_monitor, build_fixer, review_processor, and commit_recovery.
+        loop_steps: LoopSteps grouping claude_runner, state, ci_monitor, build_fixer, review_processor,
+            commit_recovery, the optional local_ci pre-flight runner, and the optional
+            ThreadSessions that lets tasks of one steel thread share a Claude session.
     """
 
     def __init__(self, opts, git_repo, work_project, loop_steps):
@@ -63,27 +69,25 @@ class WorktreeMode:
 
     def execute(self):
         """Run the worktree task loop until all tasks are complete."""
-        with timed("commit_recovery"):
+        with span("commit_recovery"):
             self._loop_steps.commit_recovery.commit_if_needed()
 
-        with timed("branch_has_been_pushed"):
+        with span("branch_has_been_pushed", kind="git"):
             pushed = self._git_repo.branch_has_been_pushed()
         if pushed and self._git_repo.has_unpushed_commits():
             self._push_and_ensure_pr()
-            self._loop_steps.ci_monitor.wait_for_workflow_completion(self._git_repo.branch, self._git_repo.head_sha)
+            self._wait_for_ci()
 
         while True:
-            t = Timer.start()
-            if self._loop_steps.build_fixer.check_and_fix_ci():
-                t.print("check_and_fix_ci (fix)")
+            with span("check_and_fix_ci", kind="ci"):
+                fixed = self._loop_steps.build_fixer.check_and_fix_ci()
+            if fixed:
                 continue
-            t.print("check_and_fix_ci")
 
-            t = Timer.start()
-            if self._loop_steps.review_processor.process_feedback():
-                t.print("process_feedback (acted)")
+            with span("process_feedback", kind="review"):
+                acted = self._loop_steps.review_processor.process_feedback()
+            if acted:
                 continue
-            t.print("process_feedback")
 
             next_task = self._work_project.get_next_task()
             if next_task is None:
@@ -121,6 +125,16 @@ class WorktreeMode:
     def _execute_task(self, next_task):
         """Execute a single task: run Claude, push, create PR, wait for CI."""
         task_description = next_task.print()
+        with span("task", kind="task", task=task_description):
+            self._run_task(next_task, task_description)
+
+    def _wait_for_ci(self):
+        with span("wait_for_ci", kind="ci"):
+            self._loop_steps.ci_monitor.wait_for_workflow_completion(
+                self._git_repo.branch, self._git_repo.head_sha,
+            )
+
+    def _run_task(self, next_task, task_description):
         progress = self._work_project.task_progress()
         print(f"Executing task {progress.current} of {progress.total}: {task_description}")
 
@@ -129,19 +143,24 @@ class WorktreeMode:
         elapsed = self._clock() - start
         duration = _format_duration(elapsed)
         print(f"Task {progress.current} of {progress.total} completed successfully in {duration}.", flush=True)
+        if self._loop_steps.local_ci is not None:
+            with span("local_ci", kind="ci"):
+                self._loop_steps.build_fixer.fix_local_ci_failures(self._loop_steps.local_ci)
         self._push_and_ensure_pr()
-        self._loop_steps.ci_monitor.wait_for_workflow_completion(self._git_repo.branch, self._git_repo.head_sha)
+        self._wait_for_ci()
 
     def _run_claude_and_validate(self, next_task, task_description):
         """Run Claude on the task and validate the result, retrying up to 3 times."""
         max_attempts = 3
-        claude_cmd = self._build_command(task_description)
         head_before = self._git_repo.head_sha
 
         for attempt in range(1, max_attempts + 1):
             print(f"Running Claude (attempt {attempt}/{max_attempts})...")
 
+            # Rebuilt per attempt: a failed run may roll the thread's session over.
+            claude_cmd = self._build_command(next_task, task_description)
             claude_result = self._run_claude(claude_cmd)
+            self._record_session(next_task, claude_cmd, claude_result)
             head_after = self._git_repo.head_sha
 
             if not check_claude_success(claude_result.returncode, head_before, head_after):
@@ -170,13 +189,13 @@ class WorktreeMode:
         """Push changes and create a Draft PR if one doesn't exist."""
         print("Pushing changes...")
 
-        with timed("push"):
+        with span("push", kind="git"):
             if not self._git_repo.push():
                 print("Error: Could not push commit to branch", file=sys.stderr)
                 sys.exit(1)
 
         if self._git_repo.pr_number is None:
-            with timed("ensure_pr"):
+            with span("ensure_pr", kind="gh"):
                 self._git_repo.ensure_pr(
                     self._work_project.directory, self._work_project.name,
                 )
@@ -187,14 +206,14 @@ class WorktreeMode:
         """Print completion message with PR URL if available."""
         print("All tasks completed!")
         if self._git_repo.pr_number:
-            with timed("mark_pr_ready"):
+            with span("mark_pr_ready", kind="gh"):
                 self._git_repo.gh_client.mark_pr_ready(self._git_repo.pr_number)
             print("PR marked ready for review")
             pr_url = self._git_repo.gh_client.get_pr_url(self._git_repo.pr_number)
             if pr_url:
                 print(f"PR: {pr_url}")
 
-    def _build_command(self, task_description):
+    def _build_command(self, next_task, task_description):
         cwd = self._git_repo.working_tree_dir
         if self._opts.mock_claude:
             return ClaudeCodeCommand(
@@ -213,9 +232,21 @@ class WorktreeMode:
                 interactive=not self._opts.non_interactive,
                 extra_prompt=self._opts.extra_prompt,
                 extra_cli_args=extra_cli_args,
+                session_id=self._session_for(next_task),
             ),
             cwd=cwd,
         )
 
+    def _session_for(self, next_task):
+        sessions = self._loop_steps.sessions
+        if sessions is None:
+            return None
+        return sessions.session_for(next_task.number.thread)
+
+    def _record_session(self, next_task, claude_cmd, claude_result):
+        sessions = self._loop_steps.sessions
+        if sessions is not None and claude_cmd.session_id is not None:
+            sessions.record_run(next_task.number.thread, claude_cmd.session_id, claude_result)
+
     def _run_claude(self, claude_cmd):
         return self._loop_steps.claude_runner.execute(claude_cmd)
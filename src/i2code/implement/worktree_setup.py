@@ -1,9 +1,9 @@
 """ProjectSetup: copy settings and run setup scripts for worktrees and clones."""
 
 import os
-import subprocess
 
 from i2code.claude.permissions import setup_claude_settings_local_json
+from i2code.trace.processes import run_command
 
 
 class ProjectSetup:
@@ -28,4 +28,4 @@ def _run_setup_project_script(project_root):
     """Run dev-scripts/setup-project.sh if it exists in the project."""
     script = os.path.join(project_root, "dev-scripts", "setup-project.sh")
     if os.path.isfile(script):
-        subprocess.run([script], cwd=project_root, check=True)
+        run_command([script], cwd=project_root, check=True)
@@ -28,7 +28,9 @@ register_thread_commands(plan)
 
 @plan.command("create")
 @click.argument("directory")
-def plan_create(directory):
+@click.option("--candidates", type=click.IntRange(min=1), default=1, show_default=True,
+              help="Generate this many plans in parallel and keep the first valid one.")
+def plan_create(directory, candidates):
     """Create an implementation plan from a specification."""
     project = IdeaProject(resolve_idea_directory(directory))
     claude_runner = ClaudeRunner()
@@ -37,7 +39,7 @@ def plan_create(directory):
         plugin_skills_fn=list_plugin_skills,
         validator_fn=validate_plan,
     )
-    create_plan(project, claude_runner, services)
+    create_plan(project, claude_runner, services, candidates=candidates)
 
 
 @plan.command("revise")
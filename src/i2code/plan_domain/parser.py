@@ -7,13 +7,13 @@ from i2code.plan_domain.thread import Thread
 from i2code.plan_domain.task import Task
 
 
-_THREAD_HEADING_RE = re.compile(r'^## (?:Steel )?Thread (\d+):')
-_TASK_LINE_RE = re.compile(r'^- \[[ x]\] \*\*Task \d+\.\d+:')
+THREAD_HEADING_RE = re.compile(r'^## (?:Steel )?Thread (\d+):')
+TASK_LINE_RE = re.compile(r'^- \[[ x]\] \*\*Task \d+\.\d+:')
 
 
 def parse(text: str) -> Plan:
     lines = text.split('\n')
-    thread_starts = _find_matching_lines(lines, _THREAD_HEADING_RE)
+    thread_starts = _find_matching_lines(lines, THREAD_HEADING_RE)
 
     if not thread_starts:
         return Plan(_preamble_lines=lines)
@@ -35,7 +35,7 @@ def _parse_threads(lines: list[str], thread_starts: list[int], end: int) -> list
 
 
 def _parse_thread(lines: list[str]) -> Thread:
-    task_starts = _find_matching_lines(lines, _TASK_LINE_RE)
+    task_starts = _find_matching_lines(lines, TASK_LINE_RE)
 
     if not task_starts:
         return Thread(_header_lines=lines)
@@ -54,7 +54,7 @@ def _find_matching_lines(lines: list[str], pattern: re.Pattern) -> list[int]:
 
 def _find_postamble_start(lines: list[str], last_thread_start: int) -> int:
     for i in range(last_thread_start + 1, len(lines)):
-        if lines[i].startswith('## ') and not _THREAD_HEADING_RE.match(lines[i]):
+        if lines[i].startswith('## ') and not THREAD_HEADING_RE.match(lines[i]):
             if i > 0 and lines[i - 1].strip() == '---':
                 return i - 1
             return i
@@ -4,11 +4,11 @@ import json
 import os
 import re
 import shutil
-import subprocess
 import sys
 from typing import NamedTuple
 
 from i2code.implement.claude_runner import ClaudeCodeCommand, ClaudeResult
+from i2code.trace.processes import run_command
 
 
 class _FileSpec(NamedTuple):
@@ -186,7 +186,7 @@ def _copy_template_file(source_path, dest_path):
 def _get_per_file_current_sha(repo_root, template_file_relpath):
     if not repo_root:
         return ""
-    result = subprocess.run(
+    result = run_command(
         ["git", "log", "-1", "--format=%H", "--", template_file_relpath],
         capture_output=True, text=True, cwd=repo_root,
     )
@@ -196,7 +196,7 @@ def _get_per_file_current_sha(repo_root, template_file_relpath):
 def _get_per_file_diff(repo_root, template_file_relpath, prev_sha, curr_sha):
     if not all([repo_root, prev_sha, curr_sha]):
         return ""
-    result = subprocess.run(
+    result = run_command(
         ["git", "diff", f"{prev_sha}..{curr_sha}", "--", template_file_relpath],
         capture_output=True, text=True, cwd=repo_root,
     )
@@ -250,7 +250,7 @@ def _read_settings_sha(settings_path):
 
 
 def _get_repo_root(config_dir):
-    result = subprocess.run(
+    result = run_command(
         ["git", "rev-parse", "--show-toplevel"],
         capture_output=True, text=True, cwd=config_dir,
     )
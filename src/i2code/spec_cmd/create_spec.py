@@ -7,11 +7,42 @@ from i2code.session_manager import read_session_id
 from i2code.template_renderer import render_template
 
 
+def prepare_spec_command(
+    project: IdeaProject,
+    *,
+    repo_root: str | None = None,
+) -> ClaudeCodeCommand:
+    """Render the create-spec prompt and build the Claude command.
+
+    Does not validate the idea file, so it is safe to run speculatively
+    in the background before the user picks the step.
+    """
+    prompt = render_template("create-spec.md", {
+        "IDEA_FILE": project.idea_file,
+        "DISCUSSION_FILE": project.discussion_file,
+    })
+
+    allowed_tools = (
+        build_allowed_tools_flag(repo_root, project.directory)
+        if repo_root is not None else None
+    )
+    cwd = repo_root if repo_root is not None else project.directory
+
+    return ClaudeCodeCommand(
+        cwd=cwd,
+        prompt=prompt,
+        interactive=True,
+        allowed_tools=allowed_tools,
+        session_id=read_session_id(project.session_id_file),
+    )
+
+
 def create_spec(
     project: IdeaProject,
     claude_runner,
     *,
     repo_root: str | None = None,
+    prepared: ClaudeCodeCommand | None = None,
 ) -> ClaudeResult:
     """Generate a specification from an idea file using Claude.
 
@@ -24,6 +55,8 @@ def create_spec(
         claude_runner: ClaudeRunner instance for invoking Claude
         repo_root: Repository root path. When provided, grants file
             permissions via allowed_tools and uses repo root as cwd.
+        prepared: Command from prepare_spec_command, if it was already
+            built in the background
 
     Returns:
         ClaudeResult from the Claude invocation
@@ -33,23 +66,6 @@ def create_spec(
     """
     project.validate_idea()
 
-    prompt = render_template("create-spec.md", {
-        "IDEA_FILE": project.idea_file,
-        "DISCUSSION_FILE": project.discussion_file,
-    })
-
-    allowed_tools = (
-        build_allowed_tools_flag(repo_root, project.directory)
-        if repo_root is not None else None
-    )
-    cwd = repo_root if repo_root is not None else project.directory
-
-    return claude_runner.execute(
-        ClaudeCodeCommand(
-            cwd=cwd,
-            prompt=prompt,
-            interactive=True,
-            allowed_tools=allowed_tools,
-            session_id=read_session_id(project.session_id_file),
-        ),
-    )
+    if prepared is None:
+        prepared = prepare_spec_command(project, repo_root=repo_root)
+    return claude_runner.execute(prepared)
@@ -1,5 +1,10 @@
-"""Template renderer: loads prompt templates and substitutes $VARIABLE placeholders."""
+"""Template renderer: loads prompt templates and substitutes $VARIABLE placeholders.
 
+Parsed templates are cached by path and modification time, so a template
+is read from disk once and again only after it is edited.
+"""
+
+from functools import lru_cache
 from pathlib import Path
 from string import Template
 
@@ -23,5 +28,9 @@ def render_template(template_name: str, variables: dict[str, str]) -> str:
     template_path = _TEMPLATES_DIR / template_name
     if not template_path.is_file():
         raise FileNotFoundError(f"Template not found: {template_path}")
-    template_text = template_path.read_text()
-    return Template(template_text).safe_substitute(variables)
+    return _load(template_path, template_path.stat().st_mtime_ns).safe_substitute(variables)
+
+
+@lru_cache(maxsize=64)
+def _load(template_path: Path, mtime_ns: int) -> Template:
+    return Template(template_path.read_text())
@@ -1,9 +1,41 @@
-"""Load and render Jinja2 templates from a caller's templates subpackage."""
+"""Load and render Jinja2 templates from a caller's templates subpackage.
 
-import importlib.resources
+Each package gets one shared ``jinja2.Environment``, which keeps compiled
+templates in an LRU cache and recompiles one only when its file's mtime
+changes (so edits in a dev install are picked up).  Compiled bytecode is
+also cached on disk, so a fresh process skips compilation too.
+"""
+
+import hashlib
+from functools import lru_cache
 
 import jinja2
 
+TEMPLATE_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=None)
+def _environment(package: str) -> jinja2.Environment:
+    return jinja2.Environment(
+        loader=_loader(package),
+        cache_size=TEMPLATE_CACHE_SIZE,
+        auto_reload=True,
+        bytecode_cache=_bytecode_cache(),
+    )
+
+
+@lru_cache(maxsize=None)
+def _loader(package: str) -> jinja2.PackageLoader:
+    return jinja2.PackageLoader(package, "templates")
+
+
+@lru_cache(maxsize=None)
+def _bytecode_cache():
+    try:
+        return jinja2.FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None  # no writable temp directory: compile in memory only
+
 
 def render_template(template_name: str, *, package: str, **kwargs) -> str:
     """Load a Jinja2 template by name and render it with the given arguments.
@@ -16,7 +48,25 @@ def render_template(template_name: str, *, package: str, **kwargs) -> str:
 
     Returns:
         The rendered template string.
+
+    Raises:
+        FileNotFoundError: If the template does not exist.
     """
-    templates = importlib.resources.files(f"{package}.templates")
-    source = templates.joinpath(template_name).read_text(encoding="utf-8")
-    return jinja2.Template(source).render(**kwargs)
+    try:
+        template = _environment(package).get_template(template_name)
+    except jinja2.TemplateNotFound as e:
+        raise _not_found(template_name, package) from e
+    return template.render(**kwargs)
+
+
+def template_version(template_name: str, *, package: str) -> str:
+    """Return a short hash of a template's source; it changes whenever the template does."""
+    try:
+        source, _, _ = _loader(package).get_source(_environment(package), template_name)
+    except jinja2.TemplateNotFound as e:
+        raise _not_found(template_name, package) from e
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+
+
+def _not_found(template_name: str, package: str) -> FileNotFoundError:
+    return FileNotFoundError(f"Template not found: {template_name} in {package}.templates")
@@ -0,0 +1,31 @@
+"""Click commands for inspecting traces written by ``--trace``."""
+
+import glob
+import os
+
+import click
+
+from i2code.trace.spans import TRACES_DIR
+from i2code.trace.summary import load_spans, summarize_spans
+
+
+def _latest_trace(root):
+    traces = glob.glob(os.path.join(root, TRACES_DIR, "*.jsonl"))
+    return max(traces, key=os.path.getmtime) if traces else None
+
+
+@click.group("trace")
+def trace():
+    """Inspect timing traces recorded in .hitl/traces."""
+
+
+@trace.command("summarize")
+@click.argument("trace_file", required=False, type=click.Path(exists=True, dir_okay=False))
+def summarize_cmd(trace_file):
+    """Show where wall-clock time went per task (default: latest trace)."""
+    if trace_file is None:
+        trace_file = _latest_trace(os.getcwd())
+        if trace_file is None:
+            raise click.ClickException(f"No traces found in {TRACES_DIR}")
+    click.echo(f"Trace: {trace_file}\n")
+    click.echo(summarize_spans(load_spans(trace_file)))
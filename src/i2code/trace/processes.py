@@ -0,0 +1,226 @@
+"""Single gateway for spawning git, gh, claude and other child processes.
+
+Every spawn is counted and timed in ``process_stats`` (printed by
+``i2code --stats``) and recorded as a trace span.  ``run_command`` is a
+drop-in for ``subprocess.run`` that also applies a default timeout to
+git and gh calls; ``track_process`` wraps the lifetime of a ``Popen`` the
+caller manages itself.
+
+GitPython also spawns git for some operations.  Those in i2code go
+through ``run_command`` instead, except the long-lived ``git cat-file``
+readers GitPython keeps per Repo to read objects, which are not counted.
+"""
+
+import os
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from i2code.trace.spans import span
+
+DEFAULT_TIMEOUTS: Dict[str, float] = {"git": 600, "gh": 300}
+# git subcommands that run hooks or copy a whole repository, so how long
+# they take is up to the project, not git: they get no default timeout.
+UNBOUNDED_GIT_COMMANDS = {"clone", "commit", "push"}
+# Exit status reported for a call stopped by its default timeout, as timeout(1) does.
+TIMEOUT_RETURNCODE = 124
+SPAN_KINDS = {"git", "gh", "claude"}
+
+
+@dataclass
+class ProcessRecord:
+    """One child process: what ran, for how long, and what it produced."""
+
+    argv: List[str]
+    program: str
+    duration: float = 0.0
+    returncode: Optional[int] = None
+    output_bytes: int = 0
+    timed_out: bool = False
+
+
+@dataclass
+class ProgramStats:
+    count: int = 0
+    duration: float = 0.0
+    failures: int = 0
+    timeouts: int = 0
+    output_bytes: int = 0
+
+
+@dataclass
+class ProcessStats:
+    """Thread-safe log of every process spawned through the gateway."""
+
+    records: List[ProcessRecord] = field(default_factory=list)
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+
+    def add(self, record: ProcessRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def count(self, program: Optional[str] = None) -> int:
+        """Number of spawns, optionally of a single program."""
+        with self._lock:
+            return sum(1 for r in self.records if program is None or r.program == program)
+
+    def by_program(self) -> Dict[str, ProgramStats]:
+        totals: Dict[str, ProgramStats] = defaultdict(ProgramStats)
+        with self._lock:
+            records = list(self.records)
+        for record in records:
+            stats = totals[record.program]
+            stats.count += 1
+            stats.duration += record.duration
+            stats.output_bytes += record.output_bytes
+            stats.timeouts += int(record.timed_out)
+            stats.failures += int(record.returncode not in (0, None))
+        return dict(totals)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.records.clear()
+
+    def format(self) -> str:
+        totals = self.by_program()
+        if not totals:
+            return "No processes spawned."
+        lines = [f"{'Program':<12} {'Count':>6} {'Time':>9} {'Failed':>7} {'Timeouts':>9} {'Output':>10}"]
+        for program, stats in sorted(totals.items(), key=lambda item: -item[1].duration):
+            lines.append(
+                f"{program:<12} {stats.count:>6} {stats.duration:>8.1f}s {stats.failures:>7}"
+                f" {stats.timeouts:>9} {_format_bytes(stats.output_bytes):>10}"
+            )
+        return "\n".join(lines)
+
+
+def _format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size}B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f}KB"
+    return f"{size / (1024 * 1024):.1f}MB"
+
+
+process_stats = ProcessStats()
+
+
+def _program_name(argv: Sequence[str]) -> str:
+    return os.path.basename(str(argv[0])) if argv else "?"
+
+
+def _output_size(output) -> int:
+    if output is None:
+        return 0
+    if isinstance(output, str):
+        return len(output.encode("utf-8", errors="replace"))
+    return len(output)
+
+
+@contextmanager
+def track_process(argv: Sequence[str], program: Optional[str] = None) -> Iterator[ProcessRecord]:
+    """Time and count a process whose lifetime the caller manages.
+
+    The caller fills in ``returncode`` and ``output_bytes`` on the yielded
+    record.  program overrides the name derived from argv[0], e.g. so a
+    mock Claude script still counts as ``claude``.
+    """
+    record = ProcessRecord(argv=[str(arg) for arg in argv], program=program or _program_name(argv))
+    kind = record.program if record.program in SPAN_KINDS else "step"
+    start = time.monotonic()
+    try:
+        with span(" ".join(record.argv[:3]), kind=kind, argv=record.argv):
+            yield record
+    except subprocess.TimeoutExpired:
+        record.timed_out = True
+        raise
+    finally:
+        record.duration = time.monotonic() - start
+        process_stats.add(record)
+
+
+def run_command(
+    argv: Sequence[str], *, program: Optional[str] = None, timeout: Optional[float] = None, **kwargs,
+) -> subprocess.CompletedProcess:
+    """Run argv like ``subprocess.run``, recording it in process_stats.
+
+    When timeout is not given, git and gh calls get DEFAULT_TIMEOUTS so a
+    hung network call fails instead of stalling the workflow; other
+    programs (editors, setup scripts, interactive Claude) and
+    UNBOUNDED_GIT_COMMANDS get none.  A call stopped by a default timeout
+    fails like any other: it returns returncode TIMEOUT_RETURNCODE, or
+    raises CalledProcessError when check is set.  An explicit timeout
+    raises TimeoutExpired, as ``subprocess.run`` does.
+    """
+    with track_process(argv, program) as record:
+        explicit_timeout = timeout is not None
+        if not explicit_timeout:
+            timeout = _default_timeout(record.program, argv)
+        try:
+            result = subprocess.run(argv, timeout=timeout, **kwargs)
+        except subprocess.CalledProcessError as e:
+            record.returncode = e.returncode
+            record.output_bytes = _output_size(e.stdout) + _output_size(e.stderr)
+            raise
+        except subprocess.TimeoutExpired as e:
+            if explicit_timeout:
+                raise
+            record.timed_out = True
+            result = _timed_out_result(argv, e, _is_text_mode(kwargs))
+            if kwargs.get("check"):
+                raise subprocess.CalledProcessError(
+                    result.returncode, argv, result.stdout, result.stderr,
+                ) from e
+        record.returncode = result.returncode
+        record.output_bytes = _output_size(result.stdout) + _output_size(result.stderr)
+        return result
+
+
+def _default_timeout(program: str, argv: Sequence[str]) -> Optional[float]:
+    if program == "git" and _git_subcommand(argv) in UNBOUNDED_GIT_COMMANDS:
+        return None
+    return DEFAULT_TIMEOUTS.get(program)
+
+
+def _git_subcommand(argv: Sequence[str]) -> Optional[str]:
+    """First argument after git's global options (``-C dir``, ``-c k=v``)."""
+    args = iter(argv[1:])
+    for arg in args:
+        if arg in ("-C", "-c"):
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _is_text_mode(kwargs) -> bool:
+    return any(kwargs.get(key) for key in ("text", "universal_newlines", "encoding", "errors"))
+
+
+def _timed_out_result(
+    argv: Sequence[str], error: subprocess.TimeoutExpired, text: bool,
+) -> subprocess.CompletedProcess:
+    message = f"{' '.join(str(arg) for arg in argv[:3])} timed out after {error.timeout:g}s\n"
+    if text:
+        stdout, stderr = _as_text(error.stdout), _as_text(error.stderr) + message
+    else:
+        stdout, stderr = _as_bytes(error.stdout), _as_bytes(error.stderr) + message.encode("utf-8")
+    return subprocess.CompletedProcess(argv, TIMEOUT_RETURNCODE, stdout, stderr)
+
+
+def _as_text(output) -> str:
+    if isinstance(output, bytes):
+        return output.decode("utf-8", errors="replace")
+    return output or ""
+
+
+def _as_bytes(output) -> bytes:
+    if isinstance(output, str):
+        return output.encode("utf-8")
+    return output or b""
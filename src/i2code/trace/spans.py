@@ -0,0 +1,131 @@
+"""Nested timing spans written as JSON lines to .hitl/traces/.
+
+Tracing is off until ``start_tracing`` is called; ``span`` is then a cheap
+no-op, so it can wrap hot paths unconditionally.
+
+Each finished span is one line::
+
+    {"id": 3, "parent": 1, "name": "claude", "kind": "claude",
+     "start": 1717000000.12, "duration": 42.7, "thread": "MainThread",
+     "status": "ok", "attrs": {...}}
+
+``start`` is wall-clock epoch seconds; ``duration`` is measured with a
+monotonic clock.  Parents are tracked per thread.
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+TRACES_DIR = os.path.join(".hitl", "traces")
+
+
+class Tracer:
+    """Appends finished spans to a JSONL file."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._file = None
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(path, "a", encoding="utf-8")
+
+    @property
+    def enabled(self) -> bool:
+        return self._file is not None
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, kind: str = "step", **attrs):
+        if not self.enabled:
+            yield {}
+            return
+        stack = self._stack()
+        span_id = next(self._ids)
+        parent = stack[-1] if stack else None
+        stack.append(span_id)
+        start = time.time()
+        t0 = time.monotonic()
+        status = "ok"
+        try:
+            yield attrs
+        except BaseException as e:
+            status = "exit" if isinstance(e, SystemExit) else "error"
+            raise
+        finally:
+            stack.pop()
+            self._write({
+                "id": span_id,
+                "parent": parent,
+                "name": name,
+                "kind": kind,
+                "start": round(start, 6),
+                "duration": round(time.monotonic() - t0, 6),
+                "thread": threading.current_thread().name,
+                "status": status,
+                "attrs": attrs,
+            })
+
+    def _write(self, record):
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line)
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_tracer = Tracer(None)
+
+
+def new_trace_path(root: str, label: str) -> str:
+    """Return a fresh trace file path under root/.hitl/traces."""
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return os.path.join(root, TRACES_DIR, f"{stamp}-{label}-{os.getpid()}.jsonl")
+
+
+def start_tracing(path: str) -> Tracer:
+    """Route spans from this process to path until stop_tracing."""
+    global _tracer
+    _tracer.close()
+    _tracer = Tracer(path)
+    return _tracer
+
+
+def stop_tracing() -> None:
+    global _tracer
+    _tracer.close()
+    _tracer = Tracer(None)
+
+
+def current_tracer() -> Tracer:
+    return _tracer
+
+
+def span(name: str, kind: str = "step", **attrs):
+    """Time the enclosed block as a span of the current tracer.
+
+    kind groups spans in ``i2code trace summarize``: task, claude, git,
+    gh, ci, review, or step.  The block receives the span's attrs dict and
+    may add to it; the span is written with whatever it holds on exit.
+    """
+    return _tracer.span(name, kind, **attrs)
@@ -0,0 +1,89 @@
+"""Summarize a span trace: where wall-clock time went, per task."""
+
+import json
+from collections import defaultdict
+from typing import Dict, List
+
+CATEGORIES = ["claude", "ci", "gh", "git", "review"]
+
+
+def load_spans(path: str) -> List[dict]:
+    """Read spans from a JSONL trace file, skipping malformed lines."""
+    spans = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and "id" in record:
+                spans.append(record)
+    return spans
+
+
+def _children(spans):
+    children = defaultdict(list)
+    for s in spans:
+        children[s.get("parent")].append(s)
+    return children
+
+
+def _breakdown(span_list, children) -> Dict[str, float]:
+    """Attribute time to the outermost categorized span beneath span_list.
+
+    A gh call made while waiting for CI counts as CI time, not gh time.
+    """
+    totals: Dict[str, float] = defaultdict(float)
+    pending = list(span_list)
+    while pending:
+        current = pending.pop()
+        kind = current.get("kind")
+        if kind in CATEGORIES:
+            totals[kind] += current.get("duration", 0.0)
+        else:
+            pending.extend(children.get(current["id"], []))
+    return totals
+
+
+def format_duration(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, secs = divmod(int(round(seconds)), 60)
+    if minutes < 60:
+        return f"{minutes}m{secs:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m"
+
+
+def summarize_spans(spans: List[dict]) -> str:
+    """Render a per-task table of wall time split by span kind."""
+    if not spans:
+        return "No spans recorded."
+    children = _children(spans)
+    known_ids = {s["id"] for s in spans}
+    roots = [s for s in spans if s.get("parent") not in known_ids]
+    tasks = sorted((s for s in spans if s.get("kind") == "task"), key=lambda s: s.get("start", 0))
+
+    rows = []
+    for task in tasks:
+        label = str(task.get("attrs", {}).get("task") or task.get("name"))
+        rows.append((label, task.get("duration", 0.0), _breakdown(children.get(task["id"], []), children)))
+    rows.append((
+        "Total",
+        sum(s.get("duration", 0.0) for s in roots),
+        _breakdown(roots, children),
+    ))
+
+    label_width = min(max(len(label) for label, _, _ in rows), 50)
+    header = f"{'Task':<{label_width}}  {'Wall':>8}" + "".join(
+        f"  {kind:>8}" for kind in CATEGORIES
+    ) + f"  {'other':>8}"
+    lines = [header, "-" * len(header)]
+    for label, wall, totals in rows:
+        other = max(wall - sum(totals.values()), 0.0)
+        lines.append(
+            f"{label[:label_width]:<{label_width}}  {format_duration(wall):>8}"
+            + "".join(f"  {format_duration(totals.get(kind, 0.0)):>8}" for kind in CATEGORIES)
+            + f"  {format_duration(other):>8}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,21 @@
+#!/usr/bin/env bash
+# Run performance benchmarks and compare against the stored baselines.
+# Pass --save-baseline to record new baselines instead.
+# Not part of test-all.sh: timings depend on the machine.
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+
+cd "$PROJECT_ROOT"
+
+MODE="--compare"
+if [[ "${1:-}" == "--save-baseline" ]]; then
+    MODE="--save-baseline"
+fi
+
+echo "=== plan_domain benchmarks ==="
+uv run --python 3.12 python3 -m benchmarks.plan_domain "$MODE"
+
+echo "=== implement loop benchmark ==="
+uv run --python 3.12 python3 -m benchmarks.implement_loop --tasks 20 --matrix
@@ -0,0 +1,88 @@
+"""Tests for the end-to-end implement loop benchmark."""
+
+import pytest
+
+from benchmarks.implement_loop import LoopConfig, complete_next_task, main, matrix_configs, run_loop
+from benchmarks.plan_domain import synthetic_plan
+from i2code.plan_domain.parser import parse
+
+
+@pytest.mark.unit
+class TestCompleteNextTask:
+
+    def test_marks_first_open_task(self, tmp_path):
+        plan_path = tmp_path / "plan.md"
+        plan_path.write_text(synthetic_plan(3, completed=1))
+
+        complete_next_task(str(plan_path))
+
+        assert parse(plan_path.read_text()).task_progress().current == 3
+
+
+@pytest.mark.unit
+class TestRunLoopWithFakes:
+
+    @pytest.mark.parametrize("mode", ["worktree", "trunk"])
+    def test_completes_every_task(self, mode):
+        result = run_loop(LoopConfig(mode, tasks=4))
+
+        assert result.probes["claude"].count == 4
+        assert result.probes["plan_parse"].count >= 4
+
+    def test_worktree_waits_for_ci_after_each_push(self):
+        result = run_loop(LoopConfig("worktree", tasks=3))
+
+        assert result.probes["gh"].count > 0
+
+    def test_simulated_latency_is_not_overhead(self):
+        result = run_loop(LoopConfig("trunk", tasks=2, claude_latency=0.05))
+
+        assert result.probes["claude"].seconds >= 0.1
+        assert result.overhead_per_task < result.wall / 2
+
+    def test_real_claude_requires_real_git(self):
+        with pytest.raises(ValueError, match="real git"):
+            run_loop(LoopConfig("trunk", tasks=1, real=frozenset({"claude"})))
+
+
+@pytest.mark.unit
+class TestMatrixConfigs:
+
+    def test_trunk_mode_never_uses_real_state(self):
+        configs = matrix_configs(LoopConfig("trunk", tasks=1))
+
+        assert all("state" not in c.real for c in configs)
+        assert configs[0].real == frozenset()
+
+    def test_worktree_mode_ends_with_all_real(self):
+        configs = matrix_configs(LoopConfig("worktree", tasks=1))
+
+        assert configs[-1].real == frozenset({"claude", "git", "state"})
+
+
+@pytest.mark.unit
+class TestMain:
+
+    def test_prints_one_row_per_mode(self, capsys):
+        assert main(["--tasks", "2"]) == 0
+
+        out = capsys.readouterr().out
+        assert "worktree[fakes]" in out
+        assert "trunk[fakes]" in out
+
+    def test_rejects_unknown_backend(self):
+        with pytest.raises(SystemExit):
+            main(["--real", "gh"])
+
+
+@pytest.mark.integration
+class TestRunLoopWithRealBackends:
+
+    @pytest.mark.parametrize("mode", ["worktree", "trunk"])
+    def test_completes_every_task(self, mode):
+        real = frozenset({"claude", "git", "state"}) if mode == "worktree" else frozenset({"claude", "git"})
+
+        result = run_loop(LoopConfig(mode, tasks=2, real=real))
+
+        assert result.probes["claude"].count == 2
+        assert result.probes["git"].count > 0
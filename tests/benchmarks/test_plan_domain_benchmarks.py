@@ -0,0 +1,101 @@
+"""Tests for the benchmark harness and the plan_domain suite."""
+
+import json
+
+import pytest
+
+from benchmarks.harness import Case, compare, measure, save_baseline
+from benchmarks.plan_domain import cases_for_size, main, synthetic_plan
+from i2code.plan_domain.parser import parse
+
+
+@pytest.mark.unit
+class TestSyntheticPlan:
+
+    @pytest.mark.parametrize("size", [1, 10, 25])
+    def test_has_requested_task_count_with_only_last_open(self, size):
+        plan = parse(synthetic_plan(size))
+
+        assert plan.task_progress().total == size
+        assert plan.task_progress().current == size
+        assert plan.get_next_task().task.title == f"Task number {size}"
+
+    def test_round_trips(self):
+        text = synthetic_plan(30)
+
+        assert parse(text).to_text() == text
+
+
+@pytest.mark.unit
+class TestMeasure:
+
+    def test_uses_fresh_setup_per_run(self):
+        seen = []
+
+        measure(Case("append", lambda: [], lambda items: seen.append(len(items)) or items.append(1)))
+
+        assert set(seen) == {0}
+
+    def test_reports_time_and_peak_memory(self):
+        result = measure(Case("alloc", lambda: None, lambda _: bytearray(200 * 1024)))
+
+        assert result["seconds"] >= 0
+        assert result["peak_kib"] >= 200
+
+
+@pytest.mark.unit
+class TestCompare:
+
+    BASELINE = {"results": {"parse[10]": {"seconds": 0.01, "peak_kib": 100.0}}}
+
+    def test_no_regression_within_tolerance(self):
+        results = {"parse[10]": {"seconds": 0.014, "peak_kib": 140.0}}
+
+        assert compare(results, self.BASELINE, tolerance=0.5) == []
+
+    def test_flags_slowdown_and_memory_growth(self):
+        results = {"parse[10]": {"seconds": 0.02, "peak_kib": 300.0}}
+
+        regressions = compare(results, self.BASELINE, tolerance=0.5)
+
+        assert len(regressions) == 2
+        assert regressions[0].startswith("parse[10]: time")
+        assert regressions[1].startswith("parse[10]: peak memory")
+
+    def test_ignores_slowdowns_below_noise_floor(self):
+        baseline = {"results": {"x": {"seconds": 1e-6, "peak_kib": 1.0}}}
+
+        assert compare({"x": {"seconds": 1e-5, "peak_kib": 1.0}}, baseline) == []
+
+    def test_ignores_cases_missing_from_baseline(self):
+        assert compare({"new[10]": {"seconds": 1.0, "peak_kib": 1.0}}, self.BASELINE) == []
+
+
+@pytest.mark.unit
+class TestPlanDomainSuite:
+
+    def test_covers_each_operation(self):
+        names = [case.name for case in cases_for_size(10)]
+
+        assert names == [
+            "parse[10]", "to_text[10]", "get_next_task[10]", "task_progress[10]",
+            "mark_task_complete[10]", "reorder_tasks[10]", "move_task_before[10]",
+        ]
+
+    def test_compare_mode_fails_on_regression(self, tmp_path, capsys):
+        baseline = tmp_path / "baseline.json"
+        save_baseline(baseline, {
+            case.name: {"seconds": 1e-9, "peak_kib": 0.0} for case in cases_for_size(10)
+        })
+
+        exit_code = main(["--sizes", "10", "--compare", "--baseline", str(baseline)])
+
+        assert exit_code == 1
+        assert "regression(s)" in capsys.readouterr().err
+
+    def test_save_baseline_writes_results(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+
+        assert main(["--sizes", "10", "--save-baseline", "--baseline", str(baseline)]) == 0
+
+        assert "parse[10]" in json.loads(baseline.read_text())["results"]
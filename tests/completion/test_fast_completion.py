@@ -0,0 +1,55 @@
+"""Unit tests for the completion fast path in the i2code entry point."""
+
+import os
+
+import pytest
+import yaml
+
+from i2code.entry import fast_complete
+
+
+@pytest.fixture
+def idea_repo(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    repo = tmp_path / "repo"
+    for name, state in [("alpha", "wip"), ("beta", "draft")]:
+        idea_dir = repo / "docs" / "ideas" / "active" / name
+        os.makedirs(idea_dir)
+        with open(idea_dir / f"{name}-metadata.yaml", "w") as f:
+            yaml.safe_dump({"state": state}, f)
+    monkeypatch.chdir(repo)
+    return repo
+
+
+def _set_words(monkeypatch, words, cword):
+    monkeypatch.setenv("COMP_WORDS", words)
+    monkeypatch.setenv("COMP_CWORD", str(cword))
+
+
+@pytest.mark.unit
+class TestFastComplete:
+
+    def test_completes_idea_names_for_idea_state(self, idea_repo, monkeypatch):
+        _set_words(monkeypatch, "i2code idea state a", 3)
+
+        assert fast_complete("bash_complete") == "plain,alpha"
+
+    def test_zsh_output_includes_state_as_help(self, idea_repo, monkeypatch):
+        _set_words(monkeypatch, "i2code idea state b", 3)
+
+        assert fast_complete("zsh_complete") == "plain\nbeta\ndraft"
+
+    @pytest.mark.parametrize("words,cword", [
+        ("i2code idea ", 2),
+        ("i2code idea state --", 3),
+        ("i2code idea state alpha ", 4),
+        ("i2code go ", 2),
+    ])
+    def test_defers_other_requests_to_full_cli(self, idea_repo, monkeypatch, words, cword):
+        _set_words(monkeypatch, words, cword)
+
+        assert fast_complete("bash_complete") is None
+
+    @pytest.mark.parametrize("instruction", [None, "", "bash_source", "powershell_complete"])
+    def test_ignores_non_completion_instructions(self, instruction):
+        assert fast_complete(instruction) is None
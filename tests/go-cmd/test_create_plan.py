@@ -9,7 +9,12 @@ from conftest import TempIdeaProject
 from i2code.claude.permissions import build_read_only_tools_flag
 from i2code.implement.claude_runner import ClaudeCodeCommand, ClaudeResult
 from i2code.implement.idea_project import IdeaProject
-from i2code.go_cmd.create_plan import PlanServices, create_plan
+from i2code.go_cmd.create_plan import (
+    PlanServices,
+    PlanStreamMonitor,
+    create_plan,
+    prepare_plan_command,
+)
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "implement"))
 from fake_claude_runner import FakeClaudeRunner
@@ -163,6 +168,11 @@ class TestCreatePlanClaudeInvocation:
             assert isinstance(command, ClaudeCodeCommand)
             assert command.interactive is False
 
+    def test_streamed_generation_requests_partial_messages(self):
+        with TempIdeaProject("my-feature") as project:
+            runner = _run_create_plan(project)
+            assert runner.calls[0][1].extra_args == ["--include-partial-messages"]
+
 
 @pytest.mark.unit
 class TestCreatePlanWritesPlanFile:
@@ -273,3 +283,142 @@ class TestCreatePlanRepairFails:
             assert os.path.isfile(project.broken_plan_file)
             with open(project.broken_plan_file) as f:
                 assert f.read() == INVALID_PLAN
+
+
+@pytest.mark.unit
+class TestCreatePlanPrepared:
+
+    def test_prepare_renders_prompt_without_validating_files(self):
+        with TempIdeaProject("my-feature") as project:
+            command = prepare_plan_command(project, _pass_services())
+            assert isinstance(command, ClaudeCodeCommand)
+            assert "idea-to-code:tdd" in (command.prompt or "")
+            assert command.interactive is False
+
+    def test_uses_prepared_command_without_enumerating_skills(self):
+        with TempIdeaProject("my-feature") as project:
+            _create_idea_and_spec(project)
+            prepared = ClaudeCodeCommand(cwd=project.directory, prompt="prepared prompt", interactive=False)
+            services = PlanServices(
+                template_renderer=_fake_renderer,
+                plugin_skills_fn=lambda: pytest.fail("skills enumerated despite prepared command"),
+                validator_fn=lambda text: (True, []),
+            )
+            runner = FakeClaudeRunner()
+            runner.set_result(_valid_result())
+            create_plan(project, runner, services, prepared=prepared)
+            assert runner.calls[0][1].prompt == "prepared prompt"
+
+
+def _services_validating(valid_text):
+    return PlanServices(
+        template_renderer=_fake_renderer,
+        plugin_skills_fn=lambda: "idea-to-code:tdd",
+        validator_fn=lambda text: (True, []) if text == valid_text else (False, [f"bad: {text}"]),
+    )
+
+
+@pytest.mark.unit
+class TestCreatePlanBestOfN:
+
+    def test_starts_one_process_per_candidate(self):
+        with TempIdeaProject("my-feature") as project:
+            _create_idea_and_spec(project)
+            runner = FakeClaudeRunner()
+            runner.set_results([_valid_result()] * 3)
+            create_plan(project, runner, _pass_services(), candidates=3)
+            assert [call[0] for call in runner.calls] == ["start", "start", "start"]
+
+    def test_writes_first_valid_candidate_and_terminates_the_rest(self):
+        with TempIdeaProject("my-feature") as project:
+            _create_idea_and_spec(project)
+            runner = FakeClaudeRunner()
+            runner.set_results([_invalid_result(), _valid_result(), None])
+            create_plan(project, runner, _services_validating(VALID_PLAN), candidates=3)
+            with open(project.plan_file) as f:
+                assert f.read() == VALID_PLAN
+            assert runner.processes[2].terminated
+            assert not runner.processes[1].terminated
+
+    def test_reports_failed_checks_per_candidate(self, capsys):
+        with TempIdeaProject("my-feature") as project:
+            _create_idea_and_spec(project)
+            runner = FakeClaudeRunner()
+            runner.set_results([_invalid_result(), _valid_result()])
+            create_plan(project, runner, _services_validating(VALID_PLAN), candidates=2)
+            err = capsys.readouterr().err
+            assert "Plan candidate 1 failed 1 check(s)" in err
+            assert "Plan candidate 2 is valid" in err
+
+    def test_repairs_best_candidate_when_none_valid(self):
+        with TempIdeaProject("my-feature") as project:
+            _create_idea_and_spec(project)
+            runner = FakeClaudeRunner()
+            runner.set_results([_invalid_result(), _invalid_result(), _valid_result()])
+            create_plan(project, runner, _services_validating(VALID_PLAN), candidates=2)
+            assert [call[0] for call in runner.calls] == ["start", "start", "execute"]
+            assert runner.calls[0][1].extra_args == []
+            repair_prompt = runner.calls[2][1].prompt or ""
+            assert "repair-plan.md" in repair_prompt
+
+
+def _delta(text):
+    return {"type": "stream_event", "event": {
+        "type": "content_block_delta", "delta": {"type": "text_delta", "text": text},
+    }}
+
+
+_MESSAGE_START = {"type": "stream_event", "event": {"type": "message_start"}}
+
+_BROKEN_TASK = """\
+## Steel Thread 1: Feature
+
+- [ ] **Task 1.1: Missing TaskType**
+  - Entrypoint: `command`
+  - Observable: Something
+  - Evidence: Something
+  - Steps:
+    - [ ] Step one
+
+"""
+
+
+@pytest.mark.unit
+class TestPlanStreamMonitor:
+
+    def test_reports_broken_task_while_streaming(self, capsys):
+        monitor = PlanStreamMonitor()
+
+        monitor.on_message(_MESSAGE_START)
+        monitor.on_message(_delta(_BROKEN_TASK))
+        monitor.on_message(_delta("- [ ] **Task 1.2: Next**\n"))
+
+        assert [d.rule for d in monitor.diagnostics] == ["missing-task-type"]
+        assert "[missing-task-type] Missing TaskType in Task 1.1" in capsys.readouterr().err
+
+    def test_new_message_restarts_validation(self):
+        monitor = PlanStreamMonitor()
+        monitor.on_message(_MESSAGE_START)
+        monitor.on_message(_delta("Let me read the spec first.\n"))
+        monitor.on_message(_MESSAGE_START)
+        monitor.on_message(_delta(_BROKEN_TASK))
+
+        monitor.on_message({"type": "result", "result": _BROKEN_TASK})
+
+        assert [d.rule for d in monitor.diagnostics] == ["missing-task-type"]
+
+    def test_validates_whole_assistant_messages_without_deltas(self):
+        monitor = PlanStreamMonitor()
+
+        monitor.on_message({"type": "assistant", "message": {
+            "content": [{"type": "text", "text": _BROKEN_TASK}],
+        }})
+        monitor.on_message({"type": "result"})
+
+        assert [d.rule for d in monitor.diagnostics] == ["missing-task-type"]
+
+    def test_never_aborts(self):
+        monitor = PlanStreamMonitor()
+        monitor.on_message(_delta(_BROKEN_TASK + "## Summary\n"))
+
+        assert monitor.on_message({"type": "result"}) is False
@@ -78,6 +78,16 @@ class TestPlanCreateInvokesPythonFunction:
         assert callable(services.plugin_skills_fn)
         assert callable(services.validator_fn)
 
+    def test_passes_single_candidate_by_default(self, tmp_path, plan_create_mocks):
+        mock_fn, _ = plan_create_mocks
+        CliRunner().invoke(main, ["plan", "create", str(tmp_path)])
+        assert mock_fn.call_args.kwargs["candidates"] == 1
+
+    def test_passes_candidates_option(self, tmp_path, plan_create_mocks):
+        mock_fn, _ = plan_create_mocks
+        CliRunner().invoke(main, ["plan", "create", "--candidates", "3", str(tmp_path)])
+        assert mock_fn.call_args.kwargs["candidates"] == 3
+
 
 @pytest.mark.unit
 class TestPlanReviseInvokesPythonFunction:
@@ -2,7 +2,7 @@
 
 import pytest
 
-from i2code.go_cmd.plan_validator import validate_plan
+from i2code.go_cmd.plan_validator import IncrementalPlanValidator, validate_plan
 
 
 VALID_PLAN = """\
@@ -290,3 +290,74 @@ class TestMissingObservableFails:
         is_valid, errors = validate_plan(self.PLAN_MISSING_OBSERVABLE)
 
         assert any("Observable" in e for e in errors)
+
+
+def _validate_in_chunks(plan_text, chunk_size):
+    validator = IncrementalPlanValidator()
+    for start in range(0, len(plan_text), chunk_size):
+        validator.feed(plan_text[start:start + chunk_size])
+    validator.finish()
+    return validator.diagnostics
+
+
+BROKEN_PLAN = """\
+# Implementation Plan
+
+## Steel Thread 1: Feature
+
+- [ ] **Task 1.1: Missing TaskType**
+  - Entrypoint: `command`
+  - Observable: Something
+  - Evidence: Something
+  - Steps:
+    - [ ] Step one
+
+- [ ] **Task 1.2: No steps**
+  - TaskType: OUTCOME
+  - Entrypoint: `command`
+  - Observable: Something
+  - Evidence: Something
+
+## Steel Thread 2: Empty
+
+## Summary
+
+Nothing to see here.
+"""
+
+
+@pytest.mark.unit
+class TestIncrementalPlanValidator:
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 10_000])
+    def test_matches_validate_plan_messages(self, chunk_size):
+        diagnostics = _validate_in_chunks(BROKEN_PLAN, chunk_size)
+
+        assert [d.message for d in diagnostics] == validate_plan(BROKEN_PLAN)[1]
+
+    def test_valid_plan_has_no_diagnostics(self):
+        assert _validate_in_chunks(VALID_PLAN, 5) == []
+
+    def test_diagnostics_carry_location_and_rule(self):
+        diagnostics = _validate_in_chunks(BROKEN_PLAN, 10_000)
+
+        assert [(d.rule, d.line, d.thread, d.task) for d in diagnostics] == [
+            ("missing-task-type", 5, 1, 1),
+            ("no-steps", 12, 1, 2),
+            ("empty-thread", 18, 2, None),
+        ]
+
+    def test_task_reported_as_soon_as_next_task_starts(self):
+        validator = IncrementalPlanValidator()
+        head = BROKEN_PLAN.split("- [ ] **Task 1.2", 1)[0]
+
+        assert validator.feed(head) == []
+        found = validator.feed("- [ ] **Task 1.2: No steps**\n")
+
+        assert [d.rule for d in found] == ["missing-task-type"]
+
+    def test_plan_without_threads_reported_on_finish(self):
+        validator = IncrementalPlanValidator()
+
+        assert validator.feed("# Plan\n\nJust prose.\n") == []
+        assert [d.rule for d in validator.finish()] == ["no-threads"]
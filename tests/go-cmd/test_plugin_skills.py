@@ -1,11 +1,20 @@
 """Tests for go_cmd.plugin_skills — enumerate installed plugin skills."""
 
+import json
+import os
 
 import pytest
 
+from i2code.go_cmd import plugin_skills
 from i2code.go_cmd.plugin_skills import list_plugin_skills
 
 
+@pytest.fixture(autouse=True)
+def _isolated_home(tmp_path, monkeypatch):
+    """Keep the scan-result cache out of the real home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+
+
 @pytest.mark.unit
 class TestListPluginSkillsFindsSkills:
 
@@ -85,3 +94,112 @@ class TestListPluginSkillsRespectsEnvVar:
         result = list_plugin_skills()
 
         assert result == "" or isinstance(result, str)
+
+
+def _make_skills(base, *names):
+    skills_dir = base / "skills"
+    for name in names:
+        (skills_dir / name).mkdir(parents=True)
+    return skills_dir
+
+
+@pytest.mark.unit
+class TestListPluginSkillsManifestLookup:
+
+    @pytest.mark.parametrize("as_list", [False, True])
+    def test_uses_install_path_from_installed_plugins_manifest(self, tmp_path, as_list, mocker):
+        cache_dir = tmp_path / "plugins" / "cache"
+        install_path = cache_dir / "mkt" / "idea-to-code" / "2.0.0"
+        _make_skills(install_path, "tdd")
+        record = {"installPath": str(install_path)}
+        manifest = {"plugins": {"idea-to-code@mkt": [record] if as_list else record}}
+        (tmp_path / "plugins" / "installed_plugins.json").write_text(json.dumps(manifest))
+        scan = mocker.spy(plugin_skills, "_scan_for_skills_dir")
+
+        result = list_plugin_skills(cache_dir=str(cache_dir))
+
+        assert result == "idea-to-code:tdd"
+        scan.assert_not_called()
+
+    def test_falls_back_to_scan_when_manifest_path_missing(self, tmp_path):
+        cache_dir = tmp_path / "plugins" / "cache"
+        _make_skills(cache_dir / "mkt" / "idea-to-code" / "1.0.0", "tdd")
+        manifest = {"plugins": {"idea-to-code@mkt": {"installPath": str(tmp_path / "gone")}}}
+        (tmp_path / "plugins" / "installed_plugins.json").write_text(json.dumps(manifest))
+
+        assert list_plugin_skills(cache_dir=str(cache_dir)) == "idea-to-code:tdd"
+
+
+@pytest.mark.unit
+class TestListPluginSkillsBoundedScan:
+
+    def test_ignores_skills_deeper_than_plugin_layout(self, tmp_path, capsys):
+        _make_skills(tmp_path / "mkt" / "idea-to-code" / "1.0.0" / "vendor" / "x", "tdd")
+
+        assert list_plugin_skills(cache_dir=str(tmp_path)) == ""
+
+    def test_skips_node_modules(self, tmp_path, capsys):
+        _make_skills(tmp_path / "mkt" / "node_modules" / "idea-to-code", "tdd")
+
+        assert list_plugin_skills(cache_dir=str(tmp_path)) == ""
+
+    def test_prefers_most_recently_modified_version(self, tmp_path):
+        old = _make_skills(tmp_path / "mkt" / "idea-to-code" / "1.0.0", "old-skill")
+        _make_skills(tmp_path / "mkt" / "idea-to-code" / "2.0.0", "new-skill")
+        os.utime(old, (0, 0))
+
+        assert list_plugin_skills(cache_dir=str(tmp_path)) == "idea-to-code:new-skill"
+
+
+@pytest.mark.unit
+class TestListPluginSkillsScanCache:
+
+    def test_second_lookup_reuses_cached_scan(self, tmp_path, mocker):
+        cache_dir = tmp_path / "cache"
+        _make_skills(cache_dir / "mkt" / "idea-to-code" / "1.0.0", "tdd")
+        index_file = tmp_path / "index.json"
+        list_plugin_skills(cache_dir=str(cache_dir), index_file=index_file)
+        scan = mocker.spy(plugin_skills, "_scan_for_skills_dir")
+
+        result = list_plugin_skills(cache_dir=str(cache_dir), index_file=index_file)
+
+        assert result == "idea-to-code:tdd"
+        scan.assert_not_called()
+
+    def test_cache_directory_mtime_change_triggers_rescan(self, tmp_path, mocker):
+        cache_dir = tmp_path / "cache"
+        _make_skills(cache_dir / "mkt" / "idea-to-code" / "1.0.0", "tdd")
+        index_file = tmp_path / "index.json"
+        list_plugin_skills(cache_dir=str(cache_dir), index_file=index_file)
+        stat = os.stat(cache_dir)
+        os.utime(cache_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        scan = mocker.spy(plugin_skills, "_scan_for_skills_dir")
+
+        list_plugin_skills(cache_dir=str(cache_dir), index_file=index_file)
+
+        scan.assert_called_once()
+
+    def test_new_plugin_version_triggers_rescan(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        plugin_dir = cache_dir / "mkt" / "idea-to-code"
+        old = _make_skills(plugin_dir / "1.0.0", "old-skill")
+        os.utime(old, (0, 0))
+        index_file = tmp_path / "index.json"
+        list_plugin_skills(cache_dir=str(cache_dir), index_file=index_file)
+        cache_stat = os.stat(cache_dir)
+        _make_skills(plugin_dir / "2.0.0", "new-skill")
+        os.utime(plugin_dir, ns=(cache_stat.st_atime_ns, cache_stat.st_mtime_ns + 1_000_000_000))
+        os.utime(cache_dir, ns=(cache_stat.st_atime_ns, cache_stat.st_mtime_ns))
+
+        result = list_plugin_skills(cache_dir=str(cache_dir), index_file=index_file)
+
+        assert result == "idea-to-code:new-skill"
+
+    def test_keeps_only_the_latest_scan(self, tmp_path):
+        index_file = tmp_path / "index.json"
+        for name in ("first", "second"):
+            _make_skills(tmp_path / name / "mkt" / "idea-to-code" / "1.0.0", "tdd")
+            list_plugin_skills(cache_dir=str(tmp_path / name), index_file=index_file)
+
+        entry = json.loads(index_file.read_text())
+        assert entry["cache_dir"] == str((tmp_path / "second").resolve())
@@ -0,0 +1,95 @@
+"""Tests for go_cmd.project_snapshot — one-pass idea directory state."""
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from conftest import TempIdeaProject, menu_config_by_label
+from i2code.go_cmd.orchestrator import EXIT, Orchestrator, OrchestratorDeps
+from i2code.go_cmd.project_snapshot import ProjectSnapshot
+
+
+def _create_file(project, filename, content=""):
+    with open(os.path.join(project.directory, filename), "w") as f:
+        f.write(content)
+
+
+def _clean_git():
+    return MagicMock(return_value=MagicMock(stdout="", returncode=0))
+
+
+@pytest.mark.unit
+class TestProjectSnapshotFiles:
+
+    def test_empty_directory_has_no_files(self):
+        with TempIdeaProject("my-feature") as project:
+            snapshot = ProjectSnapshot.capture(project, _clean_git())
+            assert not snapshot.has_idea_file
+            assert not snapshot.has_spec_file
+            assert not snapshot.has_plan_file
+            assert not snapshot.has_implement_config
+
+    def test_detects_idea_spec_plan_and_config(self):
+        with TempIdeaProject("my-feature") as project:
+            for suffix in ("idea.txt", "spec.md", "plan.md", "implement-config.yaml"):
+                _create_file(project, f"my-feature-{suffix}")
+            snapshot = ProjectSnapshot.capture(project, _clean_git())
+            assert snapshot.has_idea_file
+            assert snapshot.has_spec_file
+            assert snapshot.has_plan_file
+            assert snapshot.has_implement_config
+
+    def test_missing_directory_has_no_files(self):
+        with TempIdeaProject("my-feature") as project:
+            os.rmdir(project.directory)
+            snapshot = ProjectSnapshot.capture(project, _clean_git())
+            assert not snapshot.has_idea_file
+
+    def test_reads_lifecycle_state_and_implement_config(self):
+        with TempIdeaProject("my-feature") as project:
+            _create_file(project, "my-feature-metadata.yaml", "state: ready\n")
+            _create_file(project, "my-feature-implement-config.yaml", "trunk: true\n")
+            snapshot = ProjectSnapshot.capture(project, _clean_git())
+            assert snapshot.lifecycle_state == "ready"
+            assert snapshot.implement_config["trunk"] is True
+
+    def test_missing_metadata_has_no_lifecycle_state(self):
+        with TempIdeaProject("my-feature") as project:
+            snapshot = ProjectSnapshot.capture(project, _clean_git())
+            assert snapshot.lifecycle_state is None
+            assert snapshot.implement_config is None
+
+
+@pytest.mark.unit
+class TestProjectSnapshotGitStatus:
+
+    def test_git_status_is_not_run_until_needed(self):
+        with TempIdeaProject("my-feature") as project:
+            git_runner = _clean_git()
+            ProjectSnapshot.capture(project, git_runner)
+            git_runner.assert_not_called()
+
+    def test_git_status_runs_once(self):
+        with TempIdeaProject("my-feature") as project:
+            git_runner = MagicMock(return_value=MagicMock(stdout=" M x\n", returncode=0))
+            snapshot = ProjectSnapshot.capture(project, git_runner)
+            assert snapshot.has_uncommitted_changes
+            assert snapshot.has_uncommitted_changes
+            git_runner.assert_called_once()
+
+
+@pytest.mark.unit
+class TestOrchestratorUsesSingleSnapshot:
+
+    def test_has_plan_menu_runs_git_status_once(self):
+        with TempIdeaProject("my-feature") as project:
+            for suffix in ("idea.md", "spec.md", "plan.md"):
+                _create_file(project, f"my-feature-{suffix}")
+            _create_file(project, "my-feature-metadata.yaml", "state: wip\n")
+            git_runner = _clean_git()
+            deps = OrchestratorDeps(
+                menu_config=menu_config_by_label([EXIT]), git_runner=git_runner,
+            )
+            Orchestrator(project, deps=deps).run()
+            git_runner.assert_called_once()
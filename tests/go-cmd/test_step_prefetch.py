@@ -0,0 +1,121 @@
+"""Tests for go_cmd.step_prefetch — background preparation of the default step."""
+
+import os
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from conftest import TempIdeaProject, menu_config_by_label
+from i2code.go_cmd.orchestrator import CREATE_PLAN, REVISE_SPEC, Orchestrator, OrchestratorDeps
+from i2code.go_cmd.step_prefetch import PreparableStep, StepPrefetcher
+from i2code.implement.claude_runner import ClaudeCodeCommand
+
+
+def _command(prompt="prepared"):
+    return ClaudeCodeCommand(cwd="/tmp", prompt=prompt)
+
+
+def _recording_step(prepare=None):
+    runs = []
+
+    def run(project, prepared):
+        runs.append(prepared)
+        return MagicMock(returncode=0)
+
+    return PreparableStep(prepare=prepare or (lambda _project: _command()), run=run), runs
+
+
+@pytest.mark.unit
+class TestStepPrefetcher:
+
+    def test_take_returns_prepared_command_for_same_step(self):
+        prefetcher = StepPrefetcher()
+        step, _ = _recording_step()
+        prefetcher.prefetch("create_plan", step, project=MagicMock())
+        assert prefetcher.take("create_plan").prompt == "prepared"
+
+    def test_take_for_other_step_returns_none(self):
+        prefetcher = StepPrefetcher()
+        step, _ = _recording_step()
+        prefetcher.prefetch("create_plan", step, project=MagicMock())
+        assert prefetcher.take("revise_spec") is None
+        assert prefetcher.take("create_plan") is None
+
+    def test_plain_step_function_is_not_prefetched(self):
+        prefetcher = StepPrefetcher()
+        prefetcher.prefetch("create_plan", MagicMock(), project=MagicMock())
+        assert prefetcher.take("create_plan") is None
+
+    def test_failed_preparation_returns_none(self):
+        prefetcher = StepPrefetcher()
+
+        def failing_prepare(_project):
+            raise RuntimeError("boom")
+
+        step, _ = _recording_step(failing_prepare)
+        prefetcher.prefetch("create_plan", step, project=MagicMock())
+        assert prefetcher.take("create_plan") is None
+
+    def test_preparation_runs_in_background_thread(self):
+        prefetcher = StepPrefetcher()
+        threads = []
+
+        def prepare(_project):
+            threads.append(threading.current_thread())
+            return _command()
+
+        step, _ = _recording_step(prepare)
+        prefetcher.prefetch("create_plan", step, project=MagicMock())
+        prefetcher.take("create_plan")
+        assert threads[0] is not threading.current_thread()
+
+
+def _setup_has_spec(project):
+    for suffix in ("idea.md", "spec.md"):
+        with open(os.path.join(project.directory, f"{project.name}-{suffix}"), "w") as f:
+            f.write("")
+
+
+def _plan_writing_step(prepare=None):
+    """Preparable create_plan step whose run writes the plan file."""
+    runs = []
+
+    def run(project, prepared):
+        runs.append(prepared)
+        with open(project.plan_file, "w") as f:
+            f.write("plan")
+        return MagicMock(returncode=0)
+
+    step = PreparableStep(prepare=prepare or (lambda _project: _command()), run=run)
+    return step, runs
+
+
+@pytest.mark.unit
+class TestOrchestratorPrefetch:
+
+    def test_default_step_runs_with_prefetched_command(self):
+        with TempIdeaProject("my-feature") as project:
+            _setup_has_spec(project)
+            step, runs = _plan_writing_step()
+            deps = OrchestratorDeps(
+                menu_config=menu_config_by_label([CREATE_PLAN, "Exit"]),
+                git_runner=MagicMock(return_value=MagicMock(stdout="")),
+                create_plan_fn=step,
+            )
+            Orchestrator(project, deps=deps).run()
+            assert [command.prompt for command in runs] == ["prepared"]
+
+    def test_non_default_choice_discards_prefetched_command(self):
+        with TempIdeaProject("my-feature") as project:
+            _setup_has_spec(project)
+            step, runs = _plan_writing_step()
+            revise_spec_fn = MagicMock(return_value=MagicMock(returncode=0))
+            deps = OrchestratorDeps(
+                menu_config=menu_config_by_label([REVISE_SPEC, "Exit"]),
+                create_plan_fn=step,
+                revise_spec_fn=revise_spec_fn,
+            )
+            Orchestrator(project, deps=deps).run()
+            revise_spec_fn.assert_called_once_with(project)
+            assert runs == []
@@ -0,0 +1,118 @@
+"""Unit tests for the idea completion cache."""
+
+import os
+
+import pytest
+import yaml
+
+from i2code.idea import completion_cache
+from i2code.idea.completion_cache import cache_file_for, cached_ideas, idea_name_completions
+from i2code.idea.resolver import IdeaInfo
+
+
+def _create_active_idea(base, name, state="draft"):
+    idea_dir = os.path.join(base, "docs", "ideas", "active", name)
+    os.makedirs(idea_dir, exist_ok=True)
+    with open(os.path.join(idea_dir, f"{name}-metadata.yaml"), "w") as f:
+        yaml.safe_dump({"state": state}, f)
+    return idea_dir
+
+
+def _set_metadata_state(base, name, state):
+    metadata_path = os.path.join(base, "docs", "ideas", "active", name, f"{name}-metadata.yaml")
+    with open(metadata_path, "w") as f:
+        yaml.safe_dump({"state": state}, f)
+    stat = os.stat(metadata_path)
+    os.utime(metadata_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    return root
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cache"
+
+
+@pytest.mark.unit
+class TestCachedIdeas:
+
+    def test_returns_ideas_and_writes_cache_file(self, repo, cache_dir):
+        _create_active_idea(repo, "alpha", "wip")
+
+        result = cached_ideas(repo, cache_dir)
+
+        assert result == [IdeaInfo(name="alpha", state="wip", directory="docs/ideas/active/alpha")]
+        assert cache_file_for(repo, cache_dir).is_file()
+
+    def test_fresh_cache_skips_scanning(self, repo, cache_dir, mocker):
+        _create_active_idea(repo, "alpha")
+        cached_ideas(repo, cache_dir)
+        spy = mocker.spy(completion_cache, "list_ideas")
+
+        result = cached_ideas(repo, cache_dir)
+
+        assert [idea.name for idea in result] == ["alpha"]
+        spy.assert_not_called()
+
+    def test_new_idea_invalidates_cache(self, repo, cache_dir):
+        _create_active_idea(repo, "alpha")
+        cached_ideas(repo, cache_dir)
+        _create_active_idea(repo, "beta")
+        active_dir = repo / "docs" / "ideas" / "active"
+        stat = os.stat(active_dir)
+        os.utime(active_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        result = cached_ideas(repo, cache_dir)
+
+        assert [idea.name for idea in result] == ["alpha", "beta"]
+
+    def test_state_change_invalidates_cache(self, repo, cache_dir):
+        _create_active_idea(repo, "alpha", "draft")
+        cached_ideas(repo, cache_dir)
+        _set_metadata_state(repo, "alpha", "wip")
+
+        result = cached_ideas(repo, cache_dir)
+
+        assert result[0].state == "wip"
+
+    def test_archived_ideas_are_not_offered(self, repo, cache_dir):
+        _create_active_idea(repo, "alpha")
+        archived_dir = repo / "docs" / "ideas" / "archived" / "old"
+        archived_dir.mkdir(parents=True)
+        (archived_dir / "old-metadata.yaml").write_text("state: completed\n")
+
+        result = cached_ideas(repo, cache_dir)
+
+        assert [idea.name for idea in result] == ["alpha"]
+
+    def test_corrupt_cache_is_rebuilt(self, repo, cache_dir):
+        _create_active_idea(repo, "alpha")
+        cache_file = cache_file_for(repo, cache_dir)
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text("not json")
+
+        result = cached_ideas(repo, cache_dir)
+
+        assert [idea.name for idea in result] == ["alpha"]
+
+    def test_no_cache_written_outside_idea_repository(self, repo, cache_dir):
+        assert cached_ideas(repo, cache_dir) == []
+        assert not cache_file_for(repo, cache_dir).exists()
+
+
+@pytest.mark.unit
+class TestIdeaNameCompletions:
+
+    def test_filters_by_prefix_and_includes_state_as_help(self, repo, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        _create_active_idea(repo, "alpha", "wip")
+        _create_active_idea(repo, "beta", "draft")
+
+        items = idea_name_completions("al", repo)
+
+        assert [(item.value, item.help) for item in items] == [("alpha", "wip")]
@@ -177,6 +177,13 @@ def combined(*fns):
     return _run
 
 
+@pytest.fixture(autouse=True)
+def _isolated_home(monkeypatch, tmp_path):
+    """Keep files written under ~/.hitl, such as triage logs, out of the real home."""
+    home = tmp_path / "home"
+    monkeypatch.setattr("pathlib.Path.home", classmethod(lambda cls: home))
+
+
 @pytest.fixture
 def test_git_repo():
     """Create a temporary git repository for testing."""
@@ -7,6 +7,23 @@ regardless of pytest's conftest resolution order.
 from i2code.implement.claude_runner import ClaudeResult
 
 
+class FakeClaudeProcess:
+    """Test double for ClaudeProcess.
+
+    A result of None simulates a process that never finishes on its own.
+    """
+
+    def __init__(self, result):
+        self._result = result
+        self.terminated = False
+
+    def poll(self):
+        return self._result
+
+    def terminate(self):
+        self.terminated = True
+
+
 class FakeClaudeRunner:
     """Test double for ClaudeRunner that returns canned ClaudeResult values.
 
@@ -24,6 +41,7 @@ class FakeClaudeRunner:
         self._default_result = ClaudeResult(returncode=0)
         self._side_effects = []
         self.calls = []
+        self.processes = []
 
     def set_result(self, result):
         """Set a single result to return for the next call."""
@@ -48,6 +66,15 @@ class FakeClaudeRunner:
             return self._results.pop(0)
         return self._default_result
 
-    def execute(self, command):
+    def execute(self, command, on_message=None):
         self.calls.append(("execute", command, command.cwd))
         return self._next_result()
+
+    def execute_all(self, commands, max_concurrent=None):
+        return [self.execute(command) for command in commands]
+
+    def start(self, command):
+        self.calls.append(("start", command, command.cwd))
+        process = FakeClaudeProcess(self._next_result())
+        self.processes.append(process)
+        return process
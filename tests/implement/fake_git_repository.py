@@ -29,6 +29,8 @@ class FakeGitRepository:
         self._default_diff_output = ""
         self._diff_outputs = {}
         self._files_at_head = {}
+        self._cherry_pick_conflicts = set()
+        self.scratch_worktrees = []
         self.branch = None
         self.pr_number = None
         self.calls = []
@@ -90,6 +92,27 @@ class FakeGitRepository:
             main_repo_dir=self._working_tree_dir,
         )
 
+    def add_scratch_worktree(self, path):
+        self.calls.append(("add_scratch_worktree", path))
+        scratch = FakeGitRepository(working_tree_dir=path, main_repo_dir=self._main_repo_dir)
+        scratch.set_head_sha(self._head_sha)
+        self.scratch_worktrees.append(scratch)
+        return scratch
+
+    def remove_worktree(self, path):
+        self.calls.append(("remove_worktree", path))
+
+    def cherry_pick(self, from_sha, to_sha):
+        self.calls.append(("cherry_pick", from_sha, to_sha))
+        if to_sha in self._cherry_pick_conflicts:
+            return False
+        self._head_sha = f"{self._head_sha}+{to_sha}"
+        return True
+
+    def set_cherry_pick_conflict(self, to_sha):
+        """Make cherry-picking commits ending at to_sha fail."""
+        self._cherry_pick_conflicts.add(to_sha)
+
     def set_worktree_path(self, idea_name, path):
         self._worktrees[idea_name] = path
 
@@ -4,6 +4,16 @@ Separated into its own module so tests can import it unambiguously
 regardless of pytest's conftest resolution order.
 """
 
+from i2code.implement.github_client import FEEDBACK_PAGE_SIZE
+from i2code.implement.pr_replies import post_replies
+
+
+def _updated_since(items, since):
+    """Items updated at or after since; items without updated_at are kept."""
+    if since is None:
+        return list(items)
+    return [item for item in items if item.get("updated_at", since) >= since]
+
 
 class FakeGitHubClient:
     """Test double for GitHubClient that returns canned responses.
@@ -33,8 +43,11 @@ class FakeGitHubClient:
         self._failed_checks = {}
         self._workflow_runs = {}
         self._workflow_failure_logs = {}
+        self._failed_jobs = {}
+        self._job_failure_logs = {}
         self._default_branch = "main"
         self._reply_results = True
+        self._failing_reply_ids = set()
         self._workflow_completion_results = {}
         self._resolved_review_comment_ids = {}
         self.calls = []
@@ -110,38 +123,53 @@ class FakeGitHubClient:
     def set_workflow_failure_logs(self, run_id, logs):
         self._workflow_failure_logs[run_id] = logs
 
+    def set_failed_jobs(self, run_id, jobs):
+        self._failed_jobs[run_id] = jobs
+
+    def set_job_failure_logs(self, job_id, logs):
+        self._job_failure_logs[job_id] = logs
+
     def set_default_branch(self, branch):
         self._default_branch = branch
 
     def set_reply_results(self, success):
         self._reply_results = success
 
+    def set_failing_reply_ids(self, comment_ids):
+        """Make threaded replies to these review comments fail."""
+        self._failing_reply_ids = set(comment_ids)
+
     def set_workflow_completion_result(self, branch, sha, result):
         self._workflow_completion_results[(branch, sha)] = result
 
     def set_resolved_review_comment_ids(self, owner, repo, pr_number, ids):
         self._resolved_review_comment_ids[(owner, repo, pr_number)] = ids
 
-    def fetch_pr_comments(self, pr_number):
+    def fetch_pr_comments(self, pr_number, since=None):
         self.calls.append(("fetch_pr_comments", pr_number))
-        return self._pr_comments.get(pr_number, [])
+        return _updated_since(self._pr_comments.get(pr_number, []), since)
 
-    def fetch_pr_reviews(self, pr_number):
+    def fetch_pr_reviews(self, pr_number, known_count=0):
         self.calls.append(("fetch_pr_reviews", pr_number))
-        return self._pr_reviews.get(pr_number, [])
+        reviews = self._pr_reviews.get(pr_number, [])
+        first = (known_count - 1) // FEEDBACK_PAGE_SIZE * FEEDBACK_PAGE_SIZE if known_count else 0
+        return reviews[first:]
 
-    def fetch_pr_conversation_comments(self, pr_number):
+    def fetch_pr_conversation_comments(self, pr_number, since=None):
         self.calls.append(("fetch_pr_conversation_comments", pr_number))
-        return self._pr_conversation_comments.get(pr_number, [])
+        return _updated_since(self._pr_conversation_comments.get(pr_number, []), since)
 
     def reply_to_review_comment(self, pr_number, comment_id, body):
         self.calls.append(("reply_to_review_comment", pr_number, comment_id, body))
-        return self._reply_results
+        return self._reply_results and comment_id not in self._failing_reply_ids
 
     def reply_to_pr_comment(self, pr_number, body):
         self.calls.append(("reply_to_pr_comment", pr_number, body))
         return self._reply_results
 
+    def post_replies(self, pr_number, replies):
+        return post_replies(self, pr_number, replies)
+
     def fetch_failed_checks(self, pr_number):
         self.calls.append(("fetch_failed_checks", pr_number))
         return self._failed_checks.get(pr_number, [])
@@ -154,6 +182,14 @@ class FakeGitHubClient:
         self.calls.append(("get_workflow_failure_logs", run_id))
         return self._workflow_failure_logs.get(run_id, "")
 
+    def get_failed_jobs(self, run_id):
+        self.calls.append(("get_failed_jobs", run_id))
+        return self._failed_jobs.get(run_id, [])
+
+    def get_job_failure_logs(self, job_id):
+        self.calls.append(("get_job_failure_logs", job_id))
+        return self._job_failure_logs.get(job_id, "")
+
     def wait_for_workflow_completion(self, branch, sha, timeout_seconds=600):
         self.calls.append(("wait_for_workflow_completion", branch, sha))
         if (branch, sha) in self._workflow_completion_results:
@@ -33,6 +33,10 @@ class FakeIdeaProject:
     def state_file(self):
         return os.path.join(self._directory, f"{self._name}-wt-state.json")
 
+    @property
+    def triage_cache_dir(self):
+        return os.path.join(self._directory, f"{self._name}-triage-cache")
+
     def validate(self):
         return self
 
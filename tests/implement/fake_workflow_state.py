@@ -4,6 +4,8 @@ Separated into its own module so tests can import it unambiguously
 regardless of pytest's conftest resolution order.
 """
 
+from i2code.implement.ci_failure_fingerprints import CiFailureFingerprints
+
 
 class FakeWorkflowState:
     """Test double for WorkflowState that tracks state in memory.
@@ -11,35 +13,57 @@ class FakeWorkflowState:
     Usage:
         fake = FakeWorkflowState()
         fake.mark_comments_processed(["c1", "c2"])
-        assert fake.processed_comment_ids == ["c1", "c2"]
+        assert fake.processed_comment_ids == {"c1", "c2"}
     """
 
     def __init__(self):
-        self._processed_comment_ids = []
-        self._processed_review_ids = []
-        self._processed_conversation_ids = []
+        self._processed_comment_ids = {}
+        self._processed_review_ids = {}
+        self._processed_conversation_ids = {}
+        self._high_water_marks = {}
+        self._ci_failure_fingerprints = {}
+        self._thread_sessions = {}
         self._saved = False
 
     @property
     def processed_comment_ids(self):
-        return self._processed_comment_ids
+        return self._processed_comment_ids.keys()
 
     @property
     def processed_review_ids(self):
-        return self._processed_review_ids
+        return self._processed_review_ids.keys()
 
     @property
     def processed_conversation_ids(self):
-        return self._processed_conversation_ids
+        return self._processed_conversation_ids.keys()
+
+    @property
+    def high_water_marks(self):
+        return dict(self._high_water_marks)
+
+    @property
+    def ci_failure_fingerprints(self):
+        return CiFailureFingerprints(self._ci_failure_fingerprints)
+
+    @property
+    def thread_sessions(self):
+        return self._thread_sessions
+
+    def mark_comments_processed(self, ids, high_water_mark=None):
+        self._processed_comment_ids.update(dict.fromkeys(ids))
+        self._advance("comment", high_water_mark)
 
-    def mark_comments_processed(self, ids):
-        self._processed_comment_ids.extend(ids)
+    def mark_reviews_processed(self, ids, high_water_mark=None):
+        self._processed_review_ids.update(dict.fromkeys(ids))
+        self._advance("review", high_water_mark)
 
-    def mark_reviews_processed(self, ids):
-        self._processed_review_ids.extend(ids)
+    def mark_conversations_processed(self, ids, high_water_mark=None):
+        self._processed_conversation_ids.update(dict.fromkeys(ids))
+        self._advance("conversation", high_water_mark)
 
-    def mark_conversations_processed(self, ids):
-        self._processed_conversation_ids.extend(ids)
+    def _advance(self, kind, high_water_mark):
+        if high_water_mark and high_water_mark > self._high_water_marks.get(kind, ""):
+            self._high_water_marks[kind] = high_water_mark
 
     def save(self):
         self._saved = True
@@ -20,6 +20,7 @@ def make_processor(**overrides):
         mock_claude=None, skip_ci_wait=True, ci_timeout=600,
         pr_url="https://github.com/org/repo/pull/42",
         comments=None, reviews=None, conversation_comments=None,
+        triage_cache=None,
     )
     defaults.update(overrides)
     d = defaults
@@ -52,6 +53,7 @@ def make_processor(**overrides):
 
     processor = PullRequestReviewProcessor(
         opts=opts, git_repo=fake_repo, state=fake_state, claude_runner=fake_claude,
+        triage_cache=d["triage_cache"],
     )
 
     return processor, fake_gh, fake_repo, fake_state, fake_claude
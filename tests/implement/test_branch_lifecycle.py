@@ -9,11 +9,11 @@ from i2code.implement.branch_lifecycle import (
     remove_worktree,
 )
 
-_SUBPROCESS_PATH = "i2code.implement.branch_lifecycle.subprocess.run"
+_SUBPROCESS_PATH = "i2code.implement.branch_lifecycle.run_command"
 
 
 def _mock_subprocess(mocker, returncode=0, stdout=""):
-    """Patch subprocess.run and return the mock."""
+    """Patch run_command and return the mock."""
     mock_run = mocker.patch(_SUBPROCESS_PATH)
     mock_run.return_value.returncode = returncode
     mock_run.return_value.stdout = stdout
@@ -21,7 +21,7 @@ def _mock_subprocess(mocker, returncode=0, stdout=""):
 
 
 def _mock_fetch_and_ls_remote(mocker, ls_remote_stdout):
-    """Patch subprocess.run to record calls and simulate fetch + ls-remote.
+    """Patch run_command to record calls and simulate fetch + ls-remote.
 
     Returns the list that captures each call's args.
     """
@@ -0,0 +1,52 @@
+"""Tests for ci_failure_fingerprints: failure signatures and fix attempt history."""
+
+import pytest
+
+from i2code.implement.ci_failure_fingerprints import (
+    OUTCOME_FIXED,
+    OUTCOME_NO_COMMIT,
+    OUTCOME_STILL_FAILING,
+    CiFailureFingerprints,
+    failure_fingerprint,
+)
+
+
+@pytest.mark.unit
+class TestFailureFingerprint:
+
+    def test_ignores_volatile_details(self):
+        first = "noise 1\nsrc/a.py:10: error: bad thing at 0x7f3a9c21\ntook 1.5s"
+        second = "noise 2\nsrc/a.py:12: error: bad thing at 0x81bb02de\ntook 3.2s"
+        assert failure_fingerprint("build", first) == failure_fingerprint("build", second)
+
+    def test_different_errors_differ(self):
+        assert (
+            failure_fingerprint("build", "error: missing import")
+            != failure_fingerprint("build", "error: type mismatch")
+        )
+
+    def test_includes_job_name(self):
+        fingerprint = failure_fingerprint("test (3.12)", "FAILED test_x")
+        assert fingerprint.startswith("test (3.12):")
+        assert fingerprint != failure_fingerprint("lint", "FAILED test_x")
+
+    def test_falls_back_to_whole_excerpt_without_error_lines(self):
+        assert failure_fingerprint("build", "a\nb") != failure_fingerprint("build", "a\nc")
+
+
+@pytest.mark.unit
+class TestCiFailureFingerprints:
+
+    def test_counts_only_unsuccessful_attempts(self):
+        fingerprints = CiFailureFingerprints({})
+        fingerprints.record("build:1", OUTCOME_NO_COMMIT, "aaa")
+        fingerprints.record("build:1", OUTCOME_STILL_FAILING, "bbb")
+        fingerprints.record("build:1", OUTCOME_FIXED, "ccc")
+
+        assert fingerprints.failed_attempts("build:1") == 2
+        assert fingerprints.failed_attempts("build:2") == 0
+
+    def test_writes_through_to_backing_dict(self):
+        data = {}
+        CiFailureFingerprints(data).record("build:1", OUTCOME_NO_COMMIT, "aaa")
+        assert data == {"build:1": [{"outcome": OUTCOME_NO_COMMIT, "sha": "aaa"}]}
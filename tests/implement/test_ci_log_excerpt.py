@@ -0,0 +1,107 @@
+"""Tests for ci_log_excerpt: bounded, relevance-ordered CI log excerpts."""
+
+import pytest
+
+from i2code.implement.ci_log_excerpt import (
+    MAX_LINE_CHARS,
+    CiLogExcerptor,
+    clean_log_line,
+    excerpt_ci_log,
+    signature_priority,
+)
+
+
+def _log_line(message, job="build", step="Run tests"):
+    return f"{job}\t{step}\t2024-05-01T10:00:00.1234567Z {message}"
+
+
+def _noise(count, job="build", step="Run tests"):
+    return [_log_line(f"noise {i}", job, step) for i in range(count)]
+
+
+@pytest.mark.unit
+class TestCleanLogLine:
+
+    def test_splits_section_and_strips_timestamp_and_ansi(self):
+        section, message = clean_log_line(_log_line("\x1b[1;31mboom\x1b[0m\n"))
+        assert section == ("build", "Run tests")
+        assert message == "boom"
+
+    def test_line_without_prefix_has_empty_section(self):
+        assert clean_log_line("plain text") == (("", ""), "plain text")
+
+    def test_caps_long_lines(self):
+        _, message = clean_log_line("x" * (MAX_LINE_CHARS * 2))
+        assert message.endswith("(truncated)")
+        assert len(message) < MAX_LINE_CHARS + 20
+
+
+@pytest.mark.unit
+class TestSignaturePriority:
+
+    @pytest.mark.parametrize("message, priority", [
+        ("src/Foo.java:12: error: cannot find symbol", 0),
+        ("error[E0308]: mismatched types", 0),
+        ("FAILED tests/test_x.py::test_y - assert 1 == 2", 1),
+        ("--- FAIL: TestThing (0.00s)", 1),
+        ("Traceback (most recent call last):", 2),
+        ("    at com.example.Foo.bar(Foo.java:12)", 2),
+        ("##[error]Process completed with exit code 1.", 3),
+        ("all good", None),
+    ])
+    def test_classifies_message(self, message, priority):
+        assert signature_priority(message) == priority
+
+
+@pytest.mark.unit
+class TestCiLogExcerptor:
+
+    def test_small_log_returned_whole(self):
+        lines = [_log_line("step one"), _log_line("step two")]
+        assert excerpt_ci_log(lines) == "== build / Run tests ==\nstep one\nstep two"
+
+    def test_large_log_keeps_first_error_with_context(self):
+        lines = _noise(3000)
+        lines.insert(100, _log_line("src/Foo.java:12: error: cannot find symbol"))
+
+        excerpt = excerpt_ci_log(lines)
+
+        assert "src/Foo.java:12: error: cannot find symbol" in excerpt
+        assert "noise 99" in excerpt
+        assert "noise 100" in excerpt
+        assert "noise 2999" not in excerpt
+        assert "lines omitted" in excerpt
+
+    def test_higher_priority_errors_win_under_tight_budget(self):
+        lines = _noise(500)
+        lines.insert(50, _log_line("##[error]something generic"))
+        lines.insert(400, _log_line("FAILED tests/test_x.py::test_y"))
+
+        excerpt = excerpt_ci_log(lines, max_chars=300)
+
+        assert "FAILED tests/test_x.py::test_y" in excerpt
+        assert "something generic" not in excerpt
+
+    def test_errors_grouped_per_job_and_step(self):
+        lines = _noise(300, job="lint") + _noise(300, job="test")
+        lines.insert(10, _log_line("error: unused import", job="lint"))
+        lines.append(_log_line("FAILED test_a", job="test"))
+
+        excerpt = excerpt_ci_log(lines)
+
+        assert excerpt.index("== lint / Run tests ==") < excerpt.index("error: unused import")
+        assert excerpt.index("== test / Run tests ==") < excerpt.index("FAILED test_a")
+
+    def test_falls_back_to_step_tail_without_signatures(self):
+        excerpt = excerpt_ci_log(_noise(3000))
+
+        assert "noise 2999" in excerpt
+        assert "noise 0\n" not in excerpt
+        assert excerpt.startswith("== build / Run tests ==\n... (truncated")
+
+    def test_excerpt_stays_within_budget_with_many_errors(self):
+        excerptor = CiLogExcerptor()
+        for i in range(10_000):
+            excerptor.add_line(_log_line(f"error: failure {i}" if i % 50 == 0 else f"noise {i}"))
+
+        assert len(excerptor.excerpt()) <= 5000
@@ -1,5 +1,8 @@
 """Tests for ClaudeRunner strategy pattern."""
 
+import asyncio
+import os
+import signal
 import subprocess
 from unittest.mock import MagicMock, patch
 
@@ -15,6 +18,8 @@ from i2code.implement.claude_runner import (
     _parse_stream_json_output,
     _run_claude_with_output_capture,
 )
+from i2code.implement.managed_subprocess import AsyncManagedSubprocess
+from i2code.trace.processes import process_stats
 
 
 @pytest.mark.unit
@@ -288,6 +293,17 @@ class TestParseStreamJsonOutput:
 
         assert result_text == stdout
 
+    def test_last_messages_skip_partial_message_deltas(self):
+        stdout = (
+            '{"type":"assistant","message":{}}\n'
+            + '{"type":"stream_event","event":{}}\n' * 10
+            + '{"type":"result","result":"done"}\n'
+        )
+
+        diagnostics, _result_text = _parse_stream_json_output(stdout)
+
+        assert [m["type"] for m in diagnostics.last_messages] == ["assistant", "result"]
+
 
 @pytest.mark.unit
 class TestRunClaudeWithOutputCaptureResultText:
@@ -527,3 +543,153 @@ class TestClaudeRunnerExecuteRealClaude:
         assert result.returncode == 0
         assert result.result_text
         assert not result.result_text.startswith("{")
+
+
+@pytest.mark.unit
+class TestClaudeRunnerStart:
+
+    def test_start_returns_result_when_process_finishes(self, tmp_path):
+        script = 'echo \'{"type": "result", "result": "plan text"}\'; echo oops >&2'
+        command = ClaudeCodeCommand(cwd=str(tmp_path), mock_command=["sh", "-c", script])
+        process = ClaudeRunner(interactive=False).start(command)
+        process.process.wait()
+
+        result = process.poll()
+
+        assert result is not None
+        assert result.returncode == 0
+        assert result.result_text == "plan text"
+        assert result.output.stderr == "oops\n"
+
+    def test_poll_returns_none_while_running_and_terminate_stops_process(self, tmp_path):
+        command = ClaudeCodeCommand(cwd=str(tmp_path), mock_command=["sleep", "30"])
+        process = ClaudeRunner(interactive=False).start(command)
+
+        assert process.poll() is None
+        process.terminate()
+        assert process.process.returncode is not None
+
+    def test_start_builds_batch_argv(self, mocker, tmp_path):
+        mock_process = mocker.patch("i2code.implement.claude_runner.ClaudeProcess")
+        command = ClaudeCodeCommand(cwd=str(tmp_path), prompt="make a plan", interactive=True)
+
+        ClaudeRunner().start(command)
+
+        argv = mock_process.call_args[0][0]
+        assert argv[:3] == ["claude", "--verbose", "--output-format=stream-json"]
+        assert argv[-2:] == ["-p", "make a plan"]
+
+
+@pytest.mark.unit
+class TestClaudeRunnerExecuteOnMessage:
+
+    def test_on_message_receives_each_json_message(self, tmp_path):
+        script = 'echo \'{"type": "assistant"}\'; echo \'{"type": "result", "result": "done"}\''
+        command = ClaudeCodeCommand(cwd=str(tmp_path), mock_command=["sh", "-c", script])
+        received = []
+
+        result = ClaudeRunner(interactive=False).execute(
+            command, on_message=lambda msg: received.append(msg["type"]) and False,
+        )
+
+        assert received == ["assistant", "result"]
+        assert result.result_text == "done"
+
+    def test_on_message_returning_true_terminates_process(self, tmp_path):
+        script = 'echo \'{"type": "assistant"}\'; sleep 30; echo \'{"type": "result"}\''
+        command = ClaudeCodeCommand(cwd=str(tmp_path), mock_command=["sh", "-c", script])
+        received = []
+
+        def abort(msg):
+            received.append(msg["type"])
+            return True
+
+        result = ClaudeRunner(interactive=False).execute(command, on_message=abort)
+
+        assert received == ["assistant"]
+        assert result.returncode != 0
+
+
+@pytest.mark.unit
+class TestClaudeRunnerExecuteAll:
+
+    def test_runs_commands_concurrently_and_returns_results_in_order(self, tmp_path):
+        commands = [
+            ClaudeCodeCommand(cwd=str(tmp_path), mock_command=[
+                "sh", "-c", f'sleep {delay}; echo \'{{"type": "result", "result": "{name}"}}\'; echo {name} >&2',
+            ])
+            for name, delay in (("first", 0.5), ("second", 0))
+        ]
+
+        results = ClaudeRunner(interactive=True).execute_all(commands)
+
+        assert [r.returncode for r in results] == [0, 0]
+        assert [r.result_text for r in results] == ["first", "second"]
+        assert [r.output.stderr for r in results] == ["first\n", "second\n"]
+
+    def test_max_concurrent_limits_running_processes(self, tmp_path):
+        # Each run appends "start" then "end" to a shared log; with one slot they never interleave.
+        log = tmp_path / "log"
+        script = f"echo start >> {log}; sleep 0.2; echo end >> {log}"
+        command = ClaudeCodeCommand(cwd=str(tmp_path), mock_command=["sh", "-c", script])
+
+        ClaudeRunner(interactive=False).execute_all([command] * 3, max_concurrent=1)
+
+        assert log.read_text().split() == ["start", "end"] * 3
+
+    def test_records_each_run_in_process_stats(self, tmp_path):
+        process_stats.reset()
+        command = ClaudeCodeCommand(cwd=str(tmp_path), mock_command=["sh", "-c", "echo hi"])
+
+        ClaudeRunner(interactive=False).execute_all([command, command])
+
+        assert process_stats.count("claude") == 2
+
+    def test_execute_async_builds_batch_argv(self, mocker, tmp_path):
+        mock_run = mocker.patch(
+            "i2code.implement.claude_runner._run_claude_async",
+            new=mocker.AsyncMock(return_value=ClaudeResult(returncode=0)),
+        )
+        command = ClaudeCodeCommand(cwd=str(tmp_path), prompt="do task", interactive=True)
+
+        ClaudeRunner().execute_all([command])
+
+        argv = mock_run.call_args[0][0]
+        assert argv[:3] == ["claude", "--verbose", "--output-format=stream-json"]
+        assert argv[-2:] == ["-p", "do task"]
+
+    def test_on_message_returning_true_terminates_process(self, tmp_path):
+        script = 'echo \'{"type": "assistant"}\'; sleep 30; echo \'{"type": "result"}\''
+        command = ClaudeCodeCommand(cwd=str(tmp_path), mock_command=["sh", "-c", script])
+        received = []
+
+        def abort(msg):
+            received.append(msg["type"])
+            return True
+
+        async def run():
+            async with AsyncManagedSubprocess(label="claude") as supervisor:
+                return await ClaudeRunner(interactive=False).execute_async(
+                    command, supervisor, on_message=abort,
+                )
+
+        result = asyncio.run(run())
+
+        assert received == ["assistant"]
+        assert result.returncode != 0
+
+    def test_sigint_terminates_every_process_and_returns_130(self, tmp_path):
+        command = ClaudeCodeCommand(cwd=str(tmp_path), mock_command=["sleep", "30"])
+
+        async def run():
+            async with AsyncManagedSubprocess(label="claude", terminate_timeout=2) as supervisor:
+                runs = asyncio.gather(*(
+                    ClaudeRunner(interactive=False).execute_async(command, supervisor) for _ in range(2)
+                ))
+                await asyncio.sleep(0.2)
+                os.kill(os.getpid(), signal.SIGINT)
+                return await runs
+
+        results = asyncio.run(run())
+
+        assert [r.returncode for r in results] == [130, 130]
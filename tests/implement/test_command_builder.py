@@ -3,13 +3,16 @@
 import os
 import pytest
 
-from i2code.implement.claude_runner import ClaudeCodeCommand
+from i2code.implement.claude_runner import ClaudeCodeCommand, SessionId
 from i2code.implement.command_builder import (
     CiFixRequest,
     CommandBuilder,
     FixRequest,
     TaskCommandOpts,
 )
+from i2code.implement.prompt_budget import CHARS_PER_TOKEN, TEMPLATE_BUDGETS
+from i2code.trace.spans import start_tracing, stop_tracing
+from i2code.trace.summary import load_spans
 
 
 def _build_task_cmd(**overrides):
@@ -76,6 +79,8 @@ def _build_ci_fix_cmd(**overrides):
         "run_id": 12345,
         "workflow_name": "CI Build",
         "failure_logs": "Error: test failed",
+        "job_logs": {},
+        "previous_attempts": 0,
     }
     for key in list(request_fields):
         if key in overrides:
@@ -134,6 +139,13 @@ class TestCommandBuilderTaskCommand:
         cmd = _build_task_cmd()
         assert "Task 1.1" in cmd.prompt
 
+    def test_long_task_description_is_never_truncated(self, capsys):
+        task = "".join(f"Step {i}: do part {i} of the task\n" for i in range(2000))
+        cmd = _build_task_cmd(task_description=task, opts=TaskCommandOpts(extra_prompt="extra\n" * 2000))
+        assert task in cmd.prompt
+        assert "extra\n" * 2000 not in cmd.prompt
+        assert "over its 10000 token budget" in capsys.readouterr().err
+
     def test_build_task_command_splits_allowed_tools_from_extra_cli_args(self):
         cmd = _build_task_cmd(opts=TaskCommandOpts(
             extra_cli_args=["--allowedTools", "Bash(git commit:*)", "--debug"],
@@ -170,6 +182,22 @@ class TestCommandBuilderTaskCommand:
         assert worktree_path in cmd.prompt, f"Prompt should use worktree path. Got: {cmd.prompt}"
         assert main_repo_root not in cmd.prompt, f"Prompt should NOT use main repo path. Got: {cmd.prompt}"
 
+    def test_new_session_attaches_idea_and_spec(self):
+        session = SessionId("abc", is_new=True)
+        cmd = _build_task_cmd(opts=TaskCommandOpts(session_id=session))
+        assert cmd.session_id == session
+        assert "-idea.*" in cmd.prompt
+        assert "-spec.md" in cmd.prompt
+
+    def test_resumed_session_attaches_only_the_plan(self):
+        session = SessionId("abc", is_new=False)
+        cmd = _build_task_cmd(opts=TaskCommandOpts(session_id=session))
+        assert cmd.session_id == session
+        assert "-idea.*" not in cmd.prompt
+        assert "-spec.md" not in cmd.prompt
+        assert "docs/features/my-feature/*-plan.md" in cmd.prompt
+        assert "Task 1.1" in cmd.prompt
+
 
 @pytest.mark.unit
 class TestCommandBuilderScaffoldingCommand:
@@ -232,6 +260,30 @@ class TestCommandBuilderTriageCommand:
         assert "json" in cmd.prompt.lower()
         assert "comment_ids" in cmd.prompt
 
+    def test_oversized_feedback_is_trimmed_keeping_every_comment(self):
+        feedback = "".join(
+            f"### Comment by u on a.py:{i} (ID: {i})\n{'x' * 20_000}\n" for i in range(10)
+        )
+        cmd = CommandBuilder().build_triage_command(feedback)
+
+        assert len(cmd.prompt) <= TEMPLATE_BUDGETS["triage_feedback.j2"].max_tokens * CHARS_PER_TOKEN
+        for i in range(10):
+            assert f"(ID: {i})" in cmd.prompt
+
+    def test_traces_prompt_size(self, tmp_path):
+        path = str(tmp_path / "trace.jsonl")
+        start_tracing(path)
+        try:
+            _build_triage_cmd()
+        finally:
+            stop_tracing()
+
+        [record] = load_spans(path)
+        assert record["name"] == "render_prompt"
+        assert record["attrs"]["template"] == "triage_feedback.j2"
+        assert record["attrs"]["tokens"] > 0
+        assert "feedback_content" in record["attrs"]["sections"]
+
 
 @pytest.mark.unit
 class TestCommandBuilderFixCommand:
@@ -309,6 +361,12 @@ class TestCommandBuilderCiFixCommand:
         cmd = _build_ci_fix_cmd(failure_logs="x" * 6000)
         assert "truncated" in cmd.prompt.lower()
 
+    def test_long_logs_keep_first_error_not_just_tail(self):
+        lines = [f"noise {i}" for i in range(2000)]
+        lines.insert(5, "src/main.c:10:3: error: expected ';'")
+        cmd = _build_ci_fix_cmd(failure_logs="\n".join(lines))
+        assert "error: expected ';'" in cmd.prompt
+
     def test_renders_ci_fix_template(self, mocker):
         """Should render prompt from ci_fix.j2 template."""
         mock_render = mocker.patch("i2code.implement.command_builder.render_template", return_value="rendered prompt")
@@ -319,7 +377,42 @@ class TestCommandBuilderCiFixCommand:
             run_id=12345,
             workflow_name="CI Build",
             failure_logs="Error: test failed",
+            job_logs={},
+            previous_attempts=0,
+        )
+
+    def test_job_logs_rendered_per_job(self):
+        cmd = _build_ci_fix_cmd(
+            failure_logs="",
+            job_logs={"lint": "E501 line too long", "test (3.12)": "FAILED test_x"},
         )
+        assert "Job: lint\n```\nE501 line too long\n```" in cmd.prompt
+        assert "Job: test (3.12)\n```\nFAILED test_x\n```" in cmd.prompt
+        assert "Failure logs:" not in cmd.prompt
+
+    def test_large_job_logs_are_shrunk_to_the_budget(self, tmp_path):
+        job_logs = {
+            f"test ({i})": "".join(f"job {i} output line {n}\n" for n in range(200))
+            for i in range(16)
+        }
+        path = tmp_path / "trace.jsonl"
+        start_tracing(path)
+        try:
+            cmd = _build_ci_fix_cmd(failure_logs="", job_logs=job_logs)
+        finally:
+            stop_tracing()
+
+        assert len(cmd.prompt) <= TEMPLATE_BUDGETS["ci_fix.j2"].max_tokens * CHARS_PER_TOKEN
+        for i in range(16):
+            assert f"Job: test ({i})\n```\njob {i} output line 0\n" in cmd.prompt
+        [record] = load_spans(path)
+        assert record["attrs"]["truncated"] == ["job_logs"]
+        assert "job_logs[test (15)]" in record["attrs"]["sections"]
+
+    def test_escalates_prompt_for_repeated_failure(self):
+        assert "already survived" not in _build_ci_fix_cmd().prompt
+        cmd = _build_ci_fix_cmd(previous_attempts=1)
+        assert "already survived 1 fix attempt(s)" in cmd.prompt
 
 
 @pytest.mark.unit
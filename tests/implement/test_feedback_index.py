@@ -0,0 +1,52 @@
+"""Tests for FeedbackIndex lookups by ID."""
+
+import pytest
+
+from i2code.implement.feedback_index import FeedbackIndex
+
+
+REVIEW_COMMENTS = [{"id": 1, "body": "C1"}, {"id": 3, "body": "C3"}]
+REVIEWS = [{"id": 10, "body": "R10"}]
+CONVERSATION = [{"id": 2, "body": "G2"}]
+
+
+def _index():
+    return FeedbackIndex(REVIEW_COMMENTS, REVIEWS, CONVERSATION)
+
+
+@pytest.mark.unit
+class TestFeedbackIndex:
+
+    def test_unpacks_like_a_tuple_of_lists(self):
+        review_comments, reviews, conversation = _index()
+
+        assert (review_comments, reviews, conversation) == (REVIEW_COMMENTS, REVIEWS, CONVERSATION)
+
+    def test_is_falsy_when_empty(self):
+        assert not FeedbackIndex([], [], [])
+        assert len(_index()) == 4
+
+    def test_select_returns_matching_items_by_kind_in_fetch_order(self):
+        review_comments, reviews, conversation = _index().select([2, 10, 3, 1])
+
+        assert [c["id"] for c in review_comments] == [1, 3]
+        assert [r["id"] for r in reviews] == [10]
+        assert [c["id"] for c in conversation] == [2]
+
+    def test_select_ignores_unknown_ids(self):
+        assert not _index().select([99])
+
+    def test_is_review_comment(self):
+        index = _index()
+
+        assert index.is_review_comment(1)
+        assert not index.is_review_comment(2)
+        assert not index.is_review_comment(10)
+
+    def test_ids_shared_across_kinds_keep_both_items(self):
+        index = FeedbackIndex([{"id": 5, "body": "line"}], [], [{"id": 5, "body": "general"}])
+
+        review_comments, _, conversation = index.select([5])
+
+        assert len(review_comments) == 1 and len(conversation) == 1
+        assert index.is_review_comment(5)
@@ -0,0 +1,49 @@
+"""Tests for partitioning fix groups into concurrent and serial ones."""
+
+import pytest
+
+from i2code.implement.fix_groups import partition_fix_groups
+
+
+REVIEW_COMMENTS = [
+    {"id": 1, "path": "a.py"},
+    {"id": 2, "path": "b.py"},
+    {"id": 3, "path": "a.py"},
+    {"id": 4, "path": "c.py"},
+]
+
+
+def _group(*comment_ids):
+    return {"comment_ids": list(comment_ids), "description": f"fix {comment_ids}"}
+
+
+@pytest.mark.unit
+class TestPartitionFixGroups:
+
+    def test_groups_on_disjoint_files_run_concurrently(self):
+        groups = [_group(1), _group(2), _group(4)]
+
+        concurrent, serial = partition_fix_groups(groups, REVIEW_COMMENTS)
+
+        assert concurrent == groups
+        assert serial == []
+
+    def test_group_sharing_a_file_with_an_earlier_group_runs_serially(self):
+        groups = [_group(1), _group(2), _group(3)]
+
+        concurrent, serial = partition_fix_groups(groups, REVIEW_COMMENTS)
+
+        assert concurrent == [_group(1), _group(2)]
+        assert serial == [_group(3)]
+
+    def test_group_with_unanchored_feedback_runs_serially(self):
+        groups = [_group(1), _group(2), _group(2, 99)]
+
+        concurrent, serial = partition_fix_groups(groups, REVIEW_COMMENTS)
+
+        assert serial == [_group(2, 99)]
+
+    def test_single_candidate_runs_everything_serially(self):
+        groups = [_group(1), _group(99)]
+
+        assert partition_fix_groups(groups, REVIEW_COMMENTS) == ([], groups)
@@ -12,6 +12,7 @@ import pytest
 from git import Repo
 
 from i2code.implement.git_repository import GitRepository
+from i2code.trace.processes import process_stats
 from fake_github_client import FakeGitHubClient
 
 
@@ -21,8 +22,8 @@ def _make_git_repo(repo, gh_client=None):
 
 
 def _mock_subprocess(mocker, returncode=0, stdout="", stderr=""):
-    """Patch subprocess.run and return the mock with a CompletedProcess result."""
-    mock_run = mocker.patch("i2code.implement.git_repository.subprocess.run")
+    """Patch run_command and return the mock with a CompletedProcess result."""
+    mock_run = mocker.patch("i2code.implement.git_repository.run_command")
     mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr=stderr)
     return mock_run
 
@@ -156,6 +157,15 @@ class TestCheckout:
 
         assert repo.active_branch.name == "feature/checkout-test"
 
+    def test_checkout_is_counted_in_process_stats(self, test_git_repo_with_commit):
+        tmpdir, repo = test_git_repo_with_commit
+        repo.create_head("feature/counted")
+        process_stats.reset()
+
+        _make_git_repo(repo).checkout("feature/counted")
+
+        assert process_stats.count("git") == 1
+
 
 def _named_repo_with_branch(parent, branch_name):
     """Create a named repo directory with an initial commit and branch."""
@@ -198,6 +208,45 @@ class TestEnsureWorktree:
             assert wt1.working_tree_dir == wt2.working_tree_dir
 
 
+def _commit_file(repo_dir, name, content, message):
+    with open(os.path.join(repo_dir, name), "w") as f:
+        f.write(content)
+    subprocess.run(["git", "add", name], cwd=repo_dir, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", message], cwd=repo_dir, check=True)
+
+
+@pytest.mark.unit
+class TestScratchWorktreeCherryPick:
+
+    def test_commits_made_in_scratch_worktree_cherry_pick_onto_head(self, test_git_repo_with_commit, tmp_path):
+        tmpdir, repo = test_git_repo_with_commit
+        git_repo = _make_git_repo(repo)
+        base_sha = git_repo.head_sha
+
+        scratch = git_repo.add_scratch_worktree(str(tmp_path / "scratch"))
+        _commit_file(scratch.working_tree_dir, "fix.txt", "fixed", "Fix")
+        assert git_repo.cherry_pick(base_sha, scratch.head_sha) is True
+        git_repo.remove_worktree(scratch.working_tree_dir)
+
+        assert repo.head.commit.message.strip() == "Fix"
+        assert os.path.exists(os.path.join(tmpdir, "fix.txt"))
+        assert not os.path.exists(tmp_path / "scratch")
+
+    def test_conflicting_cherry_pick_is_aborted(self, test_git_repo_with_commit, tmp_path):
+        tmpdir, repo = test_git_repo_with_commit
+        git_repo = _make_git_repo(repo)
+        base_sha = git_repo.head_sha
+        scratch = git_repo.add_scratch_worktree(str(tmp_path / "scratch"))
+        _commit_file(scratch.working_tree_dir, "README.md", "theirs", "Theirs")
+        _commit_file(tmpdir, "README.md", "ours", "Ours")
+        head_before = git_repo.head_sha
+
+        assert git_repo.cherry_pick(base_sha, scratch.head_sha) is False
+
+        assert git_repo.head_sha == head_before
+        assert not repo.is_dirty()
+
+
 @pytest.mark.unit
 class TestWorkingTreeDir:
 
@@ -4,6 +4,7 @@ import os
 import tempfile
 import pytest
 
+from i2code.implement.git_setup import _porcelain_paths
 from i2code.implement.idea_project import IdeaProject
 
 
@@ -95,3 +96,12 @@ class TestIdeaFilesCommitValidation:
 
             # Should not raise
             validate_idea_files_committed(IdeaProject(idea_dir))
+
+
+@pytest.mark.unit
+class TestPorcelainPaths:
+
+    def test_lists_modified_untracked_and_renamed_paths(self):
+        output = " M docs/idea.md\0?? docs/spec.md\0R  docs/new.md\0docs/old.md\0"
+
+        assert _porcelain_paths(output) == {"docs/idea.md", "docs/spec.md", "docs/new.md"}
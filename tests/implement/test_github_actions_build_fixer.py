@@ -6,10 +6,12 @@ from i2code.implement.claude_runner import ClaudeCodeCommand
 from i2code.implement.command_builder import CiFixRequest, CommandBuilder
 from i2code.implement.github_actions_build_fixer import GithubActionsBuildFixer
 from i2code.implement.implement_opts import ImplementOpts
+from i2code.implement.local_ci import LocalCiJobResult, LocalCiResult
 
 from fake_claude_runner import FakeClaudeRunner
 from fake_git_repository import FakeGitRepository
 from fake_github_client import FakeGitHubClient
+from fake_workflow_state import FakeWorkflowState
 
 _BRANCH = "idea/test/01-setup"
 
@@ -151,3 +153,161 @@ class TestGithubActionsBuildFixerFixCiFailure:
         assert cmd.cwd == fake_repo.working_tree_dir
         assert cmd.mock_command == [mock_path, "fix-ci-123"]
         assert cwd == fake_repo.working_tree_dir
+
+
+@pytest.mark.unit
+class TestGithubActionsBuildFixerPerJobLogs:
+    """fix_ci_failure() fetches each failed job's log and passes them per job."""
+
+    def _fixer_with_jobs(self):
+        fixer, fake_repo, fake_gh, fake_runner = _make_fixer(
+            failing_run=_CI_BUILD_FAILURE,
+            opts_overrides=dict(ci_fix_retries=1, non_interactive=True),
+        )
+        fake_repo.set_head_sha("aaa")
+        fake_gh.set_failed_jobs(123, [
+            {"databaseId": 1, "name": "lint"},
+            {"databaseId": 2, "name": "test (3.12)"},
+        ])
+        fake_gh.set_job_failure_logs(1, "E501 line too long")
+        fake_gh.set_job_failure_logs(2, "FAILED test_x")
+        return fixer, fake_repo, fake_gh, fake_runner
+
+    def test_fetches_each_failed_job_log(self):
+        fixer, _, fake_gh, _ = self._fixer_with_jobs()
+
+        fixer.fix_ci_failure()
+
+        assert ("get_job_failure_logs", 1) in fake_gh.calls
+        assert ("get_job_failure_logs", 2) in fake_gh.calls
+        assert ("get_workflow_failure_logs", 123) not in fake_gh.calls
+
+    def test_claude_receives_job_scoped_logs(self):
+        fixer, fake_repo, _, fake_runner = self._fixer_with_jobs()
+
+        fixer.fix_ci_failure()
+
+        _, cmd, _ = fake_runner.calls[0]
+        expected = CommandBuilder().build_ci_fix_command(
+            CiFixRequest(
+                run_id=123,
+                workflow_name="CI Build",
+                failure_logs="",
+                job_logs={"lint": "E501 line too long", "test (3.12)": "FAILED test_x"},
+            ),
+            cwd=fake_repo.working_tree_dir,
+            interactive=False,
+        )
+        assert cmd == expected
+
+    def test_jobs_sharing_a_name_keep_separate_logs(self):
+        fixer, _, fake_gh, _ = _make_fixer(failing_run=_CI_BUILD_FAILURE)
+        fake_gh.set_failed_jobs(123, [
+            {"databaseId": 1, "name": "test"},
+            {"databaseId": 2, "name": "test"},
+        ])
+        fake_gh.set_job_failure_logs(1, "FAILED on linux")
+        fake_gh.set_job_failure_logs(2, "FAILED on macos")
+
+        assert fixer._fetch_job_logs(123) == {"test": "FAILED on linux", "test #2": "FAILED on macos"}
+
+
+@pytest.mark.unit
+class TestGithubActionsBuildFixerFingerprints:
+    """fix_ci_failure() escalates and then stops on a repeated identical failure."""
+
+    def _fixer(self, retries, state=None):
+        fake_gh = FakeGitHubClient()
+        fake_repo = FakeGitRepository(working_tree_dir="/fake/repo", gh_client=fake_gh)
+        fake_repo.set_pushed(True)
+        fake_repo.branch = _BRANCH
+        fake_repo.set_head_sha("aaa")
+        fake_gh.set_workflow_runs(_BRANCH, "aaa", [_CI_BUILD_FAILURE])
+        fake_gh.set_workflow_failure_logs(123, "error: cannot find symbol")
+        fake_runner = FakeClaudeRunner()
+        fixer = GithubActionsBuildFixer(
+            opts=ImplementOpts(idea_directory="/fake/idea", ci_fix_retries=retries, non_interactive=True),
+            git_repo=fake_repo, claude_runner=fake_runner, state=state,
+        )
+        return fixer, fake_runner
+
+    def test_second_attempt_on_same_failure_is_escalated(self):
+        fixer, fake_runner = self._fixer(retries=2)
+
+        fixer.fix_ci_failure()
+
+        prompts = [call[1].prompt for call in fake_runner.calls]
+        assert "already survived" not in prompts[0]
+        assert "already survived 1 fix attempt(s)" in prompts[1]
+
+    def test_stops_early_when_failure_survived_max_attempts(self, capsys):
+        fixer, fake_runner = self._fixer(retries=5)
+
+        assert fixer.fix_ci_failure() is False
+
+        assert len(fake_runner.calls) == 2
+        assert "giving up" in capsys.readouterr().err
+
+    def test_attempts_persist_in_workflow_state(self):
+        state = FakeWorkflowState()
+        first, _ = self._fixer(retries=2, state=state)
+        first.fix_ci_failure()
+
+        second, fake_runner = self._fixer(retries=2, state=state)
+
+        assert second.fix_ci_failure() is False
+        assert fake_runner.calls == []
+        assert state.saved
+
+
+class _SequentialLocalCi:
+    def __init__(self, results):
+        self._results = list(results)
+        self.runs = 0
+
+    def run(self):
+        self.runs += 1
+        return self._results.pop(0)
+
+
+_LOCAL_PASS = LocalCiResult(jobs=[LocalCiJobResult("test", True, "")])
+_LOCAL_FAIL = LocalCiResult(jobs=[
+    LocalCiJobResult("lint", True, ""),
+    LocalCiJobResult("test", False, "FAILED test_x"),
+])
+
+
+@pytest.mark.unit
+class TestGithubActionsBuildFixerLocalCi:
+    """fix_local_ci_failures() fixes local pre-flight failures without the network."""
+
+    def test_passing_run_invokes_nothing(self):
+        fixer, _, fake_gh, fake_runner = _make_fixer(opts_overrides=dict(non_interactive=True))
+
+        assert fixer.fix_local_ci_failures(_SequentialLocalCi([_LOCAL_PASS])) is True
+        assert fake_runner.calls == []
+        assert fake_gh.calls == []
+
+    def test_failure_sent_to_claude_and_rerun(self):
+        fixer, fake_repo, fake_gh, fake_runner = _make_fixer(opts_overrides=dict(non_interactive=True))
+        fake_repo.set_head_sha("aaa")
+        fake_runner.set_side_effect(lambda: fake_repo.set_head_sha("bbb"))
+        local_ci = _SequentialLocalCi([_LOCAL_FAIL, _LOCAL_PASS])
+
+        assert fixer.fix_local_ci_failures(local_ci) is True
+
+        assert local_ci.runs == 2
+        _, cmd, _ = fake_runner.calls[0]
+        assert "Job: test" in cmd.prompt
+        assert "FAILED test_x" in cmd.prompt
+        assert "Job: lint" not in cmd.prompt
+        assert fake_gh.calls == []
+
+    def test_gives_up_after_retries(self):
+        fixer, fake_repo, _, fake_runner = _make_fixer(
+            opts_overrides=dict(non_interactive=True, ci_fix_retries=2),
+        )
+        fake_repo.set_head_sha("aaa")
+
+        assert fixer.fix_local_ci_failures(_SequentialLocalCi([_LOCAL_FAIL])) is False
+        assert len(fake_runner.calls) == 2
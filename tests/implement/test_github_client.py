@@ -1,5 +1,6 @@
 """Tests for GitHubClient class."""
 
+import io
 import json
 
 import pytest
@@ -26,6 +27,22 @@ def _gh_client(monkeypatch, stdout="", returncode=0, stderr=""):
     return GitHubClient()
 
 
+def _streaming_gh_client(monkeypatch, stdout="", returncode=0, stderr="", commands=None):
+    """Patch subprocess.Popen for GitHubClient._stream_gh and return a client."""
+    class Process:
+        def __init__(self, cmd, **kwargs):
+            if commands is not None:
+                commands.append(cmd)
+            self.stdout = io.StringIO(stdout)
+            kwargs["stderr"].write(stderr.encode())
+
+        def wait(self):
+            return returncode
+
+    monkeypatch.setattr("subprocess.Popen", Process)
+    return GitHubClient()
+
+
 @pytest.mark.unit
 class TestFakeGitHubClientConformance:
     """Verify FakeGitHubClient has the same interface as GitHubClient."""
@@ -36,9 +53,10 @@ class TestFakeGitHubClientConformance:
             "get_pr_state", "get_pr_url", "mark_pr_ready",
             "fetch_pr_comments", "fetch_pr_reviews",
             "fetch_pr_conversation_comments",
-            "reply_to_review_comment", "reply_to_pr_comment",
+            "reply_to_review_comment", "reply_to_pr_comment", "post_replies",
             "fetch_failed_checks", "get_workflow_runs_for_commit",
             "get_workflow_failure_logs", "wait_for_workflow_completion",
+            "get_failed_jobs", "get_job_failure_logs",
             "get_default_branch",
             "get_resolved_review_comment_ids",
         }
@@ -200,6 +218,75 @@ class TestGitHubClientFetchPRConversationComments:
         assert client.fetch_pr_conversation_comments(123) == []
 
 
+def _paging_gh_client(monkeypatch, pages, commands):
+    """Patch subprocess.run to return successive JSON pages, recording commands."""
+    results = iter(pages)
+
+    def run(cmd, **kwargs):
+        commands.append(cmd)
+        return _gh_result(stdout=json.dumps(next(results)))
+
+    monkeypatch.setattr("subprocess.run", run)
+    return GitHubClient()
+
+
+def _comment(comment_id, updated_at):
+    return {"id": comment_id, "updated_at": updated_at}
+
+
+@pytest.mark.unit
+class TestGitHubClientIncrementalFeedback:
+    """Fetching only feedback newer than a cursor."""
+
+    def test_review_comments_since_page_newest_first_and_stop_at_cursor(self, monkeypatch):
+        first_page = [_comment(i, f"2024-05-{31 - i // 10:02d}T00:00:00Z") for i in range(100)]
+        commands = []
+        client = _paging_gh_client(monkeypatch, [first_page, []], commands)
+
+        result = client.fetch_pr_comments(123, since="2024-05-30T00:00:00Z")
+
+        assert len(commands) == 1
+        assert "sort=updated" in commands[0][2] and "direction=desc" in commands[0][2]
+        assert [c["id"] for c in result] == list(reversed(range(20)))
+
+    def test_review_comments_keep_paging_until_cursor_passed(self, monkeypatch):
+        newer = [_comment(i, "2024-06-02T00:00:00Z") for i in range(100)]
+        commands = []
+        client = _paging_gh_client(
+            monkeypatch, [newer, [_comment(100, "2024-06-01T00:00:00Z")]], commands,
+        )
+
+        result = client.fetch_pr_comments(123, since="2024-06-01T00:00:00Z")
+
+        assert len(commands) == 2
+        assert "page=2" in commands[1][2]
+        assert len(result) == 101
+
+    def test_conversation_comments_pass_since_to_github(self, monkeypatch):
+        commands = []
+        client = _paging_gh_client(monkeypatch, [[_comment(1, "2024-06-01T00:00:00Z")]], commands)
+
+        result = client.fetch_pr_conversation_comments(123, since="2024-06-01T00:00:00Z")
+
+        assert "since=2024-06-01T00%3A00%3A00Z" in commands[0][2]
+        assert [c["id"] for c in result] == [1]
+
+    def test_reviews_resume_at_page_of_last_known_review(self, monkeypatch):
+        commands = []
+        client = _paging_gh_client(monkeypatch, [[{"id": 250}]], commands)
+
+        client.fetch_pr_reviews(123, known_count=250)
+
+        assert "page=3" in commands[0][2]
+
+    def test_failed_page_returns_nothing(self, monkeypatch):
+        full_page = [_comment(i, "2024-06-02T00:00:00Z") for i in range(100)]
+        responses = iter([_gh_result(stdout=json.dumps(full_page)), _gh_result(returncode=1)])
+        monkeypatch.setattr("subprocess.run", lambda cmd, **kwargs: next(responses))
+
+        assert GitHubClient().fetch_pr_comments(123, since="2024-06-01T00:00:00Z") == []
+
+
 @pytest.mark.unit
 class TestGitHubClientReplyToReviewComment:
     """Test GitHubClient.reply_to_review_comment()."""
@@ -268,13 +355,76 @@ class TestGitHubClientGetWorkflowFailureLogs:
     """Test GitHubClient.get_workflow_failure_logs()."""
 
     def test_returns_log_output(self, monkeypatch):
-        client = _gh_client(monkeypatch, stdout="Error: test failed at line 42")
+        client = _streaming_gh_client(monkeypatch, stdout="Error: test failed at line 42")
         assert client.get_workflow_failure_logs(111) == "Error: test failed at line 42"
 
     def test_returns_error_message_on_failure(self, monkeypatch):
-        client = _gh_client(monkeypatch, returncode=1, stderr="run not found")
+        client = _streaming_gh_client(monkeypatch, returncode=1, stderr="run not found")
         result = client.get_workflow_failure_logs(111)
         assert "Error fetching logs" in result
+        assert "run not found" in result
+
+    def test_strips_job_prefix_and_timestamps(self, monkeypatch):
+        log = "build\tRun tests\t2024-05-01T10:00:00.1234567Z \x1b[31mFAILED test_x\x1b[0m\n"
+        client = _streaming_gh_client(monkeypatch, stdout=log)
+        assert client.get_workflow_failure_logs(111) == "== build / Run tests ==\nFAILED test_x"
+
+    def test_large_log_reduced_to_error_excerpt(self, monkeypatch):
+        noise = [f"build\tRun tests\t2024-05-01T10:00:00Z noise {i}" for i in range(5000)]
+        noise.insert(10, "build\tRun tests\t2024-05-01T10:00:00Z src/app.ts:3:7 - error TS2322: bad type")
+        client = _streaming_gh_client(monkeypatch, stdout="\n".join(noise))
+
+        result = client.get_workflow_failure_logs(111)
+
+        assert "error TS2322" in result
+        assert len(result) < 5000
+
+
+@pytest.mark.unit
+class TestGitHubClientGetFailedJobs:
+    """Test GitHubClient.get_failed_jobs()."""
+
+    def test_returns_only_failed_jobs(self, monkeypatch):
+        jobs = {"jobs": [
+            {"databaseId": 1, "name": "lint", "conclusion": "success"},
+            {"databaseId": 2, "name": "test (3.12)", "conclusion": "failure"},
+        ]}
+        client = _gh_client(monkeypatch, stdout=json.dumps(jobs))
+        assert client.get_failed_jobs(111) == [{"databaseId": 2, "name": "test (3.12)"}]
+
+    def test_treats_timed_out_and_cancelled_jobs_as_failed(self, monkeypatch):
+        jobs = {"jobs": [
+            {"databaseId": 1, "name": "slow", "conclusion": "timed_out"},
+            {"databaseId": 2, "name": "stopped", "conclusion": "cancelled"},
+            {"databaseId": 3, "name": "skipped", "conclusion": "skipped"},
+        ]}
+        client = _gh_client(monkeypatch, stdout=json.dumps(jobs))
+        assert [job["databaseId"] for job in client.get_failed_jobs(111)] == [1, 2]
+
+    def test_returns_empty_on_error(self, monkeypatch):
+        client = _gh_client(monkeypatch, returncode=1)
+        assert client.get_failed_jobs(111) == []
+
+
+@pytest.mark.unit
+class TestGitHubClientGetJobFailureLogs:
+    """Test GitHubClient.get_job_failure_logs()."""
+
+    def test_streams_job_log(self, monkeypatch):
+        client = _streaming_gh_client(monkeypatch, stdout="test\tpytest\t2024-05-01T10:00:00Z FAILED x\n")
+        assert client.get_job_failure_logs(7) == "== test / pytest ==\nFAILED x"
+
+    def test_requests_single_job(self, monkeypatch):
+        commands = []
+        client = _streaming_gh_client(monkeypatch, commands=commands)
+
+        client.get_job_failure_logs(7)
+
+        assert commands == [["gh", "run", "view", "--job", "7", "--log-failed"]]
+
+    def test_returns_error_message_on_failure(self, monkeypatch):
+        client = _streaming_gh_client(monkeypatch, returncode=1, stderr="job not found")
+        assert "Error fetching logs: job not found" in client.get_job_failure_logs(7)
 
 
 @pytest.mark.unit
@@ -75,6 +75,13 @@ class TestIdeaProjectConstruction:
                 project.directory, "my-feature-wt-state.json"
             )
 
+    def test_triage_cache_dir_path(self):
+        """IdeaProject.triage_cache_dir should sit beside the state file."""
+        with TempIdeaProject("my-feature") as project:
+            assert project.triage_cache_dir == os.path.join(
+                project.directory, "my-feature-triage-cache"
+            )
+
 
 @pytest.mark.unit
 class TestIdeaProjectValidation:
@@ -0,0 +1,120 @@
+"""Tests for local_ci: running workflow run: steps locally before pushing."""
+
+import os
+import textwrap
+
+import pytest
+
+from i2code.implement.local_ci import LocalCiRunner, dependency_waves, load_local_ci_jobs
+
+
+def _write_workflow(repo, text, filename="ci.yml"):
+    workflows = repo / ".github" / "workflows"
+    workflows.mkdir(parents=True, exist_ok=True)
+    (workflows / filename).write_text(textwrap.dedent(text))
+
+
+_WORKFLOW = """\
+    name: CI
+    env:
+      GREETING: hello
+      TOKEN: ${{ secrets.TOKEN }}
+    jobs:
+      lint:
+        runs-on: ubuntu-latest
+        steps:
+          - uses: actions/checkout@v4
+          - name: Lint
+            run: echo "$GREETING lint" > lint.out
+      test:
+        name: Unit tests
+        needs: lint
+        runs-on: ubuntu-latest
+        steps:
+          - run: echo ${{ matrix.python }}
+          - name: Test
+            run: echo test > test.out
+            env:
+              MODE: fast
+      deploy:
+        runs-on: ubuntu-latest
+        steps:
+          - uses: actions/deploy@v1
+"""
+
+
+@pytest.mark.unit
+class TestLoadLocalCiJobs:
+
+    def test_keeps_only_runnable_steps(self, tmp_path):
+        _write_workflow(tmp_path, _WORKFLOW)
+
+        jobs = load_local_ci_jobs(str(tmp_path))
+
+        assert [job.job_id for job in jobs] == ["lint", "test"]
+        assert [step.name for step in jobs[1].steps] == ["Test"]
+        assert jobs[1].name == "Unit tests"
+        assert jobs[1].needs == ["lint"]
+
+    def test_keeps_literal_env_only(self, tmp_path):
+        _write_workflow(tmp_path, _WORKFLOW)
+
+        test_job = load_local_ci_jobs(str(tmp_path))[1]
+
+        assert test_job.env == {"GREETING": "hello"}
+        assert test_job.steps[0].env == {"MODE": "fast"}
+
+    def test_selects_jobs_by_id_or_name(self, tmp_path):
+        _write_workflow(tmp_path, _WORKFLOW)
+
+        assert [job.job_id for job in load_local_ci_jobs(str(tmp_path), ["Unit tests"])] == ["test"]
+        assert [job.job_id for job in load_local_ci_jobs(str(tmp_path), ["lint"])] == ["lint"]
+
+    def test_missing_workflows_dir_yields_no_jobs(self, tmp_path):
+        assert load_local_ci_jobs(str(tmp_path)) == []
+
+
+@pytest.mark.unit
+class TestDependencyWaves:
+
+    def test_independent_jobs_share_a_wave(self, tmp_path):
+        _write_workflow(tmp_path, _WORKFLOW.replace("needs: lint", "needs: []"))
+
+        waves = dependency_waves(load_local_ci_jobs(str(tmp_path)))
+
+        assert [[job.job_id for job in wave] for wave in waves] == [["lint", "test"]]
+
+    def test_needs_orders_waves(self, tmp_path):
+        _write_workflow(tmp_path, _WORKFLOW)
+
+        waves = dependency_waves(load_local_ci_jobs(str(tmp_path)))
+
+        assert [[job.job_id for job in wave] for wave in waves] == [["lint"], ["test"]]
+
+
+@pytest.mark.unit
+class TestLocalCiRunner:
+
+    def test_runs_steps_in_worktree(self, tmp_path):
+        _write_workflow(tmp_path, _WORKFLOW)
+
+        result = LocalCiRunner(str(tmp_path)).run()
+
+        assert result.passed
+        assert (tmp_path / "lint.out").read_text() == "hello lint\n"
+        assert os.path.exists(tmp_path / "test.out")
+
+    def test_failed_step_reported_with_log_and_dependents_skipped(self, tmp_path):
+        _write_workflow(tmp_path, _WORKFLOW.replace(
+            'echo "$GREETING lint" > lint.out', 'echo "E501 line too long"; exit 3',
+        ))
+
+        result = LocalCiRunner(str(tmp_path)).run()
+
+        assert not result.passed
+        assert [job.name for job in result.jobs] == ["lint"]
+        log = result.failed_job_logs["lint"]
+        assert "== lint / Lint ==" in log
+        assert "E501 line too long" in log
+        assert "exit code 3" in log
+        assert not (tmp_path / "test.out").exists()
@@ -1,11 +1,13 @@
+import asyncio
 import os
 import signal
 import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from i2code.implement.managed_subprocess import ManagedSubprocess
+from i2code.implement.managed_subprocess import AsyncManagedSubprocess, ManagedSubprocess
 
 
 @pytest.fixture
@@ -204,3 +206,113 @@ class TestSignalForwarding:
         managed.__exit__(KeyboardInterrupt, KeyboardInterrupt(), None)
 
         assert_handlers_restored(original_signal_handlers)
+
+
+async def _start(*argv):
+    return await asyncio.create_subprocess_exec(*argv, start_new_session=True)
+
+
+@pytest.mark.unit
+class TestAsyncManagedSubprocess:
+    """AsyncManagedSubprocess applies ManagedSubprocess's handling to every child on the loop."""
+
+    def test_restores_signal_handlers_on_exit(self, original_signal_handlers):
+        original_sigint = signal.getsignal(signal.SIGINT)
+
+        async def run():
+            async with AsyncManagedSubprocess(label="test"):
+                pass
+
+        asyncio.run(run())
+
+        assert_handlers_restored(original_signal_handlers)
+        assert signal.getsignal(signal.SIGINT) == original_sigint
+
+    @patch("i2code.implement.managed_subprocess.os.kill")
+    @patch("i2code.implement.managed_subprocess.os.killpg")
+    def test_sigtstp_forwards_to_every_child_group(self, mock_killpg, mock_kill):
+        async def run():
+            async with AsyncManagedSubprocess(label="test") as managed:
+                first, second = await _start("sleep", "0.2"), await _start("sleep", "0.2")
+                managed.add(first)
+                managed.add(second)
+                managed._handle_sigtstp()
+                await asyncio.gather(first.wait(), second.wait())
+                return first.pid, second.pid
+
+        first_pid, second_pid = asyncio.run(run())
+
+        assert mock_killpg.call_args_list == [
+            ((first_pid, signal.SIGTSTP),), ((second_pid, signal.SIGTSTP),),
+        ]
+        mock_kill.assert_called_once_with(os.getpid(), signal.SIGTSTP)
+
+    @patch("i2code.implement.managed_subprocess.os.killpg")
+    def test_sigcont_forwards_to_children_and_reinstalls_sigtstp(self, mock_killpg):
+        async def run():
+            loop = asyncio.get_running_loop()
+            async with AsyncManagedSubprocess(label="test") as managed:
+                process = await _start("sleep", "0.2")
+                managed.add(process)
+                loop.remove_signal_handler(signal.SIGTSTP)
+                managed._handle_sigcont()
+                reinstalled = signal.getsignal(signal.SIGTSTP) != signal.SIG_DFL
+                await process.wait()
+                return process.pid, reinstalled
+
+        pid, reinstalled = asyncio.run(run())
+
+        mock_killpg.assert_called_once_with(pid, signal.SIGCONT)
+        assert reinstalled
+
+    def test_sigint_terminates_children_without_raising(self, capsys):
+        async def run():
+            async with AsyncManagedSubprocess(label="claude") as managed:
+                process = await _start("sleep", "30")
+                managed.add(process)
+                os.kill(os.getpid(), signal.SIGINT)
+                await process.wait()
+            return managed, process
+
+        managed, process = asyncio.run(run())
+
+        assert managed.interrupted
+        assert process.returncode == -signal.SIGTERM
+        err = capsys.readouterr().err
+        assert "Interrupted. Terminating claude processes..." in err
+        assert "Done." in err
+
+    def test_sigkill_escalation(self, capsys):
+        ignore_sigterm = "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); print(flush=True); time.sleep(30)"
+
+        async def run():
+            async with AsyncManagedSubprocess(label="claude", terminate_timeout=0.5) as managed:
+                process = await asyncio.create_subprocess_exec(
+                    sys.executable, "-c", ignore_sigterm,
+                    stdout=subprocess.PIPE, start_new_session=True,
+                )
+                managed.add(process)
+                await process.stdout.readline()
+                managed._handle_sigint()
+                await process.wait()
+            return process
+
+        process = asyncio.run(run())
+
+        assert process.returncode == -signal.SIGKILL
+        err = capsys.readouterr().err
+        assert err.index("Force-killing claude processes...") < err.index("Done.")
+
+    def test_terminates_children_left_running_by_an_exception(self):
+        async def run(started):
+            async with AsyncManagedSubprocess(label="test", terminate_timeout=2) as managed:
+                process = await _start("sleep", "30")
+                managed.add(process)
+                started.append(process)
+                raise RuntimeError("boom")
+
+        started = []
+        with pytest.raises(RuntimeError):
+            asyncio.run(run(started))
+
+        assert started[0].returncode == -signal.SIGTERM
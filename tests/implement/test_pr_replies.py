@@ -0,0 +1,56 @@
+"""Tests for posting replies to PR feedback in bulk."""
+
+import pytest
+
+from i2code.implement.pr_replies import Reply, consolidated_body, post_replies
+
+from fake_github_client import FakeGitHubClient
+
+
+def _calls(fake, name):
+    return [c for c in fake.calls if c[0] == name]
+
+
+@pytest.mark.unit
+class TestPostReplies:
+
+    def test_thread_replies_are_posted_individually(self):
+        fake = FakeGitHubClient()
+
+        results = post_replies(fake, 42, [Reply(1, "Done", True), Reply(2, "Done too", True)])
+
+        assert results == [True, True]
+        bodies = sorted((c[2], c[3]) for c in _calls(fake, "reply_to_review_comment"))
+        assert bodies == [(1, "<!-- i2code -->\nDone"), (2, "<!-- i2code -->\nDone too")]
+
+    def test_general_replies_are_consolidated_into_one_comment(self):
+        fake = FakeGitHubClient()
+
+        results = post_replies(fake, 42, [Reply(10, "Fixed", False), Reply(11, "Fixed", False)])
+
+        assert results == [True, True]
+        (call,) = _calls(fake, "reply_to_pr_comment")
+        assert call[2] == "<!-- i2code -->\nRe: comment 10\n\nFixed\n\nRe: comment 11\n\nFixed"
+
+    def test_single_general_reply_keeps_per_comment_format(self):
+        assert consolidated_body([Reply(10, "Why?", False)]) == "<!-- i2code -->\nRe: comment 10\n\nWhy?"
+
+    def test_failures_are_reported_per_reply(self):
+        fake = FakeGitHubClient()
+        fake.set_failing_reply_ids([2])
+
+        results = post_replies(fake, 42, [Reply(1, "a", True), Reply(2, "b", True), Reply(10, "c", False)])
+
+        assert results == [True, False, True]
+
+    def test_failed_consolidated_comment_fails_each_general_reply(self):
+        fake = FakeGitHubClient()
+        fake.set_reply_results(False)
+
+        assert post_replies(fake, 42, [Reply(10, "a", False), Reply(11, "b", False)]) == [False, False]
+
+    def test_no_replies_posts_nothing(self):
+        fake = FakeGitHubClient()
+
+        assert post_replies(fake, 42, []) == []
+        assert fake.calls == []
@@ -0,0 +1,128 @@
+"""Tests for prompt size accounting and per-template budgets."""
+
+import pytest
+
+from i2code.implement.prompt_budget import (
+    TemplateBudget,
+    approx_tokens,
+    measure,
+    render_within_budget,
+    shrink_markdown_items,
+    shrink_middle,
+)
+
+
+def _feedback(*bodies):
+    return "## Review Comments\n" + "".join(
+        f"### Comment by u on a.py:1 (ID: {i})\n{body}\n" for i, body in enumerate(bodies, 1)
+    )
+
+
+@pytest.mark.unit
+class TestMeasure:
+
+    def test_counts_bytes_and_approximate_tokens(self):
+        size = measure("héllo world!")
+        assert size.bytes == 13
+        assert size.tokens == approx_tokens("héllo world!") == 3
+
+
+@pytest.mark.unit
+class TestShrinkMiddle:
+
+    def test_leaves_short_text_alone(self):
+        assert shrink_middle("short", 100) == "short"
+
+    def test_keeps_head_and_tail_lines(self):
+        text = "".join(f"line {i}\n" for i in range(100))
+        shrunk = shrink_middle(text, 200)
+
+        assert shrunk.startswith("line 0\n")
+        assert shrunk.endswith("line 99\n")
+        assert "lines omitted to fit the prompt budget" in shrunk
+        assert len(shrunk) < 300
+
+
+@pytest.mark.unit
+class TestShrinkMarkdownItems:
+
+    def test_keeps_every_heading(self):
+        text = _feedback("a" * 5000, "b" * 50, "c" * 5000)
+        shrunk = shrink_markdown_items(text, 1500)
+
+        for comment_id in (1, 2, 3):
+            assert f"(ID: {comment_id})" in shrunk
+        assert len(shrunk) < 1800
+
+    def test_cuts_only_the_longest_bodies(self):
+        shrunk = shrink_markdown_items(_feedback("a" * 5000, "short body"), 1000)
+
+        assert "short body" in shrunk
+        assert "chars omitted to fit the prompt budget" in shrunk
+        assert "a" * 5000 not in shrunk
+
+
+@pytest.mark.unit
+class TestRenderWithinBudget:
+
+    @staticmethod
+    def _render(**args):
+        return f"Header\n{args['first']}\n{args['second']}\n"
+
+    def test_within_budget_renders_unchanged(self):
+        result = render_within_budget(self._render, TemplateBudget(1000), {"first": "x", "second": "y"})
+
+        assert result.prompt == "Header\nx\ny\n"
+        assert result.truncated == []
+        assert result.sections["first"] == measure("x")
+
+    def test_shrinks_sections_in_priority_order_until_within_budget(self):
+        budget = TemplateBudget(1000, (("first", shrink_middle), ("second", shrink_middle)))
+        args = {"first": "f\n" * 3000, "second": "s\n" * 100}
+
+        result = render_within_budget(self._render, budget, args)
+
+        assert result.truncated == ["first"]
+        assert result.size.tokens <= 1000
+        assert "s\n" * 100 in result.prompt
+        assert result.sections["first"] == measure(args["first"])
+
+    def test_shrinks_every_text_of_a_mapping_section_evenly(self):
+        budget = TemplateBudget(1000, (("first", shrink_middle),))
+        args = {"first": {"a": "a\n" * 1500, "b": "b\n" * 1500, "c": "c\n" * 10}, "second": "y"}
+        render = lambda **args: "".join(args["first"].values()) + args["second"]  # noqa: E731
+
+        result = render_within_budget(render, budget, args)
+
+        assert result.truncated == ["first"]
+        assert result.size.tokens <= 1000
+        assert "c\n" * 10 in result.prompt
+        assert result.prompt.count("omitted to fit the prompt budget") == 2
+        assert result.sections["first[a]"] == measure(args["first"]["a"])
+
+    def test_reports_a_prompt_still_over_budget(self):
+        args = {"first": "f\n" * 3000, "second": "y"}
+
+        result = render_within_budget(self._render, TemplateBudget(1000), args)
+
+        assert result.prompt == self._render(**args)
+        assert result.over_budget
+        assert result.trace_attrs()["over_budget"] is True
+
+    def test_without_budget_measures_but_never_shrinks(self):
+        args = {"first": "f\n" * 3000, "second": "y"}
+
+        result = render_within_budget(self._render, None, args)
+
+        assert result.prompt == self._render(**args)
+        assert result.budget_tokens is None
+        assert result.truncated == []
+
+    def test_trace_attrs_report_sizes(self):
+        result = render_within_budget(self._render, TemplateBudget(1000), {"first": "x", "second": "y"})
+
+        attrs = result.trace_attrs()
+        assert attrs["bytes"] == len("Header\nx\ny\n")
+        assert attrs["budget_tokens"] == 1000
+        assert attrs["sections"]["first"] == {"bytes": 1, "tokens": 1}
+        assert attrs["truncated"] == []
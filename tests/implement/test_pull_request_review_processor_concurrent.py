@@ -0,0 +1,158 @@
+"""Tests for concurrent fix-group execution in PullRequestReviewProcessor.
+
+Independent fix groups are fixed in scratch worktrees, cherry-picked onto the
+branch in triage order, and covered by a single push and CI wait.
+"""
+
+import itertools
+import json
+import os
+
+import pytest
+
+from i2code.implement.claude_runner import CapturedOutput, ClaudeResult, ClaudeRunner
+
+from fake_claude_runner import FakeClaudeRunner
+from pull_request_review_processor_helpers import make_processor
+
+
+COMMENTS = [
+    {"id": 1, "body": "fix a", "path": "a.py", "user": {"login": "u"}},
+    {"id": 2, "body": "fix b", "path": "b.py", "user": {"login": "u"}},
+    {"id": 3, "body": "fix a again", "path": "a.py", "user": {"login": "u"}},
+]
+
+
+class CommittingClaudeRunner(FakeClaudeRunner):
+    """Returns the triage first, then 'commits' in whichever repo a fix runs in."""
+
+    def __init__(self, triage, repos_by_dir):
+        super().__init__()
+        self._triage = triage
+        self._repos_by_dir = repos_by_dir
+
+    def execute(self, command, on_message=None):
+        self.calls.append(("execute", command, command.cwd))
+        if len(self.calls) == 1:
+            return ClaudeResult(returncode=0, output=CapturedOutput(self._triage), result_text=self._triage)
+        repo = self._repos_by_dir()[command.cwd]
+        repo.set_head_sha(f"{repo.head_sha}@{os.path.basename(command.cwd)}")
+        return ClaudeResult(returncode=0)
+
+
+@pytest.fixture(autouse=True)
+def scratch_dirs(monkeypatch, tmp_path):
+    """Hand out predictable scratch worktree paths: scratch-0, scratch-1, ..."""
+    counter = itertools.count()
+    monkeypatch.setattr(
+        "i2code.implement.pull_request_review_processor.tempfile.mkdtemp",
+        lambda prefix: str(tmp_path / f"scratch-{next(counter)}"),
+    )
+
+
+def _run(groups, conflicts=(), **overrides):
+    triage = json.dumps({
+        "will_fix": [{"comment_ids": ids, "description": f"fix {ids}"} for ids in groups],
+        "needs_clarification": [],
+    })
+    processor, fake_gh, fake_repo, _, _ = make_processor(
+        comments=COMMENTS, reviews=[], conversation_comments=[], skip_ci_wait=False, **overrides,
+    )
+    fake_repo.set_head_sha("base")
+    for to_sha in conflicts:
+        fake_repo.set_cherry_pick_conflict(to_sha)
+
+    def repos_by_dir():
+        repos = [fake_repo] + fake_repo.scratch_worktrees
+        return {repo.working_tree_dir: repo for repo in repos}
+
+    claude = CommittingClaudeRunner(triage, repos_by_dir)
+    processor._claude_runner = claude
+    result = processor.process_pr_feedback()
+    return result, fake_gh, fake_repo, claude
+
+
+def _calls(fake, name):
+    return [c for c in fake.calls if c[0] == name]
+
+
+@pytest.mark.unit
+class TestConcurrentFixGroups:
+
+    def test_independent_groups_fix_in_scratch_worktrees(self):
+        _, _, fake_repo, claude = _run([[1], [2]])
+
+        fix_dirs = {call[2] for call in claude.calls[1:]}
+        assert fix_dirs == {scratch.working_tree_dir for scratch in fake_repo.scratch_worktrees}
+        assert len(fix_dirs) == 2
+
+    def test_fixes_cherry_pick_in_triage_order(self):
+        _, _, fake_repo, _ = _run([[1], [2]])
+
+        picks = _calls(fake_repo, "cherry_pick")
+        assert [p[2] for p in picks] == [s.head_sha for s in fake_repo.scratch_worktrees]
+        assert all(p[1] == "base" for p in picks)
+
+    def test_scratch_worktrees_are_removed(self):
+        _, _, fake_repo, _ = _run([[1], [2]])
+
+        assert len(_calls(fake_repo, "remove_worktree")) == 2
+
+    def test_one_push_and_one_ci_wait_cover_all_groups(self):
+        result, fake_gh, fake_repo, _ = _run([[1], [2], [3]])
+
+        assert result == (True, True)
+        assert len(_calls(fake_repo, "push")) == 1
+        assert len(_calls(fake_gh, "wait_for_workflow_completion")) == 1
+        assert len(_calls(fake_gh, "reply_to_review_comment")) == 3
+
+    def test_group_on_shared_file_is_fixed_on_branch_afterwards(self):
+        _, _, fake_repo, claude = _run([[1], [2], [3]])
+
+        assert claude.calls[-1][2] == fake_repo.working_tree_dir
+
+    def test_conflicting_cherry_pick_is_redone_on_branch(self):
+        result, _, fake_repo, claude = _run([[1], [2]], conflicts=["base@scratch-1"])
+
+        assert result == (True, True)
+        assert [p[2] for p in _calls(fake_repo, "cherry_pick")] == ["base@scratch-0", "base@scratch-1"]
+        assert claude.calls[-1][2] == fake_repo.working_tree_dir
+        assert len(claude.calls) == 4
+
+    def test_interactive_mode_fixes_serially_on_branch(self):
+        _, _, fake_repo, claude = _run([[1], [2]], non_interactive=False)
+
+        assert fake_repo.scratch_worktrees == []
+        assert {call[2] for call in claude.calls} == {fake_repo.working_tree_dir}
+
+
+_MOCK_CLAUDE = """#!/bin/sh
+case "$1" in
+  triage-*) echo '{"will_fix": [{"comment_ids": [1], "description": "a"}, {"comment_ids": [2], "description": "b"}], "needs_clarification": []}' ;;
+  fix-*) echo done > "fixed-by-$1" ;;
+esac
+"""
+
+
+@pytest.mark.unit
+class TestConcurrentFixGroupsWithRealRunner:
+
+    def test_fixes_run_as_supervised_processes_in_each_scratch_worktree(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        mock_claude = tmp_path / "mock-claude"
+        mock_claude.write_text(_MOCK_CLAUDE)
+        mock_claude.chmod(0o755)
+        worktree = tmp_path / "worktree"
+        for directory in (worktree, tmp_path / "scratch-0", tmp_path / "scratch-1"):
+            directory.mkdir()
+        processor, _, fake_repo, _, _ = make_processor(
+            comments=COMMENTS[:2], reviews=[], conversation_comments=[],
+            working_tree_dir=str(worktree), mock_claude=str(mock_claude),
+        )
+        processor._claude_runner = ClaudeRunner(interactive=False)
+
+        processor.process_pr_feedback()
+
+        assert (tmp_path / "scratch-0" / "fixed-by-fix-42-1").exists()
+        assert (tmp_path / "scratch-1" / "fixed-by-fix-42-2").exists()
+        assert len(_calls(fake_repo, "remove_worktree")) == 2
@@ -0,0 +1,72 @@
+"""Tests for incremental feedback fetching in PullRequestReviewProcessor.
+
+Feedback older than the state's high-water marks is not fetched again, and
+the marks advance once everything fetched has been handled.
+"""
+
+import pytest
+
+from pull_request_review_processor_helpers import make_processor
+
+
+OLD = "2024-05-01T00:00:00Z"
+MARK = "2024-05-02T00:00:00Z"
+NEW = "2024-05-03T00:00:00Z"
+
+
+def _comment(comment_id, updated_at, body="please fix"):
+    return {"id": comment_id, "body": body, "user": {"login": "u"}, "updated_at": updated_at}
+
+
+@pytest.mark.unit
+class TestFeedbackCursors:
+
+    def test_skips_comments_older_than_high_water_mark(self):
+        processor, _, _, fake_state, _ = make_processor(
+            comments=[_comment(1, OLD), _comment(2, NEW)],
+            reviews=[],
+            conversation_comments=[_comment(10, OLD), _comment(11, NEW)],
+        )
+        fake_state.mark_comments_processed([], MARK)
+        fake_state.mark_conversations_processed([], MARK)
+
+        review_comments, _, conversation = processor._fetch_unprocessed_feedback(42)
+
+        assert [c["id"] for c in review_comments] == [2]
+        assert [c["id"] for c in conversation] == [11]
+
+    def test_new_review_refetches_all_review_comments(self):
+        """A comment drafted in a pending review can predate the mark."""
+        processor, _, _, fake_state, _ = make_processor(
+            comments=[_comment(1, OLD)],
+            reviews=[{"id": 100, "state": "COMMENTED", "submitted_at": NEW}],
+            conversation_comments=[],
+        )
+        fake_state.mark_comments_processed([], MARK)
+
+        review_comments, reviews, _ = processor._fetch_unprocessed_feedback(42)
+
+        assert [c["id"] for c in review_comments] == [1]
+        assert [r["id"] for r in reviews] == [100]
+
+    def test_only_self_comments_advance_high_water_mark(self):
+        processor, _, _, fake_state, _ = make_processor(
+            comments=[_comment(1, NEW, body="<!-- i2code -->\nDone")],
+            reviews=[],
+            conversation_comments=[_comment(10, NEW, body="<!-- i2code -->\nDone")],
+        )
+
+        processor._fetch_unprocessed_feedback(42)
+
+        assert fake_state.high_water_marks == {"comment": NEW, "conversation": NEW}
+
+    def test_pending_user_feedback_does_not_advance_high_water_mark(self):
+        processor, _, _, fake_state, _ = make_processor(
+            comments=[_comment(1, NEW)],
+            reviews=[],
+            conversation_comments=[],
+        )
+
+        processor._fetch_unprocessed_feedback(42)
+
+        assert "comment" not in fake_state.high_water_marks
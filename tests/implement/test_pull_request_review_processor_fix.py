@@ -126,3 +126,20 @@ class TestProcessPrFeedbackFixGroup:
         assert 1 in fake_state.processed_comment_ids
         assert 10 in fake_state.processed_review_ids
         assert 20 in fake_state.processed_conversation_ids
+
+    def test_fix_records_latest_feedback_timestamps(self):
+        """The newest timestamp of each processed kind becomes its high-water mark."""
+        processor, _, fake_state, _ = _make_fix_processor(
+            comments=[
+                {"id": 1, "body": "fix this", "user": {"login": "u"}, "updated_at": "2024-05-02T09:00:00Z"},
+                {"id": 2, "body": "and this", "user": {"login": "u"}, "updated_at": "2024-05-03T09:00:00Z"},
+            ],
+            triage_json=_triage_with_fix([1, 2]),
+            reviews=[{"id": 10, "body": "looks bad", "state": "CHANGES_REQUESTED", "user": {"login": "u"},
+                      "submitted_at": "2024-05-01T09:00:00Z"}],
+        )
+        processor.process_pr_feedback()
+        assert fake_state.high_water_marks == {
+            "comment": "2024-05-03T09:00:00Z",
+            "review": "2024-05-01T09:00:00Z",
+        }
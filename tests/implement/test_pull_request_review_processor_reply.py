@@ -6,6 +6,8 @@ the PR) and reply-with-clarifications (questions sent back to the reviewer).
 
 import pytest
 
+from i2code.implement.feedback_index import FeedbackIndex
+
 from pull_request_review_processor_helpers import make_processor
 
 
@@ -31,7 +33,7 @@ def _push_and_reply_body(comment_id, review_comments, conversation_comments):
     """Call _push_and_reply and return the reply body posted to the matching call."""
     processor, fake_gh, fake_repo, _, _ = make_processor()
     fake_repo.set_head_sha("aaa111")
-    processor._push_and_reply("abc12345", [comment_id], review_comments, conversation_comments)
+    processor._push_and_reply([("abc12345", [comment_id])], FeedbackIndex(review_comments, [], conversation_comments))
     call_name = "reply_to_review_comment" if review_comments else "reply_to_pr_comment"
     return _get_reply_body(fake_gh, call_name)
 
@@ -41,7 +43,7 @@ def _clarification_reply_body(comment_id, question, review_comments, conversatio
     processor, fake_gh, _, _, _ = make_processor()
     processor._reply_with_clarifications(
         [{"comment_id": comment_id, "question": question}],
-        42, review_comments, conversation_comments,
+        42, FeedbackIndex(review_comments, [], conversation_comments),
     )
     call_name = "reply_to_review_comment" if review_comments else "reply_to_pr_comment"
     return _get_reply_body(fake_gh, call_name)
@@ -71,3 +73,28 @@ class TestReplyWithClarificationsMarker:
     def test_conversation_comment_clarification_starts_with_marker(self):
         body = _clarification_reply_body(200, "Can you explain further?", [], [{"id": 200, "body": "Why this approach?"}])
         _assert_marker_prefixed(body, "Re: comment 200", "Can you explain further?")
+
+
+@pytest.mark.unit
+class TestBulkReplies:
+    """Replies for a whole batch of fixes go out together."""
+
+    def test_general_comments_get_one_consolidated_reply(self):
+        processor, fake_gh, _, _, _ = make_processor()
+        conversation = [{"id": 200, "body": "a"}, {"id": 201, "body": "b"}]
+
+        processor._push_and_reply([("abc12345", [200, 201])], FeedbackIndex([], [], conversation))
+
+        body = _get_reply_body(fake_gh, "reply_to_pr_comment")
+        _assert_marker_prefixed(body, "Re: comment 200", "Re: comment 201", "Fixed in abc12345")
+
+    def test_failed_reply_is_reported_for_that_comment_only(self, capsys):
+        processor, fake_gh, _, _, _ = make_processor()
+        fake_gh.set_failing_reply_ids([101])
+        review_comments = [{"id": 100, "body": "a"}, {"id": 101, "body": "b"}]
+
+        processor._push_and_reply([("abc12345", [100, 101])], FeedbackIndex(review_comments, [], []))
+
+        out = capsys.readouterr().out
+        assert "Replied to comment 100" in out
+        assert "Warning: Failed to reply to comment 101" in out
@@ -17,6 +17,7 @@ from i2code.implement.claude_runner import (
     _parse_stream_json_output,
 )
 from i2code.implement.command_builder import CommandBuilder
+from i2code.implement.triage_cache import TriageCache
 
 from fake_git_repository import FakeGitRepository
 from fake_github_client import FakeGitHubClient
@@ -129,6 +130,59 @@ class TestProcessPrFeedbackTriage:
         assert not hasattr(PullRequestReviewProcessor, "_extract_result_text")
 
 
+
+@pytest.mark.unit
+class TestTriageCaching:
+    """A triage result is reused when the same feedback is triaged again."""
+
+    FEEDBACK = "Review comment 1: fix this"
+
+    @staticmethod
+    def _triage_result(triage):
+        text = json.dumps(triage)
+        return ClaudeResult(returncode=0, output=CapturedOutput(text), result_text=text)
+
+    def test_cache_hit_skips_claude(self, tmp_path):
+        triage = {"will_fix": [], "needs_clarification": [{"comment_id": 1, "question": "?"}]}
+        cache = TriageCache(tmp_path)
+        cache.put(self.FEEDBACK, triage)
+        processor, _, _, _, fake_claude = make_processor(triage_cache=cache)
+
+        assert processor._triage_feedback(self.FEEDBACK, 42) == triage
+        assert fake_claude.calls == []
+
+    def test_cache_miss_runs_claude_and_stores_result(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("pathlib.Path.home", classmethod(lambda cls: tmp_path))
+        triage = {"will_fix": [], "needs_clarification": []}
+        cache = TriageCache(tmp_path / "cache")
+        processor, _, _, _, fake_claude = make_processor(triage_cache=cache)
+        fake_claude.set_result(self._triage_result(triage))
+
+        assert processor._triage_feedback(self.FEEDBACK, 42) == triage
+        assert len(fake_claude.calls) == 1
+        assert cache.get(self.FEEDBACK) == triage
+
+    def test_unparseable_triage_is_not_cached(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("pathlib.Path.home", classmethod(lambda cls: tmp_path))
+        cache = TriageCache(tmp_path / "cache")
+        processor, _, _, _, fake_claude = make_processor(triage_cache=cache)
+        fake_claude.set_result(ClaudeResult(
+            returncode=0, output=CapturedOutput("not json"), result_text="not json",
+        ))
+
+        assert processor._triage_feedback(self.FEEDBACK, 42) is None
+        assert cache.get(self.FEEDBACK) is None
+
+    def test_mock_claude_bypasses_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("pathlib.Path.home", classmethod(lambda cls: tmp_path))
+        cache = TriageCache(tmp_path / "cache")
+        cache.put(self.FEEDBACK, {"will_fix": [], "needs_clarification": []})
+        processor, _, _, _, fake_claude = make_processor(triage_cache=cache, mock_claude="/mock")
+        fake_claude.set_result(self._triage_result({"will_fix": [], "needs_clarification": []}))
+
+        processor._triage_feedback(self.FEEDBACK, 42)
+        assert len(fake_claude.calls) == 1
+
 @pytest.mark.unit
 class TestParseTriageResult:
     """Test parsing JSON triage result from Claude."""
@@ -218,20 +272,37 @@ class TestTriageFeedbackLogging:
         result = processor._triage_feedback(feedback_content, PR6_NUMBER)
         assert result is None
 
-        log_file = home_dir / ".hitl" / worktree_name / "logs" / "log.log"
+        log_dir = home_dir / ".hitl" / worktree_name / "logs"
+        log_file = log_dir / "triage.jsonl"
         assert log_file.exists(), f"Expected log file at {log_file}"
 
-        log_content = log_file.read_text()
-        assert "--- prompt ---" in log_content
-        assert "--- claude response ---" in log_content
-        assert "not json at all" in log_content
+        [entry] = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert entry["event"] == "triage"
+        assert entry["pr"] == PR6_NUMBER
+        assert entry["response"] == "not json at all"
 
+        prompt = (log_dir / "prompts" / f"{entry['prompt']}.txt").read_text()
         for comment in review_comments:
             body = comment.get("body", "").strip()
             if body:
-                assert body in log_content, f"Expected review comment body in log: {body[:60]}..."
+                assert body in prompt, f"Expected review comment body in logged prompt: {body[:60]}..."
                 break
 
+    def test_repeated_prompt_is_stored_once(self, pr6_feedback, home_dir):
+        processor, worktree_name = self._make_triage_processor("not json at all")
+        feedback_content = PullRequestReviewProcessor._format_all_feedback(
+            pr6_feedback["review_comments"], pr6_feedback["reviews"], pr6_feedback["conversation_comments"],
+        )
+
+        processor._triage_feedback(feedback_content, PR6_NUMBER)
+        processor._triage_feedback(feedback_content, PR6_NUMBER)
+
+        log_dir = home_dir / ".hitl" / worktree_name / "logs"
+        entries = [json.loads(line) for line in (log_dir / "triage.jsonl").read_text().splitlines()]
+        assert len(entries) == 2
+        assert entries[0]["prompt"] == entries[1]["prompt"]
+        assert len(list((log_dir / "prompts").iterdir())) == 1
+
     def test_parses_real_claude_triage_response(self, pr6_feedback, home_dir):
         with open(PR6_TRIAGE_STDOUT_FILE) as f:
             triage_stdout = f.read()
@@ -317,7 +317,7 @@ class TestTaskDetectionAndExecution:
 
         state_file = os.path.join(self.repo.idea_dir, f"{self.repo.idea_name}-wt-state.json")
         state = WorkflowState.load(state_file)
-        assert state.processed_comment_ids == [], \
+        assert state.processed_comment_ids == set(), \
             "New state should have empty processed_comment_ids"
 
         original_cwd = os.getcwd()
@@ -0,0 +1,76 @@
+"""Tests for ThreadSessions: one resumable Claude session per steel thread."""
+
+import pytest
+
+from i2code.implement.claude_runner import CapturedOutput, ClaudeResult, SessionId
+from i2code.implement.thread_sessions import ThreadSessions
+
+from fake_workflow_state import FakeWorkflowState
+
+
+def _ok(stdout=""):
+    return ClaudeResult(returncode=0, output=CapturedOutput(stdout))
+
+
+def _run(sessions, thread, result=None):
+    session = sessions.session_for(thread)
+    sessions.record_run(thread, session, result or _ok())
+    return session
+
+
+@pytest.mark.unit
+class TestThreadSessions:
+
+    def test_first_task_of_thread_starts_new_session(self):
+        session = ThreadSessions(FakeWorkflowState()).session_for(1)
+        assert session.is_new
+
+    def test_same_new_session_until_a_run_is_recorded(self):
+        sessions = ThreadSessions(FakeWorkflowState())
+        assert sessions.session_for(1) == sessions.session_for(1)
+
+    def test_next_task_in_thread_resumes_session(self):
+        sessions = ThreadSessions(FakeWorkflowState())
+        first = _run(sessions, 1)
+        assert sessions.session_for(1) == SessionId(first.session_id, is_new=False)
+
+    def test_new_thread_starts_new_session_and_forgets_previous(self):
+        state = FakeWorkflowState()
+        sessions = ThreadSessions(state)
+        first = _run(sessions, 1)
+        second = _run(sessions, 2)
+
+        assert second.is_new and second.session_id != first.session_id
+        assert list(state.thread_sessions) == ["2"]
+
+    def test_persists_mapping_in_workflow_state(self):
+        state = FakeWorkflowState()
+        session = _run(ThreadSessions(state), 1, _ok("output"))
+
+        assert state.saved
+        assert state.thread_sessions == {
+            "1": {"session_id": session.session_id, "turns": 1, "output_bytes": 6},
+        }
+        assert ThreadSessions(state).session_for(1) == SessionId(session.session_id, is_new=False)
+
+    def test_rolls_over_after_turn_budget(self):
+        sessions = ThreadSessions(FakeWorkflowState(), max_turns=2)
+        first = _run(sessions, 1)
+        _run(sessions, 1)
+        assert sessions.session_for(1).session_id != first.session_id
+
+    def test_rolls_over_after_output_budget(self):
+        sessions = ThreadSessions(FakeWorkflowState(), max_output_bytes=10)
+        first = _run(sessions, 1, _ok("x" * 10))
+        rolled = sessions.session_for(1)
+        assert rolled.is_new and rolled.session_id != first.session_id
+
+    def test_failed_run_drops_session(self):
+        state = FakeWorkflowState()
+        sessions = ThreadSessions(state)
+        first = _run(sessions, 1)
+        _run(sessions, 1, ClaudeResult(returncode=1))
+
+        assert state.thread_sessions == {}
+        retry = sessions.session_for(1)
+        assert retry.is_new and retry.session_id != first.session_id
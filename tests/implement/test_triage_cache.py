@@ -0,0 +1,41 @@
+"""Tests for the content-addressed triage cache."""
+
+import pytest
+
+from i2code.implement import triage_cache
+from i2code.implement.triage_cache import TriageCache
+
+TRIAGE = {"will_fix": [{"comment_ids": [1], "description": "Fix it"}], "needs_clarification": []}
+
+
+@pytest.mark.unit
+class TestTriageCache:
+
+    def test_miss_returns_none(self, tmp_path):
+        assert TriageCache(tmp_path / "cache").get("feedback") is None
+
+    def test_returns_triage_stored_for_same_feedback(self, tmp_path):
+        TriageCache(tmp_path).put("feedback", TRIAGE)
+        assert TriageCache(tmp_path).get("feedback") == TRIAGE
+
+    def test_different_feedback_misses(self, tmp_path):
+        cache = TriageCache(tmp_path)
+        cache.put("feedback", TRIAGE)
+        assert cache.get("other feedback") is None
+
+    def test_key_includes_triage_template_version(self, tmp_path, monkeypatch):
+        TriageCache(tmp_path).put("feedback", TRIAGE)
+        monkeypatch.setattr(triage_cache, "template_version", lambda name, package: "edited")
+        assert TriageCache(tmp_path).get("feedback") is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = TriageCache(tmp_path)
+        (tmp_path / f"{cache.key('feedback')}.json").write_text("{not json")
+        assert cache.get("feedback") is None
+
+    def test_keeps_only_max_entries(self, tmp_path):
+        cache = TriageCache(tmp_path, max_entries=2)
+        for i in range(4):
+            cache.put(f"feedback {i}", TRIAGE)
+        assert len(list(tmp_path.glob("*.json"))) == 2
+        assert cache.get("feedback 3") == TRIAGE
@@ -0,0 +1,137 @@
+"""Tests for the rotating, structured triage log."""
+
+import gc
+import gzip
+import json
+import os
+import time
+import weakref
+
+import pytest
+
+from i2code.implement.triage_log import TriageLog, _close_open_logs, default_log_dir, prompt_hash
+
+
+def _entries(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.mark.unit
+class TestTriageLogEntries:
+
+    def test_writes_one_json_line_per_entry(self, tmp_path):
+        log = TriageLog(tmp_path)
+        log.log("triage", pr=6, response="ok")
+        log.log("triage", pr=7, response="again")
+        log.close()
+
+        entries = _entries(tmp_path / "triage.jsonl")
+        assert [e["pr"] for e in entries] == [6, 7]
+        assert all(e["event"] == "triage" and "ts" in e for e in entries)
+
+    def test_buffers_entries_until_flush(self, tmp_path):
+        log = TriageLog(tmp_path)
+        log.log("triage", response="x")
+        assert (tmp_path / "triage.jsonl").read_text() == ""
+
+        log.flush()
+        assert len(_entries(tmp_path / "triage.jsonl")) == 1
+        log.close()
+
+    def test_stores_prompt_once_by_content_hash(self, tmp_path):
+        log = TriageLog(tmp_path)
+        log.log("triage", prompt="the prompt")
+        log.log("triage", prompt="the prompt")
+        log.close()
+
+        entries = _entries(tmp_path / "triage.jsonl")
+        assert {e["prompt"] for e in entries} == {prompt_hash("the prompt")}
+        assert os.listdir(tmp_path / "prompts") == [f"{prompt_hash('the prompt')}.txt"]
+        assert log.read_prompt(entries[0]["prompt"]) == "the prompt"
+
+    def test_appends_to_existing_log(self, tmp_path):
+        first = TriageLog(tmp_path)
+        first.log("triage", pr=1)
+        first.close()
+        second = TriageLog(tmp_path)
+        second.log("triage", pr=2)
+        second.close()
+
+        assert [e["pr"] for e in _entries(tmp_path / "triage.jsonl")] == [1, 2]
+
+    def test_open_logs_are_flushed_at_exit(self, tmp_path):
+        log = TriageLog(tmp_path)
+        log.log("triage", pr=6)
+
+        _close_open_logs()
+
+        assert [e["pr"] for e in _entries(tmp_path / "triage.jsonl")] == [6]
+
+    def test_exit_handling_does_not_keep_logs_alive(self, tmp_path):
+        log = TriageLog(tmp_path)
+        ref = weakref.ref(log)
+        del log
+        gc.collect()
+
+        assert ref() is None
+
+    def test_default_log_dir_is_per_worktree_under_home(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("pathlib.Path.home", classmethod(lambda cls: tmp_path))
+        assert default_log_dir("/work/repo-wt-x") == tmp_path / ".hitl" / "repo-wt-x" / "logs"
+
+
+@pytest.mark.unit
+class TestTriageLogRotation:
+
+    def test_rotates_and_gzips_when_size_exceeded(self, tmp_path):
+        log = TriageLog(tmp_path, max_bytes=200)
+        log.log("triage", response="a" * 150)
+        log.log("triage", response="b" * 150)
+        log.close()
+
+        [segment] = list(tmp_path.glob("triage-*.jsonl.gz"))
+        with gzip.open(segment, "rt") as f:
+            assert json.loads(f.read())["response"] == "a" * 150
+        assert _entries(tmp_path / "triage.jsonl")[0]["response"] == "b" * 150
+
+    def test_rotated_segments_stay_plain_without_compression(self, tmp_path):
+        log = TriageLog(tmp_path, max_bytes=200, compress=False)
+        log.log("triage", response="a" * 150)
+        log.log("triage", response="b" * 150)
+        log.close()
+
+        assert len(list(tmp_path.glob("triage-*.jsonl"))) == 1
+        assert not list(tmp_path.glob("*.gz"))
+
+    def test_rotates_when_max_age_exceeded(self, tmp_path, monkeypatch):
+        log = TriageLog(tmp_path, max_age_seconds=60)
+        log.log("triage", pr=1)
+        real_time = time.time
+        monkeypatch.setattr("i2code.implement.triage_log.time.time", lambda: real_time() + 120)
+        log.log("triage", pr=2)
+        log.close()
+
+        assert len(list(tmp_path.glob("triage-*.jsonl.gz"))) == 1
+        assert [e["pr"] for e in _entries(tmp_path / "triage.jsonl")] == [2]
+
+    def test_keeps_only_backup_count_segments(self, tmp_path, monkeypatch):
+        clock = [time.time()]
+        monkeypatch.setattr("i2code.implement.triage_log.time.time", lambda: clock[0])
+        log = TriageLog(tmp_path, max_age_seconds=1, backup_count=2)
+        for pr in range(5):
+            log.log("triage", pr=pr)
+            clock[0] += 2
+        log.close()
+
+        assert len(list(tmp_path.glob("triage-*.jsonl.gz"))) == 2
+
+    def test_prunes_prompts_only_referenced_by_deleted_segments(self, tmp_path):
+        log = TriageLog(tmp_path, max_bytes=100, backup_count=0)
+        log.log("triage", prompt="old prompt", response="a" * 80)
+        stale = tmp_path / "prompts" / f"{prompt_hash('old prompt')}.txt"
+        os.utime(stale, (0, 0))
+        log.log("triage", prompt="new prompt", response="b" * 80)
+        log.close()
+
+        assert not stale.exists()
+        assert log.read_prompt(prompt_hash("new prompt")) == "new prompt"
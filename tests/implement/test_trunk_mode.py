@@ -6,16 +6,18 @@ from contextlib import contextmanager
 
 import pytest
 
-from i2code.implement.claude_runner import CapturedOutput, ClaudeCodeCommand, ClaudeResult
+from i2code.implement.claude_runner import CapturedOutput, ClaudeCodeCommand, ClaudeResult, SessionId
 from i2code.implement.commit_recovery import TaskCommitRecovery
 from i2code.implement.idea_project import IdeaProject
 from i2code.implement.implement_opts import ImplementOpts
+from i2code.implement.thread_sessions import ThreadSessions
 from i2code.implement.trunk_mode import TrunkMode
 from i2code.implement.workspace import Workspace
 
 from conftest import write_plan_file, mark_task_complete, advance_head, combined
 from fake_claude_runner import FakeClaudeRunner
 from fake_git_repository import FakeGitRepository
+from fake_workflow_state import FakeWorkflowState
 
 
 def _opts(**kwargs):
@@ -29,7 +31,7 @@ def _noop_commit_recovery(project, fake_runner):
     return TaskCommitRecovery(git_repo=FakeGitRepository(), project=project, claude_runner=fake_runner)
 
 
-def _make_trunk_mode(task_specs, opts_overrides=None):
+def _make_trunk_mode(task_specs, opts_overrides=None, sessions=None):
     """Create a TrunkMode test environment.
 
     Returns (mode, project, fake_repo, fake_runner, plan_path).
@@ -49,6 +51,7 @@ def _make_trunk_mode(task_specs, opts_overrides=None):
         workspace=Workspace(fake_repo, project),
         claude_runner=fake_runner,
         commit_recovery=_noop_commit_recovery(project, fake_runner),
+        sessions=sessions,
     )
     return mode, project, fake_repo, fake_runner, plan_path
 
@@ -170,6 +173,52 @@ class TestTrunkModeExecute:
         assert cmd.mock_command[0] == "/path/to/mock-script"
 
 
+
+@pytest.mark.unit
+class TestTrunkModeThreadSessions:
+    """With ThreadSessions, consecutive tasks of a thread share a Claude session."""
+
+    TASKS = [(1, 1, "Task 1", False), (1, 2, "Task 2", False), (2, 1, "Task 3", False)]
+
+    def _completing(self, fake_repo, plan_path):
+        return [
+            combined(advance_head(fake_repo, sha), mark_task_complete(plan_path, thread, task, title))
+            for sha, (thread, task, title, _) in zip(["b", "c", "d"], self.TASKS)
+        ]
+
+    def test_resumes_session_within_thread_and_starts_new_one_per_thread(self, capsys):
+        state = FakeWorkflowState()
+        mode, _, fake_repo, fake_runner, plan_path = _make_trunk_mode(
+            self.TASKS, sessions=ThreadSessions(state),
+        )
+        fake_runner.set_side_effects(self._completing(fake_repo, plan_path))
+        mode.execute()
+
+        first, second, third = (cmd.session_id for _, cmd, _ in fake_runner.calls)
+        assert first.is_new
+        assert second == SessionId(first.session_id, is_new=False)
+        assert third.is_new and third.session_id != first.session_id
+        assert state.thread_sessions == {
+            "2": {"session_id": third.session_id, "turns": 1, "output_bytes": 0},
+        }
+
+    def test_rolls_over_after_turn_budget(self, capsys):
+        mode, _, fake_repo, fake_runner, plan_path = _make_trunk_mode(
+            self.TASKS[:2], sessions=ThreadSessions(FakeWorkflowState(), max_turns=1),
+        )
+        fake_runner.set_side_effects(self._completing(fake_repo, plan_path)[:2])
+        mode.execute()
+
+        first, second = (cmd.session_id for _, cmd, _ in fake_runner.calls)
+        assert second.is_new and second.session_id != first.session_id
+
+    def test_without_sessions_commands_have_no_session(self, capsys):
+        mode, _, fake_repo, fake_runner, plan_path = _make_trunk_mode(self.TASKS[:1])
+        fake_runner.set_side_effects(self._completing(fake_repo, plan_path)[:1])
+        mode.execute()
+
+        assert fake_runner.calls[0][1].session_id is None
+
 PLAN_WITH_INCOMPLETE_TASK = """\
 # Implementation Plan: Test Feature
 
@@ -28,9 +28,9 @@ class TestWorkflowStateDefaultState:
 
             state = WorkflowState.load(state_file)
 
-            assert state.processed_comment_ids == []
-            assert state.processed_review_ids == []
-            assert state.processed_conversation_ids == []
+            assert state.processed_comment_ids == set()
+            assert state.processed_review_ids == set()
+            assert state.processed_conversation_ids == set()
 
     def test_new_state_file_has_no_slice_number(self):
         from i2code.implement.workflow_state import WorkflowState
@@ -52,7 +52,7 @@ class TestWorkflowStateDefaultState:
 
         state = WorkflowState.load(str(idea_dir / "test-idea-wt-state.json"))
 
-        assert state.processed_conversation_ids == []
+        assert state.processed_conversation_ids == set()
 
 
 @pytest.mark.unit
@@ -79,9 +79,9 @@ class TestWorkflowStateLoad:
 
             state = WorkflowState.load(state_file)
 
-            assert state.processed_comment_ids == [101, 102]
-            assert state.processed_review_ids == [201]
-            assert state.processed_conversation_ids == [301, 302]
+            assert state.processed_comment_ids == {101, 102}
+            assert state.processed_review_ids == {201}
+            assert state.processed_conversation_ids == {301, 302}
 
     def test_loads_file_missing_conversation_ids_defaults_empty(self):
         """Old state files may not have processed_conversation_ids."""
@@ -98,7 +98,7 @@ class TestWorkflowStateLoad:
 
             state = WorkflowState.load(state_file)
 
-            assert state.processed_conversation_ids == []
+            assert state.processed_conversation_ids == set()
 
 
 @pytest.mark.unit
@@ -160,8 +160,8 @@ class TestWorkflowStateSave:
             state.save()
 
             reloaded = WorkflowState.load(state_file)
-            assert reloaded.processed_comment_ids == [101, 102]
-            assert reloaded.processed_review_ids == [201]
+            assert reloaded.processed_comment_ids == {101, 102}
+            assert reloaded.processed_review_ids == {201}
 
 
 @pytest.mark.unit
@@ -177,7 +177,7 @@ class TestWorkflowStateMarkProcessed:
             state = WorkflowState.load(state_file)
             state.mark_comments_processed([101, 102])
 
-            assert state.processed_comment_ids == [101, 102]
+            assert state.processed_comment_ids == {101, 102}
 
     def test_mark_comments_processed_accumulates(self):
         from i2code.implement.workflow_state import WorkflowState
@@ -189,7 +189,7 @@ class TestWorkflowStateMarkProcessed:
             state.mark_comments_processed([101])
             state.mark_comments_processed([102, 103])
 
-            assert state.processed_comment_ids == [101, 102, 103]
+            assert state.processed_comment_ids == {101, 102, 103}
 
     def test_mark_reviews_processed_appends_ids(self):
         from i2code.implement.workflow_state import WorkflowState
@@ -200,7 +200,7 @@ class TestWorkflowStateMarkProcessed:
             state = WorkflowState.load(state_file)
             state.mark_reviews_processed([201, 202])
 
-            assert state.processed_review_ids == [201, 202]
+            assert state.processed_review_ids == {201, 202}
 
     def test_mark_conversations_processed_appends_ids(self):
         from i2code.implement.workflow_state import WorkflowState
@@ -211,7 +211,7 @@ class TestWorkflowStateMarkProcessed:
             state = WorkflowState.load(state_file)
             state.mark_conversations_processed([301, 302])
 
-            assert state.processed_conversation_ids == [301, 302]
+            assert state.processed_conversation_ids == {301, 302}
 
     def test_mark_conversations_processed_accumulates(self):
         from i2code.implement.workflow_state import WorkflowState
@@ -223,4 +223,157 @@ class TestWorkflowStateMarkProcessed:
             state.mark_conversations_processed([301])
             state.mark_conversations_processed([302])
 
-            assert state.processed_conversation_ids == [301, 302]
+            assert state.processed_conversation_ids == {301, 302}
+
+
+@pytest.mark.unit
+class TestWorkflowStateCiFailureFingerprints:
+    """CI fix attempts are persisted with the workflow state."""
+
+    def test_recorded_attempts_survive_reload(self, tmp_path):
+        from i2code.implement.workflow_state import WorkflowState
+
+        state_file = str(tmp_path / "my-feature-wt-state.json")
+        state = WorkflowState.load(state_file)
+        state.ci_failure_fingerprints.record("build:abc", "no-commit", "aaa")
+        state.save()
+
+        reloaded = WorkflowState.load(state_file)
+
+        assert reloaded.ci_failure_fingerprints.attempts("build:abc") == [
+            {"outcome": "no-commit", "sha": "aaa"},
+        ]
+
+
+@pytest.mark.unit
+class TestWorkflowStateThreadSessions:
+    """The Claude session per steel thread is persisted with the workflow state."""
+
+    def test_thread_sessions_survive_reload(self, tmp_path):
+        from i2code.implement.workflow_state import WorkflowState
+
+        state_file = str(tmp_path / "my-feature-wt-state.json")
+        state = WorkflowState.load(state_file)
+        state.thread_sessions["1"] = {"session_id": "abc", "turns": 1, "output_bytes": 10}
+        state.save()
+
+        assert WorkflowState.load(state_file).thread_sessions == {
+            "1": {"session_id": "abc", "turns": 1, "output_bytes": 10},
+        }
+
+
+@pytest.mark.unit
+class TestWorkflowStateProcessedLog:
+    """Processed IDs are appended to a log and compacted into the state file."""
+
+    def test_save_appends_new_ids_without_rewriting_state_file(self, tmp_path):
+        from i2code.implement.workflow_state import WorkflowState, processed_log_file
+
+        state_file = str(tmp_path / "state.json")
+        state = WorkflowState.load(state_file)
+        before = (tmp_path / "state.json").read_text()
+        state.mark_comments_processed([101, 102])
+        state.save()
+
+        assert (tmp_path / "state.json").read_text() == before
+        with open(processed_log_file(state_file)) as f:
+            entries = [json.loads(line) for line in f]
+        assert entries == [{"kind": "comment", "ids": [101, 102]}]
+
+    def test_reload_replays_log(self, tmp_path):
+        from i2code.implement.workflow_state import WorkflowState
+
+        state_file = str(tmp_path / "state.json")
+        state = WorkflowState.load(state_file)
+        state.mark_conversations_processed([301])
+        state.save()
+        state.mark_conversations_processed([302])
+        state.save()
+
+        assert WorkflowState.load(state_file).processed_conversation_ids == {301, 302}
+
+    def test_already_processed_ids_are_not_logged_again(self, tmp_path):
+        from i2code.implement.workflow_state import WorkflowState, processed_log_file
+
+        state_file = str(tmp_path / "state.json")
+        state = WorkflowState.load(state_file)
+        state.mark_reviews_processed([201, 201])
+        state.mark_reviews_processed([201])
+        state.save()
+
+        with open(processed_log_file(state_file)) as f:
+            assert len(f.readlines()) == 1
+
+    def test_torn_log_line_is_ignored(self, tmp_path):
+        from i2code.implement.workflow_state import WorkflowState, processed_log_file
+
+        state_file = str(tmp_path / "state.json")
+        state = WorkflowState.load(state_file)
+        state.mark_comments_processed([101])
+        state.save()
+        with open(processed_log_file(state_file), "a") as f:
+            f.write('{"kind": "comment", "ids": [10')
+
+        assert WorkflowState.load(state_file).processed_comment_ids == {101}
+
+    def test_log_is_compacted_into_state_file(self, tmp_path, monkeypatch):
+        from i2code.implement import workflow_state
+        from i2code.implement.workflow_state import WorkflowState, processed_log_file
+
+        monkeypatch.setattr(workflow_state, "COMPACT_AFTER_ENTRIES", 3)
+        state_file = str(tmp_path / "state.json")
+        state = WorkflowState.load(state_file)
+        for comment_id in (101, 102, 103):
+            state.mark_comments_processed([comment_id])
+            state.save()
+
+        assert not os.path.exists(processed_log_file(state_file))
+        with open(state_file) as f:
+            assert json.load(f)["processed_comment_ids"] == [101, 102, 103]
+
+    def test_other_state_changes_compact_immediately(self, tmp_path):
+        from i2code.implement.workflow_state import WorkflowState, processed_log_file
+
+        state_file = str(tmp_path / "state.json")
+        state = WorkflowState.load(state_file)
+        state.mark_comments_processed([101])
+        state.ci_failure_fingerprints.record("build:abc", "no-commit", "aaa")
+        state.save()
+
+        assert not os.path.exists(processed_log_file(state_file))
+        with open(state_file) as f:
+            saved = json.load(f)
+        assert saved["processed_comment_ids"] == [101]
+        assert "build:abc" in saved["ci_failure_fingerprints"]
+
+
+@pytest.mark.unit
+class TestWorkflowStateHighWaterMarks:
+    """The latest processed timestamp per kind is remembered."""
+
+    def test_only_advances(self, tmp_path):
+        from i2code.implement.workflow_state import WorkflowState
+
+        state = WorkflowState.load(str(tmp_path / "state.json"))
+        state.mark_comments_processed([1], "2024-05-02T10:00:00Z")
+        state.mark_comments_processed([2], "2024-05-01T10:00:00Z")
+
+        assert state.high_water_marks == {"comment": "2024-05-02T10:00:00Z"}
+
+    def test_survive_reload_from_log_and_snapshot(self, tmp_path, monkeypatch):
+        from i2code.implement import workflow_state
+        from i2code.implement.workflow_state import WorkflowState
+
+        state_file = str(tmp_path / "state.json")
+        state = WorkflowState.load(state_file)
+        state.mark_reviews_processed([201], "2024-05-01T10:00:00Z")
+        state.save()
+        assert WorkflowState.load(state_file).high_water_marks == {"review": "2024-05-01T10:00:00Z"}
+
+        monkeypatch.setattr(workflow_state, "COMPACT_AFTER_ENTRIES", 1)
+        state.mark_conversations_processed([301], "2024-05-03T10:00:00Z")
+        state.save()
+        assert WorkflowState.load(state_file).high_water_marks == {
+            "review": "2024-05-01T10:00:00Z",
+            "conversation": "2024-05-03T10:00:00Z",
+        }
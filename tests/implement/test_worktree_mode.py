@@ -11,7 +11,9 @@ from i2code.implement.github_actions_build_fixer import GithubActionsBuildFixer
 from i2code.implement.github_actions_monitor import GithubActionsMonitor
 from i2code.implement.idea_project import IdeaProject
 from i2code.implement.implement_opts import ImplementOpts
+from i2code.implement.local_ci import LocalCiJobResult, LocalCiResult
 from i2code.implement.pull_request_review_processor import PullRequestReviewProcessor
+from i2code.implement.thread_sessions import ThreadSessions
 from i2code.implement.worktree_mode import LoopSteps, WorktreeMode
 
 from conftest import write_plan_file, mark_task_complete, advance_head, combined
@@ -116,6 +118,8 @@ def _make_worktree_mode(plan_path, idea_dir, work_dir, **kwargs):
         review_processor=review_processor,
         commit_recovery=commit_recovery,
         clock=kwargs.get('clock'),
+        local_ci=kwargs.get('local_ci'),
+        sessions=kwargs.get('sessions'),
     )
     mode = WorktreeMode(
         opts=opts,
@@ -235,6 +239,50 @@ class TestWorktreeModeTaskExecution:
             ensure_pr_calls = [c for c in fake_repo.calls if c[0] == "ensure_pr"]
             assert len(ensure_pr_calls) == 1
 
+    def test_runs_task_in_thread_session_and_records_it(self, capsys):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fake_state = FakeWorkflowState()
+            mode, _, fake_runner, _, _ = _make_success_mode(
+                tmpdir, fake_state=fake_state, sessions=ThreadSessions(fake_state),
+            )
+            mode.execute()
+
+            _, cmd, _ = fake_runner.calls[0]
+            assert cmd.session_id.is_new
+            assert fake_state.thread_sessions["1"]["session_id"] == cmd.session_id.session_id
+
+
+class _RecordingLocalCi:
+    """LocalCiRunner stand-in that records when it runs relative to pushes."""
+
+    def __init__(self, fake_repo):
+        self._fake_repo = fake_repo
+        self.pushes_seen = []
+
+    def run(self):
+        self.pushes_seen.append(self._fake_repo.calls.count(("push",)))
+        return LocalCiResult(jobs=[LocalCiJobResult("test", True, "")])
+
+
+@pytest.mark.unit
+class TestWorktreeModeLocalCi:
+    """WorktreeMode runs the optional local CI pre-flight before pushing a task."""
+
+    def test_runs_local_ci_before_push(self, capsys):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plan_path, idea_dir, fake_repo, fake_runner = _setup_task_with_success(tmpdir)
+            local_ci = _RecordingLocalCi(fake_repo)
+            mode, _, _, _, _ = _make_worktree_mode(
+                plan_path, idea_dir, tmpdir,
+                fake_repo=fake_repo, fake_runner=fake_runner, local_ci=local_ci,
+                opts=ImplementOpts(idea_directory=idea_dir, skip_ci_wait=True),
+            )
+
+            mode.execute()
+
+            assert local_ci.pushes_seen == [0]
+            assert ("push",) in fake_repo.calls
+
 
 def _run_with_fake_clock(capsys, start, end):
     """Run a single task with a fake clock and return captured stdout."""
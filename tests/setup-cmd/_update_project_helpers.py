@@ -31,7 +31,7 @@ def create_config_dir(tmpdir):
 
 
 def per_file_subprocess_run(repo_root, *, per_file_shas=None, per_file_diffs=None):
-    """Mock subprocess.run with per-file SHA/diff control keyed by relpath.
+    """Mock run_command with per-file SHA/diff control keyed by relpath.
 
     per_file_shas maps `relpath -> SHA string` for `git log -1 --format=%H -- <relpath>`.
     per_file_diffs maps `relpath -> diff string` for `git diff <prev>..<curr> -- <relpath>`.
@@ -134,8 +134,8 @@ def run_update_with_per_file_mock(tmpdir, fakes, *, markers=None, diffs_by_kind=
     per_file_shas = {
         relpath_by_kind[k]: sha for k, sha in _DEFAULT_CURRENT_SHAS.items()
     }
-    with patch("i2code.setup_cmd.update_project.subprocess") as mock_sub:
-        mock_sub.run = per_file_subprocess_run(
+    with patch("i2code.setup_cmd.update_project.run_command") as mock_run:
+        mock_run.side_effect = per_file_subprocess_run(
             tmpdir, per_file_shas=per_file_shas, per_file_diffs=per_file_diffs,
         )
         update_project(project_dir, config_dir, fake_runner, fake_renderer)
@@ -90,8 +90,8 @@ def _run_first_sync(tmpdir, fakes, *, missing_kind, template_override=None):
         claude_md_relpath: _DEFAULT_CURRENT_SHAS["claude_md"],
         settings_relpath: _DEFAULT_CURRENT_SHAS["settings"],
     }
-    with patch("i2code.setup_cmd.update_project.subprocess") as mock_sub:
-        mock_sub.run = per_file_subprocess_run(
+    with patch("i2code.setup_cmd.update_project.run_command") as mock_run:
+        mock_run.side_effect = per_file_subprocess_run(
             tmpdir, per_file_shas=per_file_shas, per_file_diffs={synced_relpath: ""},
         )
         update_project(project_dir, config_dir, fake_runner, fake_renderer)
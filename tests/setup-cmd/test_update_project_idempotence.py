@@ -40,8 +40,8 @@ class TestIdempotenceAndCleanup:
                 claude_md_relpath: "diff-for-claude-md",
                 settings_relpath: "diff-for-settings",
             }
-            with patch("i2code.setup_cmd.update_project.subprocess") as mock_sub:
-                mock_sub.run = per_file_subprocess_run(
+            with patch("i2code.setup_cmd.update_project.run_command") as mock_run:
+                mock_run.side_effect = per_file_subprocess_run(
                     tmpdir, per_file_shas=per_file_shas,
                     per_file_diffs=first_run_diffs,
                 )
@@ -51,8 +51,8 @@ class TestIdempotenceAndCleanup:
             fake_renderer.calls.clear()
 
             second_run_diffs = {claude_md_relpath: "", settings_relpath: ""}
-            with patch("i2code.setup_cmd.update_project.subprocess") as mock_sub:
-                mock_sub.run = per_file_subprocess_run(
+            with patch("i2code.setup_cmd.update_project.run_command") as mock_run:
+                mock_run.side_effect = per_file_subprocess_run(
                     tmpdir, per_file_shas=per_file_shas,
                     per_file_diffs=second_run_diffs,
                 )
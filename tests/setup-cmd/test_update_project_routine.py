@@ -50,8 +50,8 @@ def _run_update_capturing_result(tmpdir, fakes, *, markers=None, diffs_by_kind=N
     per_file_shas = {
         relpath_by_kind[k]: sha for k, sha in _DEFAULT_CURRENT_SHAS.items()
     }
-    with patch("i2code.setup_cmd.update_project.subprocess") as mock_sub:
-        mock_sub.run = per_file_subprocess_run(
+    with patch("i2code.setup_cmd.update_project.run_command") as mock_run:
+        mock_run.side_effect = per_file_subprocess_run(
             tmpdir, per_file_shas=per_file_shas, per_file_diffs=per_file_diffs,
         )
         result = update_project(project_dir, config_dir, fake_runner, fake_renderer)
@@ -43,8 +43,8 @@ def _run_capturing_git_calls(tmpdir, fakes, markers):
             cmd, capture_output=capture_output, text=text, check=check, cwd=cwd,
         )
 
-    with patch("i2code.setup_cmd.update_project.subprocess") as mock_sub:
-        mock_sub.run = tracking
+    with patch("i2code.setup_cmd.update_project.run_command") as mock_run:
+        mock_run.side_effect = tracking
         update_project(project_dir, config_dir, fake_runner, fake_renderer)
     return captured, claude_md_relpath, settings_relpath
 
@@ -8,7 +8,7 @@ import pytest
 from conftest import TempIdeaProject
 from i2code.implement.claude_runner import ClaudeResult
 from i2code.implement.idea_project import IdeaProject
-from i2code.spec_cmd.create_spec import create_spec
+from i2code.spec_cmd.create_spec import create_spec, prepare_spec_command
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "implement"))
 from fake_claude_runner import FakeClaudeRunner
@@ -122,3 +122,21 @@ class TestCreateSpecAllowedTools:
             _, _, _, cmd, cwd = _run_create_spec(project)
             assert cmd.allowed_tools is None
             assert cwd == project.directory
+
+
+@pytest.mark.unit
+class TestCreateSpecPrepared:
+
+    def test_prepare_builds_interactive_command_with_rendered_prompt(self):
+        with TempIdeaProject("my-feature") as project:
+            command = prepare_spec_command(project)
+            assert command.interactive is True
+            assert project.idea_file in (command.prompt or "")
+
+    def test_uses_prepared_command(self):
+        with TempIdeaProject("my-feature") as project:
+            _create_idea_file(project)
+            prepared = prepare_spec_command(project)
+            runner = FakeClaudeRunner()
+            create_spec(project, runner, prepared=prepared)
+            assert runner.calls[0][1] is prepared
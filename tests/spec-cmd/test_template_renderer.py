@@ -1,5 +1,6 @@
 """Tests for template_renderer: loads prompt templates and substitutes variables."""
 
+import os
 
 import pytest
 
@@ -44,3 +45,33 @@ class TestRenderTemplate:
         # After substitution, those should be replaced
         assert "${IDEA_FILE}" not in result
         assert "${DISCUSSION_FILE}" not in result
+
+
+@pytest.mark.unit
+class TestTemplateCache:
+
+    def test_reads_template_once(self, tmp_path, monkeypatch):
+        from i2code import template_renderer
+
+        (tmp_path / "t.md").write_text("Hello $NAME")
+        monkeypatch.setattr(template_renderer, "_TEMPLATES_DIR", tmp_path)
+        template_renderer._load.cache_clear()
+
+        for _ in range(3):
+            assert template_renderer.render_template("t.md", {"NAME": "A"}) == "Hello A"
+
+        assert template_renderer._load.cache_info().misses == 1
+
+    def test_rereads_edited_template(self, tmp_path, monkeypatch):
+        from i2code import template_renderer
+
+        template = tmp_path / "t.md"
+        template.write_text("Hello $NAME")
+        monkeypatch.setattr(template_renderer, "_TEMPLATES_DIR", tmp_path)
+        assert template_renderer.render_template("t.md", {"NAME": "A"}) == "Hello A"
+
+        template.write_text("Hi $NAME")
+        mtime_ns = template.stat().st_mtime_ns + 1_000_000_000
+        os.utime(template, ns=(mtime_ns, mtime_ns))
+
+        assert template_renderer.render_template("t.md", {"NAME": "A"}) == "Hi A"
@@ -1,5 +1,7 @@
 """Tests for the shared template renderer."""
 
+import os
+
 import pytest
 
 SAMPLE_PACKAGE = "tests.templates.sample_pkg"
@@ -22,3 +24,66 @@ class TestRenderTemplate:
 
         with pytest.raises(FileNotFoundError):
             render_template("nonexistent.j2", package=SAMPLE_PACKAGE)
+
+
+def _write_package(root, name, template_source):
+    """Create an importable package with templates/greeting.j2 under root."""
+    templates = root / name / "templates"
+    templates.mkdir(parents=True)
+    (root / name / "__init__.py").write_text("")
+    (templates / "__init__.py").write_text("")
+    greeting = templates / "greeting.j2"
+    greeting.write_text(template_source)
+    return greeting
+
+
+def _touch_later(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.unit
+class TestTemplateCompilationCache:
+
+    def test_reuses_compiled_template(self, monkeypatch):
+        from i2code.templates import template_renderer
+
+        environment = template_renderer._environment(SAMPLE_PACKAGE)
+        template_renderer.render_template("greeting.j2", package=SAMPLE_PACKAGE, name="World")
+        first = environment.get_template("greeting.j2")
+        template_renderer.render_template("greeting.j2", package=SAMPLE_PACKAGE, name="World")
+
+        assert environment.get_template("greeting.j2") is first
+
+    def test_picks_up_edited_template(self, tmp_path, monkeypatch):
+        from i2code.templates.template_renderer import render_template
+
+        monkeypatch.syspath_prepend(str(tmp_path))
+        greeting = _write_package(tmp_path, "edited_pkg", "Hello, {{ name }}!")
+        assert render_template("greeting.j2", package="edited_pkg", name="A") == "Hello, A!"
+
+        greeting.write_text("Hi, {{ name }}!")
+        _touch_later(greeting)
+
+        assert render_template("greeting.j2", package="edited_pkg", name="A") == "Hi, A!"
+
+
+@pytest.mark.unit
+class TestTemplateVersion:
+
+    def test_is_stable_for_the_same_template(self):
+        from i2code.templates.template_renderer import template_version
+
+        assert template_version("greeting.j2", package=SAMPLE_PACKAGE) == \
+            template_version("greeting.j2", package=SAMPLE_PACKAGE)
+
+    def test_changes_with_template_source(self, tmp_path, monkeypatch):
+        from i2code.templates.template_renderer import template_version
+
+        monkeypatch.syspath_prepend(str(tmp_path))
+        greeting = _write_package(tmp_path, "versioned_pkg", "Hello, {{ name }}!")
+        before = template_version("greeting.j2", package="versioned_pkg")
+
+        greeting.write_text("Hi, {{ name }}!")
+
+        assert template_version("greeting.j2", package="versioned_pkg") != before
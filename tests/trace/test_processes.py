@@ -0,0 +1,158 @@
+"""Tests for i2code.trace.processes."""
+
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from i2code.cli import main
+from i2code.trace.processes import (
+    DEFAULT_TIMEOUTS,
+    TIMEOUT_RETURNCODE,
+    process_stats,
+    run_command,
+    track_process,
+)
+from i2code.trace.spans import start_tracing, stop_tracing
+from i2code.trace.summary import load_spans
+
+
+@pytest.fixture(autouse=True)
+def _clean_stats():
+    process_stats.reset()
+    yield
+    process_stats.reset()
+
+
+@pytest.mark.unit
+class TestRunCommand:
+
+    def test_records_program_returncode_and_output_size(self):
+        result = run_command(
+            [sys.executable, "-c", "print('hello')"], capture_output=True, text=True,
+        )
+
+        assert result.stdout == "hello\n"
+        [record] = process_stats.records
+        assert record.returncode == 0
+        assert record.output_bytes == len("hello\n")
+        assert record.duration > 0
+
+    def test_program_override(self):
+        run_command([sys.executable, "-c", "pass"], program="claude")
+
+        assert process_stats.count("claude") == 1
+
+    def test_applies_default_timeout_for_git_and_gh(self, monkeypatch):
+        seen = []
+        monkeypatch.setattr(
+            "subprocess.run",
+            lambda argv, **kwargs: seen.append(kwargs.get("timeout")) or subprocess.CompletedProcess(argv, 0),
+        )
+
+        run_command(["git", "status"])
+        run_command(["gh", "pr", "list"])
+        run_command(["git", "fetch"], timeout=5)
+        run_command(["vim", "file"])
+
+        assert seen == [600, 300, 5, None]
+
+    @pytest.mark.parametrize("argv", [
+        ["git", "commit", "-m", "msg"],
+        ["git", "-C", "/repo", "push", "origin", "main"],
+        ["git", "clone", "src", "dst"],
+    ])
+    def test_no_default_timeout_for_hook_running_and_cloning_git_commands(self, monkeypatch, argv):
+        seen = []
+        monkeypatch.setattr(
+            "subprocess.run",
+            lambda argv, **kwargs: seen.append(kwargs.get("timeout")) or subprocess.CompletedProcess(argv, 0),
+        )
+
+        run_command(argv)
+
+        assert seen == [None]
+
+    def test_default_timeout_returns_failed_result(self, monkeypatch):
+        monkeypatch.setitem(DEFAULT_TIMEOUTS, "python", 0.1)
+        argv = [sys.executable, "-c", "import sys, time; print('partial', flush=True); time.sleep(5)"]
+
+        result = run_command(argv, program="python", capture_output=True, text=True)
+
+        assert result.returncode == TIMEOUT_RETURNCODE
+        assert "timed out after 0.1s" in result.stderr
+        [record] = process_stats.records
+        assert record.timed_out
+        assert record.returncode == TIMEOUT_RETURNCODE
+
+    def test_default_timeout_with_check_raises_called_process_error(self, monkeypatch):
+        monkeypatch.setitem(DEFAULT_TIMEOUTS, "python", 0.1)
+
+        with pytest.raises(subprocess.CalledProcessError) as excinfo:
+            run_command(
+                [sys.executable, "-c", "import time; time.sleep(5)"], program="python", check=True,
+                capture_output=True,
+            )
+
+        assert excinfo.value.returncode == TIMEOUT_RETURNCODE
+        assert b"timed out" in excinfo.value.stderr
+
+    def test_explicit_timeout_is_recorded_and_raised(self):
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_command([sys.executable, "-c", "import time; time.sleep(5)"], timeout=0.1)
+
+        [record] = process_stats.records
+        assert record.timed_out
+        assert process_stats.by_program()[record.program].timeouts == 1
+
+    def test_called_process_error_still_recorded(self):
+        with pytest.raises(subprocess.CalledProcessError):
+            run_command([sys.executable, "-c", "raise SystemExit(3)"], check=True)
+
+        assert process_stats.records[0].returncode == 3
+        assert process_stats.by_program()[process_stats.records[0].program].failures == 1
+
+    def test_emits_span_of_program_kind(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("subprocess.run", lambda argv, **kwargs: subprocess.CompletedProcess(argv, 0))
+        path = str(tmp_path / "trace.jsonl")
+        start_tracing(path)
+        try:
+            run_command(["gh", "run", "view", "42"])
+        finally:
+            stop_tracing()
+
+        [recorded] = load_spans(path)
+        assert recorded["kind"] == "gh"
+        assert recorded["name"] == "gh run view"
+
+
+@pytest.mark.unit
+class TestTrackProcess:
+
+    def test_caller_fills_in_result(self):
+        with track_process(["git", "log"]) as record:
+            record.returncode = 1
+            record.output_bytes = 10
+
+        assert process_stats.count("git") == 1
+        stats = process_stats.by_program()["git"]
+        assert (stats.failures, stats.output_bytes) == (1, 10)
+
+
+@pytest.mark.unit
+class TestStatsOption:
+
+    def test_prints_stats_on_exit(self):
+        result = CliRunner().invoke(main, ["--stats", "trace", "--help"])
+
+        assert result.exit_code == 0
+        assert "Subprocess stats:" in result.output
+
+    def test_format_lists_programs(self):
+        with track_process(["git", "status"]) as record:
+            record.returncode = 0
+
+        text = process_stats.format()
+        assert "git" in text
+        assert "Count" in text
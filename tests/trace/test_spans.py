@@ -0,0 +1,99 @@
+"""Tests for i2code.trace.spans."""
+
+import threading
+
+import pytest
+
+from i2code.trace.spans import current_tracer, new_trace_path, span, start_tracing, stop_tracing
+from i2code.trace.summary import load_spans
+
+
+@pytest.fixture
+def trace_path(tmp_path):
+    path = str(tmp_path / ".hitl" / "traces" / "run.jsonl")
+    start_tracing(path)
+    yield path
+    stop_tracing()
+
+
+@pytest.mark.unit
+class TestSpan:
+
+    def test_disabled_by_default_records_nothing(self, tmp_path):
+        assert not current_tracer().enabled
+        with span("anything"):
+            pass
+        assert not (tmp_path / ".hitl").exists()
+
+    def test_records_nested_spans_with_parent_ids(self, trace_path):
+        with span("task", kind="task", task="Task 1.1"):
+            with span("claude", kind="claude"):
+                pass
+        stop_tracing()
+
+        spans = {s["name"]: s for s in load_spans(trace_path)}
+        assert spans["task"]["parent"] is None
+        assert spans["task"]["attrs"] == {"task": "Task 1.1"}
+        assert spans["claude"]["parent"] == spans["task"]["id"]
+        assert spans["claude"]["kind"] == "claude"
+        assert spans["claude"]["status"] == "ok"
+
+    def test_block_can_add_attrs(self, trace_path):
+        with span("render_prompt", template="t.j2") as attrs:
+            attrs["tokens"] = 12
+        stop_tracing()
+
+        assert load_spans(trace_path)[0]["attrs"] == {"template": "t.j2", "tokens": 12}
+
+    def test_disabled_span_yields_scratch_attrs(self):
+        with span("anything") as attrs:
+            attrs["tokens"] = 12
+
+    def test_error_status_when_block_raises(self, trace_path):
+        with pytest.raises(ValueError):
+            with span("boom"):
+                raise ValueError("x")
+        stop_tracing()
+
+        assert load_spans(trace_path)[0]["status"] == "error"
+
+    def test_exit_status_on_system_exit(self, trace_path):
+        with pytest.raises(SystemExit):
+            with span("push", kind="git"):
+                raise SystemExit(1)
+        stop_tracing()
+
+        assert load_spans(trace_path)[0]["status"] == "exit"
+
+    def test_spans_in_other_threads_do_not_inherit_parent(self, trace_path):
+        with span("outer"):
+            thread = threading.Thread(target=self._record_span, args=("in-thread",))
+            thread.start()
+            thread.join()
+        stop_tracing()
+
+        spans = {s["name"]: s for s in load_spans(trace_path)}
+        assert spans["in-thread"]["parent"] is None
+
+    @staticmethod
+    def _record_span(name):
+        with span(name):
+            pass
+
+    def test_stop_tracing_disables_span(self, trace_path):
+        stop_tracing()
+        with span("after"):
+            pass
+
+        assert load_spans(trace_path) == []
+
+
+@pytest.mark.unit
+class TestNewTracePath:
+
+    def test_path_is_under_hitl_traces_and_labelled(self, tmp_path):
+        path = new_trace_path(str(tmp_path), "my-idea")
+
+        assert path.startswith(str(tmp_path / ".hitl" / "traces"))
+        assert "my-idea" in path
+        assert path.endswith(".jsonl")
@@ -0,0 +1,91 @@
+"""Tests for i2code.trace.summary and the 'i2code trace summarize' command."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from i2code.trace.cli import trace
+from i2code.trace.summary import format_duration, summarize_spans
+
+
+def _span(span_id, name, kind, duration, parent=None, start=0.0, **attrs):
+    return {
+        "id": span_id, "parent": parent, "name": name, "kind": kind,
+        "start": start, "duration": duration, "status": "ok", "attrs": attrs,
+    }
+
+
+SPANS = [
+    _span(1, "implement", "command", 100.0),
+    _span(2, "task", "task", 60.0, parent=1, start=1.0, task="Task 1.1: Build it"),
+    _span(3, "claude", "claude", 40.0, parent=2),
+    _span(4, "push", "git", 2.0, parent=2),
+    _span(5, "wait_for_ci", "ci", 15.0, parent=2),
+    _span(6, "gh run view", "gh", 5.0, parent=5),
+    _span(7, "process_feedback", "review", 30.0, parent=1),
+]
+
+
+def _row(output, label):
+    return next(line for line in output.splitlines() if line.startswith(label)).split()
+
+
+@pytest.mark.unit
+class TestSummarizeSpans:
+
+    def test_task_row_splits_time_by_kind(self):
+        row = _row(summarize_spans(SPANS), "Task 1.1")
+
+        # label (4 words), wall, claude, ci, gh, git, review, other
+        assert row[4:] == ["1m00s", "40.0s", "15.0s", "0.0s", "2.0s", "0.0s", "3.0s"]
+
+    def test_gh_inside_ci_counts_as_ci(self):
+        row = _row(summarize_spans(SPANS), "Task 1.1")
+
+        assert row[6] == "15.0s"
+        assert row[7] == "0.0s"
+
+    def test_total_row_covers_root_spans(self):
+        row = _row(summarize_spans(SPANS), "Total")
+
+        assert row[1:] == ["1m40s", "40.0s", "15.0s", "0.0s", "2.0s", "30.0s", "13.0s"]
+
+    def test_empty_trace(self):
+        assert summarize_spans([]) == "No spans recorded."
+
+
+@pytest.mark.unit
+class TestFormatDuration:
+
+    @pytest.mark.parametrize("seconds,expected", [
+        (4.25, "4.2s"),
+        (75, "1m15s"),
+        (3725, "1h02m"),
+    ])
+    def test_formats(self, seconds, expected):
+        assert format_duration(seconds) == expected
+
+
+@pytest.mark.unit
+class TestSummarizeCommand:
+
+    def test_summarizes_latest_trace_in_cwd(self, tmp_path, monkeypatch):
+        traces = tmp_path / ".hitl" / "traces"
+        traces.mkdir(parents=True)
+        (traces / "run.jsonl").write_text("".join(json.dumps(s) + "\n" for s in SPANS))
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(trace, ["summarize"])
+
+        assert result.exit_code == 0, result.output
+        assert "Task 1.1" in result.output
+        assert "Total" in result.output
+
+    def test_errors_when_no_traces(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(trace, ["summarize"])
+
+        assert result.exit_code != 0
+        assert "No traces found" in result.output